@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Generate src/core/modules/registry/module_manifest.json from the module registry.
+
+The manifest lets ``import core.modules`` register Core's modules without
+importing them (see core/modules/registry/manifest.py). It is a build
+artifact: run this before ``python -m build`` so the wheel ships it. A checkout
+without one, or with one built from other sources, imports eagerly.
+
+Usage:
+    python scripts/generate_module_manifest.py
+    python scripts/generate_module_manifest.py --check
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Setup path
+script_dir = Path(__file__).resolve().parent
+project_root = script_dir.parent
+sys.path.insert(0, str(project_root / "src"))
+
+os.environ["FLYTO_VALIDATION_MODE"] = "dev"
+# Build from a full eager import, so every row passes the quality validator.
+os.environ["FLYTO_LAZY_MODULES"] = "0"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true", help="fail when the manifest is missing or stale")
+    parser.add_argument("--output", type=Path, help="write here instead of the packaged location")
+    args = parser.parse_args()
+
+    import core.modules  # noqa: F401  (registers every module)
+    from core.modules.registry.manifest import (
+        DEFAULT_MANIFEST_PATH,
+        build_manifest,
+        load_manifest,
+        write_manifest,
+    )
+
+    output_path = args.output or DEFAULT_MANIFEST_PATH
+    if args.check:
+        current = load_manifest(output_path)
+        if current is None or current["modules"] != build_manifest()["modules"]:
+            print(f"Stale module manifest: {output_path}", file=sys.stderr)
+            return 1
+        print(f"Module manifest check passed: {output_path}")
+        total = len(current["modules"])
+    else:
+        total = len(write_manifest(output_path)["modules"])
+        print(f"Generated {output_path}")
+    print(f"  {total} modules")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -104,6 +104,14 @@ def build_package() -> bool:
     print("\n=== Building Package ===")
     clean_build()
 
+    # Lazy module loading reads this manifest; it is built, not committed.
+    result = subprocess.run(
+        [sys.executable, "scripts/generate_module_manifest.py"],
+        cwd=get_project_root()
+    )
+    if result.returncode != 0:
+        return False
+
     result = subprocess.run(
         [sys.executable, "-m", "build"],
         cwd=get_project_root()
@@ -7,10 +7,11 @@ ExecutorHooks implementation that collects step evidence via the EvidenceStore.
 Designed to run inside an already-running event loop (FastAPI).
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from core.engine.hooks import ExecutorHooks, HookContext, HookResult
 from core.engine.evidence import EvidenceStore, StepEvidence
@@ -22,14 +23,31 @@ class APIEvidenceHooks(ExecutorHooks):
     """
     Collects context_before / context_after for every step and persists
     them via EvidenceStore.  Unlike EvidenceExecutorHooks this class is
-    async-safe — it schedules saves as fire-and-forget tasks so the
-    workflow engine is not blocked.
+    async-safe — it schedules saves as tasks so the workflow engine is
+    not blocked; await flush() once the workflow has finished.
     """
 
     def __init__(self, evidence_store: EvidenceStore, execution_id: str):
         self.store = evidence_store
         self.execution_id = execution_id
         self._step_starts: Dict[str, Dict[str, Any]] = {}
+        self._pending: Set[asyncio.Task] = set()
+
+    async def flush(self) -> None:
+        """Wait until every evidence record of this execution is on disk."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        await self.store.flush(self.execution_id)
+
+    def _schedule_save(self, evidence: StepEvidence) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.store.save_evidence(evidence))
+            return
+        task = loop.create_task(self.store.save_evidence(evidence))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -80,13 +98,8 @@ class APIEvidenceHooks(ExecutorHooks):
             step_index=start_info.get("step_index"),
         )
 
-        # Save synchronously — we're inside the engine's event loop
-        import asyncio
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.store.save_evidence(evidence))
-        except RuntimeError:
-            asyncio.run(self.store.save_evidence(evidence))
+        # Scheduled on the engine's event loop; flush() awaits it
+        self._schedule_save(evidence)
 
         return HookResult.continue_execution()
 
@@ -113,12 +126,7 @@ class APIEvidenceHooks(ExecutorHooks):
             step_index=context.step_index,
         )
 
-        import asyncio
-        try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.store.save_evidence(evidence))
-        except RuntimeError:
-            asyncio.run(self.store.save_evidence(evidence))
+        self._schedule_save(evidence)
 
         return HookResult.continue_execution()
 
@@ -75,6 +75,8 @@ async def run_workflow(body: RunWorkflowRequest, request: Request):
             result = await engine.execute()
         finally:
             state.running_workflows.pop(execution_id, None)
+            if hooks is not None:
+                await hooks.flush()
 
         duration_ms = int((time.time() - t0) * 1000)
 
@@ -22,6 +22,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.catalog_facts import CORE_CATALOG_CATEGORY_COUNT, CORE_MODULE_COUNT
+from core.db_pool import close_all_db_pools
+from core.http_pool import close_all_pools
 from core.session_reaper import reaper_loop
 
 from .routes import (
@@ -84,6 +86,8 @@ def create_app(
                 except RuntimeError:
                     logger.exception("Failed to close browser session during shutdown")
             state.browser_sessions.clear()
+            await close_all_pools()
+            await close_all_db_pools()
             logger.info("Server shutdown - browser and debugger sessions cleaned up")
 
     app = FastAPI(
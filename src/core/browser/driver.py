@@ -7,6 +7,7 @@ import asyncio
 import logging
 import os
 import random
+import re
 import shutil
 import sys
 from typing import Any, Dict, List, Optional
@@ -26,6 +27,77 @@ logger = logging.getLogger(__name__)
 # Node.js version to auto-download when system node is unavailable
 _NODE_VERSION = '20.18.3'
 
+# Selector engine prefixes such as text=, role=, data-testid= (css= and
+# xpath= are handled before this is checked)
+_ENGINE_PREFIX = re.compile(r'^[A-Za-z][\w-]*=')
+
+# Extracts every row and field of BrowserDriver.extract in one evaluate
+# instead of a query_selector plus inner_text/get_attribute round trip per
+# field per element. CSS walks open shadow roots, as Playwright's CSS engine
+# does; XPath starting with / is scoped to the element, as in Playwright.
+# Returns null when a selector is not native CSS (e.g. :has-text, >>), so
+# the caller can fall back to the locator path.
+_BATCH_EXTRACT_SCRIPT = """
+({selector, fields, index}) => {
+    const validate = (sel) => {
+        if (sel.kind === 'css') document.createDocumentFragment().querySelector(sel.value);
+    };
+    const cssMatches = (scope, css, firstOnly) => {
+        const found = [];
+        const visit = (root) => {
+            const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+            for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                if (node.matches(css)) {
+                    found.push(node);
+                    if (firstOnly) return true;
+                }
+                if (node.shadowRoot && visit(node.shadowRoot)) return true;
+            }
+            return false;
+        };
+        visit(scope);
+        return found;
+    };
+    const xpathMatches = (scope, xpath, firstOnly) => {
+        if (scope.nodeType !== Node.DOCUMENT_NODE && xpath.startsWith('/')) xpath = '.' + xpath;
+        const result = document.evaluate(
+            xpath, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const found = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            const node = result.snapshotItem(i);
+            if (node.nodeType !== Node.ELEMENT_NODE) continue;
+            found.push(node);
+            if (firstOnly) break;
+        }
+        return found;
+    };
+    const query = (scope, sel, firstOnly) => sel.kind === 'xpath'
+        ? xpathMatches(scope, sel.value, firstOnly)
+        : cssMatches(scope, sel.value, firstOnly);
+    const readField = (element, field) => {
+        const target = field.sub ? query(element, field.sub, true)[0] : element;
+        if (!target) return null;
+        if (field.attr !== null) return target.getAttribute(field.attr);
+        return target instanceof HTMLElement ? target.innerText : null;
+    };
+    try {
+        validate(selector);
+        fields.forEach((field) => field.sub && validate(field.sub));
+        let elements = query(document, selector, false);
+        if (index !== null) elements = index < elements.length ? [elements[index]] : [];
+        return elements.map((element) => fields.map((field) => {
+            try {
+                return readField(element, field);
+            } catch (e) {
+                return null;
+            }
+        }));
+    } catch (e) {
+        return null;
+    }
+}
+"""
+
 
 def _find_external_node() -> Optional[str]:
     """Find a usable Node.js binary outside the PyInstaller temp dir.
@@ -77,6 +149,11 @@ class BrowserDriver:
         self._browser: Optional[Browser] = None
         self._page: Optional[Page] = None
         self._context = None
+        # False for a driver made by new_context(): it shares another driver's
+        # browser process and closing it closes only its own context.
+        self._owns_browser = True
+        # Context settings from launch(), reused for every new context
+        self._context_options: Optional[Dict[str, Any]] = None
         # Track whether a snapshot was taken since last navigation.
         # Used by modules to auto-snapshot before interaction.
         self._snapshot_since_nav = False
@@ -112,6 +189,7 @@ class BrowserDriver:
         record_video_size: Optional[Dict[str, int]] = None,
         channel: Optional[str] = None,
         stealth: bool = True,
+        persistent: bool = True,
     ) -> Dict[str, Any]:
         """
         Launch browser instance
@@ -122,6 +200,8 @@ class BrowserDriver:
             slow_mo: Delay between actions in milliseconds
             record_video_dir: Directory to save recorded videos (enables Playwright video recording)
             record_video_size: Video resolution (e.g., {'width': 1280, 'height': 720}). Defaults to viewport size.
+            persistent: Try the persistent Chromium profile first. Pass False
+                       to get a browser that can host more contexts (new_context).
 
         Returns:
             Status dictionary
@@ -194,7 +274,10 @@ class BrowserDriver:
             # Cloud workers skip persistent context — the user_data_dir causes
             # lock file and permission issues in containerized environments.
             # Persistent context is for desktop cookie persistence (Cloudflare etc.)
-            _skip_persistent = os.environ.get("DEPLOYMENT_MODE") in ("worker", "web")
+            _skip_persistent = (
+                not persistent
+                or os.environ.get("DEPLOYMENT_MODE") in ("worker", "web")
+            )
 
             if self.browser_type == 'chromium':
                 launched = False
@@ -225,16 +308,57 @@ class BrowserDriver:
                 self._context = await self._browser.new_context(**context_kwargs)
                 self._page = await self._context.new_page()
 
-            # Stealth: comprehensive anti-detection patches
-            # Applied via add_init_script() so they run BEFORE any page JS.
+            self._context_options = {
+                'context_kwargs': context_kwargs,
+                'languages': languages,
+                'stealth': stealth,
+            }
+
+            # Stealth: comprehensive anti-detection patches (see _apply_stealth).
             # Disable with stealth=False if patches interfere with testing.
-            languages_js = str(languages)
-            # Deterministic seed for fingerprint randomization — same seed
-            # produces same GPU/hardware profile within one driver instance,
-            # preventing inconsistency with persistent cookies.
-            _fingerprint_seed = random.randint(0, 2**32 - 1)
             if stealth:
-                await self._context.add_init_script(f"""
+                await self._apply_stealth(languages)
+
+                # Create a fresh page so init_script applies (persistent context's
+                # initial page was created before add_init_script).
+                new_page = await self._context.new_page()
+                old_page = self._page
+                self._page = new_page
+                if old_page and old_page != new_page and hasattr(old_page, 'close'):
+                    try:
+                        await old_page.close()
+                    except Exception:
+                        pass
+
+            # SECURITY: In cloud/worker mode, intercept ALL outbound requests
+            # at the browser network layer to enforce SSRF rules.
+            # This catches fetch(), WebSocket, XHR, <img src=...>, etc. that
+            # bypass the goto() URL validation. Also prevents DNS rebinding.
+            await self._install_egress_guard()
+
+            logger.info("Browser launched successfully")
+
+            return {
+                'status': 'success',
+                'browser_type': self.browser_type,
+                'headless': self.headless
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to launch browser: {str(e)}")
+            raise RuntimeError(f"Browser launch failed: {str(e)}") from e
+
+    async def _apply_stealth(self, languages: List[str]):
+        """Install the anti-detection patches on the current context.
+
+        Applied via add_init_script() so they run BEFORE any page JS.
+        """
+        languages_js = str(languages)
+        # Deterministic seed for fingerprint randomization — same seed
+        # produces same GPU/hardware profile within one context,
+        # preventing inconsistency with persistent cookies.
+        _fingerprint_seed = random.randint(0, 2**32 - 1)
+        await self._context.add_init_script(f"""
                 // Seeded PRNG for stable fingerprint within a session
                 let _fpS = {_fingerprint_seed};
                 function _fpRand() {{ _fpS = (_fpS * 1664525 + 1013904223) & 0xFFFFFFFF; return (_fpS >>> 0) / 0xFFFFFFFF; }}
@@ -480,36 +604,7 @@ class BrowserDriver:
                         return origIsType.call(this, type);
                     }};
                 }}
-            """)
-
-                # Create a fresh page so init_script applies (persistent context's
-                # initial page was created before add_init_script).
-                new_page = await self._context.new_page()
-                old_page = self._page
-                self._page = new_page
-                if old_page and old_page != new_page and hasattr(old_page, 'close'):
-                    try:
-                        await old_page.close()
-                    except Exception:
-                        pass
-
-            # SECURITY: In cloud/worker mode, intercept ALL outbound requests
-            # at the browser network layer to enforce SSRF rules.
-            # This catches fetch(), WebSocket, XHR, <img src=...>, etc. that
-            # bypass the goto() URL validation. Also prevents DNS rebinding.
-            await self._install_egress_guard()
-
-            logger.info("Browser launched successfully")
-
-            return {
-                'status': 'success',
-                'browser_type': self.browser_type,
-                'headless': self.headless
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to launch browser: {str(e)}")
-            raise RuntimeError(f"Browser launch failed: {str(e)}") from e
+        """)
 
     async def _install_egress_guard(self):
         """Install network-level egress guard on the browser context.
@@ -924,20 +1019,29 @@ class BrowserDriver:
 
         Returns:
             Extracted data
+
+        CSS and XPath selectors are extracted in a single page round trip
+        (see _extract_batched); other selectors, and anything the batched
+        script cannot match, go through the element-by-element path.
         """
         self._ensure_page()
 
         try:
             logger.info(f"Extracting data: {selector} (multiple={multiple})")
 
+            batched = await self._extract_batched(selector, fields, multiple)
+
             if multiple:
-                # Extract from multiple elements (supports CSS and XPath)
-                elements = await self._query_selector_all(selector)
+                if batched is not None:
+                    results = batched
+                else:
+                    # Extract from multiple elements (supports CSS and XPath)
+                    elements = await self._query_selector_all(selector)
 
-                results = []
-                for element in elements:
-                    item_data = await self._extract_from_element(element, fields)
-                    results.append(item_data)
+                    results = []
+                    for element in elements:
+                        item_data = await self._extract_from_element(element, fields)
+                        results.append(item_data)
 
                 logger.info(f"Extracted {len(results)} items")
 
@@ -947,13 +1051,16 @@ class BrowserDriver:
                     'data': results
                 }
             else:
-                # Extract from single element (supports CSS and XPath)
-                element = await self._query_selector(selector)
+                if batched is not None:
+                    data = batched[0]
+                else:
+                    # Extract from single element (supports CSS and XPath)
+                    element = await self._query_selector(selector)
 
-                if not element:
-                    raise ValueError(f"Element not found: {selector}")
+                    if not element:
+                        raise ValueError(f"Element not found: {selector}")
 
-                data = await self._extract_from_element(element, fields)
+                    data = await self._extract_from_element(element, fields)
 
                 logger.info(f"Extracted data from: {selector}")
 
@@ -966,6 +1073,75 @@ class BrowserDriver:
             logger.error(f"Extraction failed: {str(e)}")
             raise RuntimeError(f"Failed to extract from {selector}: {str(e)}") from e
 
+    async def _extract_batched(self,
+                               selector: str,
+                               fields: Dict[str, str],
+                               multiple: bool) -> Optional[List[Dict[str, Any]]]:
+        """
+        Extract all matching elements and fields in one page.evaluate
+
+        Args:
+            selector: Target selector, as for extract()
+            fields: Field extraction map, as for extract()
+            multiple: Extract every match rather than the first (or :nth=)
+
+        Returns:
+            One dict per element, or None when the selectors cannot be
+            compiled or nothing matched. Empty results are left to the
+            locator path, which understands all of Playwright's selector
+            dialect (e.g. CSS combinators across shadow roots) and so is
+            the one to report "not found".
+        """
+        base_selector, nth_index, near_selector = self._parse_modifiers(selector)
+        if near_selector:
+            return None
+        root = self._compile_selector(self._normalize_selector(base_selector))
+        if root is None:
+            return None
+
+        compiled_fields = []
+        for field_selector in fields.values():
+            # Same parsing as _extract_from_element
+            sub_selector, attr_name = field_selector, None
+            if '@' in field_selector:
+                parts = field_selector.split('@')
+                sub_selector, attr_name = parts[0].strip(), parts[1].strip()
+            sub = None
+            if sub_selector:
+                sub = self._compile_selector(sub_selector)
+                if sub is None:
+                    return None
+            compiled_fields.append({'sub': sub, 'attr': attr_name})
+
+        rows = await self._page.evaluate(_BATCH_EXTRACT_SCRIPT, {
+            'selector': root,
+            'fields': compiled_fields,
+            'index': None if multiple else (nth_index or 0),
+        })
+        if not rows:
+            return None
+
+        names = list(fields)
+        return [dict(zip(names, row)) for row in rows]
+
+    def _compile_selector(self, selector: str) -> Optional[Dict[str, str]]:
+        """
+        Compile a selector for the batched extraction script
+
+        Returns:
+            {'kind': 'css' | 'xpath', 'value': ...}, or None for selectors
+            only Playwright's locator engines understand (text=, role=, ...)
+        """
+        if selector.startswith('xpath='):
+            return {'kind': 'xpath', 'value': selector[6:]}
+        if selector.startswith('//') or selector.startswith('..'):
+            return {'kind': 'xpath', 'value': selector}
+        if selector.startswith('css='):
+            return {'kind': 'css', 'value': selector[4:]}
+        if _ENGINE_PREFIX.match(selector):
+            return None
+        return {'kind': 'css', 'value': selector}
+
     async def _extract_from_element(self,
                                     element: ElementHandle,
                                     fields: Dict[str, str]) -> Dict[str, Any]:
@@ -1127,6 +1303,10 @@ class BrowserDriver:
                     logger.debug("Context close timed out or failed, continuing")
                 self._context = None
 
+            if self._browser and not self._owns_browser:
+                # A context of a shared browser: leave the process running
+                self._browser = None
+
             if self._browser:
                 try:
                     await asyncio.wait_for(self._browser.close(), timeout=_CLOSE_TIMEOUT)
@@ -1241,6 +1421,76 @@ class BrowserDriver:
         """Get HumanBehavior instance (or None if fast mode)."""
         return self._human
 
+    async def new_context(self, proxy: Optional[str] = None) -> 'BrowserDriver':
+        """Open an isolated context (cookies, storage, proxy) on this browser.
+
+        Contexts share the browser process, so each one costs a renderer
+        rather than a whole browser. Requires a browser started with
+        launch(persistent=False); a persistent profile is a single context.
+
+        Args:
+            proxy: Proxy server URL for this context only
+
+        Returns:
+            A driver for the new context. Closing it closes only the context.
+        """
+        if not self._browser or not self._context_options:
+            raise RuntimeError(
+                "new_context() needs a browser started with launch(persistent=False)"
+            )
+        driver = BrowserDriver(
+            headless=self.headless,
+            viewport=self.viewport,
+            browser_type=self.browser_type,
+        )
+        driver._browser = self._browser
+        driver._owns_browser = False
+        driver._context_options = self._context_options
+        driver._human = self._human
+        driver.on_egress_blocked = self.on_egress_blocked
+        await driver._open_context(proxy)
+        return driver
+
+    async def reset_context(self, proxy: Optional[str] = None):
+        """Replace the current context with a fresh one on the same browser.
+
+        Drops cookies, storage, open pages and resource blocking — a clean
+        slate for the next task without relaunching the browser.
+
+        Args:
+            proxy: Proxy server URL for the new context
+        """
+        if not self._browser or not self._context_options:
+            raise RuntimeError(
+                "reset_context() needs a browser started with launch(persistent=False)"
+            )
+        old_context = self._context
+        self._context = None
+        self._page = None
+        if old_context:
+            try:
+                await asyncio.wait_for(old_context.close(), timeout=2)
+            except (asyncio.TimeoutError, Exception):
+                logger.debug("Context close timed out or failed, continuing")
+        await self._open_context(proxy)
+
+    async def _open_context(self, proxy: Optional[str]):
+        """Create this driver's context and page from the launch settings."""
+        options = self._context_options
+        context_kwargs = dict(options['context_kwargs'])
+        if proxy:
+            context_kwargs['proxy'] = {'server': proxy}
+        self._context = await self._browser.new_context(**context_kwargs)
+        if options['stealth']:
+            await self._apply_stealth(options['languages'])
+        self._page = await self._context.new_page()
+        self._current_proxy = proxy
+        self._blocked_resources = set()
+        self._snapshot_since_nav = False
+        self._cached_hints = {}
+        self._hints_url = None
+        await self._install_egress_guard()
+
     async def rotate_proxy(self) -> Optional[str]:
         """Rotate to next proxy from pool. Returns new proxy or None.
 
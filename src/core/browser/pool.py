@@ -5,6 +5,12 @@ Browser Pool — Multiple concurrent browser instances
 
 Each browser instance can have its own proxy, enabling
 parallel scraping with IP rotation.
+
+With contexts_per_browser > 1 the pool hands out browser contexts instead
+of whole browsers: each Chromium process hosts several isolated contexts
+(own cookies, storage and proxy), which gives many more concurrent pages
+per GB of RAM. A context is reset rather than its browser relaunched, and
+can be recycled after max_uses_per_context tasks.
 """
 import asyncio
 import logging
@@ -27,6 +33,14 @@ class PoolTaskError:
         return f"PoolTaskError({self.error!r}, retryable={self.retryable})"
 
 
+class _ContextSlot:
+    """A pooled browser context and the index of the browser hosting it."""
+
+    def __init__(self, host_index: int):
+        self.host_index = host_index
+        self.uses = 0
+
+
 class BrowserPool:
     """Manages a pool of BrowserDriver instances for concurrent operations.
 
@@ -46,16 +60,50 @@ class BrowserPool:
         results = await pool.map(urls, scrape_fn)
 
         await pool.close_all()
+
+    Context pooling (many contexts per browser process):
+        pool = BrowserPool(size=2, contexts_per_browser=8, max_uses_per_context=50)
+        await pool.launch_all(proxy_pool=proxy_pool)   # one proxy per context
+        results = await pool.map(urls, scrape_fn)      # up to 16 pages at once
+
+    In context mode acquire() returns a driver for one context; it is used
+    exactly like a whole-browser driver.
     """
 
-    def __init__(self, size: int = 1):
+    def __init__(self, size: int = 1, contexts_per_browser: int = 1,
+                 max_uses_per_context: int = 0):
         if size < 1:
             raise ValueError("Pool size must be >= 1")
+        if contexts_per_browser < 1:
+            raise ValueError("contexts_per_browser must be >= 1")
+        if max_uses_per_context < 0:
+            raise ValueError("max_uses_per_context must be >= 0")
         self.size = size
+        self.contexts_per_browser = contexts_per_browser
+        # Recycle a context after this many tasks (0 = never)
+        self.max_uses_per_context = max_uses_per_context
         self._browsers: list = []
         self._available: Optional[asyncio.Queue] = None
         self._launched = False
         self._launch_kwargs: Dict[str, Any] = {}
+        self._proxy_pool = None
+        # Context mode: context drivers handed out, keyed by id()
+        self._contexts: Dict[int, Any] = {}
+        self._slots: Dict[int, _ContextSlot] = {}
+        # Serializes host relaunches so one dead browser is relaunched once
+        self._host_lock = asyncio.Lock()
+
+    @property
+    def context_mode(self) -> bool:
+        """Whether the pool hands out contexts rather than whole browsers."""
+        return self.contexts_per_browser > 1 or self.max_uses_per_context > 0
+
+    @property
+    def capacity(self) -> int:
+        """How many drivers can be acquired at once."""
+        if self.context_mode:
+            return self.size * self.contexts_per_browser
+        return self.size
 
     async def launch_all(
         self,
@@ -86,6 +134,23 @@ class BrowserPool:
         self._proxy_pool = proxy_pool
         self._available = asyncio.Queue()
 
+        if self.context_mode:
+            for i in range(self.size):
+                host = await self._launch_host()
+                self._browsers.append(host)
+                for _ in range(self.contexts_per_browser):
+                    proxy = proxy_pool.next() if proxy_pool else None
+                    context = await host.new_context(proxy=proxy)
+                    self._contexts[id(context)] = context
+                    self._slots[id(context)] = _ContextSlot(host_index=i)
+                    await self._available.put(context)
+                logger.info(
+                    f"Pool browser {i + 1}/{self.size} launched "
+                    f"with {self.contexts_per_browser} context(s)"
+                )
+            self._launched = True
+            return
+
         for i in range(self.size):
             proxy = proxy_pool.next() if proxy_pool else None
 
@@ -117,6 +182,57 @@ class BrowserPool:
 
         self._launched = True
 
+    async def _launch_host(self):
+        """Launch a browser process that hosts pooled contexts.
+
+        The host is launched without a proxy (each context gets its own) and
+        without the persistent profile, which cannot hold more contexts.
+        """
+        from .driver import BrowserDriver
+
+        kw = self._launch_kwargs
+        host = BrowserDriver(
+            headless=kw.get('headless', True),
+            viewport=kw.get('viewport'),
+            browser_type=kw.get('browser_type', 'chromium'),
+        )
+        await host.launch(
+            user_agent=kw.get('user_agent'),
+            locale=kw.get('locale'),
+            slow_mo=kw.get('slow_mo', 0),
+            channel=kw.get('channel'),
+            stealth=kw.get('stealth', True),
+            persistent=False,
+        )
+        behavior = kw.get('behavior')
+        if behavior:
+            from .humanize import HumanBehavior
+            host._human = HumanBehavior(behavior)
+        return host
+
+    async def _reset_context(self, context) -> None:
+        """Give a pooled context a fresh state and the next proxy.
+
+        Relaunches the hosting browser first if it has died; contexts of the
+        same host that notice afterwards just reattach to the new process.
+        """
+        slot = self._slots[id(context)]
+        async with self._host_lock:
+            host = self._browsers[slot.host_index]
+            if not host._browser or not host._browser.is_connected():
+                logger.warning(f"Pool browser {slot.host_index + 1} is dead, relaunching")
+                try:
+                    await asyncio.wait_for(host.close(), timeout=5.0)
+                except Exception:
+                    pass
+                host = await self._launch_host()
+                self._browsers[slot.host_index] = host
+        context._browser = host._browser
+        context._human = host._human
+        proxy = self._proxy_pool.next() if self._proxy_pool else None
+        await context.reset_context(proxy=proxy)
+        slot.uses = 0
+
     async def _check_health(self, driver) -> bool:
         """Check if a browser driver is still alive."""
         try:
@@ -188,15 +304,40 @@ class BrowserPool:
 
         # Health check — relaunch if dead
         if not await self._check_health(driver):
-            logger.warning("Acquired browser is dead, relaunching")
-            driver = await self._relaunch_driver(driver)
+            if self.context_mode:
+                logger.warning("Acquired browser context is dead, resetting it")
+                try:
+                    await self._reset_context(driver)
+                except Exception:
+                    # Keep the slot: the next acquire tries again
+                    await self._available.put(driver)
+                    raise
+            else:
+                logger.warning("Acquired browser is dead, relaunching")
+                driver = await self._relaunch_driver(driver)
 
         return driver
 
-    async def release(self, driver):
-        """Return a browser to the pool."""
-        if self._available is not None:
-            await self._available.put(driver)
+    async def release(self, driver, reset: bool = False):
+        """Return a browser to the pool.
+
+        In context mode the context is reset (fresh cookies, storage and the
+        next proxy) when ``reset`` is set or it has served
+        max_uses_per_context tasks.
+        """
+        if self._available is None:
+            return
+        slot = self._slots.get(id(driver))
+        if slot is not None:
+            slot.uses += 1
+            recycle = self.max_uses_per_context and slot.uses >= self.max_uses_per_context
+            if reset or recycle:
+                try:
+                    await self._reset_context(driver)
+                except Exception as e:
+                    # acquire() health-checks it and resets again
+                    logger.warning(f"Pool context reset failed: {e}")
+        await self._available.put(driver)
 
     async def map(self, items: list, fn, max_concurrency: int = 0) -> List[Any]:
         """Execute fn(driver, item) for each item using pool browsers.
@@ -204,7 +345,8 @@ class BrowserPool:
         Args:
             items: List of items to process
             fn: Async function(driver, item) -> result
-            max_concurrency: Max concurrent tasks (0 = pool size)
+            max_concurrency: Max concurrent tasks (0 = pool capacity:
+                             browsers, or contexts in context mode)
 
         Returns:
             List of results in same order as items.
@@ -213,13 +355,14 @@ class BrowserPool:
         if not self._launched:
             raise RuntimeError("Pool not launched. Call launch_all() first.")
 
-        concurrency = max_concurrency or self.size
+        concurrency = max_concurrency or self.capacity
         semaphore = asyncio.Semaphore(concurrency)
         results: List[Any] = [None] * len(items)
 
         async def _worker(idx, item):
             async with semaphore:
                 driver = await self.acquire()
+                is_browser_crash = False
                 try:
                     results[idx] = await fn(driver, item)
                 except Exception as e:
@@ -230,13 +373,20 @@ class BrowserPool:
                     )
                     logger.warning(f"Pool task {idx} failed: {e}")
                 finally:
-                    await self.release(driver)
+                    await self.release(driver, reset=is_browser_crash)
 
         await asyncio.gather(*[_worker(i, item) for i, item in enumerate(items)])
         return results
 
     async def close_all(self):
         """Close all browser instances in the pool."""
+        for context in self._contexts.values():
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close pool context: {e}")
+        self._contexts.clear()
+        self._slots.clear()
         for i, driver in enumerate(self._browsers):
             try:
                 await driver.close()
@@ -254,3 +404,8 @@ class BrowserPool:
     @property
     def browsers(self) -> list:
         return list(self._browsers)
+
+    @property
+    def contexts(self) -> list:
+        """Pooled context drivers (empty unless in context mode)."""
+        return list(self._contexts.values())
@@ -9,6 +9,8 @@ Only fetch when LLM has decided to use a specific module.
 
 from typing import Dict, Any, Mapping, Optional, List
 
+from .search_index import IndexedModule, get_search_index
+
 
 # Settled at registration: the module declares ``provides_capability``,
 # ``ModuleRegistry.register`` assigns ``plugin``. The catalog only forwards them.
@@ -160,10 +162,9 @@ def get_modules_batch(module_ids: List[str]) -> Dict[str, Dict[str, Any]]:
 def _score_module(
     query_words: List[str],
     query_lower: str,
-    module_id: str,
-    meta: Dict[str, Any],
+    entry: IndexedModule,
 ) -> float:
-    """Score a single module against query words.
+    """Score a single indexed module against query words.
 
     Scoring signals (per query word):
     - Exact tag match:       +4
@@ -173,12 +174,10 @@ def _score_module(
     - Partial text match:    +1.5
     All-words bonus:         +3
     """
-    mid_lower = module_id.lower()
-    label = meta.get('ui_label', '').lower()
-    description = meta.get('ui_description', '').lower()
-    tags = [t.lower() for t in meta.get('tags', [])]
-    id_words = mid_lower.replace('.', ' ').replace('_', ' ').split()
-    all_text = set(tags + id_words + label.split())
+    mid_lower = entry.mid_lower
+    label = entry.label
+    description = entry.description
+    tags = entry.tags
 
     score = 0.0
     matched_words = 0
@@ -197,7 +196,7 @@ def _score_module(
         elif word in description:
             score += 1
             word_matched = True
-        elif any(word in t for t in all_text):
+        elif any(word in t for t in entry.words):
             score += 1.5
             word_matched = True
 
@@ -224,6 +223,7 @@ def search_modules(
     query: str,
     category: Optional[str] = None,
     limit: int = 20,
+    lang: str = 'en',
 ) -> List[Dict[str, Any]]:
     """
     Search modules by keyword with multi-signal scoring.
@@ -235,10 +235,11 @@ def search_modules(
     the registry holds them (see :func:`_registry_identity`), so a host can see
     what installing an optional package made available. Both are empty strings
     for the majority of modules, which ship with Core and declare nothing.
-    """
-    from ..modules.registry import ModuleRegistry
 
-    all_metadata = ModuleRegistry.get_all_metadata()
+    Reads the cached per-language index (see ``core.catalog.search_index``)
+    and scores only the modules whose text can contain a query term.
+    """
+    index = get_search_index(lang)
     query_lower = query.lower()
     query_words = [w for w in query_lower.split() if len(w) > 1]
 
@@ -247,24 +248,16 @@ def search_modules(
         query_words = query_lower.replace('.', ' ').split()
 
     results = []
-    for module_id, meta in all_metadata.items():
-        if category and meta.get('category') != category:
+    for entry in index.candidates(query_words + [query_lower]):
+        if category and entry.category != category:
             continue
 
-        score = _score_module(query_words, query_lower, module_id, meta)
+        score = _score_module(query_words, query_lower, entry)
         if score > 0:
-            results.append({
-                'module_id': module_id,
-                'label': meta.get('ui_label', module_id),
-                'description': meta.get('ui_description', ''),
-                'category': meta.get('category', ''),
-                'can_be_start': meta.get('can_be_start', False),
-                # Carried through, not matched on: _score_module never reads
-                # either field, so results say more without matching or
-                # ordering differently.
-                **_registry_identity(meta),
-                'score': score,
-            })
+            # Carried through, not matched on: _score_module never reads
+            # provides_capability or plugin, so results say more without
+            # matching or ordering differently.
+            results.append({**entry.row, 'score': score})
 
     results.sort(key=lambda x: (-x['score'], x['module_id']))
     return results[:limit]
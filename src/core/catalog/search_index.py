@@ -0,0 +1,159 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Catalog Search Index
+
+Prebuilt lookup structure behind :func:`core.catalog.module.search_modules`.
+
+Search used to call ``ModuleRegistry.get_all_metadata()`` per query — a deep
+copy, stability filter and localisation of every module row — and then score
+every module. MCP agents search constantly (``search_modules`` and the
+alternatives ``execute_module`` suggests for an unknown id), so each call paid
+for ~470 metadata copies to return a handful of hits.
+
+The index is built once per (language, environment, registry generation):
+
+- every visible module is reduced to the lower-cased fields scoring reads
+  and the public fields a result carries, so a query allocates nothing per
+  module it does not return;
+- a trigram posting list over module id, label, description and tags.
+
+Scoring is unchanged — it still matches substrings, and it is what decides
+whether a module is a hit. The trigram lists only narrow which modules get
+scored: a term can occur inside a field only if every one of its trigrams
+does, so intersecting the term's posting lists yields a superset of the
+modules it can match. Terms shorter than a trigram skip the narrowing.
+
+Validity follows ``core.capability_manifest``: a cached index is served only
+while ``ModuleRegistry.current_generation()`` equals the generation it was
+built from, and it is built with no cache lock held, because building takes
+the registry lock.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+NGRAM = 3
+
+# Separates fields in the gram source so no gram spans two fields.
+_FIELD_SEP = '\x00'
+
+
+@dataclass(frozen=True)
+class IndexedModule:
+    """One module, reduced to what scoring reads and what a result returns."""
+
+    module_id: str
+    category: str
+    mid_lower: str
+    label: str
+    description: str
+    tags: Tuple[str, ...]
+    words: FrozenSet[str]
+    row: Mapping[str, Any]
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SearchIndex:
+    """Trigram index over one localized, stability-filtered catalog."""
+
+    def __init__(self, metadata: Mapping[str, Mapping[str, Any]], generation: int):
+        from .module import _registry_identity
+
+        self.generation = generation
+        self.entries: List[IndexedModule] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+        for module_id, meta in metadata.items():
+            mid_lower = module_id.lower()
+            label = meta.get('ui_label', '').lower()
+            description = meta.get('ui_description', '').lower()
+            tags = tuple(t.lower() for t in meta.get('tags', []))
+            id_words = mid_lower.replace('.', ' ').replace('_', ' ').split()
+            entry = IndexedModule(
+                module_id=module_id,
+                category=meta.get('category'),
+                mid_lower=mid_lower,
+                label=label,
+                description=description,
+                tags=tags,
+                words=frozenset(tags + tuple(id_words) + tuple(label.split())),
+                row={
+                    'module_id': module_id,
+                    'label': meta.get('ui_label', module_id),
+                    'description': meta.get('ui_description', ''),
+                    'category': meta.get('category', ''),
+                    'can_be_start': meta.get('can_be_start', False),
+                    **_registry_identity(meta),
+                },
+            )
+            position = len(self.entries)
+            self.entries.append(entry)
+            source = _FIELD_SEP.join((mid_lower, label, description) + tags)
+            for gram in _grams(source):
+                self._postings.setdefault(gram, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def candidates(self, terms: Iterable[str]) -> List[IndexedModule]:
+        """Modules in which at least one of ``terms`` may occur, in index order."""
+        matched: Set[int] = set()
+        for term in terms:
+            if len(term) < NGRAM:
+                return self.entries
+            positions: Optional[Set[int]] = None
+            # Rarest gram first keeps the running intersection small.
+            for gram in sorted(_grams(term), key=lambda g: len(self._postings.get(g, ()))):
+                posting = self._postings.get(gram)
+                if not posting:
+                    positions = set()
+                    break
+                positions = set(posting) if positions is None else positions & posting
+                if not positions:
+                    break
+            matched |= positions or set()
+        return [self.entries[i] for i in sorted(matched)]
+
+
+# Same slot discipline as core.capability_manifest: the lock guards the dict
+# and is never held while building, since building takes the registry lock.
+_cache_lock = threading.RLock()
+_indexes: Dict[Tuple[str, str], SearchIndex] = {}
+
+
+def get_search_index(lang: str = 'en') -> SearchIndex:
+    """
+    The search index for ``lang`` in the current environment.
+
+    Rebuilt when the registry generation has moved since it was built;
+    otherwise served as-is (callers must not mutate it).
+    """
+    from ..modules.registry import ModuleRegistry
+    from ..modules.types.stability import get_current_env
+
+    key = (lang, get_current_env())
+    with _cache_lock:
+        index = _indexes.get(key)
+    if index is not None and index.generation == ModuleRegistry.current_generation():
+        return index
+
+    # Read the generation first: if the registry moves during the build, the
+    # index is stamped older than what it holds and the next call rebuilds.
+    generation = ModuleRegistry.current_generation()
+    index = SearchIndex(ModuleRegistry.get_all_metadata(lang=lang), generation)
+    with _cache_lock:
+        current = _indexes.get(key)
+        if current is None or generation >= current.generation:
+            _indexes[key] = index
+    return index
+
+
+def invalidate_search_index() -> None:
+    """Drop every cached index; the next search rebuilds."""
+    with _cache_lock:
+        _indexes.clear()
@@ -19,6 +19,7 @@ DEFAULT_TIMEOUT_MS: int = 30000
 EXPONENTIAL_BACKOFF_BASE: int = 2
 MAX_LOG_RESULT_LENGTH: int = 200
 DEFAULT_MAX_TREE_DEPTH: int = 5
+DEFAULT_DAG_MAX_CONCURRENCY: int = 8
 
 
 # =============================================================================
@@ -0,0 +1,322 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Shared database connection pools for the database.* modules.
+
+database.query, database.insert and database.update used to open a fresh
+``asyncpg.connect`` / ``aiomysql.connect`` on every call and close it again,
+so a foreach over a few thousand rows paid a TCP handshake, authentication
+and backend start-up for each of them — and, run concurrently, could use up
+the server's connection slots.
+
+This module keeps a process-wide set of driver pools (``asyncpg.Pool``,
+``aiomysql.Pool``), keyed by the driver, the full connection settings
+(DSN, or host/port/user/password/database) and the running event loop. A
+call checks a connection out for its duration and hands it back; the pool
+keeps between FLYTO_DB_POOL_MIN_SIZE and FLYTO_DB_POOL_MAX_SIZE connections
+open, so concurrent steps queue for a connection instead of opening more.
+
+Connections go back clean: asyncpg resets a connection on release, and a
+MySQL connection's open transaction (a read leaves one behind) is rolled
+back, so the next caller never sees another step's snapshot.
+
+Pools unused for FLYTO_DB_POOL_IDLE_TIMEOUT_S are closed by the session
+reaper (see session_reaper.py); within a pool, asyncpg also closes
+connections idle that long. SQLite is not pooled: opening a local file is
+cheap, and a shared ``:memory:`` connection would change what the modules
+see. Set FLYTO_DB_POOL=0 to go back to one connection per call.
+
+Environment variables:
+- FLYTO_DB_POOL: 0/false disables pooling (default: enabled)
+- FLYTO_DB_POOL_MIN_SIZE: connections kept open per pool (default: 1)
+- FLYTO_DB_POOL_MAX_SIZE: most connections per pool (default: 10)
+- FLYTO_DB_POOL_IDLE_TIMEOUT_S: idle time before a pool is closed (default: 300)
+"""
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SIZE = 1
+DEFAULT_MAX_SIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT_S = 300.0
+
+POOLED_DATABASES = ("postgresql", "mysql")
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def pooling_enabled() -> bool:
+    """Whether database.* modules share pooled connections (FLYTO_DB_POOL, default on)."""
+    return os.environ.get("FLYTO_DB_POOL", "").strip().lower() not in (
+        "0", "false", "no", "off"
+    )
+
+
+def pool_idle_timeout_s() -> float:
+    """Read the pool idle timeout from FLYTO_DB_POOL_IDLE_TIMEOUT_S, or the default."""
+    return _env_number("FLYTO_DB_POOL_IDLE_TIMEOUT_S", DEFAULT_POOL_IDLE_TIMEOUT_S)
+
+
+def _label(db_type: str, connect: Dict[str, Any]) -> str:
+    """Where a pool connects to, without credentials (for logs and stats)."""
+    if "dsn" in connect:
+        try:
+            parts = urlsplit(connect["dsn"] or "")
+            host = parts.hostname or ""
+            port = f":{parts.port}" if parts.port else ""
+            return f"{db_type}://{host}{port}{parts.path}"
+        except ValueError:
+            return f"{db_type}://?"
+    return f"{db_type}://{connect.get('host', '')}:{connect.get('port', '')}/{connect.get('db') or ''}"
+
+
+@dataclass
+class _DbPool:
+    """One driver pool and its usage bookkeeping."""
+
+    db_type: str
+    pool: Any
+    loop: asyncio.AbstractEventLoop
+    label: str
+    active: int = 0
+    checkouts: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class DbPoolManager:
+    """
+    Process-wide registry of database connection pools.
+
+    Driver pools belong to the event loop they were created on, so the loop
+    is part of the key; pools left behind by a closed loop are dropped the
+    next time the registry is touched.
+    """
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ):
+        self.max_size = max(1, int(
+            max_size if max_size is not None
+            else _env_number("FLYTO_DB_POOL_MAX_SIZE", DEFAULT_MAX_SIZE)
+        ))
+        self.min_size = min(self.max_size, max(0, int(
+            min_size if min_size is not None
+            else _env_number("FLYTO_DB_POOL_MIN_SIZE", DEFAULT_MIN_SIZE)
+        )))
+        self._pools: Dict[Tuple, _DbPool] = {}
+        self._creating: Dict[Tuple, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    @asynccontextmanager
+    async def connection(self, db_type: str, **connect: Any):
+        """
+        A connection to the database ``connect`` describes, for one call.
+
+        ``connect`` is ``dsn=...`` for PostgreSQL, and aiomysql's
+        ``host``/``port``/``user``/``password``/``db`` for MySQL. With
+        pooling disabled the connection is opened here and closed on exit.
+        """
+        if db_type not in POOLED_DATABASES:
+            raise ValueError(f"No connection pool for database type: {db_type}")
+        if not pooling_enabled():
+            conn = await _connect(db_type, connect)
+            try:
+                yield conn
+            finally:
+                await _close_connection(db_type, conn)
+            return
+
+        entry = await self._acquire(db_type, connect)
+        try:
+            async with entry.pool.acquire() as conn:
+                try:
+                    yield conn
+                finally:
+                    if db_type == "mysql":
+                        await _end_transaction(conn)
+        finally:
+            entry.active -= 1
+            entry.last_used = time.monotonic()
+
+    async def _acquire(self, db_type: str, connect: Dict[str, Any]) -> _DbPool:
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        key = (loop, db_type, tuple(sorted(connect.items())))
+        entry = self._pools.get(key)
+        if entry is None:
+            lock = self._creating.setdefault(key, asyncio.Lock())
+            async with lock:
+                entry = self._pools.get(key)
+                if entry is None:
+                    pool = await self._create_pool(db_type, connect)
+                    entry = _DbPool(db_type, pool, loop, _label(db_type, connect))
+                    self._pools[key] = entry
+                    logger.info("Opened database pool for %s", entry.label)
+            self._creating.pop(key, None)
+        entry.active += 1
+        entry.checkouts += 1
+        entry.last_used = time.monotonic()
+        return entry
+
+    async def _create_pool(self, db_type: str, connect: Dict[str, Any]) -> Any:
+        if db_type == "postgresql":
+            import asyncpg
+            return await asyncpg.create_pool(
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=pool_idle_timeout_s(),
+                **connect,
+            )
+        import aiomysql
+        return await aiomysql.create_pool(
+            minsize=self.min_size,
+            maxsize=self.max_size,
+            **connect,
+        )
+
+    def _drop_dead_loops(self) -> None:
+        for key, entry in list(self._pools.items()):
+            if entry.loop.is_closed():
+                # Its sockets died with the loop; nothing left to await
+                del self._pools[key]
+
+    async def close_idle(self, idle_s: Optional[float] = None) -> int:
+        """
+        Close pools on the running loop with no connection checked out for ``idle_s``.
+
+        Returns:
+            Number of pools closed
+        """
+        timeout = idle_s if idle_s is not None else pool_idle_timeout_s()
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        now = time.monotonic()
+        closed = 0
+        for key, entry in list(self._pools.items()):
+            if entry.loop is not loop or entry.active or now - entry.last_used <= timeout:
+                continue
+            del self._pools[key]
+            logger.info("Closing idle database pool for %s", entry.label)
+            await _close_pool(entry)
+            closed += 1
+        return closed
+
+    async def close_all(self) -> int:
+        """Close every pool on the running loop (shutdown). Returns the count."""
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        closed = 0
+        for key, entry in list(self._pools.items()):
+            if entry.loop is not loop:
+                continue
+            del self._pools[key]
+            await _close_pool(entry)
+            closed += 1
+        return closed
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counts and per-database usage, for status endpoints and tests."""
+        now = time.monotonic()
+        pools = [
+            {
+                "database": entry.label,
+                "active": entry.active,
+                "checkouts": entry.checkouts,
+                "idleS": round(now - entry.last_used, 3),
+            }
+            for entry in self._pools.values()
+        ]
+        return {
+            "pools": len(pools),
+            "minSize": self.min_size,
+            "maxSize": self.max_size,
+            "databases": pools,
+        }
+
+
+async def _connect(db_type: str, connect: Dict[str, Any]) -> Any:
+    if db_type == "postgresql":
+        import asyncpg
+        return await asyncpg.connect(**connect)
+    import aiomysql
+    return await aiomysql.connect(**connect)
+
+
+async def _close_connection(db_type: str, conn: Any) -> None:
+    if db_type == "postgresql":
+        await conn.close()
+    else:
+        conn.close()
+        await conn.ensure_closed()
+
+
+async def _end_transaction(conn: Any) -> None:
+    """Roll back whatever a MySQL caller left open before the pool takes it back."""
+    try:
+        await conn.rollback()
+    except Exception:
+        # A broken connection; closed, the pool discards it instead of reusing it
+        logger.debug("Discarding MySQL connection that failed to roll back", exc_info=True)
+        conn.close()
+
+
+async def _close_pool(entry: _DbPool) -> None:
+    if entry.db_type == "postgresql":
+        await entry.pool.close()
+    else:
+        entry.pool.close()
+        await entry.pool.wait_closed()
+
+
+_manager: Optional[DbPoolManager] = None
+
+
+def get_db_pool_manager() -> DbPoolManager:
+    """The process-wide pool manager (created on first use)."""
+    global _manager
+    if _manager is None:
+        _manager = DbPoolManager()
+    return _manager
+
+
+def db_connection(db_type: str, **connect: Any):
+    """
+    A pooled connection for one database.* call.
+
+        async with db_connection('postgresql', dsn=dsn) as conn:
+            await conn.fetch(query)
+    """
+    return get_db_pool_manager().connection(db_type, **connect)
+
+
+async def close_idle_db_pools(idle_s: Optional[float] = None) -> int:
+    """Close idle pools on the running loop; no-op before first use."""
+    if _manager is None:
+        return 0
+    return await _manager.close_idle(idle_s)
+
+
+async def close_all_db_pools() -> int:
+    """Close every pool on the running loop; no-op before first use."""
+    if _manager is None:
+        return 0
+    return await _manager.close_all()
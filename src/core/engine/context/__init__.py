@@ -30,6 +30,11 @@ from .layers import (
     create_context,
     merge_node_output,
 )
+from .snapshot import (
+    ContextSnapshot,
+    CopyOnWriteContext,
+    snapshot_context,
+)
 
 __all__ = [
     # Constants
@@ -41,8 +46,11 @@ __all__ = [
     "SecretExposureError",
     # Classes
     "ContextBuilder",
+    "ContextSnapshot",
+    "CopyOnWriteContext",
     "LayeredContext",
     # Functions
     "create_context",
     "merge_node_output",
+    "snapshot_context",
 ]
@@ -0,0 +1,173 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Context Snapshots
+
+Copy-on-write execution context with O(1) point-in-time snapshots.
+
+CopyOnWriteContext is a plain dict for every reader (modules, resolvers,
+json), but its mutators first hand the previous value of a key to each
+live snapshot. A snapshot therefore shares all unchanged entries with the
+live context and only holds the entries overwritten since it was taken.
+
+Snapshots are shallow: they pin which value each key was bound to, not
+the contents of that value. Step outputs are stored as new objects, so
+this matches how the engine writes context.
+"""
+
+import copy
+import weakref
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+# Marker for keys that did not exist when a snapshot was taken
+_MISSING = object()
+
+
+class ContextSnapshot(Mapping):
+    """
+    Read-only view of a CopyOnWriteContext at the moment it was taken.
+
+    Supports the read side of the dict API (get, items, keys, in, len,
+    copy); copy() and to_dict() return plain dicts.
+    """
+
+    __slots__ = ('_source', '_undo', '__weakref__')
+
+    def __init__(self, source: "CopyOnWriteContext"):
+        self._source = source
+        self._undo: Dict[Any, Any] = {}
+
+    def _preserve(self, key: Any, previous: Any) -> None:
+        """Keep the value a key had when the snapshot was taken."""
+        if key not in self._undo:
+            self._undo[key] = previous
+
+    def __getitem__(self, key: Any) -> Any:
+        undo = self._undo
+        if key in undo:
+            value = undo[key]
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        return dict.__getitem__(self._source, key)
+
+    def __contains__(self, key: Any) -> bool:
+        if key in self._undo:
+            return self._undo[key] is not _MISSING
+        return dict.__contains__(self._source, key)
+
+    def __iter__(self) -> Iterator[Any]:
+        undo = self._undo
+        for key in list(dict.keys(self._source)):
+            if undo.get(key) is not _MISSING:
+                yield key
+        for key, value in list(undo.items()):
+            if value is not _MISSING and not dict.__contains__(self._source, key):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the snapshot as a plain (shallow) dict."""
+        return {key: self[key] for key in self}
+
+    copy = to_dict
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"ContextSnapshot({self.to_dict()!r})"
+
+
+class CopyOnWriteContext(dict):
+    """
+    Execution context dict that supports O(1) snapshots.
+
+    Reads are plain dict reads. Writes cost one extra dict lookup per
+    outstanding snapshot for the first write of each key after it was
+    taken; snapshots that are no longer referenced cost nothing.
+    """
+
+    __slots__ = ('_snapshots',)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Keyed by id(): snapshots compare like dicts, so they are unhashable
+        self._snapshots: "weakref.WeakValueDictionary[int, ContextSnapshot]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def snapshot(self) -> ContextSnapshot:
+        """Take a read-only point-in-time view without copying entries."""
+        snap = ContextSnapshot(self)
+        self._snapshots[id(snap)] = snap
+        return snap
+
+    def _record(self, key: Any) -> None:
+        if self._snapshots:
+            previous = dict.get(self, key, _MISSING)
+            for snap in self._snapshots.values():
+                snap._preserve(key, previous)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._record(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._record(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if dict.__contains__(self, key):
+            self._record(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Any:
+        if self:
+            self._record(next(reversed(self)))
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in list(self):
+            self._record(key)
+        dict.clear(self)
+
+    def __ior__(self, other: Any) -> "CopyOnWriteContext":
+        self.update(other)
+        return self
+
+    def __copy__(self) -> "CopyOnWriteContext":
+        return CopyOnWriteContext(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CopyOnWriteContext":
+        return CopyOnWriteContext(copy.deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        return (CopyOnWriteContext, (dict(self),))
+
+
+def snapshot_context(context: Dict[str, Any]) -> Mapping:
+    """
+    Snapshot any execution context.
+
+    Returns an O(1) ContextSnapshot for a CopyOnWriteContext and a shallow
+    dict copy for plain dicts (e.g. per-iteration foreach contexts).
+    """
+    if isinstance(context, CopyOnWriteContext):
+        return context.snapshot()
+    return dict(context)
@@ -0,0 +1,182 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Evidence Context Codec
+
+Delta encoding for the context snapshots in evidence.jsonl.
+
+Every `keyframe_interval` records (and for the first record of an
+execution) a line carries the full `context_before` / `context_after`.
+Lines in between carry top-level diffs instead:
+
+    {"context_encoding": "delta",
+     "context_before": {"set": {...}, "unset": [...]},  # vs previous context_after
+     "context_after":  {"set": {...}, "unset": [...]},  # vs this context_before
+     ...}
+
+Lines without `context_encoding` (files written before delta encoding)
+are read as keyframes, so old evidence stays loadable.
+
+Entries are matched against the previous context by identity first: the
+engine binds a key to a new object whenever it changes (see
+context/snapshot.py), so an entry still bound to the same object is
+reused as stored and encoded last time. Only entries bound to a new
+object are prepared and encoded, which keeps the cost of a record
+proportional to what its step changed. Like context snapshots this is
+shallow: an object mutated in place keeps the form it was stored with.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+KEYFRAME = "keyframe"
+DELTA = "delta"
+
+# key -> (raw context value, stored value, encoded stored value)
+_Entries = Dict[str, Tuple[Any, Any, str]]
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+class ContextDeltaEncoder:
+    """
+    Encodes one execution's evidence records as keyframes and deltas.
+
+    Entries bound to the same object as in the previous context are
+    unchanged; the others are compared by their encoded form.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int = 20,
+        prepare: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize encoder.
+
+        Args:
+            keyframe_interval: Write a full keyframe every N records
+            prepare: Applied to each context value before storage
+                (e.g. truncation of large values)
+        """
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._prepare = prepare or (lambda value: value)
+        self._entries: Optional[_Entries] = None
+        self._since_keyframe = 0
+
+    def encode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace the record's contexts with their stored form.
+
+        Args:
+            data: Evidence record dict with full context_before/context_after
+                (the live context values, not copies)
+
+        Returns:
+            Record with `context_encoding` set and contexts encoded
+        """
+        before = self._entries_for(data.get('context_before') or {}, self._entries)
+        after = self._entries_for(data.get('context_after') or {}, before)
+
+        if self._entries is None or self._since_keyframe >= self.keyframe_interval - 1:
+            data['context_encoding'] = KEYFRAME
+            data['context_before'] = {k: entry[1] for k, entry in before.items()}
+            data['context_after'] = {k: entry[1] for k, entry in after.items()}
+            self._since_keyframe = 0
+        else:
+            data['context_encoding'] = DELTA
+            data['context_before'] = _diff(self._entries, before)
+            data['context_after'] = _diff(before, after)
+            self._since_keyframe += 1
+
+        self._entries = after
+        return data
+
+    def _entries_for(self, context: Dict[str, Any], base: Optional[_Entries]) -> _Entries:
+        base = base or {}
+        entries: _Entries = {}
+        for key, value in context.items():
+            entry = base.get(key)
+            if entry is None or entry[0] is not value:
+                stored = self._prepare(value)
+                entry = (value, stored, _encode(stored))
+            entries[key] = entry
+        return entries
+
+
+def _diff(base: _Entries, target: _Entries) -> Dict[str, Any]:
+    changed = {}
+    for key, entry in target.items():
+        previous = base.get(key)
+        if previous is None or (previous is not entry and previous[2] != entry[2]):
+            changed[key] = entry[1]
+    removed = [key for key in base if key not in target]
+    return {'set': changed, 'unset': removed}
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a {'set', 'unset'} delta to a context, returning a new dict."""
+    result = dict(base)
+    for key in delta.get('unset', ()):
+        result.pop(key, None)
+    result.update(delta.get('set', {}))
+    return result
+
+
+class ContextDeltaDecoder:
+    """
+    Rebuilds full contexts from records read in file order.
+
+    Each keyframe resets the state, so decoding can start at any keyframe.
+    """
+
+    def __init__(self):
+        self._context: Optional[Dict[str, Any]] = None
+
+    def decode(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore full context_before/context_after on a stored record.
+
+        Args:
+            data: Record as parsed from evidence.jsonl (modified in place)
+
+        Returns:
+            The record without `context_encoding`
+        """
+        encoding = data.pop('context_encoding', KEYFRAME)
+        if encoding == DELTA:
+            if self._context is None:
+                logger.warning(
+                    f"Evidence delta for step {data.get('step_id')} has no keyframe; "
+                    f"rebuilding from an empty context"
+                )
+                self._context = {}
+            before = apply_delta(self._context, data.get('context_before') or {})
+            after = apply_delta(before, data.get('context_after') or {})
+        else:
+            before = data.get('context_before') or {}
+            after = data.get('context_after') or {}
+
+        data['context_before'] = before
+        data['context_after'] = after
+        self._context = after
+        return data
+
+
+def is_keyframe(data: Dict[str, Any]) -> bool:
+    """Whether a stored record carries full contexts."""
+    return data.get('context_encoding', KEYFRAME) != DELTA
+
+
+def iter_decoded_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Parse and decode evidence.jsonl lines in file order."""
+    decoder = ContextDeltaDecoder()
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield decoder.decode(json.loads(line))
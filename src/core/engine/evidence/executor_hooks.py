@@ -4,12 +4,17 @@
 Evidence Executor Hooks
 
 ExecutorHooks wrapper for evidence capture.
+
+Inside a running event loop (the WorkflowEngine's) the async evidence
+hook is scheduled as tasks, chained so pre/post captures keep their call
+order; await flush() once the workflow has finished. Without a running
+loop each call runs to completion with asyncio.run().
 """
 
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from .hook import StepEvidenceHook
 from .models import BrowserContextProtocol
@@ -32,7 +37,7 @@ class EvidenceExecutorHooks:
         from .hooks import CompositeHooks, LoggingHooks
         composite = CompositeHooks([LoggingHooks(), evidence_hooks])
 
-        # Pass to WorkflowEngine
+        # Pass to WorkflowEngine; it awaits flush() when the run ends
         engine = WorkflowEngine(workflow, hooks=composite)
     """
 
@@ -63,6 +68,7 @@ class EvidenceExecutorHooks:
         )
         self._store = store
         self._execution_id = execution_id
+        self._last: Optional[asyncio.Task] = None
 
     def set_browser_context(self, browser_context: BrowserContextProtocol) -> None:
         """Set browser context for screenshot capture"""
@@ -76,11 +82,40 @@ class EvidenceExecutorHooks:
 
     def on_workflow_complete(self, context: Any) -> None:
         """Called when workflow completes successfully"""
-        pass
+        self._schedule(self._hook.flush, "flush")
 
     def on_workflow_failed(self, context: Any) -> None:
         """Called when workflow fails"""
-        pass
+        self._schedule(self._hook.flush, "flush")
+
+    async def flush(self) -> None:
+        """Wait for scheduled captures, then write out this execution's evidence"""
+        if self._last is not None:
+            await asyncio.gather(self._last, return_exceptions=True)
+        await self._hook.flush()
+
+    def _schedule(self, fn: Callable[..., Awaitable[None]], label: str, *args: Any) -> None:
+        """Run ``fn(*args)`` after previously scheduled calls; never raises"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                asyncio.run(fn(*args))
+            except Exception as e:
+                logger.warning(f"Evidence {label} failed: {e}")
+            return
+
+        previous = self._last
+
+        async def run() -> None:
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            try:
+                await fn(*args)
+            except Exception as e:
+                logger.warning(f"Evidence {label} failed: {e}")
+
+        self._last = loop.create_task(run())
 
     def on_module_missing(self, context: Any) -> Any:
         """Called when module is not found"""
@@ -90,29 +125,13 @@ class EvidenceExecutorHooks:
     def on_pre_execute(self, context: Any) -> Any:
         """Called before each step - capture context before"""
         from ..hooks import HookResult
-        try:
-            # Run async hook in sync context
-            asyncio.get_event_loop().run_until_complete(
-                self._hook.on_pre_execute(context)
-            )
-        except RuntimeError:
-            # No event loop running - create one
-            asyncio.run(self._hook.on_pre_execute(context))
-        except Exception as e:
-            logger.warning(f"Evidence pre-execute failed: {e}")
+        self._schedule(self._hook.on_pre_execute, "pre-execute", context)
         return HookResult.continue_execution()
 
     def on_post_execute(self, context: Any) -> Any:
         """Called after each step - capture evidence"""
         from ..hooks import HookResult
-        try:
-            asyncio.get_event_loop().run_until_complete(
-                self._hook.on_post_execute(context)
-            )
-        except RuntimeError:
-            asyncio.run(self._hook.on_post_execute(context))
-        except Exception as e:
-            logger.warning(f"Evidence post-execute failed: {e}")
+        self._schedule(self._hook.on_post_execute, "post-execute", context)
         return HookResult.continue_execution()
 
     def on_error(self, context: Any) -> Any:
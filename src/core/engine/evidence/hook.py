@@ -9,8 +9,9 @@ Hook that captures comprehensive execution evidence.
 import copy
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
+from ..context.snapshot import ContextSnapshot
 from .models import BrowserContextProtocol, StepEvidence
 from .store import EvidenceStore
 
@@ -58,7 +59,7 @@ class StepEvidenceHook:
         self.capture_dom = capture_dom
 
         # Per-step state
-        self._context_before: Dict[str, Any] = {}
+        self._context_before: Mapping[str, Any] = {}
         self._start_time: Optional[datetime] = None
 
     def set_browser_context(self, browser_context: BrowserContextProtocol) -> None:
@@ -73,10 +74,13 @@ class StepEvidenceHook:
             ctx: HookContext from workflow engine
         """
         try:
-            # Deep copy context to capture before state
-            self._context_before = copy.deepcopy(
-                getattr(ctx, 'variables', {})
-            )
+            # Snapshots from the engine already pin the before state;
+            # anything else is deep copied
+            variables = getattr(ctx, 'variables', {})
+            if isinstance(variables, ContextSnapshot):
+                self._context_before = variables
+            else:
+                self._context_before = copy.deepcopy(variables)
             self._start_time = datetime.now()
         except Exception as e:
             logger.warning(f"Failed to capture pre-execute context: {e}")
@@ -116,7 +120,7 @@ class StepEvidenceHook:
                 execution_id=self.execution_id,
                 timestamp=self._start_time or datetime.now(),
                 duration_ms=duration_ms,
-                context_before=self._context_before,
+                context_before=dict(self._context_before),
                 context_after=dict(variables) if variables else {},
                 status='error' if error else 'success',
                 error_message=str(error) if error else None,
@@ -141,6 +145,10 @@ class StepEvidenceHook:
             self._context_before = {}
             self._start_time = None
 
+    async def flush(self) -> None:
+        """Wait until this execution's evidence is written to disk."""
+        await self.store.flush(self.execution_id)
+
     async def _capture_browser_evidence(
         self,
         evidence: StepEvidence,
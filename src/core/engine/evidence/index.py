@@ -0,0 +1,180 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Evidence Index
+
+Sidecar index for evidence.jsonl, written next to it as evidence.idx.
+
+Each index line maps one evidence record to its byte range:
+
+    {"step_id": "step_5", "step_index": 5, "offset": 10240, "length": 812,
+     "keyframe": false}
+
+A lookup seeks to the nearest keyframe at or before the record and
+parses only the records from there to the target (at most one keyframe
+interval). Runs without an index, or whose index does not cover the
+JSONL exactly, get the index rebuilt with one scan.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .codec import ContextDeltaDecoder, is_keyframe
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "evidence.idx"
+
+
+def index_entry(data: Dict[str, Any], offset: int, length: int) -> Dict[str, Any]:
+    """Build the index entry for a stored (encoded) evidence record."""
+    return {
+        'step_id': data.get('step_id'),
+        'step_index': data.get('step_index'),
+        'offset': offset,
+        'length': length,
+        'keyframe': is_keyframe(data),
+    }
+
+
+class EvidenceIndex:
+    """
+    In-memory view of an evidence index.
+
+    Usage:
+        index = EvidenceIndex.open(exec_dir / "evidence.jsonl")
+        position = index.find(step_id="step_5")
+        record = index.read(position)
+    """
+
+    def __init__(self, jsonl_path: Path, entries: List[Dict[str, Any]]):
+        self.jsonl_path = Path(jsonl_path)
+        self.entries = entries
+
+    @classmethod
+    def open(cls, jsonl_path: Path) -> "EvidenceIndex":
+        """
+        Load the index for a JSONL file, rebuilding it when missing or stale.
+
+        Args:
+            jsonl_path: Path to evidence.jsonl
+
+        Returns:
+            EvidenceIndex covering every record in the file
+        """
+        jsonl_path = Path(jsonl_path)
+        index_path = jsonl_path.with_name(INDEX_FILENAME)
+        size = jsonl_path.stat().st_size
+
+        entries = cls._read_entries(index_path)
+        if entries is not None and cls._covers(entries, size):
+            return cls(jsonl_path, entries)
+
+        entries = cls._scan(jsonl_path)
+        cls._write_entries(index_path, entries)
+        return cls(jsonl_path, entries)
+
+    def find(
+        self,
+        step_id: Optional[str] = None,
+        step_index: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Find the first record matching a step id and/or step index.
+
+        Returns:
+            Position of the record in the file, or None if not found
+        """
+        for position, entry in enumerate(self.entries):
+            if step_id is not None and entry.get('step_id') != step_id:
+                continue
+            if step_index is not None and entry.get('step_index') != step_index:
+                continue
+            return position
+        return None
+
+    def read(self, position: int) -> Dict[str, Any]:
+        """
+        Read and decode the record at a position.
+
+        Parses the records from the nearest preceding keyframe up to the
+        target, so the returned record carries full contexts.
+        """
+        start = position
+        while start > 0 and not self.entries[start].get('keyframe', True):
+            start -= 1
+
+        first = self.entries[start]['offset']
+        target = self.entries[position]
+        with open(self.jsonl_path, 'rb') as f:
+            f.seek(first)
+            raw = f.read(target['offset'] + target['length'] - first)
+
+        decoder = ContextDeltaDecoder()
+        record: Dict[str, Any] = {}
+        for line in raw.splitlines():
+            if line.strip():
+                record = decoder.decode(json.loads(line))
+        return record
+
+    # -----------------------------------------------------------------
+    # Index file helpers
+    # -----------------------------------------------------------------
+
+    @staticmethod
+    def _read_entries(index_path: Path) -> Optional[List[Dict[str, Any]]]:
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable evidence index {index_path}: {e}")
+            return None
+
+    @staticmethod
+    def _covers(entries: List[Dict[str, Any]], size: int) -> bool:
+        """Whether entries tile the JSONL file exactly, in order."""
+        expected = 0
+        for entry in entries:
+            if entry.get('offset') != expected:
+                return False
+            expected += entry.get('length', 0)
+        return expected == size
+
+    @staticmethod
+    def _scan(jsonl_path: Path) -> List[Dict[str, Any]]:
+        """Rebuild entries by scanning the JSONL file once."""
+        entries = []
+        offset = 0
+        with open(jsonl_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    entries.append(index_entry(json.loads(line), offset, len(line)))
+                elif entries:
+                    # Blank lines belong to the preceding record's range
+                    entries[-1]['length'] += len(line)
+                offset += len(line)
+
+        if entries and entries[0]['offset'] != 0:
+            # Leading blank lines belong to the first record's range
+            entries[0]['length'] += entries[0]['offset']
+            entries[0]['offset'] = 0
+
+        logger.info(f"Rebuilt evidence index for {jsonl_path} ({len(entries)} records)")
+        return entries
+
+    @staticmethod
+    def _write_entries(index_path: Path, entries: List[Dict[str, Any]]) -> None:
+        tmp_path = index_path.with_name(index_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + '\n')
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            # Read-only evidence (e.g. an archived run): keep the in-memory index
+            logger.debug(f"Could not write evidence index {index_path}: {e}")
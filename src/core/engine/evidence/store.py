@@ -4,14 +4,29 @@
 Evidence Store
 
 Stores execution evidence to filesystem.
+
+Step contexts are delta-encoded against the previous step with periodic
+full keyframes (see codec.py), so evidence size grows with what each
+step changes rather than with the whole context. Records are encoded in
+a worker thread and file writes happen on a background writer (see
+writer.py), so neither runs on the event loop; call flush() at workflow
+completion.
 """
 
+import asyncio
+import dataclasses
 import json
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
+from .codec import ContextDeltaEncoder, iter_decoded_lines
+from .index import EvidenceIndex, index_entry
 from .models import StepEvidence
+from .writer import EvidenceWriter
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +38,8 @@ class EvidenceStore:
     Directory structure:
         evidence/
         ├── exec_abc123/
-        │   ├── evidence.jsonl    # All step metadata
+        │   ├── evidence.jsonl    # All step metadata (delta-encoded contexts)
+        │   ├── evidence.idx      # Byte offsets of each record (see index.py)
         │   ├── step_1.png        # Screenshot
         │   ├── step_1.html       # DOM snapshot
         │   └── ...
@@ -31,11 +47,18 @@ class EvidenceStore:
             └── ...
     """
 
+    # Executions with live delta-encoder state; an evicted execution
+    # simply starts its next record with a keyframe
+    MAX_OPEN_EXECUTIONS = 64
+
     def __init__(
         self,
         base_path: Path,
         capture_context: bool = True,
         max_context_depth: int = 5,
+        keyframe_interval: int = 20,
+        fsync: str = 'none',
+        max_pending_writes: int = 1024,
     ):
         """
         Initialize evidence store.
@@ -44,10 +67,21 @@ class EvidenceStore:
             base_path: Base directory for evidence storage
             capture_context: Whether to capture context snapshots
             max_context_depth: Max nesting depth for context serialization
+            keyframe_interval: Write full contexts every N steps, deltas between
+            fsync: Writer fsync policy: 'none', 'batch' or 'always'
+            max_pending_writes: Queued writes before savers wait for the writer
         """
         self.base_path = Path(base_path)
         self.capture_context = capture_context
         self.max_context_depth = max_context_depth
+        self.keyframe_interval = keyframe_interval
+        self._encoders: "OrderedDict[str, ContextDeltaEncoder]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writer = EvidenceWriter(
+            fsync=fsync,
+            max_pending=max_pending_writes,
+            on_record_failed=self._on_record_failed,
+        )
 
     def get_execution_dir(self, execution_id: str) -> Path:
         """Get/create directory for execution evidence"""
@@ -59,25 +93,28 @@ class EvidenceStore:
         """
         Save evidence metadata to JSONL file.
 
-        Appends to evidence.jsonl in the execution directory.
+        Serializes the record in a worker thread and queues it for the
+        background writer, which appends it to evidence.jsonl in the
+        execution directory. The record's fields are read as they are,
+        without a deep copy: the encoder only serializes the context
+        entries that changed since the previous record.
         """
         try:
-            exec_dir = self.get_execution_dir(evidence.execution_id)
-            jsonl_path = exec_dir / "evidence.jsonl"
-
-            # Serialize to JSON
-            data = evidence.to_dict()
-            # Truncate large context if needed
-            data = self._truncate_large_values(data)
-            line = json.dumps(data, default=str, ensure_ascii=False) + '\n'
+            # Shallow: asdict() would deep-copy both contexts on the loop
+            data = {
+                f.name: getattr(evidence, f.name)
+                for f in dataclasses.fields(evidence)
+            }
 
-            # Append to JSONL file
-            with open(jsonl_path, 'a', encoding='utf-8') as f:
-                f.write(line)
+            await self._writer.wait_for_capacity()
+            await asyncio.to_thread(self._queue_record, data)
 
-            logger.debug(f"Saved evidence for step {evidence.step_id}")
+            logger.debug(f"Queued evidence for step {evidence.step_id}")
 
         except Exception as e:
+            # Restart with a keyframe: the failed record never reached the writer
+            with self._lock:
+                self._encoders.pop(evidence.execution_id, None)
             logger.warning(f"Failed to save evidence for {evidence.step_id}: {e}")
 
     async def save_screenshot(
@@ -87,7 +124,7 @@ class EvidenceStore:
         screenshot_bytes: bytes,
     ) -> str:
         """
-        Save screenshot and return relative path.
+        Queue a screenshot write and return its relative path.
 
         Args:
             execution_id: Execution ID
@@ -98,14 +135,10 @@ class EvidenceStore:
             Relative filename (e.g., "step_1.png")
         """
         try:
-            exec_dir = self.get_execution_dir(execution_id)
             filename = f"{step_id}.png"
-            path = exec_dir / filename
-
-            with open(path, 'wb') as f:
-                f.write(screenshot_bytes)
-
-            logger.debug(f"Saved screenshot: {path}")
+            await self._writer.wait_for_capacity()
+            self._writer.put_file(self.base_path / execution_id / filename, screenshot_bytes)
+            logger.debug(f"Queued screenshot: {filename}")
             return filename
 
         except Exception as e:
@@ -119,7 +152,7 @@ class EvidenceStore:
         dom_html: str,
     ) -> str:
         """
-        Save DOM snapshot and return relative path.
+        Queue a DOM snapshot write and return its relative path.
 
         Args:
             execution_id: Execution ID
@@ -130,20 +163,36 @@ class EvidenceStore:
             Relative filename (e.g., "step_1.html")
         """
         try:
-            exec_dir = self.get_execution_dir(execution_id)
             filename = f"{step_id}.html"
-            path = exec_dir / filename
-
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(dom_html)
-
-            logger.debug(f"Saved DOM snapshot: {path}")
+            await self._writer.wait_for_capacity()
+            self._writer.put_file(
+                self.base_path / execution_id / filename, dom_html.encode('utf-8')
+            )
+            logger.debug(f"Queued DOM snapshot: {filename}")
             return filename
 
         except Exception as e:
             logger.warning(f"Failed to save DOM snapshot for {step_id}: {e}")
             return ""
 
+    async def flush(self, execution_id: Optional[str] = None) -> None:
+        """
+        Wait until all queued evidence is written.
+
+        Call at workflow completion. With an execution_id, the files kept
+        open for that execution are closed as well.
+
+        Args:
+            execution_id: Execution that finished (optional)
+        """
+        await self._writer.flush(
+            self.base_path / execution_id if execution_id else None
+        )
+
+    def close(self) -> None:
+        """Write everything still queued and stop the writer (blocking)."""
+        self._writer.close()
+
     async def load_evidence(self, execution_id: str) -> List[StepEvidence]:
         """
         Load all evidence for an execution.
@@ -154,6 +203,7 @@ class EvidenceStore:
         Returns:
             List of StepEvidence records in execution order
         """
+        await self.flush(execution_id)
         exec_dir = self.base_path / execution_id
         jsonl_path = exec_dir / "evidence.jsonl"
 
@@ -163,11 +213,8 @@ class EvidenceStore:
         evidence_list = []
         try:
             with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        data = json.loads(line)
-                        evidence_list.append(StepEvidence.from_dict(data))
+                for data in iter_decoded_lines(f):
+                    evidence_list.append(StepEvidence.from_dict(data))
         except Exception as e:
             logger.warning(f"Failed to load evidence for {execution_id}: {e}")
 
@@ -176,23 +223,38 @@ class EvidenceStore:
     async def load_step_evidence(
         self,
         execution_id: str,
-        step_id: str,
+        step_id: Optional[str] = None,
+        step_index: Optional[int] = None,
     ) -> Optional[StepEvidence]:
         """
         Load evidence for a specific step.
 
+        Uses the sidecar index to read only the records between the
+        nearest keyframe and the step.
+
         Args:
             execution_id: Execution ID
             step_id: Step ID to find
+            step_index: Step index to find (alternative or addition to step_id)
 
         Returns:
             StepEvidence if found, None otherwise
         """
-        all_evidence = await self.load_evidence(execution_id)
-        for evidence in all_evidence:
-            if evidence.step_id == step_id:
-                return evidence
-        return None
+        await self.flush(execution_id)
+        jsonl_path = self.base_path / execution_id / "evidence.jsonl"
+        if not jsonl_path.exists():
+            return None
+
+        try:
+            with self._lock:
+                index = EvidenceIndex.open(jsonl_path)
+            position = index.find(step_id=step_id, step_index=step_index)
+            if position is None:
+                return None
+            return StepEvidence.from_dict(index.read(position))
+        except Exception as e:
+            logger.warning(f"Failed to load step evidence for {execution_id}/{step_id}: {e}")
+            return None
 
     async def get_screenshot_path(
         self,
@@ -200,6 +262,7 @@ class EvidenceStore:
         step_id: str,
     ) -> Optional[Path]:
         """Get full path to screenshot file if it exists"""
+        await self.flush()
         path = self.base_path / execution_id / f"{step_id}.png"
         return path if path.exists() else None
 
@@ -209,11 +272,13 @@ class EvidenceStore:
         step_id: str,
     ) -> Optional[Path]:
         """Get full path to DOM snapshot file if it exists"""
+        await self.flush()
         path = self.base_path / execution_id / f"{step_id}.html"
         return path if path.exists() else None
 
     async def list_executions(self) -> List[str]:
         """List all execution IDs with evidence"""
+        await self.flush()
         if not self.base_path.exists():
             return []
 
@@ -233,12 +298,58 @@ class EvidenceStore:
             True if deleted, False if not found
         """
         import shutil
+        await self.flush(execution_id)
+        with self._lock:
+            self._encoders.pop(execution_id, None)
         exec_dir = self.base_path / execution_id
         if exec_dir.exists():
             shutil.rmtree(exec_dir)
             return True
         return False
 
+    def _queue_record(self, data: Dict[str, Any]) -> None:
+        """Encode one evidence record and hand it to the writer (worker thread)"""
+        execution_id = data['execution_id']
+        jsonl_path = self.base_path / execution_id / "evidence.jsonl"
+        if isinstance(data.get('timestamp'), datetime):
+            data['timestamp'] = data['timestamp'].isoformat()
+        context_before = data.pop('context_before')
+        context_after = data.pop('context_after')
+        # Truncate large values if needed (contexts are truncated
+        # per entry by the encoder, at the same depth)
+        data = self._truncate_large_values(data)
+        data['context_before'] = context_before
+        data['context_after'] = context_after
+
+        # Encode and queue under one lock so deltas follow file order
+        with self._lock:
+            data = self._get_encoder(execution_id).encode(data)
+            line = json.dumps(data, default=str, ensure_ascii=False) + '\n'
+            self._writer.put_record(
+                jsonl_path, line.encode('utf-8'), index_entry(data, 0, 0)
+            )
+
+    def _get_encoder(self, execution_id: str) -> ContextDeltaEncoder:
+        """Get the delta encoder for an execution (caller holds the lock)"""
+        encoder = self._encoders.get(execution_id)
+        if encoder is None:
+            encoder = ContextDeltaEncoder(
+                keyframe_interval=self.keyframe_interval,
+                # Context entries sit two levels below the record root
+                prepare=lambda value: self._truncate_large_values(value, current_depth=2),
+            )
+            self._encoders[execution_id] = encoder
+            while len(self._encoders) > self.MAX_OPEN_EXECUTIONS:
+                self._encoders.popitem(last=False)
+        else:
+            self._encoders.move_to_end(execution_id)
+        return encoder
+
+    def _on_record_failed(self, jsonl_path: Path) -> None:
+        """Writer callback: restart the execution with a keyframe"""
+        with self._lock:
+            self._encoders.pop(jsonl_path.parent.name, None)
+
     def _truncate_large_values(
         self,
         data: Any,
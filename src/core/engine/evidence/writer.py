@@ -0,0 +1,285 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Evidence Writer
+
+Background writer that keeps evidence file I/O off the event loop.
+
+EvidenceStore serializes records on the caller's side and hands bytes to
+a single writer thread through a queue. The thread keeps each
+execution's evidence.jsonl / evidence.idx open, writes queued jobs in
+batches and flushes once per batch. A thread (rather than a task on one
+event loop) serves every caller, including hooks that save evidence via
+asyncio.run() from synchronous code.
+
+fsync policies:
+    none   - flush to the OS once per batch (default)
+    batch  - additionally fsync every touched file once per batch
+    always - fsync after every record
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .index import INDEX_FILENAME
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ('none', 'batch', 'always')
+
+_RECORD = 'record'
+_FILE = 'file'
+_FLUSH = 'flush'
+_STOP = 'stop'
+
+
+class EvidenceWriter:
+    """
+    Single background thread writing evidence records and artifacts.
+
+    Usage:
+        writer = EvidenceWriter(fsync='batch')
+        await writer.wait_for_capacity()
+        writer.put_record(jsonl_path, payload, entry)
+        await writer.flush()
+    """
+
+    def __init__(
+        self,
+        fsync: str = 'none',
+        max_pending: int = 1024,
+        batch_size: int = 64,
+        max_open_files: int = 64,
+        on_record_failed: Optional[Callable[[Path], None]] = None,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            fsync: One of FSYNC_POLICIES
+            max_pending: Jobs queued before submitters wait for the writer
+            batch_size: Maximum jobs written per flush
+            max_open_files: Executions whose files are kept open at once
+            on_record_failed: Called with the JSONL path when a record
+                could not be written
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.fsync = fsync
+        self.max_pending = max(1, max_pending)
+        self.batch_size = max(1, batch_size)
+        self.max_open_files = max(1, max_open_files)
+        self._on_record_failed = on_record_failed
+
+        self._queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+        self._capacity = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._atexit_registered = False
+
+        # Writer-thread state
+        self._appenders: "OrderedDict[Path, Tuple[IO[bytes], IO[str]]]" = OrderedDict()
+        self._broken: Set[Path] = set()
+
+    # -----------------------------------------------------------------
+    # Submitting side
+    # -----------------------------------------------------------------
+
+    async def wait_for_capacity(self) -> None:
+        """Wait (off the event loop) while the queue is at its bound."""
+        if self._queue.qsize() >= self.max_pending:
+            await asyncio.to_thread(self._wait_capacity)
+
+    def put_record(self, jsonl_path: Path, payload: bytes, entry: Dict[str, Any]) -> None:
+        """Queue one encoded evidence line with its index entry fields."""
+        self._put((_RECORD, Path(jsonl_path), payload, entry))
+
+    def put_file(self, path: Path, content: bytes) -> None:
+        """Queue a whole-file write (screenshot, DOM snapshot)."""
+        self._put((_FILE, Path(path), content))
+
+    async def flush(self, execution_dir: Optional[Path] = None) -> None:
+        """
+        Wait until every job queued so far is written and flushed.
+
+        Args:
+            execution_dir: Also close the files kept open for this
+                execution (e.g. at workflow completion or before reading)
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, execution_dir and Path(execution_dir), done))
+        await asyncio.to_thread(done.wait)
+
+    def close(self) -> None:
+        """Drain the queue, close all files and stop the thread (blocking)."""
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put((_STOP,))
+            thread.join()
+            self._thread = None
+
+    def _put(self, job: Tuple[Any, ...]) -> None:
+        self._ensure_thread()
+        self._queue.put(job)
+
+    def _wait_capacity(self) -> None:
+        with self._capacity:
+            while self._queue.qsize() >= self.max_pending:
+                self._capacity.wait(timeout=1.0)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='evidence-writer', daemon=True
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    # -----------------------------------------------------------------
+    # Writer thread
+    # -----------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self._capacity:
+                self._capacity.notify_all()
+
+            stop = self._write_batch(batch)
+            if stop:
+                self._close_all()
+                return
+
+    def _write_batch(self, batch: List[Tuple[Any, ...]]) -> bool:
+        """Write one batch; returns True when a stop job was seen."""
+        touched: Dict[Path, Tuple[IO[bytes], IO[str]]] = {}
+        for job in batch:
+            kind = job[0]
+            if kind == _RECORD:
+                self._write_record(job[1], job[2], job[3], touched)
+            elif kind == _FILE:
+                self._write_file(job[1], job[2])
+            elif kind == _FLUSH:
+                self._flush_files(touched)
+                touched = {}
+                if job[1] is not None:
+                    self._close_dir(job[1])
+                job[2].set()
+            elif kind == _STOP:
+                self._flush_files(touched)
+                return True
+        self._flush_files(touched)
+        return False
+
+    def _write_record(
+        self,
+        jsonl_path: Path,
+        payload: bytes,
+        entry: Dict[str, Any],
+        touched: Dict[Path, Tuple[IO[bytes], IO[str]]],
+    ) -> None:
+        if jsonl_path in self._broken:
+            if not entry.get('keyframe'):
+                # A delta after a lost record cannot be decoded; wait for
+                # the keyframe the store writes next
+                logger.warning(f"Dropping evidence delta for {entry.get('step_id')} after write failure")
+                return
+            self._broken.discard(jsonl_path)
+
+        try:
+            files = self._open(jsonl_path)
+            data_file, index_file = files
+            offset = data_file.tell()
+            data_file.write(payload)
+            index_file.write(json.dumps(dict(entry, offset=offset, length=len(payload))) + '\n')
+            if self.fsync == 'always':
+                self._sync(files)
+            else:
+                touched[jsonl_path] = files
+        except Exception as e:
+            logger.warning(f"Failed to write evidence for {entry.get('step_id')}: {e}")
+            self._broken.add(jsonl_path)
+            self._close_path(jsonl_path)
+            if self._on_record_failed:
+                self._on_record_failed(jsonl_path)
+
+    @staticmethod
+    def _write_file(path: Path, content: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+        except Exception as e:
+            logger.warning(f"Failed to write evidence file {path}: {e}")
+
+    def _open(self, jsonl_path: Path) -> Tuple[IO[bytes], IO[str]]:
+        files = self._appenders.get(jsonl_path)
+        if files is not None:
+            self._appenders.move_to_end(jsonl_path)
+            return files
+
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        data_file = open(jsonl_path, 'ab')
+        index_file = open(jsonl_path.with_name(INDEX_FILENAME), 'a', encoding='utf-8')
+        files = (data_file, index_file)
+        self._appenders[jsonl_path] = files
+        while len(self._appenders) > self.max_open_files:
+            oldest = next(iter(self._appenders))
+            self._close_path(oldest)
+        return files
+
+    def _flush_files(self, touched: Dict[Path, Tuple[IO[bytes], IO[str]]]) -> None:
+        for files in touched.values():
+            try:
+                if self.fsync == 'batch':
+                    self._sync(files)
+                else:
+                    for f in files:
+                        f.flush()
+            except Exception as e:
+                logger.warning(f"Failed to flush evidence files: {e}")
+
+    @staticmethod
+    def _sync(files: Tuple[IO[bytes], IO[str]]) -> None:
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _close_dir(self, execution_dir: Path) -> None:
+        for path in [p for p in self._appenders if p.parent == execution_dir]:
+            self._close_path(path)
+
+    def _close_path(self, jsonl_path: Path) -> None:
+        files = self._appenders.pop(jsonl_path, None)
+        for f in files or ():
+            try:
+                f.close()
+            except Exception:
+                pass
+
+    def _close_all(self) -> None:
+        for path in list(self._appenders):
+            self._close_path(path)
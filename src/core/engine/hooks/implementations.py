@@ -6,6 +6,7 @@ Hook Implementations
 Concrete implementations of executor hooks.
 """
 
+import inspect
 import logging
 import time
 from typing import Any, Dict, List, Optional
@@ -319,3 +320,14 @@ class CompositeHooks(ExecutorHooks):
 
     def on_retry(self, context: HookContext) -> HookResult:
         return self._call_hooks("on_retry", context)
+
+    async def flush(self) -> None:
+        """Await every hook's async flush(); errors are logged"""
+        for hook in self._hooks:
+            flush = getattr(hook, "flush", None)
+            if not inspect.iscoroutinefunction(flush):
+                continue
+            try:
+                await flush()
+            except Exception as e:
+                logger.warning(f"Hook error in {hook.__class__.__name__}.flush: {e}")
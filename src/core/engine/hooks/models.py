@@ -9,7 +9,7 @@ Enums and data classes for the hooks system.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 class HookAction(Enum):
@@ -41,7 +41,8 @@ class HookContext:
 
     # Execution state
     params: Dict[str, Any] = field(default_factory=dict)
-    variables: Dict[str, Any] = field(default_factory=dict)
+    # Read-only snapshot of the execution context (see context.snapshot)
+    variables: Mapping[str, Any] = field(default_factory=dict)
 
     # Timing
     started_at: Optional[datetime] = None
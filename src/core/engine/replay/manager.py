@@ -14,6 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from ..evidence.codec import iter_decoded_lines
+from ..evidence.index import EvidenceIndex
 from .models import ReplayConfig, ReplayResult
 
 logger = logging.getLogger(__name__)
@@ -82,22 +84,20 @@ class ReplayManager:
             return None
 
         try:
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    data = json.loads(line)
-                    if data.get('step_id') == step_id:
-                        return {
-                            "context_before": data.get('context_before', {}),
-                            "context_after": data.get('context_after', {}),
-                            "step_index": data.get('step_index'),
-                            "module_id": data.get('module_id'),
-                            "status": data.get('status'),
-                            "output": data.get('output', {}),
-                        }
+            # Seek via the sidecar index; contexts are rebuilt from the
+            # nearest keyframe
+            index = EvidenceIndex.open(jsonl_path)
+            position = index.find(step_id=step_id)
+            if position is not None:
+                data = index.read(position)
+                return {
+                    "context_before": data.get('context_before', {}),
+                    "context_after": data.get('context_after', {}),
+                    "step_index": data.get('step_index'),
+                    "module_id": data.get('module_id'),
+                    "status": data.get('status'),
+                    "output": data.get('output', {}),
+                }
 
         except Exception as e:
             logger.error(f"Failed to load state for {execution_id}/{step_id}: {e}")
@@ -125,10 +125,7 @@ class ReplayManager:
         steps = []
         try:
             with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        steps.append(json.loads(line))
+                steps.extend(iter_decoded_lines(f))
         except Exception as e:
             logger.error(f"Failed to load steps for {execution_id}: {e}")
 
@@ -240,8 +237,9 @@ class ReplayManager:
         if not state:
             raise ValueError(f"Cannot load state for {execution_id}/{step_id}")
 
-        # Start with context before the step
-        context = copy.deepcopy(state.get('context_before', {}))
+        # Start with context before the step. State is parsed fresh from
+        # evidence on every load, so nothing else holds these objects.
+        context = dict(state.get('context_before', {}))
 
         # Apply modifications
         if modified_context:
@@ -395,7 +393,7 @@ class ReplayManager:
                 )
 
             # Prepare context
-            context = copy.deepcopy(state.get('context_before', {}))
+            context = dict(state.get('context_before', {}))
             if modified_context:
                 context.update(modified_context)
 
@@ -0,0 +1,33 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Step Result Cache — skip steps whose module, params and inputs are unchanged.
+
+Opt-in per step (`cache:`) or per workflow; see cache.py for the syntax.
+"""
+
+from .cache import (
+    CachePolicy,
+    StepResultCache,
+    compute_cache_key,
+    create_cache_store,
+    get_cache_config,
+)
+from .stores import (
+    DirectoryStepCache,
+    MemoryStepCache,
+    RedisStepCache,
+    StepCacheStore,
+)
+
+__all__ = [
+    "CachePolicy",
+    "StepResultCache",
+    "compute_cache_key",
+    "create_cache_store",
+    "get_cache_config",
+    "StepCacheStore",
+    "MemoryStepCache",
+    "DirectoryStepCache",
+    "RedisStepCache",
+]
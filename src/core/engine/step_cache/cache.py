@@ -0,0 +1,293 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Step Result Cache
+
+Content-addressed cache of step results, the automatic counterpart of
+`pinned_output`.
+
+A step's cache key is a SHA-256 over its module id, module version,
+resolved params and input items. Only modules registered with
+`deterministic=True` are cached, unless the step's `cache:` block vouches
+for the step with `deterministic: true` (e.g. an HTTP GET during recipe
+development). Results that are not JSON-serializable, and failed results,
+are never cached. Item step results (LegacyStepResult) are stored with a
+type tag and their item rows, so a hit returns the same type, with the
+same ItemBatch, as a live run.
+
+Workflow YAML:
+    cache:                 # Workflow-level default (optional)
+      enabled: true        # Cache every deterministic step (default true)
+      ttl: 3600            # Seconds; omitted = no expiry
+      store: memory        # memory | directory | redis
+
+    steps:
+      - id: fetch
+        module: http.get
+        cache:             # or `cache: true` / `cache: false`
+          ttl: 600
+          deterministic: true
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .stores import (
+    DirectoryStepCache,
+    MemoryStepCache,
+    RedisStepCache,
+    StepCacheStore,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_STORES = ('memory', 'directory', 'redis')
+
+# Marks a stored result that is rebuilt into its original type on a hit
+_TYPE_KEY = '__step_cache_type__'
+_LEGACY_STEP_RESULT = 'legacy_step_result'
+
+# Shared by every run in the process, so re-running a recipe hits
+_memory_store: Optional[MemoryStepCache] = None
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching decision for one step."""
+    ttl: Optional[float] = None
+    deterministic: bool = False
+
+
+def _parse_ttl(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        ttl = float(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid cache ttl: {value!r}")
+        return None
+    return ttl if ttl > 0 else None
+
+
+def get_cache_config(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read the workflow-level cache setting.
+
+    Accepts `cache: true` or `cache: {enabled, ttl, store}`.
+
+    Returns:
+        Normalized config dict; `enabled` is False when steps are only
+        cached through their own `cache:` blocks
+    """
+    raw = workflow.get('cache')
+    if raw is True:
+        raw = {}
+    if not isinstance(raw, dict):
+        return {'enabled': False, 'ttl': None, 'store': 'memory'}
+
+    store = raw.get('store', 'memory')
+    if store not in CACHE_STORES:
+        logger.warning(f"Unknown step cache store '{store}', using memory")
+        store = 'memory'
+    return {
+        'enabled': raw.get('enabled', True) is not False,
+        'ttl': _parse_ttl(raw.get('ttl')),
+        'store': store,
+    }
+
+
+def create_cache_store(name: str = 'memory') -> StepCacheStore:
+    """
+    Create the store named in a workflow's cache config.
+
+    Locations come from the environment rather than the workflow:
+    FLYTO_STEP_CACHE_DIR (directory) and FLYTO_STEP_CACHE_REDIS_URL (redis).
+    """
+    global _memory_store
+    if name == 'directory':
+        return DirectoryStepCache(os.environ.get('FLYTO_STEP_CACHE_DIR') or None)
+    if name == 'redis':
+        return RedisStepCache(
+            os.environ.get('FLYTO_STEP_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+        )
+    if _memory_store is None:
+        _memory_store = MemoryStepCache()
+    return _memory_store
+
+
+def compute_cache_key(
+    module_id: str,
+    module_version: str,
+    params: Dict[str, Any],
+    input_items: Optional[List[Any]] = None,
+) -> Optional[str]:
+    """
+    Stable content hash of a step invocation.
+
+    Returns:
+        Hex digest, or None when the params or items are not JSON-serializable
+    """
+    items = None
+    if input_items is not None:
+        items = [
+            {
+                'json': item.json,
+                'binary': {
+                    name: hashlib.sha256(data.data).hexdigest()
+                    for name, data in sorted((item.binary or {}).items())
+                },
+            }
+            for item in input_items
+        ]
+    payload = {
+        'module': module_id,
+        'version': module_version,
+        'params': params,
+        'items': items,
+    }
+    try:
+        text = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class StepResultCache:
+    """
+    Looks up and stores step results for one workflow run.
+
+    Usage:
+        cache = StepResultCache(create_cache_store(), get_cache_config(workflow))
+        policy = cache.policy_for(step_config, module_id)
+        key = cache.key_for(module_id, params, input_items)
+        hit, result = await cache.get(key)
+        ...
+        await cache.put(key, result, policy)
+    """
+
+    def __init__(
+        self,
+        store: Optional[StepCacheStore] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            store: Backend (defaults to the shared in-memory store)
+            config: Workflow-level config from get_cache_config()
+        """
+        self.store = store if store is not None else create_cache_store()
+        self.config = config or {'enabled': False, 'ttl': None, 'store': 'memory'}
+        self.hits = 0
+        self.misses = 0
+        # module_id -> (version, deterministic)
+        self._modules: Dict[str, Tuple[str, bool]] = {}
+
+    def policy_for(self, step_config: Dict[str, Any], module_id: str) -> Optional[CachePolicy]:
+        """
+        Decide whether a step is cached.
+
+        Returns:
+            CachePolicy, or None when the step must run
+        """
+        raw = step_config.get('cache')
+        if raw is None:
+            if not self.config['enabled']:
+                return None
+            raw = {}
+        elif raw is True:
+            raw = {}
+        elif not isinstance(raw, dict) or raw.get('enabled', True) is False:
+            return None
+
+        ttl = _parse_ttl(raw['ttl']) if 'ttl' in raw else self.config['ttl']
+        policy = CachePolicy(ttl=ttl, deterministic=raw.get('deterministic') is True)
+        if not policy.deterministic and not self._module_info(module_id)[1]:
+            return None
+        return policy
+
+    def key_for(
+        self,
+        module_id: str,
+        params: Dict[str, Any],
+        input_items: Optional[List[Any]] = None,
+    ) -> Optional[str]:
+        """Cache key for a step invocation (None = not cacheable)."""
+        return compute_cache_key(module_id, self._module_info(module_id)[0], params, input_items)
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a result.
+
+        Returns:
+            (hit, result) — result is a fresh copy
+        """
+        try:
+            text = await self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Step cache lookup failed: {e}")
+            text = None
+        if text is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, _restore(json.loads(text))
+
+    async def put(self, key: str, result: Any, policy: CachePolicy) -> None:
+        """Store a successful, JSON-serializable result."""
+        if isinstance(result, dict) and result.get('ok') is False:
+            return
+        try:
+            text = json.dumps(_storable(result), ensure_ascii=False)
+        except (TypeError, ValueError):
+            logger.debug("Step result is not JSON-serializable; not caching")
+            return
+        try:
+            await self.store.set(key, text, policy.ttl)
+        except Exception as e:
+            logger.warning(f"Step cache store failed: {e}")
+
+    def _module_info(self, module_id: str) -> Tuple[str, bool]:
+        info = self._modules.get(module_id)
+        if info is None:
+            from ...modules.registry import ModuleRegistry
+            lookup_id = 'template.invoke' if module_id.startswith('template.invoke:') else module_id
+            metadata = ModuleRegistry.get_metadata(lookup_id) or {}
+            info = (str(metadata.get('version', '')), metadata.get('deterministic') is True)
+            self._modules[module_id] = info
+        return info
+
+
+def _storable(result: Any) -> Any:
+    """The JSON form of a result, tagged when it is rebuilt on a hit."""
+    from ...modules.items import LegacyStepResult
+    if not isinstance(result, LegacyStepResult) or result.batch is None:
+        return result
+    # Raw entries: a pending items_full is rebuilt from the batch rows
+    entries = dict(dict.items(result))
+    if entries.get('items') is result.batch.json:
+        del entries['items']
+    return {
+        _TYPE_KEY: _LEGACY_STEP_RESULT,
+        'result': entries,
+        'batch': result.batch.to_dicts(),
+        'pending': result._pending,
+    }
+
+
+def _restore(value: Any) -> Any:
+    """Rebuild a result stored by _storable()."""
+    if not isinstance(value, dict) or value.get(_TYPE_KEY) != _LEGACY_STEP_RESULT:
+        return value
+    from ...modules.items import ItemBatch, LegacyStepResult
+    batch = ItemBatch.from_dicts(value['batch'])
+    entries = value['result']
+    entries.setdefault('items', batch.json)
+    result = LegacyStepResult(entries, batch)
+    result._pending = value['pending']
+    return result
@@ -0,0 +1,183 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Step Cache Stores
+
+Pluggable storage for cached step results.
+
+Stores hold serialized JSON text keyed by the step's content hash, so a
+cached result is always handed back as a fresh copy regardless of the
+backend. Expiry is tracked per entry as an absolute timestamp.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".flyto" / "step-cache"
+DEFAULT_REDIS_PREFIX = "flyto:step-cache:"
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return time.time() + ttl if ttl else None
+
+
+class StepCacheStore(ABC):
+    """Storage backend for the step result cache."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the stored JSON text for a key, or None if absent/expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store JSON text under a key, expiring after ttl seconds (None = never)."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryStepCache(StepCacheStore):
+    """In-process LRU cache; the default store."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, _expires_at(ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DirectoryStepCache(StepCacheStore):
+    """
+    On-disk cache, one JSON file per entry.
+
+    Survives process restarts, so re-running a recipe from the CLI reuses
+    results from the previous run.
+
+    Directory structure:
+        step-cache/
+        ├── 3f/
+        │   └── 3f9a....json   # {"expires_at": ..., "value": "..."}
+        └── ...
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._read, self._entry_path(key))
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        entry = json.dumps({'expires_at': _expires_at(ttl), 'value': value})
+        await asyncio.to_thread(self._write, self._entry_path(key), entry)
+
+    async def clear(self) -> None:
+        import shutil
+        await asyncio.to_thread(shutil.rmtree, self.path, True)
+
+    @staticmethod
+    def _read(path: Path) -> Optional[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unreadable step cache entry {path}: {e}")
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and expires_at <= time.time():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry.get('value')
+
+    @staticmethod
+    def _write(path: Path, entry: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(entry)
+        os.replace(tmp_path, path)
+
+
+class RedisStepCache(StepCacheStore):
+    """
+    Redis-backed cache shared between workers.
+
+    Requires the optional `redis` package (pip install redis). TTLs map to
+    Redis key expiry.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = DEFAULT_REDIS_PREFIX):
+        self.url = url
+        self.prefix = prefix
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                raise ImportError(
+                    "redis package is required for the redis step cache. "
+                    "Install with: pip install redis"
+                )
+            self._client = aioredis.from_url(self.url)
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._get_client().get(self.prefix + key)
+        if value is None:
+            return None
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expiry = max(1, int(ttl)) if ttl else None
+        await self._get_client().set(self.prefix + key, value, ex=expiry)
+
+    async def clear(self) -> None:
+        client = self._get_client()
+        async for redis_key in client.scan_iter(match=f"{self.prefix}*"):
+            await client.delete(redis_key)
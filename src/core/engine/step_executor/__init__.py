@@ -22,6 +22,7 @@ def create_step_executor(
     total_steps: int = 0,
     evolution=None,
     recipe_id: Optional[str] = None,
+    result_cache=None,
 ) -> StepExecutor:
     """
     Create a step executor instance.
@@ -33,6 +34,7 @@ def create_step_executor(
         total_steps: Total steps in workflow
         evolution: Optional StepHealer for self-healing workflows
         recipe_id: Recipe ID for evolution memory tracking
+        result_cache: Optional StepResultCache for `cache:` steps
 
     Returns:
         Configured StepExecutor instance
@@ -44,6 +46,7 @@ def create_step_executor(
         total_steps=total_steps,
         evolution=evolution,
         recipe_id=recipe_id,
+        result_cache=result_cache,
     )
 
 
@@ -10,6 +10,7 @@ import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from ..context.snapshot import snapshot_context
 from ..hooks import HookContext
 
 
@@ -61,7 +62,7 @@ def create_step_context(
         total_steps=total_steps,
         module_id=module_id,
         params=step_params,
-        variables=context.copy(),
+        variables=snapshot_context(context),
         started_at=datetime.fromtimestamp(step_start_time) if step_start_time else None,
         elapsed_ms=elapsed_ms,
         result=result,
@@ -17,12 +17,13 @@ import asyncio
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from ..exceptions import StepTimeoutError, StepExecutionError
 from ..hooks import ExecutorHooks, HookAction
 from .context_builder import create_step_context
 from .foreach import execute_foreach_step
+from .plans import RESOLVED_PARAMS_KEY, execute_plan, has_execution_plan
 from .retry import execute_with_retry
 
 # Phase 0: Runtime invoker for future plugin support
@@ -34,12 +35,16 @@ except ImportError:
     _RUNTIME_INVOKER_AVAILABLE = False
 
 if TYPE_CHECKING:
-    from ..variable_resolver import VariableResolver
+    from ..step_cache import StepResultCache
+    from ..variable_resolver import ResolutionPlan, VariableResolver
     from ...modules.items import Item, NodeExecutionResult, StepInputItems
     from ..trace import StepTrace, TraceCollector
 
 logger = logging.getLogger(__name__)
 
+# Items-mode outcome for items that never ran because an earlier item failed
+_ITEM_SKIPPED = object()
+
 # SECURITY: Patterns for sensitive keys that should be redacted from results
 _SENSITIVE_KEY_PATTERN = re.compile(
     r'(?i)(api[_-]?key|secret|password|token|credential|auth|private[_-]?key|bearer|jwt)',
@@ -63,15 +68,18 @@ def _redact_sensitive_output(data: Any, depth: int = 0) -> Any:
         # Don't redact regular strings - only check dict keys
         return data
 
+    def redact_entry(key: Any, value: Any) -> Any:
+        # Check if key name suggests sensitive data
+        if _SENSITIVE_KEY_PATTERN.search(str(key)):
+            return '[REDACTED]'
+        return _redact_sensitive_output(value, depth + 1)
+
     if isinstance(data, dict):
-        redacted = {}
-        for key, value in data.items():
-            # Check if key name suggests sensitive data
-            if _SENSITIVE_KEY_PATTERN.search(str(key)):
-                redacted[key] = '[REDACTED]'
-            else:
-                redacted[key] = _redact_sensitive_output(value, depth + 1)
-        return redacted
+        from ...modules.items import LegacyStepResult
+        if isinstance(data, LegacyStepResult):
+            # Keeps items_full unbuilt; it is redacted when a hook first reads it
+            return data.map_values(redact_entry)
+        return {key: redact_entry(key, value) for key, value in data.items()}
 
     if isinstance(data, (list, tuple)):
         return [_redact_sensitive_output(item, depth + 1) for item in data]
@@ -99,6 +107,7 @@ class StepExecutor:
         total_steps: int = 0,
         evolution: Optional["StepHealer"] = None,
         recipe_id: Optional[str] = None,
+        result_cache: Optional["StepResultCache"] = None,
     ):
         """
         Initialize step executor.
@@ -110,6 +119,7 @@ class StepExecutor:
             total_steps: Total number of steps in workflow (for hooks)
             evolution: Optional StepHealer for self-healing workflows
             recipe_id: Recipe ID for evolution memory tracking
+            result_cache: Optional step result cache (steps opt in via `cache:`)
         """
         from ..hooks import NullHooks
         self._hooks = hooks or NullHooks()
@@ -118,6 +128,11 @@ class StepExecutor:
         self._total_steps = total_steps
         self._evolution = evolution
         self._recipe_id = recipe_id
+        self._result_cache = result_cache
+
+        # Compiled params per step: step id -> (raw params, ResolutionPlan).
+        # One entry per step, replaced when the step's raw params change.
+        self._resolution_plans: Dict[str, Tuple[Any, "ResolutionPlan"]] = {}
 
     def _create_step_context(
         self,
@@ -342,7 +357,13 @@ class StepExecutor:
         step_id = step_config.get('id', f'step_{id(step_config)}')
         module_id = step_config.get('module')
         step_params = step_config.get('params', {})
-        resolved_params = resolver.resolve(step_params)
+        if step_config.get(RESOLVED_PARAMS_KEY):
+            # Plan child whose task came from resolved data (see plans.py)
+            resolved_params = dict(step_params)
+        else:
+            resolved_params = resolver.resolve_plan(
+                self._get_resolution_plan(resolver, step_id, step_params)
+            )
         resolved_params = self._substitute_local_vars(resolved_params)
         from ..variable_resolver import VariableResolver
         resolved_params = VariableResolver.resolve_tvars(resolved_params)
@@ -379,6 +400,18 @@ class StepExecutor:
                 items=trace_items,
             )
 
+        # Step result cache: key on the inputs before the module sees them
+        cache_key, cache_policy = None, None
+        if self._result_cache is not None:
+            cache_policy = self._result_cache.policy_for(step_config, module_id)
+            if cache_policy is not None:
+                cache_key = self._result_cache.key_for(module_id, resolved_params, input_items)
+            if cache_key is not None:
+                hit, cached = await self._result_cache.get(cache_key)
+                if hit:
+                    logger.info(f"Step '{step_id}': Using cached result (skipping execution)")
+                    return cached
+
         try:
             if retry_config:
                 async def execute_fn():
@@ -386,7 +419,7 @@ class StepExecutor:
                         step_id, module_id, resolved_params, context, timeout, input_items, step_trace
                     )
 
-                return await execute_with_retry(
+                result = await execute_with_retry(
                     step_id=step_id,
                     execute_fn=execute_fn,
                     retry_config=retry_config,
@@ -399,7 +432,7 @@ class StepExecutor:
                     total_steps=self._total_steps,
                 )
             else:
-                return await self._execute_module_with_timeout(
+                result = await self._execute_module_with_timeout(
                     step_id, module_id, resolved_params, context, timeout, input_items, step_trace
                 )
 
@@ -408,6 +441,36 @@ class StepExecutor:
         except StepExecutionError as e:
             return self._handle_step_error(step_id, e, on_error)
 
+        # flow.parallel / flow.batch return a plan; run it for real
+        if has_execution_plan(result):
+            result = await execute_plan(
+                step_config, result, resolver, context, self._execute_single_step, step_index
+            )
+
+        if cache_key is not None:
+            await self._result_cache.put(cache_key, result, cache_policy)
+        return result
+
+    def _get_resolution_plan(
+        self,
+        resolver: "VariableResolver",
+        step_id: str,
+        step_params: Any,
+    ) -> "ResolutionPlan":
+        """
+        Get the compiled resolution plan for a step's raw params.
+
+        Compiled once per executor (i.e. per workflow run) and reused by
+        every foreach iteration and retry of the step while its raw params
+        are the same object or equal to the ones it was compiled from.
+        """
+        cached = self._resolution_plans.get(step_id)
+        if cached is not None and (cached[0] is step_params or cached[0] == step_params):
+            return cached[1]
+        plan = resolver.compile(step_params)
+        self._resolution_plans[step_id] = (step_params, plan)
+        return plan
+
     async def _try_heal(
         self,
         step_config: Dict[str, Any],
@@ -573,55 +636,69 @@ class StepExecutor:
         input_items: Optional[List["Item"]],
         step_trace: Optional["StepTrace"],
     ) -> Any:
-        """Process each input item independently."""
+        """
+        Process each input item independently.
+
+        Items run one at a time unless the module opts in to more
+        throughput: ``max_item_concurrency > 1`` fans execute_item() out
+        over a semaphore, and overriding execute_batch() hands the module
+        chunks of ``item_batch_size`` items. Output order and per-item
+        failure accounting are the same in every strategy.
+        """
         from ...modules.items import (
             Item, ItemContext, NodeExecutionResult, ExecutionStatus,
             ItemError, ExecutionMeta, items_to_legacy_context
         )
 
         items = input_items if input_items is not None else [Item(json={})]
-        output_items = []
-        errors = []
         on_error = params.get('$on_error', 'stop')
+        item_ctx = ItemContext(items=items, totalItems=len(items))
 
-        for i, item in enumerate(items):
-            item_trace = None
-            if step_trace:
-                from ..trace import ItemTrace
-                item_trace = ItemTrace(index=i, input=item.json).start()
+        item_traces = None
+        if step_trace:
+            from ..trace import ItemTrace
+            item_traces = [ItemTrace(index=i, input=item.json) for i, item in enumerate(items)]
+
+        outcomes = await self._run_items(
+            module_instance, items, item_ctx, on_error, item_traces
+        )
+
+        output_items = []
+        errors = []
+        for i, outcome in enumerate(outcomes):
+            if outcome is _ITEM_SKIPPED:
+                continue
+            item_trace = item_traces[i] if item_traces else None
             try:
-                item_ctx = ItemContext(items=items, totalItems=len(items))
-                result_item = await module_instance.execute_item(item, i, item_ctx)
-                if isinstance(result_item, list):
-                    output_items.extend(result_item)
+                if isinstance(outcome, Exception):
+                    if on_error != 'continue':
+                        raise outcome
+                    error_item = Item(
+                        json={},
+                        error=ItemError(message=str(outcome), itemIndex=i)
+                    )
+                    output_items.append(error_item)
+                    errors.append(outcome)
+                    if item_trace:
+                        item_trace.fail(str(outcome))
+                elif isinstance(outcome, list):
+                    output_items.extend(outcome)
                     if item_trace:
                         item_trace.complete({
                             "items": [
                                 (ri.json if isinstance(ri, Item) else Item.from_value(ri).json)
-                                for ri in result_item
+                                for ri in outcome
                             ]
                         })
                 else:
-                    output_items.append(result_item)
+                    output_items.append(outcome)
                     if item_trace:
-                        if isinstance(result_item, Item):
-                            item_trace.complete(result_item.json)
-                        elif isinstance(result_item, dict):
-                            item_trace.complete(result_item)
+                        if isinstance(outcome, Item):
+                            item_trace.complete(outcome.json)
+                        elif isinstance(outcome, dict):
+                            item_trace.complete(outcome)
                         else:
-                            item_trace.complete({"value": result_item})
-            except Exception as e:
-                if on_error == 'continue':
-                    error_item = Item(
-                        json={},
-                        error=ItemError(message=str(e), itemIndex=i)
-                    )
-                    output_items.append(error_item)
-                    errors.append(e)
-                    if item_trace:
-                        item_trace.fail(str(e))
-                else:
-                    raise
+                            item_trace.complete({"value": outcome})
             finally:
                 if item_trace and step_trace:
                     step_trace.add_item_trace(item_trace)
@@ -637,6 +714,82 @@ class StepExecutor:
         )
         return items_to_legacy_context(node_result)
 
+    async def _run_items(
+        self,
+        module_instance: Any,
+        items: List["Item"],
+        item_ctx: Any,
+        on_error: str,
+        item_traces: Optional[List[Any]],
+    ) -> List[Any]:
+        """
+        Run the module over every item and return one outcome per item.
+
+        An outcome is the value execute_item()/execute_batch() produced for
+        that item, or the exception it raised. With on_error 'stop', items
+        not yet started when a failure is seen are marked _ITEM_SKIPPED.
+        """
+        from ...modules.base import BaseModule
+
+        stop_on_error = on_error != 'continue'
+        outcomes: List[Any] = [_ITEM_SKIPPED] * len(items)
+
+        execute_batch = getattr(type(module_instance), 'execute_batch', None)
+        if execute_batch is not None and execute_batch is not BaseModule.execute_batch:
+            batch_size = max(1, int(getattr(module_instance, 'item_batch_size', 100) or 1))
+            for start in range(0, len(items), batch_size):
+                chunk = items[start:start + batch_size]
+                if item_traces:
+                    for trace in item_traces[start:start + len(chunk)]:
+                        trace.start()
+                try:
+                    results = await module_instance.execute_batch(chunk, start, item_ctx)
+                    if not isinstance(results, list) or len(results) != len(chunk):
+                        raise ValueError(
+                            f"execute_batch must return one result per item "
+                            f"({len(chunk)} expected)"
+                        )
+                except Exception as e:
+                    results = [e] * len(chunk)
+                outcomes[start:start + len(chunk)] = results
+                if stop_on_error and any(isinstance(r, Exception) for r in results):
+                    break
+            return outcomes
+
+        concurrency = max(1, int(getattr(module_instance, 'max_item_concurrency', 1) or 1))
+
+        if concurrency == 1:
+            for i, item in enumerate(items):
+                if item_traces:
+                    item_traces[i].start()
+                try:
+                    outcomes[i] = await module_instance.execute_item(item, i, item_ctx)
+                except Exception as e:
+                    outcomes[i] = e
+                    if stop_on_error:
+                        break
+            return outcomes
+
+        semaphore = asyncio.Semaphore(concurrency)
+        failed = False
+
+        async def run_item(i: int, item: "Item") -> None:
+            nonlocal failed
+            async with semaphore:
+                if failed:
+                    return
+                if item_traces:
+                    item_traces[i].start()
+                try:
+                    outcomes[i] = await module_instance.execute_item(item, i, item_ctx)
+                except Exception as e:
+                    outcomes[i] = e
+                    if stop_on_error:
+                        failed = True
+
+        await asyncio.gather(*(run_item(i, item) for i, item in enumerate(items)))
+        return outcomes
+
     async def _execute_all_mode(
         self,
         step_id: str,
@@ -649,7 +802,7 @@ class StepExecutor:
             ExecutionMeta, items_to_legacy_context
         )
 
-        items = input_items or []
+        items = list(input_items) if input_items else []
         item_ctx = ItemContext(items=items, totalItems=len(items))
         output_items = await module_instance.execute_all(items, item_ctx)
 
@@ -664,19 +817,24 @@ class StepExecutor:
         self,
         context: Dict[str, Any],
         upstream_step_ids: Optional[List[str]] = None
-    ) -> Optional[List["Item"]]:
+    ) -> Optional[Sequence["Item"]]:
         """
         Extract input items from context based on upstream steps.
 
+        A single upstream result produced by items_to_legacy_context is
+        passed on as its ItemBatch (json only), without rebuilding an Item
+        per row; items are then created one at a time as the module reads
+        them.
+
         Args:
             context: Workflow context
             upstream_step_ids: List of upstream step IDs to get items from
 
         Returns:
-            List of input items merged from all upstream steps,
+            Input items merged from all upstream steps,
             or None if no upstream info is provided.
         """
-        from ...modules.items import Item
+        from ...modules.items import Item, ItemBatch
 
         if upstream_step_ids is None:
             return None
@@ -689,7 +847,12 @@ class StepExecutor:
             if isinstance(step_result, dict):
                 # Check for items array
                 step_items = step_result.get('items', [])
-                if step_items:
+                batch = getattr(step_result, 'batch', None)
+                if step_items and isinstance(batch, ItemBatch) and step_items is batch.json:
+                    if len(upstream_step_ids) == 1:
+                        return batch.json_only()
+                    items.extend(batch.json_only())
+                elif step_items:
                     for item_data in step_items:
                         items.append(Item.from_value(item_data))
                 elif step_result.get('data'):
@@ -4,8 +4,14 @@
 Foreach Execution
 
 Step execution for each item in an array.
+
+Iterations run sequentially by default. A step may opt into bounded
+parallelism with ``concurrency: N``; each iteration then gets its own
+child context (a shallow copy of the workflow context holding the loop
+variable) so iterations never observe each other's loop state.
 """
 
+import asyncio
 import logging
 from typing import Any, Callable, Coroutine, Dict, List, Optional, TYPE_CHECKING
 
@@ -47,8 +53,7 @@ async def execute_foreach_step(
         Array of results matching input array order
     """
     step_id = step_config.get('id', f'step_{id(step_config)}')
-    on_error = step_config.get('on_error', 'stop')
-    timeout = step_config.get('timeout', 0)
+    concurrency = _get_concurrency(step_config)
 
     resolved_array = resolver.resolve(foreach_array)
 
@@ -60,6 +65,15 @@ async def execute_foreach_step(
 
     logger.info(f"Executing foreach step '{step_id}' with {len(resolved_array)} items")
 
+    if concurrency > 1 and len(resolved_array) > 1:
+        return await _execute_concurrent(
+            step_config, resolver, context, resolved_array, foreach_var,
+            execute_single_fn, step_index, step_trace, concurrency,
+        )
+
+    on_error = step_config.get('on_error', 'stop')
+    timeout = step_config.get('timeout', 0)
+
     results = []
     for index, item in enumerate(resolved_array):
         context[foreach_var] = item
@@ -90,3 +104,75 @@ async def execute_foreach_step(
         del context['__foreach_index__']
 
     return results
+
+
+def _get_concurrency(step_config: Dict[str, Any]) -> int:
+    """Read the step's ``concurrency`` option, defaulting to sequential."""
+    raw = step_config.get('concurrency', 1)
+    try:
+        concurrency = int(raw)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid foreach concurrency {raw!r}, running sequentially")
+        return 1
+    return max(1, concurrency)
+
+
+async def _execute_concurrent(
+    step_config: Dict[str, Any],
+    resolver: "VariableResolver",
+    context: Dict[str, Any],
+    items: List[Any],
+    foreach_var: str,
+    execute_single_fn: Callable[..., Coroutine[Any, Any, Any]],
+    step_index: int,
+    step_trace: Optional["StepTrace"],
+    concurrency: int,
+) -> List[Any]:
+    """
+    Run foreach iterations with at most ``concurrency`` in flight.
+
+    Each iteration resolves params against its own child context, so the
+    shared workflow context is never mutated by the loop. Results keep
+    input order. With on_error 'stop' the first failure cancels the
+    iterations still pending and is raised as the step error.
+    """
+    step_id = step_config.get('id', f'step_{id(step_config)}')
+    on_error = step_config.get('on_error', 'stop')
+    timeout = step_config.get('timeout', 0)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    logger.info(f"Foreach step '{step_id}' running with concurrency {concurrency}")
+
+    async def run_iteration(index: int, item: Any) -> Any:
+        async with semaphore:
+            child_context = dict(context)
+            child_context[foreach_var] = item
+            child_context['__foreach_index__'] = index
+            child_resolver = resolver.with_context(child_context)
+            try:
+                return await execute_single_fn(
+                    step_config, child_resolver, child_context, timeout, step_index, step_trace
+                )
+            except Exception as e:
+                if on_error == 'continue':
+                    logger.warning(
+                        f"Foreach iteration {index} failed, continuing: {str(e)}"
+                    )
+                    return {'ok': False, 'error': str(e), 'index': index}
+                raise StepExecutionError(
+                    step_id,
+                    f"Foreach iteration {index} failed: {str(e)}",
+                    e
+                )
+
+    tasks = [
+        asyncio.ensure_future(run_iteration(index, item))
+        for index, item in enumerate(items)
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,398 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Execution Plans
+
+Runs the plans returned by flow.parallel (`__parallel_execution__`) and
+flow.batch (`__batch_execution__`) and replaces them with real results.
+
+Each task or batch runs as a child step through the executor's
+single-step path, so it gets parameter resolution, retry and timeout
+handling like any other step. Children resolve against their own child
+context (as concurrent foreach iterations do):
+
+- flow.parallel tasks: `{module, params}` definitions, bounded by
+  `concurrency_limit`, with `fail_fast` and an overall `timeout_ms`.
+- flow.batch: the optional `task` runs once per batch with `${batch}` and
+  `${batch_index}` in scope, `parallel_batches` at a time and `delay_ms`
+  between batch starts. Without a task the plan is left for edge routing.
+
+Task params are resolved exactly once. A task written out in the step
+config runs with its raw params, which the child resolver resolves. A
+task that came from data (its definition was itself a `${...}`
+expression) is already resolved, so its child step skips resolution and
+`${...}` text in that data stays literal.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..variable_resolver import VariableResolver
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_PLAN_KEY = '__parallel_execution__'
+BATCH_PLAN_KEY = '__batch_execution__'
+
+# Set on a child step config whose params are already resolved
+RESOLVED_PARAMS_KEY = '$params_resolved'
+
+ExecuteSingleFn = Callable[..., Coroutine[Any, Any, Any]]
+
+
+def has_execution_plan(result: Any) -> bool:
+    """Whether a module result carries a plan for the engine to run."""
+    return isinstance(result, dict) and (PARALLEL_PLAN_KEY in result or BATCH_PLAN_KEY in result)
+
+
+async def execute_plan(
+    step_config: Dict[str, Any],
+    result: Dict[str, Any],
+    resolver: "VariableResolver",
+    context: Dict[str, Any],
+    execute_single_fn: ExecuteSingleFn,
+    step_index: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run the plan in a module result.
+
+    Args:
+        step_config: Config of the flow.parallel / flow.batch step
+        result: Module result holding the plan
+        resolver: Variable resolver of the step
+        context: Current workflow context (not modified)
+        execute_single_fn: StepExecutor._execute_single_step
+        step_index: Index of the step
+
+    Returns:
+        Aggregated result with real per-task results and durations
+    """
+    if PARALLEL_PLAN_KEY in result:
+        return await _execute_parallel_plan(
+            step_config, result[PARALLEL_PLAN_KEY], resolver, context,
+            execute_single_fn, step_index,
+        )
+
+    plan = result[BATCH_PLAN_KEY]
+    task = plan.get('task')
+    if not isinstance(task, dict) or not task.get('module'):
+        return result
+    task = _child_task(step_config.get('params', {}).get('task'), task)
+    return await _execute_batch_plan(
+        step_config, plan, task, resolver, context, execute_single_fn, step_index,
+    )
+
+
+def _child_task(raw: Any, resolved: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The task definition a child step runs from.
+
+    Args:
+        raw: The task as written in the step config
+        resolved: The same task after the step's own resolution
+
+    Returns:
+        The resolved task with the raw params when the config spells the
+        task out, else the resolved task marked as already resolved
+    """
+    if isinstance(raw, dict):
+        return {**resolved, 'params': raw.get('params', {})}
+    return {**resolved, RESOLVED_PARAMS_KEY: True}
+
+
+class _ChildRunner:
+    """Runs child steps of a plan and records their outcome."""
+
+    def __init__(
+        self,
+        step_config: Dict[str, Any],
+        resolver: "VariableResolver",
+        context: Dict[str, Any],
+        execute_single_fn: ExecuteSingleFn,
+        step_index: int,
+    ):
+        self.step_id = step_config.get('id', f'step_{id(step_config)}')
+        self.resolver = resolver
+        self.context = context
+        self.execute_single_fn = execute_single_fn
+        self.step_index = step_index
+
+    async def run(
+        self,
+        entry: Dict[str, Any],
+        child_id: str,
+        task: Dict[str, Any],
+        variables: Dict[str, Any],
+    ) -> bool:
+        """Run one child step, filling `entry`; returns True on success."""
+        child_config = {
+            'id': child_id,
+            'module': task.get('module'),
+            'params': task.get('params', {}),
+            'timeout': task.get('timeout', 0),
+            'on_error': 'stop',
+        }
+        if task.get('retry'):
+            child_config['retry'] = task['retry']
+        if task.get(RESOLVED_PARAMS_KEY):
+            child_config[RESOLVED_PARAMS_KEY] = True
+
+        child_context = dict(self.context)
+        child_context.update(variables)
+        child_resolver = self.resolver.with_context(child_context)
+
+        entry['status'] = 'running'
+        start = time.time()
+        try:
+            output = await self.execute_single_fn(
+                child_config, child_resolver, child_context,
+                child_config['timeout'], self.step_index, None,
+            )
+        except asyncio.CancelledError:
+            entry['status'] = 'cancelled'
+            raise
+        except Exception as e:
+            entry.update(status='failed', error=str(e))
+            return False
+        finally:
+            entry['duration_ms'] = int((time.time() - start) * 1000)
+
+        if isinstance(output, dict) and output.get('ok') is False:
+            entry.update(status='failed', error=output.get('error'), result=output)
+            return False
+        entry.update(status='completed', result=output)
+        return True
+
+
+async def _gather_children(
+    runners: List[Coroutine[Any, Any, bool]],
+    stop_on: Optional[Callable[[bool], bool]],
+    timeout: Optional[float],
+) -> bool:
+    """
+    Run child coroutines until all finish, `stop_on(outcome)` is true for
+    one of them, or the timeout expires. Unfinished children are cancelled.
+
+    Returns:
+        True if the timeout expired
+    """
+    tasks = [asyncio.ensure_future(runner) for runner in runners]
+    deadline = time.monotonic() + timeout if timeout else None
+    timed_out = False
+    try:
+        pending = set(tasks)
+        while pending:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if stop_on and any(stop_on(task.result()) for task in done):
+                break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return timed_out
+
+
+def _mark_unfinished(entries: List[Dict[str, Any]]) -> None:
+    for entry in entries:
+        if entry['status'] in ('pending', 'running'):
+            entry['status'] = 'cancelled'
+
+
+async def _execute_parallel_plan(
+    step_config: Dict[str, Any],
+    plan: Dict[str, Any],
+    resolver: "VariableResolver",
+    context: Dict[str, Any],
+    execute_single_fn: ExecuteSingleFn,
+    step_index: int,
+) -> Dict[str, Any]:
+    """Run flow.parallel tasks and aggregate their results."""
+    runner = _ChildRunner(step_config, resolver, context, execute_single_fn, step_index)
+    tasks = plan.get('tasks', [])
+    raw_tasks = step_config.get('params', {}).get('tasks')
+    if not isinstance(raw_tasks, list) or len(raw_tasks) != len(tasks):
+        raw_tasks = [None] * len(tasks)
+    child_tasks = [
+        _child_task(raw, task) if isinstance(task, dict) else task
+        for raw, task in zip(raw_tasks, tasks)
+    ]
+    mode = plan.get('mode', 'all')
+    fail_fast = plan.get('fail_fast', True)
+    limit = int(plan.get('concurrency_limit') or 0)
+    timeout_ms = plan.get('timeout_ms') or 0
+    semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+    logger.info(
+        f"Parallel step '{runner.step_id}': {len(tasks)} tasks, mode={mode}, "
+        f"concurrency_limit={limit or 'unlimited'}"
+    )
+
+    entries = [{'index': i, 'task': task, 'status': 'pending'} for i, task in enumerate(tasks)]
+
+    if mode == 'race':
+        stop_on = bool
+    elif mode == 'all' and fail_fast:
+        stop_on = lambda ok: not ok  # noqa: E731
+    else:
+        stop_on = None
+    # Set once stop_on fires, so tasks waiting on the semaphore never start
+    halted = asyncio.Event()
+
+    async def run_task(index: int) -> bool:
+        task = child_tasks[index]
+        child_id = f"{runner.step_id}.tasks[{index}]"
+        if not isinstance(task, dict) or not task.get('module'):
+            entries[index].update(status='failed', error="Task is missing 'module'", duration_ms=0)
+            ok = False
+        elif semaphore is None:
+            ok = await runner.run(entries[index], child_id, task, {'task_index': index})
+        else:
+            async with semaphore:
+                if halted.is_set():
+                    return False
+                ok = await runner.run(entries[index], child_id, task, {'task_index': index})
+        if stop_on and stop_on(ok):
+            halted.set()
+        return ok
+
+    start = time.time()
+    timed_out = await _gather_children(
+        [run_task(i) for i in range(len(tasks))],
+        stop_on,
+        timeout_ms / 1000 if timeout_ms > 0 else None,
+    )
+    duration_ms = int((time.time() - start) * 1000)
+    _mark_unfinished(entries)
+
+    completed = [e for e in entries if e['status'] == 'completed']
+    failed = [e for e in entries if e['status'] == 'failed']
+
+    if timed_out:
+        event = 'partial'
+    elif mode == 'race':
+        event = 'completed' if completed else 'error'
+    elif failed:
+        event = 'error' if (mode == 'all' and fail_fast) or not completed else 'partial'
+    else:
+        event = 'completed'
+
+    summary = {
+        'results': entries,
+        'completed_count': len(completed),
+        'failed_count': len(failed),
+        'total_count': len(tasks),
+        'mode': mode,
+        'duration_ms': duration_ms,
+    }
+    if mode == 'race' and completed:
+        summary['winner'] = completed[0]['index']
+        summary['result'] = completed[0]['result']
+
+    response: Dict[str, Any] = {'__event__': event, 'ok': event != 'error', 'outputs': {event: summary}}
+    response.update(summary)
+    if timed_out:
+        response['__error__'] = {
+            'code': 'PARALLEL_TIMEOUT',
+            'message': f'Parallel execution timed out after {timeout_ms}ms',
+        }
+    elif event == 'error':
+        first = failed[0] if failed else None
+        response['__error__'] = {
+            'code': 'PARALLEL_TASK_FAILED',
+            'message': f"Task {first['index']} failed: {first.get('error')}" if first else 'No task completed',
+        }
+    return response
+
+
+async def _execute_batch_plan(
+    step_config: Dict[str, Any],
+    plan: Dict[str, Any],
+    task: Dict[str, Any],
+    resolver: "VariableResolver",
+    context: Dict[str, Any],
+    execute_single_fn: ExecuteSingleFn,
+    step_index: int,
+) -> Dict[str, Any]:
+    """Run the flow.batch task once per batch and aggregate the results."""
+    runner = _ChildRunner(step_config, resolver, context, execute_single_fn, step_index)
+    batches = plan.get('batches', [])
+    parallel = max(1, int(plan.get('parallel_batches') or 1))
+    delay = (plan.get('delay_ms') or 0) / 1000
+    continue_on_error = plan.get('continue_on_error', False)
+    semaphore = asyncio.Semaphore(parallel)
+
+    logger.info(
+        f"Batch step '{runner.step_id}': {len(batches)} batches, {parallel} at a time"
+    )
+
+    entries = [
+        {'batch_index': i, 'size': len(batch), 'status': 'pending'}
+        for i, batch in enumerate(batches)
+    ]
+    # Batch starts are spaced by delay_ms (rate limiting), in batch order
+    start_lock = asyncio.Lock()
+    last_start = [None]
+    halted = asyncio.Event()
+
+    async def run_batch(index: int) -> bool:
+        async with semaphore:
+            if halted.is_set():
+                return False
+            if delay:
+                async with start_lock:
+                    if last_start[0] is not None:
+                        wait = last_start[0] + delay - time.monotonic()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    last_start[0] = time.monotonic()
+            ok = await runner.run(
+                entries[index],
+                f"{runner.step_id}.batches[{index}]",
+                task,
+                {'batch': batches[index], 'batch_index': index},
+            )
+            if not ok and not continue_on_error:
+                halted.set()
+            return ok
+
+    start = time.time()
+    await _gather_children(
+        [run_batch(i) for i in range(len(batches))],
+        None if continue_on_error else (lambda ok: not ok),
+        None,
+    )
+    duration_ms = int((time.time() - start) * 1000)
+    _mark_unfinished(entries)
+
+    failed = [e for e in entries if e['status'] == 'failed']
+    completed = [e for e in entries if e['status'] == 'completed']
+    event = 'error' if failed and not continue_on_error else 'completed'
+
+    summary = {
+        'results': entries,
+        'completed_count': len(completed),
+        'failed_count': len(failed),
+        'total_batches': plan.get('total_batches', len(batches)),
+        'total_items': plan.get('total_items', sum(len(b) for b in batches)),
+        'duration_ms': duration_ms,
+    }
+    response: Dict[str, Any] = {'__event__': event, 'ok': event != 'error', 'outputs': {event: summary}}
+    response.update(summary)
+    if event == 'error':
+        response['__error__'] = {
+            'code': 'BATCH_FAILED',
+            'message': f"Batch {failed[0]['batch_index']} failed: {failed[0].get('error')}",
+        }
+    return response
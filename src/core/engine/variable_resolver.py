@@ -5,14 +5,46 @@ Variable Resolver - Resolve ${...} expressions in workflow parameters
 
 Supports item-based execution variables per ITEM_PIPELINE_SPEC.md Section 4.3
 """
+import copy
 import re
 import os
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+from ..safe_eval import EXPRESSION_CACHE
+
 logger = logging.getLogger(__name__)
 
+# Compiled string kinds (see _compile_string)
+_LITERAL = 0
+_SINGLE_VAR = 1
+_TEMPLATE = 2
+
+# Compiled plan node kinds (see VariableResolver.compile)
+_NODE_CONST = 0
+_NODE_COPY = 1
+_NODE_STRING = 2
+_NODE_DICT = 3
+_NODE_LIST = 4
+
+
+class ResolutionPlan:
+    """
+    Precompiled resolution steps for a raw params tree.
+
+    Built once by VariableResolver.compile(); resolving a plan only walks
+    the precomputed nodes, with paths already split and literal segments
+    already separated, so no regex runs per resolution.
+    """
+
+    __slots__ = ('root', 'is_constant')
+
+    def __init__(self, root: Tuple[Any, ...]):
+        self.root = root
+        self.is_constant = root[0] in (_NODE_CONST, _NODE_COPY)
+
 
 class VariableResolver:
     """
@@ -68,6 +100,23 @@ class VariableResolver:
             'workflow': self.workflow_metadata
         }
 
+    def with_context(self, context: Dict[str, Any]) -> "VariableResolver":
+        """
+        Create a resolver sharing params and builtins but reading another context.
+
+        Used by concurrent foreach iterations, which each resolve against
+        their own child context.
+
+        Args:
+            context: Execution context for the new resolver
+
+        Returns:
+            New VariableResolver bound to ``context``
+        """
+        child = copy.copy(self)
+        child.context = context
+        return child
+
     def resolve(self, value: Any) -> Any:
         """
         Resolve variables in a value
@@ -89,25 +138,69 @@ class VariableResolver:
 
     def _resolve_string(self, text: str) -> Any:
         """Resolve variables in a string"""
-        # Normalize {{...}} (mustache) to ${...} before resolution
-        text = self.MUSTACHE_PATTERN.sub(r'${\1}', text)
-
-        # Check if entire string is a single variable reference
-        match = self.VAR_PATTERN.fullmatch(text)
-        if match:
-            # Return the actual value (might not be a string)
-            value = self._get_variable_value(match.group(1))
+        return self._resolve_compiled_string(_compile_string(text))
+
+    def _resolve_compiled_string(self, compiled: Tuple[Any, ...]) -> Any:
+        """Resolve a string compiled by _compile_string()"""
+        kind = compiled[0]
+        if kind == _LITERAL:
+            return compiled[1]
+
+        if kind == _SINGLE_VAR:
+            # Entire string is a single variable reference:
+            # return the actual value (might not be a string)
+            value = self._lookup(compiled[1])
             if value is not None:
                 return value
             # Preserve unresolved expression (may be resolved later by sub-module)
-            return text
+            return compiled[2]
 
         # Otherwise, replace all variable references with their string representations
-        def replacer(match):
-            value = self._get_variable_value(match.group(1))
-            return str(value) if value is not None else match.group(0)
+        out = []
+        for segment in compiled[1]:
+            if isinstance(segment, str):
+                out.append(segment)
+            else:
+                value = self._lookup(segment[0])
+                out.append(str(value) if value is not None else segment[1])
+        return ''.join(out)
+
+    def compile(self, value: Any) -> ResolutionPlan:
+        """
+        Compile a raw params tree into a reusable resolution plan.
+
+        Strings are pre-parsed into literal segments and pre-split variable
+        paths; subtrees without any variable reference are marked constant
+        and only copied (never re-scanned) when the plan is resolved.
+
+        Args:
+            value: Raw value (string, dict, list, or primitive)
+
+        Returns:
+            ResolutionPlan for resolve_plan()
+        """
+        return ResolutionPlan(_compile_node(value))
+
+    def resolve_plan(self, plan: ResolutionPlan) -> Any:
+        """
+        Resolve a plan built by compile() against the current context.
 
-        return self.VAR_PATTERN.sub(replacer, text)
+        Equivalent to resolve() on the value the plan was compiled from.
+        """
+        return self._resolve_node(plan.root)
+
+    def _resolve_node(self, node: Tuple[Any, ...]) -> Any:
+        """Resolve one compiled plan node"""
+        kind = node[0]
+        if kind == _NODE_STRING:
+            return self._resolve_compiled_string(node[1])
+        if kind == _NODE_DICT:
+            return {k: self._resolve_node(child) for k, child in node[1]}
+        if kind == _NODE_LIST:
+            return [self._resolve_node(child) for child in node[1]]
+        if kind == _NODE_COPY:
+            return _copy_constant(node[1])
+        return node[1]
 
     def _resolve_dict(self, d: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve variables in a dictionary"""
@@ -174,8 +267,10 @@ class VariableResolver:
             ${$item.field} - Current item (in items mode)
             ${$index} - Current item index
         """
-        parts = var_path.split('.')
+        return self._lookup(var_path.split('.'))
 
+    def _lookup(self, parts) -> Any:
+        """Get value for a variable path already split on '.'"""
         if not parts:
             return None
 
@@ -431,35 +526,42 @@ class VariableResolver:
 
         Supports operators: ==, !=, >, <, >=, <=, contains, !contains
 
+        The condition text is split on its operator once and cached in the
+        shared EXPRESSION_CACHE; each call only resolves both sides.
+
         Args:
             condition: Condition string (e.g., "${step1.count} > 0")
 
         Returns:
             Boolean result
         """
-        # Resolve variables in condition first
-        resolved = self._resolve_string(condition)
-
-        # Simple operators
-        operators = [
-            ('==', lambda a, b: a == b),
-            ('!=', lambda a, b: a != b),
-            ('>=', lambda a, b: float(a) >= float(b)),
-            ('<=', lambda a, b: float(a) <= float(b)),
-            ('>', lambda a, b: float(a) > float(b)),
-            ('<', lambda a, b: float(a) < float(b)),
-            ('!contains', lambda a, b: str(b) not in str(a)),
-            ('contains', lambda a, b: str(b) in str(a)),
-        ]
-
-        for op_str, op_func in operators:
-            if op_str in resolved:
-                parts = resolved.split(op_str, 1)
-                if len(parts) == 2:
-                    left = parts[0].strip()
-                    right = parts[1].strip()
+        if not isinstance(condition, str):
+            return self._evaluate_resolved_condition(condition)
+
+        op_func, left, right = EXPRESSION_CACHE.get_or_compile(
+            'condition', condition, _compile_condition
+        )
+        if op_func is None:
+            # No operator in the expression itself: the operator (if any)
+            # comes from the resolved value, e.g. when: ${params.rule}
+            return self._evaluate_resolved_condition(self._resolve_compiled_string(left))
+
+        left_value = str(self._resolve_compiled_string(left)).strip()
+        right_value = str(self._resolve_compiled_string(right)).strip()
+        try:
+            return op_func(left_value, right_value)
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def _evaluate_resolved_condition(resolved: Any) -> bool:
+        """Evaluate an already-resolved condition value"""
+        if isinstance(resolved, str):
+            for op_str, op_func in _CONDITION_OPERATORS:
+                if op_str in resolved:
+                    left, right = resolved.split(op_str, 1)
                     try:
-                        return op_func(left, right)
+                        return op_func(left.strip(), right.strip())
                     except (ValueError, TypeError):
                         return False
 
@@ -470,3 +572,113 @@ class VariableResolver:
             return resolved.lower() in ['true', 'yes', '1']
 
         return bool(resolved)
+
+
+# Condition operators in match order (see VariableResolver.evaluate_condition)
+_CONDITION_OPERATORS = (
+    ('==', lambda a, b: a == b),
+    ('!=', lambda a, b: a != b),
+    ('>=', lambda a, b: float(a) >= float(b)),
+    ('<=', lambda a, b: float(a) <= float(b)),
+    ('>', lambda a, b: float(a) > float(b)),
+    ('<', lambda a, b: float(a) < float(b)),
+    ('!contains', lambda a, b: str(b) not in str(a)),
+    ('contains', lambda a, b: str(b) in str(a)),
+)
+
+
+def _compile_condition(condition: str) -> Tuple[Any, ...]:
+    """
+    Split a condition on its operator once, before any variable resolution.
+
+    Returns (op_func, left, right) with both sides compiled by
+    _compile_string, or (None, whole, None) when the expression text has
+    no operator. Operators are only looked for in the literal text outside
+    ``${...}`` / ``{{...}}`` references, so a path such as
+    ``${check_contains.ok}`` is never split; locating the operator in the
+    expression rather than in the resolved string also keeps substituted
+    values from changing which operator applies.
+    """
+    normalized = VariableResolver.MUSTACHE_PATTERN.sub(r'${\1}', condition)
+    # Same length as normalized, with every reference blanked out
+    literal = VariableResolver.VAR_PATTERN.sub(lambda m: '\0' * len(m.group(0)), normalized)
+    for op_str, op_func in _CONDITION_OPERATORS:
+        position = literal.find(op_str)
+        if position >= 0:
+            left = normalized[:position]
+            right = normalized[position + len(op_str):]
+            return (op_func, _compile_string(left), _compile_string(right))
+    return (None, _compile_string(condition), None)
+
+
+@lru_cache(maxsize=4096)
+def _compile_string(text: str) -> Tuple[Any, ...]:
+    """
+    Pre-parse a parameter string once.
+
+    Returns one of:
+        (_LITERAL, text)                          no variable references
+        (_SINGLE_VAR, parts, unresolved_text)     whole string is ${path}
+        (_TEMPLATE, segments)                     literals mixed with
+                                                  (parts, unresolved) refs
+    """
+    # Normalize {{...}} (mustache) to ${...} before resolution
+    normalized = VariableResolver.MUSTACHE_PATTERN.sub(r'${\1}', text)
+    if '${' not in normalized:
+        return (_LITERAL, normalized)
+
+    match = VariableResolver.VAR_PATTERN.fullmatch(normalized)
+    if match:
+        return (_SINGLE_VAR, tuple(match.group(1).split('.')), normalized)
+
+    segments: List[Any] = []
+    position = 0
+    for match in VariableResolver.VAR_PATTERN.finditer(normalized):
+        if match.start() > position:
+            segments.append(normalized[position:match.start()])
+        segments.append((tuple(match.group(1).split('.')), match.group(0)))
+        position = match.end()
+    if position < len(normalized):
+        segments.append(normalized[position:])
+
+    if len(segments) == 1 and isinstance(segments[0], str):
+        return (_LITERAL, segments[0])
+    return (_TEMPLATE, tuple(segments))
+
+
+def _compile_node(value: Any) -> Tuple[Any, ...]:
+    """Compile one value of a params tree into a plan node."""
+    if isinstance(value, str):
+        compiled = _compile_string(value)
+        if compiled[0] == _LITERAL:
+            return (_NODE_CONST, compiled[1])
+        return (_NODE_STRING, compiled)
+
+    if isinstance(value, dict):
+        children = tuple((k, _compile_node(v)) for k, v in value.items())
+        if all(child[0] in (_NODE_CONST, _NODE_COPY) for _, child in children):
+            return (_NODE_COPY, value)
+        return (_NODE_DICT, children)
+
+    if isinstance(value, list):
+        children = tuple(_compile_node(v) for v in value)
+        if all(child[0] in (_NODE_CONST, _NODE_COPY) for child in children):
+            return (_NODE_COPY, value)
+        return (_NODE_LIST, children)
+
+    return (_NODE_CONST, value)
+
+
+def _copy_constant(value: Any) -> Any:
+    """
+    Copy a constant dict/list subtree.
+
+    resolve() always returns fresh containers, and modules may mutate the
+    params they receive, so constant containers are copied structurally
+    (strings and scalars are shared).
+    """
+    if isinstance(value, dict):
+        return {k: _copy_constant(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_constant(v) for v in value]
+    return value
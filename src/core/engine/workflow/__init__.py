@@ -10,10 +10,12 @@ from .engine import WorkflowEngine
 from .routing import WorkflowRouter
 from .debug import DebugController
 from .output import OutputCollector
+from .scheduler import DagScheduler
 
 __all__ = [
     "WorkflowEngine",
     "WorkflowRouter",
     "DebugController",
     "OutputCollector",
+    "DagScheduler",
 ]
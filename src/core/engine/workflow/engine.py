@@ -11,20 +11,24 @@ Supports:
 - Error handling (on_error: stop/continue/retry)
 - Timeout per step
 - Foreach iteration with result aggregation
+- Content-addressed step result cache (cache:)
 - Workflow-level output definition
 - Executor hooks for lifecycle events
 """
 
 import asyncio
+import inspect
 import logging
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..variable_resolver import VariableResolver
+from ..context.snapshot import CopyOnWriteContext
 from ..hooks import ExecutorHooks, NullHooks, HookContext, HookAction
 from ..exceptions import StepTimeoutError, WorkflowExecutionError, StepExecutionError
 from ..flow_control import is_flow_control_module, is_iteration_module
+from ..step_cache import StepCacheStore, StepResultCache, create_cache_store, get_cache_config
 from ..step_executor import StepExecutor, create_step_executor
 from ..trace import ExecutionTrace, TraceCollector
 from ...constants import WorkflowStatus
@@ -32,6 +36,7 @@ from ...constants import WorkflowStatus
 from .routing import WorkflowRouter
 from .debug import DebugController
 from .output import OutputCollector
+from .scheduler import DagScheduler, get_scheduler_config
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +75,7 @@ class WorkflowEngine:
         step_mode: bool = False,
         initial_context: Optional[Dict[str, Any]] = None,
         enable_trace: bool = False,
+        step_cache: Optional[StepCacheStore] = None,
     ):
         """
         Initialize workflow engine.
@@ -86,10 +92,12 @@ class WorkflowEngine:
             step_mode: If True, pause after each step
             initial_context: Optional initial context to inject
             enable_trace: If True, collect detailed execution trace
+            step_cache: Optional store for cached step results (defaults to
+                the store named by the workflow's `cache:` setting)
         """
         self.workflow = workflow
         self.params = self._parse_params(workflow.get('params', []), params or {})
-        self.context = {}
+        self.context = CopyOnWriteContext()
         self.execution_log = []
 
         self.workflow_id = workflow.get('id', 'unknown')
@@ -125,6 +133,13 @@ class WorkflowEngine:
         # Edges for routing
         self._edges = workflow.get('edges', [])
 
+        # Optional dependency-graph scheduling (scheduler: {mode: dag})
+        self._scheduler_config = get_scheduler_config(workflow)
+
+        # Step result cache (cache: on the workflow or individual steps)
+        self._cache_config = get_cache_config(workflow)
+        self._step_cache_store = step_cache
+
         # Goto tracking
         self._visited_gotos: Dict[str, int] = {}
 
@@ -196,7 +211,7 @@ class WorkflowEngine:
             workflow_id=self.workflow_id,
             workflow_name=self.workflow_name,
             total_steps=self._total_steps,
-            variables=self.context.copy(),
+            variables=self.context.snapshot(),
             started_at=datetime.fromtimestamp(self.start_time) if self.start_time else None,
             elapsed_ms=elapsed_ms,
         )
@@ -225,6 +240,12 @@ class WorkflowEngine:
             total_steps=self._total_steps,
             evolution=self._evolution_healer,
             recipe_id=self._recipe_id,
+            result_cache=StepResultCache(
+                self._step_cache_store
+                if self._step_cache_store is not None
+                else create_cache_store(self._cache_config['store']),
+                self._cache_config,
+            ),
         )
 
         # Initialize trace collector if tracing enabled
@@ -255,7 +276,10 @@ class WorkflowEngine:
             for w in error_edge_warnings:
                 logger.warning(f"Error edge validation: {w['message']}")
 
-            await self._execute_steps(steps)
+            if self._use_dag_scheduler(steps):
+                await self._execute_steps_dag(steps)
+            else:
+                await self._execute_steps(steps)
 
             self.status = WorkflowStatus.COMPLETED
             self.end_time = time.time()
@@ -301,8 +325,19 @@ class WorkflowEngine:
             raise WorkflowExecutionError(f"Workflow execution failed: {str(e)}") from e
 
         finally:
+            await self._flush_hooks()
             await self._cleanup_resources()
 
+    async def _flush_hooks(self) -> None:
+        """Await the hooks' async flush(), if any, so their scheduled work lands"""
+        flush = getattr(self._hooks, 'flush', None)
+        if not inspect.iscoroutinefunction(flush):
+            return
+        try:
+            await flush()
+        except Exception as e:
+            logger.warning(f"Hook flush failed: {e}")
+
     async def _cleanup_resources(self):
         """Clean up resources (browser sessions, etc.) after workflow execution.
 
@@ -397,6 +432,44 @@ class WorkflowEngine:
         if parallel_batch:
             await self._execute_parallel_steps(parallel_batch)
 
+    def _use_dag_scheduler(self, steps: List[Dict[str, Any]]) -> bool:
+        """Check whether the DAG scheduler was requested and can run this workflow."""
+        if not self._scheduler_config:
+            return False
+
+        if self._start_step is not None or self._end_step is not None:
+            reason = "partial execution (start_step/end_step)"
+        elif self._pause_callback or self._debug.get_breakpoints() or self._debug.step_mode:
+            reason = "pause/breakpoint debugging"
+        else:
+            reason = DagScheduler.unsupported_reason(steps, self._router)
+
+        if reason:
+            logger.warning(f"DAG scheduler disabled, running sequentially: {reason}")
+            return False
+        return True
+
+    async def _execute_steps_dag(self, steps: List[Dict[str, Any]]):
+        """Execute workflow steps as soon as their dependencies complete."""
+        scheduler = DagScheduler(max_concurrency=self._scheduler_config['max_concurrency'])
+        scheduler.build(steps, self._router)
+
+        async def run_step(step_idx: int, step: Dict[str, Any]) -> None:
+            step_id = step.get('id', f'step_{step_idx}')
+            self.current_step = step_idx
+            step_status = 'success'
+            step_error = None
+            try:
+                await self._execute_step_with_flow_control(step, step_idx, steps)
+            except Exception as e:
+                step_status = 'failed'
+                step_error = e
+                raise
+            finally:
+                await self._save_checkpoint(step_idx, step_id, step_status, step_error)
+
+        await scheduler.run(steps, run_step, lambda: self._debug.is_cancelled)
+
     async def _handle_pause_check(self, current_idx: int, step_id: str) -> None:
         """Handle pause check before step execution."""
         if self._pause_callback:
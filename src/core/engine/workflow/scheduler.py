@@ -0,0 +1,316 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Workflow DAG Scheduler
+
+Dependency-driven step dispatch for workflows that opt in with:
+
+    scheduler:
+      mode: dag
+      max_concurrency: 8
+
+Dependencies come from data edges, ${...}/{{...}} references, `inputs`
+and explicit `depends_on` lists. Each step runs as soon as the steps it
+reads from have finished, and never before a later-declared step could
+observe a different value than in sequential order:
+
+- read-after-write: a step waits for the last earlier step that produced
+  the name it reads (step id or `output` variable)
+- write-after-read: a step producing a name waits for earlier readers
+- write-after-write: producers of the same name keep declaration order
+- steps that share implicit context state (browser sessions, resource
+  sub-node inputs, LLM agent state, foreach loop variables) keep
+  declaration order among themselves
+
+Only this data-dependency order is kept. Independent steps with side
+effects (file writes, HTTP requests) may run in any order; workflows
+chain them with `depends_on` when their order matters.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ...constants import DEFAULT_DAG_MAX_CONCURRENCY
+from ..flow_control import is_flow_control_module
+from .routing import WorkflowRouter
+
+logger = logging.getLogger(__name__)
+
+# ${expr} and {{expr}} references anywhere in a step's config
+_REFERENCE_PATTERN = re.compile(r'\$\{([^}]+)\}|\{\{([^}]+)\}\}')
+
+# Leading identifier of a reference path (step id or output variable)
+_REFERENCE_ROOT = re.compile(r'^\s*([A-Za-z_][\w-]*)')
+
+# Step config keys that can carry variable references
+_REFERENCE_KEYS = ('params', 'foreach', 'when')
+
+# Module categories that read or write shared context state (browser
+# sessions, reverse-engineering sessions, verification targets, the
+# agent depth and browser the llm modules look at) instead of passing
+# data through ${...} references
+CONTEXT_COUPLED_CATEGORIES = frozenset([
+    'browser',
+    'verify',
+    'reverse',
+    'warroom',
+    'element',
+    'llm',
+])
+
+
+def get_scheduler_config(workflow: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Read the workflow-level scheduler setting.
+
+    Accepts `scheduler: dag` or `scheduler: {mode: dag, max_concurrency: N}`.
+
+    Returns:
+        Normalized config dict, or None when DAG scheduling is not requested
+    """
+    raw = workflow.get('scheduler')
+    if isinstance(raw, str):
+        raw = {'mode': raw}
+    if not isinstance(raw, dict) or raw.get('mode') != 'dag':
+        return None
+
+    try:
+        max_concurrency = int(raw.get('max_concurrency', DEFAULT_DAG_MAX_CONCURRENCY))
+    except (TypeError, ValueError):
+        max_concurrency = DEFAULT_DAG_MAX_CONCURRENCY
+    return {'mode': 'dag', 'max_concurrency': max(1, max_concurrency)}
+
+
+class DagScheduler:
+    """
+    Builds a step dependency graph and dispatches ready steps concurrently.
+
+    Only workflows without routing semantics are eligible: flow control
+    modules, step connections and error edges decide the next step at
+    runtime, so those workflows stay on the sequential path.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_DAG_MAX_CONCURRENCY):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum number of steps running at once
+        """
+        self._max_concurrency = max(1, max_concurrency)
+        self._dependencies: Dict[int, Set[int]] = {}
+        self._order: List[int] = []
+
+    @staticmethod
+    def unsupported_reason(
+        steps: List[Dict[str, Any]],
+        router: WorkflowRouter,
+    ) -> Optional[str]:
+        """
+        Explain why a workflow cannot be DAG-scheduled.
+
+        Returns:
+            Reason string, or None when the workflow is eligible
+        """
+        for step in steps:
+            step_id = step.get('id', '')
+            if is_flow_control_module(step.get('module', '')):
+                return f"step '{step_id}' uses flow control module '{step.get('module')}'"
+            if step.get('connections'):
+                return f"step '{step_id}' declares connections"
+            if f"{step_id}:error" in router.event_routes:
+                return f"step '{step_id}' has an error edge"
+        return None
+
+    @property
+    def dependencies(self) -> Dict[int, Set[int]]:
+        """Get step index -> indices of steps it waits for."""
+        return self._dependencies
+
+    def build(self, steps: List[Dict[str, Any]], router: WorkflowRouter) -> None:
+        """
+        Build the dependency graph for the given steps.
+
+        Every dependency points from a lower step index to a higher one,
+        so the graph is acyclic by construction.
+
+        Args:
+            steps: Workflow steps in declaration order
+            router: Router with the step and edge indices already built
+        """
+        self._order = [
+            idx for idx, step in enumerate(steps)
+            if not router.is_resource_source(step.get('id', f'step_{idx}'))
+        ]
+        self._dependencies = {idx: set() for idx in self._order}
+
+        producers: Dict[str, List[int]] = {}
+        for idx in self._order:
+            for name in self._produced_names(steps[idx]):
+                producers.setdefault(name, []).append(idx)
+
+        last_coupled: Optional[int] = None
+        for idx in self._order:
+            step = steps[idx]
+            deps = self._dependencies[idx]
+
+            for name in self._read_names(step, router):
+                writers = producers.get(name, [])
+                previous = [w for w in writers if w < idx]
+                if previous:
+                    deps.add(previous[-1])
+                later = [w for w in writers if w > idx]
+                if later:
+                    # write-after-read: the next producer waits for this reader
+                    self._dependencies[later[0]].add(idx)
+
+            for name in self._produced_names(step):
+                previous = [w for w in producers[name] if w < idx]
+                if previous:
+                    deps.add(previous[-1])
+
+            if self._is_context_coupled(step, router):
+                if last_coupled is not None:
+                    deps.add(last_coupled)
+                last_coupled = idx
+
+            deps.discard(idx)
+
+    async def run(
+        self,
+        steps: List[Dict[str, Any]],
+        execute_fn: Callable[[int, Dict[str, Any]], Awaitable[Any]],
+        is_cancelled: Callable[[], bool],
+    ) -> None:
+        """
+        Dispatch every step once its dependencies have completed.
+
+        On the first failure no new steps are dispatched, steps still
+        running are cancelled, and the failure of the earliest-declared
+        failed step is raised.
+
+        Args:
+            steps: Workflow steps in declaration order
+            execute_fn: Coroutine executing one step (index, config)
+            is_cancelled: Returns True once the workflow was cancelled
+        """
+        pending = list(self._order)
+        done: Set[int] = set()
+        running: Dict["asyncio.Task[Any]", int] = {}
+        failures: Dict[int, BaseException] = {}
+
+        logger.info(
+            f"DAG scheduler: {len(pending)} steps, max concurrency {self._max_concurrency}"
+        )
+
+        try:
+            while pending or running:
+                if not failures and not is_cancelled():
+                    for idx in list(pending):
+                        if len(running) >= self._max_concurrency:
+                            break
+                        if self._dependencies[idx] <= done:
+                            pending.remove(idx)
+                            task = asyncio.ensure_future(execute_fn(idx, steps[idx]))
+                            running[task] = idx
+
+                if not running:
+                    # Stopped by a failure or cancellation (the graph is acyclic,
+                    # so otherwise some pending step is always ready)
+                    break
+
+                finished, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    idx = running.pop(task)
+                    if task.cancelled():
+                        continue
+                    error = task.exception()
+                    if error is not None:
+                        failures[idx] = error
+                    else:
+                        done.add(idx)
+
+                if failures:
+                    for task in running:
+                        task.cancel()
+        finally:
+            if running:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        if failures:
+            raise failures[min(failures)]
+
+    # -----------------------------------------------------------------
+    # Graph helpers
+    # -----------------------------------------------------------------
+
+    @staticmethod
+    def _produced_names(step: Dict[str, Any]) -> Set[str]:
+        """Context names a step writes: its id and optional output variable."""
+        names = set()
+        if step.get('id'):
+            names.add(step['id'])
+        if isinstance(step.get('output'), str):
+            names.add(step['output'])
+        return names
+
+    @classmethod
+    def _read_names(cls, step: Dict[str, Any], router: WorkflowRouter) -> Set[str]:
+        """Context names a step reads through references, edges or inputs."""
+        names: Set[str] = set()
+        for key in _REFERENCE_KEYS:
+            if key in step:
+                cls._collect_references(step[key], names)
+
+        step_id = step.get('id', '')
+        names.update(router.get_upstream_step_ids(step_id, data_edges_only=False))
+        for key in ('inputs', '$upstream_steps', 'depends_on'):
+            value = step.get(key)
+            if isinstance(value, str):
+                names.add(value)
+            elif isinstance(value, list):
+                names.update(v for v in value if isinstance(v, str))
+
+        names.discard(step_id)
+        return names
+
+    @classmethod
+    def _collect_references(cls, value: Any, names: Set[str]) -> None:
+        """Collect the root name of every variable reference in a value."""
+        if isinstance(value, str):
+            if '${' not in value and '{{' not in value:
+                return
+            for match in _REFERENCE_PATTERN.finditer(value):
+                expr = match.group(1) or match.group(2)
+                if expr.startswith('steps.'):
+                    expr = expr[len('steps.'):]
+                root = _REFERENCE_ROOT.match(expr)
+                if root:
+                    names.add(root.group(1))
+        elif isinstance(value, dict):
+            for item in value.values():
+                cls._collect_references(item, names)
+        elif isinstance(value, list):
+            for item in value:
+                cls._collect_references(item, names)
+
+    @staticmethod
+    def _is_context_coupled(step: Dict[str, Any], router: WorkflowRouter) -> bool:
+        """Whether a step shares implicit context state with other steps."""
+        module_id = step.get('module') or ''
+        if module_id.split('.', 1)[0] in CONTEXT_COUPLED_CATEGORIES:
+            return True
+        # The engine hands agent modules their notifier through context['_agent_notify']
+        if 'agent' in module_id:
+            return True
+        # A foreach writes its loop variable and __foreach_index__ into the context
+        if step.get('foreach'):
+            return True
+        # Resource sub-nodes are injected through the shared context['inputs']
+        return bool(router.get_resource_sources(step.get('id', '')))
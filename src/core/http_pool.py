@@ -0,0 +1,336 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Shared outbound HTTP connection pools.
+
+Until now every http.* call built its own ``guarded_client_session`` — and
+http.request built one per retry attempt — so a foreach over a few thousand
+API calls paid a fresh TCP (and TLS) handshake for each of them.
+
+This module keeps a process-wide set of keep-alive ``TCPConnector`` pools,
+keyed by the target origin (scheme, host, port), the SSRF settings in force
+and the running event loop. Each call still gets its own short-lived
+``ClientSession`` (its own timeout and cookie jar, so nothing leaks between
+workflow steps); only the connector underneath is shared, with
+``connector_owner=False`` so closing the session leaves the pool warm.
+
+Security: the connectors come from ``ssrf_guarded_connector``, so the
+DNS-rebinding guard still vets every connect-time resolution. The key
+includes the guard's configuration (allow_private, FLYTO_ALLOWED_HOSTS, a
+trusted outbound scope), so a connection opened under one policy is never
+handed to a call running under another. aiohttp already keys idle
+connections by host, port and ``ssl`` argument, which keeps verified and
+``verify_ssl=False`` connections apart.
+
+Sharing a connector must not add queueing the per-call connectors never
+had: time spent waiting for a free connection counts against a request's
+``ClientTimeout(total)``. So a pool has no overall connection cap and, by
+default, no per-host cap either; FLYTO_HTTP_POOL_LIMIT_PER_HOST sets one for
+deployments that want to bound the load they put on a single upstream.
+
+Pools unused for FLYTO_HTTP_POOL_IDLE_TIMEOUT_S are closed by the session
+reaper (see session_reaper.py). Set FLYTO_HTTP_POOL=0 to go back to one
+connector per call.
+
+Environment variables:
+- FLYTO_HTTP_POOL: 0/false disables pooling (default: enabled)
+- FLYTO_HTTP_POOL_LIMIT_PER_HOST: concurrent connections per host, 0 for no cap (default: 0)
+- FLYTO_HTTP_POOL_KEEPALIVE_S: idle keep-alive per connection (default: 30)
+- FLYTO_HTTP_POOL_IDLE_TIMEOUT_S: idle time before a pool is closed (default: 300)
+"""
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .utils import (
+    get_ssrf_config,
+    guarded_client_session,
+    ssrf_guarded_connector,
+    ssrf_protection_enabled,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT_PER_HOST = 0
+DEFAULT_KEEPALIVE_S = 30.0
+DEFAULT_POOL_IDLE_TIMEOUT_S = 300.0
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def pooling_enabled() -> bool:
+    """Whether http.* modules share pooled connectors (FLYTO_HTTP_POOL, default on)."""
+    return os.environ.get("FLYTO_HTTP_POOL", "").strip().lower() not in (
+        "0", "false", "no", "off"
+    )
+
+
+def pool_idle_timeout_s() -> float:
+    """Read the pool idle timeout from FLYTO_HTTP_POOL_IDLE_TIMEOUT_S, or the default."""
+    return _env_float("FLYTO_HTTP_POOL_IDLE_TIMEOUT_S", DEFAULT_POOL_IDLE_TIMEOUT_S)
+
+
+def _origin(url: str) -> Tuple[str, str, Optional[int]]:
+    try:
+        parts = urlsplit(url or "")
+        return (parts.scheme.lower(), (parts.hostname or "").lower(), parts.port)
+    except ValueError:
+        return ("", "", None)
+
+
+def _security_key() -> Tuple:
+    """The SSRF settings a connector's resolver was built with."""
+    if not ssrf_protection_enabled():
+        return ("unguarded",)
+    cfg = get_ssrf_config()
+    restricted = cfg.get("restricted_hosts")
+    return (
+        "guarded",
+        bool(cfg.get("allow_private", False)),
+        tuple(sorted(cfg.get("allowed_hosts") or ())),
+        tuple(sorted(restricted)) if restricted is not None else None,
+    )
+
+
+@dataclass
+class _Pool:
+    """One shared connector and its usage bookkeeping."""
+
+    connector: aiohttp.TCPConnector
+    loop: asyncio.AbstractEventLoop
+    active: int = 0
+    sessions: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class HttpPoolManager:
+    """
+    Process-wide registry of SSRF-guarded keep-alive connectors.
+
+    Connectors belong to the event loop they were created on, so the loop is
+    part of the key; pools left behind by a closed loop are dropped the next
+    time the registry is touched.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: Optional[int] = None,
+        keepalive_s: Optional[float] = None,
+    ):
+        self.limit_per_host = (
+            limit_per_host
+            if limit_per_host is not None
+            else int(_env_float("FLYTO_HTTP_POOL_LIMIT_PER_HOST", DEFAULT_LIMIT_PER_HOST))
+        )
+        self.keepalive_s = (
+            keepalive_s
+            if keepalive_s is not None
+            else _env_float("FLYTO_HTTP_POOL_KEEPALIVE_S", DEFAULT_KEEPALIVE_S)
+        )
+        self._pools: Dict[Tuple, _Pool] = {}
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def sessions(self, **session_kwargs: Any) -> "PooledSessions":
+        """Sessions for one call, one per origin it talks to (see PooledSessions)."""
+        return PooledSessions(self, session_kwargs)
+
+    @asynccontextmanager
+    async def session(self, url: str, **session_kwargs: Any):
+        """A ``ClientSession`` over the pool for ``url``'s origin."""
+        async with self.sessions(**session_kwargs) as sessions:
+            yield sessions.for_url(url)
+
+    def _acquire(self, url: str) -> _Pool:
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        key = (loop, _origin(url), _security_key())
+        pool = self._pools.get(key)
+        if pool is None or pool.connector.closed:
+            connector = ssrf_guarded_connector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_s,
+            )
+            pool = _Pool(connector=connector, loop=loop)
+            self._pools[key] = pool
+        pool.active += 1
+        pool.sessions += 1
+        pool.last_used = time.monotonic()
+        return pool
+
+    def _release(self, pool: _Pool) -> None:
+        pool.active -= 1
+        pool.last_used = time.monotonic()
+
+    def _drop_dead_loops(self) -> None:
+        for key, pool in list(self._pools.items()):
+            if pool.loop.is_closed():
+                # Its transports died with the loop; nothing left to await
+                del self._pools[key]
+
+    async def close_idle(self, idle_s: Optional[float] = None) -> int:
+        """
+        Close pools on the running loop with no session open for ``idle_s``.
+
+        Returns:
+            Number of pools closed
+        """
+        timeout = idle_s if idle_s is not None else pool_idle_timeout_s()
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        now = time.monotonic()
+        closed = 0
+        for key, pool in list(self._pools.items()):
+            if pool.loop is not loop or pool.active or now - pool.last_used <= timeout:
+                continue
+            del self._pools[key]
+            logger.info("Closing idle HTTP pool for %s://%s", key[1][0], key[1][1])
+            await pool.connector.close()
+            closed += 1
+        return closed
+
+    async def close_all(self) -> int:
+        """Close every pool on the running loop (shutdown). Returns the count."""
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        closed = 0
+        for key, pool in list(self._pools.items()):
+            if pool.loop is not loop:
+                continue
+            del self._pools[key]
+            await pool.connector.close()
+            closed += 1
+        return closed
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counts and per-origin usage, for status endpoints and tests."""
+        now = time.monotonic()
+        pools = []
+        for (_, (scheme, host, port), _), pool in self._pools.items():
+            pools.append({
+                "origin": f"{scheme}://{host}" + (f":{port}" if port else ""),
+                "active": pool.active,
+                "sessions": pool.sessions,
+                "idleS": round(now - pool.last_used, 3),
+            })
+        return {
+            "pools": len(pools),
+            "limitPerHost": self.limit_per_host,
+            "keepaliveS": self.keepalive_s,
+            "origins": pools,
+        }
+
+
+class PooledSessions:
+    """
+    Per-call sessions over the shared pools, created on first use per origin.
+
+    http.batch and http.session talk to several hosts from one call; each
+    origin gets its own session over its own pool, and all of them share the
+    call's session kwargs (timeout, cookie_jar).
+
+        async with manager.sessions(timeout=timeout) as sessions:
+            await guarded_aiohttp_request(sessions.for_url(url), 'GET', url)
+
+    With pooling disabled each origin gets a plain ``guarded_client_session``.
+    """
+
+    def __init__(self, manager: HttpPoolManager, session_kwargs: Dict[str, Any]):
+        self._manager = manager
+        self._kwargs = session_kwargs
+        self._pooled = pooling_enabled()
+        self._sessions: Dict[Tuple, Tuple[aiohttp.ClientSession, Optional[_Pool]]] = {}
+
+    async def __aenter__(self) -> "PooledSessions":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def for_url(self, url: str) -> aiohttp.ClientSession:
+        """The session for ``url``'s origin, opened on first use."""
+        origin = _origin(url)
+        entry = self._sessions.get(origin)
+        if entry is None:
+            if self._pooled:
+                pool = self._manager._acquire(url)
+                session = aiohttp.ClientSession(
+                    connector=pool.connector, connector_owner=False, **self._kwargs
+                )
+            else:
+                pool = None
+                session = guarded_client_session(**self._kwargs)
+            entry = (session, pool)
+            self._sessions[origin] = entry
+        return entry[0]
+
+    async def close(self) -> None:
+        """Close the sessions; pooled connectors stay open for the next call."""
+        entries = list(self._sessions.values())
+        self._sessions.clear()
+        for session, pool in entries:
+            try:
+                await session.close()
+            finally:
+                if pool is not None:
+                    self._manager._release(pool)
+
+
+_manager: Optional[HttpPoolManager] = None
+
+
+def get_pool_manager() -> HttpPoolManager:
+    """The process-wide pool manager (created on first use)."""
+    global _manager
+    if _manager is None:
+        _manager = HttpPoolManager()
+    return _manager
+
+
+def pooled_client_session(url: str, **session_kwargs: Any):
+    """
+    Drop-in for ``guarded_client_session`` that reuses pooled connections.
+
+    ``url`` picks the pool; the session may still follow a redirect to
+    another host (through the same SSRF-guarded connector).
+
+        async with pooled_client_session(url, timeout=timeout) as session:
+            ...
+    """
+    return get_pool_manager().session(url, **session_kwargs)
+
+
+def pooled_client_sessions(**session_kwargs: Any) -> PooledSessions:
+    """Per-origin pooled sessions for a call that talks to several hosts."""
+    return get_pool_manager().sessions(**session_kwargs)
+
+
+async def close_idle_pools(idle_s: Optional[float] = None) -> int:
+    """Close idle pools on the running loop; no-op before first use."""
+    if _manager is None:
+        return 0
+    return await _manager.close_idle(idle_s)
+
+
+async def close_all_pools() -> int:
+    """Close every pool on the running loop; no-op before first use."""
+    if _manager is None:
+        return 0
+    return await _manager.close_all()
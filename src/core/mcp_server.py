@@ -23,7 +23,8 @@ import json
 import sys
 import os
 import asyncio
-from typing import Any, Dict
+import contextlib
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from core.mcp_handler import (
     handle_jsonrpc_request,
@@ -31,6 +32,8 @@ from core.mcp_handler import (
     TOOLS,
     SERVER_VERSION,
 )
+from core.db_pool import close_all_db_pools
+from core.http_pool import close_all_pools
 from core.session_reaper import reaper_loop
 
 # Browser session store — persists BrowserDriver across MCP tool calls (STDIO-specific)
@@ -78,27 +81,284 @@ async def execute_module(module_id, params, context=None):
     )
 
 
+# ============================================================
+# Concurrent dispatch
+# ============================================================
+# Requests used to be handled one at a time: a slow browser.goto or recipe
+# run held up every later call, including a cheap search_modules. Each
+# request now runs as its own task; the reader keeps reading, so it also
+# sees cancellation notifications for requests still running.
+#
+#   - At most FLYTO_MCP_MAX_IN_FLIGHT requests execute at once (default 8);
+#     the rest wait for a slot in arrival order.
+#   - Calls that drive the same browser or debugger session are serialized
+#     in arrival order (see _session_lanes); a page cannot take two
+#     navigations at once.
+#   - Responses are written as requests finish, each carrying the id of the
+#     request it answers, through one writer so lines never interleave.
+#   - notifications/cancelled cancels the named request; per the MCP spec a
+#     cancelled request gets no response.
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+def max_in_flight() -> int:
+    """Read the in-flight cap from FLYTO_MCP_MAX_IN_FLIGHT, or the default."""
+    try:
+        return max(1, int(os.environ.get('FLYTO_MCP_MAX_IN_FLIGHT', '')))
+    except ValueError:
+        return DEFAULT_MAX_IN_FLIGHT
+
+
+class StdoutWriter:
+    """Single writer for protocol output.
+
+    Handlers finish in any order; funnelling every line through one queue and
+    one task keeps each JSON-RPC message whole. The blocking write runs in a
+    thread so a slow reader on the other end of the pipe cannot stall the
+    event loop.
+    """
+
+    def __init__(self, stream=None):
+        self._stream = stream if stream is not None else sys.stdout
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def send(self, message: dict) -> None:
+        self._queue.put_nowait(json.dumps(message))
+
+    async def close(self) -> None:
+        """Flush everything queued so far, then stop."""
+        self._queue.put_nowait(None)
+        if self._task is not None:
+            await self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await self._queue.get()
+            if line is None:
+                return
+            await loop.run_in_executor(None, self._write, line)
+
+    def _write(self, line: str) -> None:
+        self._stream.write(line + "\n")
+        self._stream.flush()
+
+
+class RequestDispatcher:
+    """Runs JSON-RPC requests concurrently under a global cap and per-session lanes."""
+
+    def __init__(
+        self,
+        writer: StdoutWriter,
+        browser_sessions: Dict[str, Any],
+        debugger_sessions: Dict[str, Any],
+        session_activity: Dict[str, float],
+        limit: Optional[int] = None,
+    ):
+        self._writer = writer
+        self._browser_sessions = browser_sessions
+        self._debugger_sessions = debugger_sessions
+        self._session_activity = session_activity
+        self._slots = asyncio.Semaphore(limit if limit is not None else max_in_flight())
+        self._lanes: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._lane_users: Dict[Tuple[str, str], int] = {}
+        self._by_id: Dict[Any, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        # Session-less calls per kind whose session is resolved on acquire
+        self._unbound: Dict[str, Set[asyncio.Task]] = {}
+
+    def submit(self, request: Any) -> None:
+        """Start handling one parsed message; returns immediately."""
+        if isinstance(request, dict) and request.get("method") == "notifications/cancelled":
+            params = request.get("params")
+            if isinstance(params, dict):
+                self.cancel(params.get("requestId"))
+            return
+        wanted = self._session_lanes(request)
+        # A call naming a session first lets earlier session-less calls of
+        # its kind bind theirs: they may resolve to the same session.
+        earlier = [
+            task
+            for kind, session in wanted if session is not None and session != "*"
+            for task in self._unbound.get(kind, ())
+        ]
+        lanes: List[Tuple[str, str]] = []
+        for kind, session in wanted:
+            self._hold(lanes, (kind, session or "*"))
+        task = asyncio.create_task(self._run(request, wanted, lanes, earlier))
+        self._tasks.add(task)
+        unbound = {kind for kind, session in wanted if session is None}
+        for kind in unbound:
+            self._unbound.setdefault(kind, set()).add(task)
+        req_id = request.get("id") if isinstance(request, dict) else None
+        if req_id is not None:
+            self._by_id[req_id] = task
+        task.add_done_callback(lambda done: self._finish(done, req_id, lanes, unbound))
+
+    def cancel(self, req_id: Any) -> bool:
+        """Cancel the in-flight request with this id. False if none is running."""
+        task = self._by_id.get(req_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    async def drain(self) -> None:
+        """Wait for every submitted request to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def _run(
+        self,
+        request: Any,
+        wanted: List[Tuple[str, Optional[str]]],
+        lanes: List[Tuple[str, str]],
+        earlier: List[asyncio.Task],
+    ) -> None:
+        try:
+            if earlier:
+                await asyncio.wait(earlier)
+            async with contextlib.AsyncExitStack() as stack:
+                # Sorted acquisition ("*" sorts before any session id): two
+                # requests needing the same pair of lanes cannot deadlock.
+                # Lanes before the slot, so a request queued behind its
+                # session does not hold a slot idle.
+                for kind, session in sorted(wanted, key=lambda lane: (lane[0], lane[1] or "*")):
+                    await stack.enter_async_context(self._lane((kind, session or "*")))
+                    if session is None:
+                        # Resolved now, after the calls queued ahead of it
+                        # (a launch, say) have opened their sessions
+                        bound = _lane_session(None, self._sessions(kind))
+                        if bound != "*":
+                            self._hold(lanes, (kind, bound))
+                            await stack.enter_async_context(self._lane((kind, bound)))
+                await stack.enter_async_context(self._slots)
+                response = await self._handle(request)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            req_id = request.get("id") if isinstance(request, dict) else None
+            response = {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32000, "message": str(e)}}
+        if response is not None:
+            self._writer.send(response)
+
+    async def _handle(self, request: Any) -> Optional[dict]:
+        if not isinstance(request, dict):
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
+        return await handle_jsonrpc_request(
+            request, self._browser_sessions, self._debugger_sessions, self._session_activity,
+        )
+
+    def _sessions(self, kind: str) -> Dict[str, Any]:
+        return self._browser_sessions if kind == "browser" else self._debugger_sessions
+
+    def _hold(self, lanes: List[Tuple[str, str]], lane: Tuple[str, str]) -> None:
+        lanes.append(lane)
+        self._lane_users[lane] = self._lane_users.get(lane, 0) + 1
+
+    def _lane(self, lane: Tuple[str, str]) -> asyncio.Lock:
+        lock = self._lanes.get(lane)
+        if lock is None:
+            lock = self._lanes[lane] = asyncio.Lock()
+        return lock
+
+    def _finish(
+        self, task: asyncio.Task, req_id: Any, lanes: List[Tuple[str, str]], unbound: Set[str],
+    ) -> None:
+        self._tasks.discard(task)
+        for kind in unbound:
+            self._unbound[kind].discard(task)
+            if not self._unbound[kind]:
+                del self._unbound[kind]
+        if req_id is not None and self._by_id.get(req_id) is task:
+            del self._by_id[req_id]
+        for lane in lanes:
+            self._lane_users[lane] -= 1
+            if not self._lane_users[lane]:
+                del self._lane_users[lane]
+                self._lanes.pop(lane, None)
+
+    def _session_lanes(self, request: Any) -> List[Tuple[str, Optional[str]]]:
+        """The session lanes a request must hold while it runs.
+
+        Only execute_module calls of browser.* / reverse.* modules touch a
+        session. An explicit session id names the lane. Without one (None
+        here) the request queues on the kind's "*" lane, where browser.launch
+        and reverse.attach also queue, and once it holds that lane it binds
+        to the session the handler will fall back to: the only open one, if
+        there is exactly one. Resolving then rather than on arrival means a
+        call sent right behind a launch drives the session the launch
+        opened. Calls naming a session wait for earlier session-less calls
+        of their kind, so a pipelined launch, goto, click still runs one
+        at a time, as it did when requests ran one at a time.
+        """
+        if not isinstance(request, dict) or request.get("method") != "tools/call":
+            return []
+        params = request.get("params")
+        if not isinstance(params, dict) or params.get("name") != "execute_module":
+            return []
+        arguments = params.get("arguments")
+        if not isinstance(arguments, dict):
+            return []
+        module_id = arguments.get("module_id")
+        if not isinstance(module_id, str):
+            return []
+        context = arguments.get("context")
+        context = context if isinstance(context, dict) else {}
+
+        if module_id == "browser.launch":
+            return [("browser", "*")]
+        if module_id == "reverse.attach":
+            return [("browser", _named_session(context.get("browser_session"))), ("debugger", "*")]
+        if module_id.startswith("browser."):
+            return [("browser", _named_session(context.get("browser_session")))]
+        if module_id.startswith("reverse."):
+            return [("debugger", _named_session(context.get("debugger_session")))]
+        return []
+
+
+def _named_session(session_id: Any) -> Optional[str]:
+    return session_id if isinstance(session_id, str) and session_id else None
+
+
+def _lane_session(session_id: Any, sessions: Dict[str, Any]) -> str:
+    if isinstance(session_id, str) and session_id:
+        return session_id
+    if len(sessions) == 1:
+        return next(iter(sessions))
+    return "*"
+
+
 async def async_main():
     """MCP Server main loop — persistent event loop for browser session survival."""
     loop = asyncio.get_event_loop()
     reaper_task = asyncio.create_task(
         reaper_loop(_browser_sessions, _debugger_sessions, _session_activity)
     )
+    writer = StdoutWriter()
+    writer.start()
+    dispatcher = RequestDispatcher(
+        writer, _browser_sessions, _debugger_sessions, _session_activity,
+    )
     while True:
         line = await loop.run_in_executor(None, sys.stdin.readline)
         if not line:
             break  # EOF
         try:
             request = json.loads(line.strip())
-            response = await handle_jsonrpc_request(
-                request, _browser_sessions, _debugger_sessions, _session_activity,
-            )
-            if response is not None:
-                print(json.dumps(response), flush=True)
         except json.JSONDecodeError:
-            pass
-        except Exception as e:
-            print(json.dumps({"jsonrpc": "2.0", "error": {"code": -32000, "message": str(e)}}), flush=True)
+            continue
+        dispatcher.submit(request)
+
+    # Let requests already read finish and their responses go out before
+    # the sessions they may be using are torn down below.
+    await dispatcher.drain()
+    await writer.close()
 
     reaper_task.cancel()
     await asyncio.gather(reaper_task, return_exceptions=True)
@@ -122,6 +382,9 @@ async def async_main():
             pass
     _browser_sessions.clear()
 
+    await close_all_pools()
+    await close_all_db_pools()
+
 
 def main():
     """Entry point — runs the async main loop."""
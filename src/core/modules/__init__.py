@@ -43,6 +43,8 @@ from .items import (
     ItemEdgeType,
     EdgeInfo,
     MergeStrategy,
+    ItemBatch,
+    LegacyStepResult,
     wrap_legacy_result,
     items_to_legacy_context,
     merge_items,
@@ -140,21 +142,43 @@ from .builtin import (
     get_builtin_module_meta,
 )
 
-# Import atomic modules (legacy - being migrated to plugins)
-from .atomic import browser
-from .atomic import data
-from .atomic import utility
+# Atomic and third-party modules. With a current prebuilt manifest their
+# metadata is registered without importing them and each module's code loads
+# on first ModuleRegistry.get(); otherwise the packages are imported and
+# register themselves. See registry/manifest.py.
+from .registry.manifest import register_from_manifest
+
+_lazy = register_from_manifest()
 
 # Import legacy atomic modules (deprecated - use plugins instead)
 from . import atomic
 
 # Import third-party integration modules
-from .third_party import ai
-from .third_party import communication
-from .third_party import database
-from .third_party import cloud
-from .third_party import productivity
-from .third_party import developer
+if not _lazy:
+    from . import third_party
+
+_LAZY_SUBPACKAGES = {
+    'browser': 'atomic',
+    'data': 'atomic',
+    'utility': 'atomic',
+    'ai': 'third_party',
+    'communication': 'third_party',
+    'database': 'third_party',
+    'cloud': 'third_party',
+    'productivity': 'third_party',
+    'developer': 'third_party',
+}
+
+
+def __getattr__(name):
+    if name == 'third_party':
+        import importlib
+        return importlib.import_module('.third_party', __name__)
+    if name in _LAZY_SUBPACKAGES:
+        import importlib
+        return importlib.import_module(f'.{_LAZY_SUBPACKAGES[name]}.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Composite modules (coming in v1.1)
 from . import composite
@@ -186,6 +210,8 @@ __all__ = [
     'ItemEdgeType',
     'EdgeInfo',
     'MergeStrategy',
+    'ItemBatch',
+    'LegacyStepResult',
     'wrap_legacy_result',
     'items_to_legacy_context',
     'merge_items',
@@ -52,6 +52,9 @@ def register_all():
 
     This function is called by ModuleRegistry.discover_plugins() via entry_points.
     It imports all module categories, which triggers registration via @register_module.
+    When ``core.modules`` registered the catalog from the prebuilt module
+    manifest, only the optional categories are imported here; the rest load
+    on first ``ModuleRegistry.get()`` (see registry/manifest.py).
 
     Usage in pyproject.toml:
         [project.entry-points."flyto.modules"]
@@ -62,8 +65,11 @@ def register_all():
         return
 
     import importlib
-    for name in _ALL_CATEGORIES:
-        importlib.import_module(f'.{name}', __package__)
+    from ..registry.manifest import registered_from_manifest
+
+    if not registered_from_manifest():
+        for name in _ALL_CATEGORIES:
+            importlib.import_module(f'.{name}', __package__)
 
     for name in _OPTIONAL_CATEGORIES:
         try:
@@ -77,45 +83,33 @@ def register_all():
 # Auto-register on import
 register_all()
 
-# Re-exports for direct attribute access (modules already in sys.modules)
-from . import (  # noqa: F401
-    ai, analysis, archive, array, auth,
-    browser, cache, check, communication, compare, convert, crypto,
-    data, database, datetime, dns, docker, document,
-    element, encode, env, error,
-    file, flow, format,
-    git, graphql,
-    hash, http,
-    image,
-    k8s, llm, logic,
-    markdown, math, mcp, meta, monitor,
-    network, notification,
-    object, output,
-    path, port, process,
-    queue, random, regex, reverse,
-    sandbox, scheduler, set, shell, stats, storage, string,
-    template, testing, text, training,
-    ui, utility,
-    validate, vector, verify, verification, vision,
-    warroom,
-)
-
-# Re-export element registry
-from .element_registry import (
-    ElementRegistry,
-    get_element_registry,
-    create_element_registry,
-    ELEMENT_REGISTRY_CONTEXT_KEY,
-)
-
-# Re-export flow control modules
-from .flow import LoopModule, BranchModule, SwitchModule, GotoModule
-
-# Re-export element modules
-from .element import ElementQueryModule, ElementTextModule, ElementAttributeModule
-
-# Re-export browser find module
-from .browser.find import BrowserFindModule
+# Category packages and the re-exports below resolve on first attribute
+# access, so they do not undo lazy loading (PEP 562).
+_LAZY_EXPORTS = {
+    'ElementRegistry': 'element_registry',
+    'get_element_registry': 'element_registry',
+    'create_element_registry': 'element_registry',
+    'ELEMENT_REGISTRY_CONTEXT_KEY': 'element_registry',
+    'LoopModule': 'flow',
+    'BranchModule': 'flow',
+    'SwitchModule': 'flow',
+    'GotoModule': 'flow',
+    'ElementQueryModule': 'element',
+    'ElementTextModule': 'element',
+    'ElementAttributeModule': 'element',
+    'BrowserFindModule': 'browser.find',
+}
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _ALL_CATEGORIES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(f'.{_LAZY_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'register_all',
@@ -11,7 +11,7 @@ using Redis as the backend storage.
 from contextlib import suppress
 from typing import Any, Dict, List
 
-from ....utils import enforce_outbound_service_url
+from ....utils import enforce_outbound_service_url_async
 from ...registry import register_module
 from ...schema import compose, field
 from ...types import DataType, EdgeType, NodeType
@@ -171,7 +171,7 @@ async def ai_memory_redis(context: Dict[str, Any]) -> Dict[str, Any]:
 
     params = context['params']
     redis_url = params.get('redis_url', 'redis://localhost:6379')
-    redis_url = enforce_outbound_service_url(redis_url, purpose='Redis memory')
+    redis_url = await enforce_outbound_service_url_async(redis_url, purpose='Redis memory')
     key_prefix = params.get('key_prefix', 'flyto:memory:')
     session_id = params.get('session_id', '')
     ttl_seconds = params.get('ttl_seconds', 86400)
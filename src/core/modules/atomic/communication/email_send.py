@@ -14,7 +14,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_host, validate_path_with_env_config
+from ....utils import enforce_outbound_host_async, validate_path_with_env_config
 from ...registry import register_module
 from ...schema import compose, presets
 
@@ -116,7 +116,7 @@ async def email_send(context: Dict[str, Any]) -> Dict[str, Any]:
     # Validate SMTP config
     if not smtp_host:
         raise ValueError("SMTP host not configured. Set SMTP_HOST env or provide smtp_host param")
-    smtp_host = enforce_outbound_host(smtp_host, purpose='SMTP')
+    smtp_host = await enforce_outbound_host_async(smtp_host, purpose='SMTP')
 
     # Get email parameters
     from_email = params.get('from_email') or os.getenv('SMTP_FROM_EMAIL', smtp_user)
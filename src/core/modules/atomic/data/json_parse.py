@@ -34,6 +34,7 @@ from ...errors import ValidationError, InvalidValueError
     # Execution settings
     retryable=False,
     concurrent_safe=True,
+    deterministic=True,
 
     # Security settings
     requires_credentials=False,
@@ -82,6 +82,7 @@ def _dict_to_element(tag: str, data: Any) -> ET.Element:
     retryable=True,
     max_retries=2,
     concurrent_safe=True,
+    deterministic=True,
 
     # Security settings
     requires_credentials=False,
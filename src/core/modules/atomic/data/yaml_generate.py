@@ -41,6 +41,7 @@ from ...errors import ValidationError, ModuleError
     retryable=True,
     max_retries=2,
     concurrent_safe=True,
+    deterministic=True,
 
     # Security settings
     requires_credentials=False,
@@ -3,13 +3,20 @@
 """
 Database Insert Module
 Insert data into database tables
+
+All rows go in one transaction through the driver's bulk path: asyncpg
+``executemany`` (``COPY`` from COPY_MIN_ROWS rows up, multi-row ``VALUES``
+when ``returning`` is set), multi-row ``VALUES`` for MySQL and one
+``executemany`` for SQLite. PostgreSQL and MySQL connections come from the
+shared pools in core/db_pool.py.
 """
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ...registry import register_module
 from ...schema import compose, presets
+from ....db_pool import db_connection
 from ....utils import validate_sql_identifier, validate_sql_identifiers, SQLInjectionError
 
 
@@ -18,6 +25,13 @@ logger = logging.getLogger(__name__)
 
 SUPPORTED_DATABASES = ['postgresql', 'mysql', 'sqlite']
 
+# PostgreSQL switches from executemany to COPY at this many rows
+COPY_MIN_ROWS = 1000
+# Multi-row statements: bind parameters (PostgreSQL's limit is 32767, MySQL's
+# 65535) and rows per statement, which keeps MySQL packets small
+MAX_BIND_PARAMS = 32767
+MAX_ROWS_PER_STATEMENT = 1000
+
 
 @register_module(
     module_id='database.insert',
@@ -148,7 +162,7 @@ async def _insert_postgresql(
 ) -> Dict[str, Any]:
     """Insert into PostgreSQL"""
     try:
-        import asyncpg
+        import asyncpg  # noqa: F401
     except ImportError:
         raise ImportError("asyncpg is required for PostgreSQL. Install with: pip install asyncpg")
 
@@ -170,34 +184,45 @@ async def _insert_postgresql(
 
         connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
-    conn = await asyncpg.connect(connection_string)
-    try:
-        columns = list(rows[0].keys())
-        placeholders = ', '.join(f'${i+1}' for i in range(len(columns)))
-        columns_str = ', '.join(columns)
-
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        if returning:
-            query += f" RETURNING {', '.join(returning)}"
+    columns = list(rows[0].keys())
+    values = [[row[col] for col in columns] for row in rows]
+    columns_str = ', '.join(columns)
 
+    async with db_connection('postgresql', dsn=connection_string) as conn:
         returning_data = []
-        for row in rows:
-            values = [row[col] for col in columns]
+        async with conn.transaction():
             if returning:
-                result = await conn.fetchrow(query, *values)
-                returning_data.append(dict(result))
+                # Multi-row VALUES, so RETURNING comes back in one round trip per chunk
+                for chunk in _chunks(values, len(columns)):
+                    rows_sql = ', '.join(
+                        '(' + ', '.join(f'${i * len(columns) + j + 1}' for j in range(len(columns))) + ')'
+                        for i in range(len(chunk))
+                    )
+                    query = (
+                        f"INSERT INTO {table} ({columns_str}) VALUES {rows_sql} "
+                        f"RETURNING {', '.join(returning)}"
+                    )
+                    records = await conn.fetch(query, *[v for row in chunk for v in row])
+                    returning_data.extend(dict(r) for r in records)
+            elif len(values) >= COPY_MIN_ROWS:
+                # COPY quotes identifiers; unquoted names in SQL fold to lower case
+                await conn.copy_records_to_table(
+                    table.lower(),
+                    records=[tuple(row) for row in values],
+                    columns=[col.lower() for col in columns],
+                )
             else:
-                await conn.execute(query, *values)
+                placeholders = ', '.join(f'${i+1}' for i in range(len(columns)))
+                query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
+                await conn.executemany(query, values)
 
-        logger.info(f"Inserted {len(rows)} rows into {table}")
+    logger.info(f"Inserted {len(rows)} rows into {table}")
 
-        return {
-            'ok': True,
-            'inserted_count': len(rows),
-            'returning_data': returning_data
-        }
-    finally:
-        await conn.close()
+    return {
+        'ok': True,
+        'inserted_count': len(rows),
+        'returning_data': returning_data
+    }
 
 
 async def _insert_mysql(
@@ -208,7 +233,7 @@ async def _insert_mysql(
 ) -> Dict[str, Any]:
     """Insert into MySQL"""
     try:
-        import aiomysql
+        import aiomysql  # noqa: F401
     except ImportError:
         raise ImportError("aiomysql is required for MySQL. Install with: pip install aiomysql")
 
@@ -225,37 +250,32 @@ async def _insert_mysql(
             "Set 'host' parameter or MYSQL_HOST environment variable."
         )
 
-    conn = await aiomysql.connect(
+    columns = list(rows[0].keys())
+    values = [[row[col] for col in columns] for row in rows]
+    columns_str = ', '.join(columns)
+    row_sql = '(' + ', '.join(['%s'] * len(columns)) + ')'
+
+    async with db_connection(
+        'mysql',
         host=host,
         port=port,
         user=user,
         password=password,
         db=database
-    )
-    try:
-        columns = list(rows[0].keys())
-        placeholders = ', '.join(['%s'] * len(columns))
-        columns_str = ', '.join(columns)
-
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-
+    ) as conn:
         async with conn.cursor() as cursor:
-            for row in rows:
-                values = [row[col] for col in columns]
-                await cursor.execute(query, values)
-            await conn.commit()
+            for chunk in _chunks(values, len(columns)):
+                query = f"INSERT INTO {table} ({columns_str}) VALUES {', '.join([row_sql] * len(chunk))}"
+                await cursor.execute(query, [v for row in chunk for v in row])
+        await conn.commit()
 
-        logger.info(f"Inserted {len(rows)} rows into {table}")
+    logger.info(f"Inserted {len(rows)} rows into {table}")
 
-        return {
-            'ok': True,
-            'inserted_count': len(rows),
-            'returning_data': []
-        }
-    finally:
-        # RELIABILITY: Properly close async MySQL connection
-        conn.close()
-        await conn.ensure_closed()
+    return {
+        'ok': True,
+        'inserted_count': len(rows),
+        'returning_data': []
+    }
 
 
 async def _insert_sqlite(
@@ -272,18 +292,15 @@ async def _insert_sqlite(
     def _run_insert():
         conn = sqlite3.connect(database)
         try:
-            cursor = conn.cursor()
             columns = list(rows[0].keys())
             placeholders = ', '.join(['?'] * len(columns))
             columns_str = ', '.join(columns)
 
             query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
 
-            for row in rows:
-                values = [row[col] for col in columns]
-                cursor.execute(query, values)
-
-            conn.commit()
+            # One transaction: commits on success, rolls back on error
+            with conn:
+                conn.executemany(query, ([row[col] for col in columns] for row in rows))
             return len(rows)
         finally:
             conn.close()
@@ -297,3 +314,10 @@ async def _insert_sqlite(
         'inserted_count': count,
         'returning_data': []
     }
+
+
+def _chunks(values: List[List[Any]], column_count: int) -> Iterator[List[List[Any]]]:
+    """Rows grouped so each multi-row statement stays within the limits above."""
+    size = max(1, min(MAX_ROWS_PER_STATEMENT, MAX_BIND_PARAMS // max(1, column_count)))
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
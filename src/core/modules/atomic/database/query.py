@@ -3,6 +3,13 @@
 """
 Database Query Module
 Execute SQL queries on databases (PostgreSQL, MySQL, SQLite)
+
+PostgreSQL and MySQL connections come from the shared pools in
+core/db_pool.py. ``fetch: chunked`` also returns the rows as one item per
+``chunk_size`` rows, so downstream steps iterate chunks instead of one large
+row list. The result is read into memory in full first: a module returns
+its output in one piece, so a server-side cursor would only keep a
+transaction open for as long as the read without lowering peak memory.
 """
 import logging
 import os
@@ -10,6 +17,7 @@ from typing import Any, Dict, List, Optional
 
 from ...registry import register_module
 from ...schema import compose, presets
+from ....db_pool import db_connection
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +26,8 @@ logger = logging.getLogger(__name__)
 # Supported database types
 SUPPORTED_DATABASES = ['postgresql', 'mysql', 'sqlite', 'mssql']
 
+DEFAULT_CHUNK_SIZE = 1000
+
 
 @register_module(
     module_id='database.query',
@@ -62,6 +72,7 @@ SUPPORTED_DATABASES = ['postgresql', 'mysql', 'sqlite', 'mssql']
         presets.DB_USER(),
         presets.DB_PASSWORD(),
         presets.FETCH_MODE(),
+        presets.DB_CHUNK_SIZE(),
     ),
     output_schema={
         'rows': {
@@ -110,6 +121,7 @@ async def database_query(context: Dict[str, Any]) -> Dict[str, Any]:
     db_type = params.get('database_type', 'postgresql')
     connection_string = params.get('connection_string') or os.getenv('DATABASE_URL')
     fetch_mode = params.get('fetch', 'all')
+    chunk_size = int(params.get('chunk_size') or DEFAULT_CHUNK_SIZE)
 
     # Validate query (basic security check)
     if not query.strip():
@@ -117,11 +129,11 @@ async def database_query(context: Dict[str, Any]) -> Dict[str, Any]:
 
     # Execute based on database type
     if db_type == 'postgresql':
-        return await _execute_postgresql(query, query_params, connection_string, params, fetch_mode)
+        return await _execute_postgresql(query, query_params, connection_string, params, fetch_mode, chunk_size)
     elif db_type == 'mysql':
-        return await _execute_mysql(query, query_params, connection_string, params, fetch_mode)
+        return await _execute_mysql(query, query_params, connection_string, params, fetch_mode, chunk_size)
     elif db_type == 'sqlite':
-        return await _execute_sqlite(query, query_params, params, fetch_mode)
+        return await _execute_sqlite(query, query_params, params, fetch_mode, chunk_size)
     else:
         raise ValueError(f"Unsupported database type: {db_type}")
 
@@ -131,11 +143,12 @@ async def _execute_postgresql(
     query_params: List[Any],
     connection_string: Optional[str],
     params: Dict[str, Any],
-    fetch_mode: str
+    fetch_mode: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
     """Execute PostgreSQL query"""
     try:
-        import asyncpg
+        import asyncpg  # noqa: F401
     except ImportError:
         raise ImportError("asyncpg is required for PostgreSQL. Install with: pip install asyncpg")
 
@@ -159,8 +172,7 @@ async def _execute_postgresql(
         connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
     # Execute query
-    conn = await asyncpg.connect(connection_string)
-    try:
+    async with db_connection('postgresql', dsn=connection_string) as conn:
         if fetch_mode == 'none':
             result = await conn.execute(query, *query_params)
             return {
@@ -179,18 +191,18 @@ async def _execute_postgresql(
                 'row_count': len(rows),
                 'columns': columns
             }
-        else:  # all
+        else:  # all, chunked
             records = await conn.fetch(query, *query_params)
             rows = [dict(r) for r in records]
             columns = list(records[0].keys()) if records else []
+            if fetch_mode == 'chunked':
+                return _chunked_result(columns, rows, chunk_size)
             return {
                 'ok': True,
                 'rows': rows,
                 'row_count': len(rows),
                 'columns': columns
             }
-    finally:
-        await conn.close()
 
 
 async def _execute_mysql(
@@ -198,7 +210,8 @@ async def _execute_mysql(
     query_params: List[Any],
     connection_string: Optional[str],
     params: Dict[str, Any],
-    fetch_mode: str
+    fetch_mode: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
     """Execute MySQL query"""
     try:
@@ -220,14 +233,14 @@ async def _execute_mysql(
         )
 
     # Execute query
-    conn = await aiomysql.connect(
+    async with db_connection(
+        'mysql',
         host=host,
         port=port,
         user=user,
         password=password,
         db=database
-    )
-    try:
+    ) as conn:
         async with conn.cursor(aiomysql.DictCursor) as cursor:
             await cursor.execute(query, query_params)
 
@@ -249,26 +262,25 @@ async def _execute_mysql(
                     'row_count': len(rows),
                     'columns': columns
                 }
-            else:  # all
+            else:  # all, chunked
                 rows = await cursor.fetchall()
                 columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                if fetch_mode == 'chunked':
+                    return _chunked_result(columns, list(rows), chunk_size)
                 return {
                     'ok': True,
                     'rows': list(rows),
                     'row_count': len(rows),
                     'columns': columns
                 }
-    finally:
-        # RELIABILITY: Properly close async MySQL connection
-        conn.close()
-        await conn.ensure_closed()
 
 
 async def _execute_sqlite(
     query: str,
     query_params: List[Any],
     params: Dict[str, Any],
-    fetch_mode: str
+    fetch_mode: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
     """Execute SQLite query"""
     import sqlite3
@@ -305,7 +317,7 @@ async def _execute_sqlite(
                     'row_count': len(rows),
                     'columns': list(columns)
                 }
-            else:  # all
+            else:  # all, chunked
                 rows_raw = cursor.fetchall()
                 if rows_raw:
                     columns = rows_raw[0].keys()
@@ -313,6 +325,8 @@ async def _execute_sqlite(
                 else:
                     columns = []
                     rows = []
+                if fetch_mode == 'chunked':
+                    return _chunked_result(list(columns), rows, chunk_size)
                 return {
                     'ok': True,
                     'rows': rows,
@@ -323,3 +337,22 @@ async def _execute_sqlite(
             conn.close()
 
     return await asyncio.to_thread(_run_query)
+
+
+def _chunked_result(columns: List[str], rows: List[Dict[str, Any]], chunk_size: int) -> Dict[str, Any]:
+    """The ``all`` result plus one item per ``chunk_size`` rows, numbered in read order."""
+    return {
+        'ok': True,
+        'rows': rows,
+        'row_count': len(rows),
+        'columns': columns,
+        'data': [
+            {
+                'rows': rows[start:start + chunk_size],
+                'row_count': len(rows[start:start + chunk_size]),
+                'columns': columns,
+                'chunk': index,
+            }
+            for index, start in enumerate(range(0, len(rows), chunk_size))
+        ],
+    }
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 
 from ...registry import register_module
 from ...schema import compose, presets
+from ....db_pool import db_connection
 from ....utils import validate_sql_identifier, validate_sql_identifiers, SQLInjectionError
 
 
@@ -140,7 +141,7 @@ async def _update_postgresql(
 ) -> Dict[str, Any]:
     """Update PostgreSQL"""
     try:
-        import asyncpg
+        import asyncpg  # noqa: F401
     except ImportError:
         raise ImportError("asyncpg is required for PostgreSQL. Install with: pip install asyncpg")
 
@@ -162,8 +163,7 @@ async def _update_postgresql(
 
         connection_string = f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
-    conn = await asyncpg.connect(connection_string)
-    try:
+    async with db_connection('postgresql', dsn=connection_string) as conn:
         set_columns = list(data.keys())
         where_columns = list(where.keys())
 
@@ -191,8 +191,6 @@ async def _update_postgresql(
             'ok': True,
             'updated_count': updated_count
         }
-    finally:
-        await conn.close()
 
 
 async def _update_mysql(
@@ -204,7 +202,7 @@ async def _update_mysql(
 ) -> Dict[str, Any]:
     """Update MySQL"""
     try:
-        import aiomysql
+        import aiomysql  # noqa: F401
     except ImportError:
         raise ImportError("aiomysql is required for MySQL. Install with: pip install aiomysql")
 
@@ -221,14 +219,14 @@ async def _update_mysql(
             "Set 'host' parameter or MYSQL_HOST environment variable."
         )
 
-    conn = await aiomysql.connect(
+    async with db_connection(
+        'mysql',
         host=host,
         port=port,
         user=user,
         password=password,
         db=database
-    )
-    try:
+    ) as conn:
         set_parts = [f"{col} = %s" for col in data.keys()]
         where_parts = [f"{col} = %s" for col in where.keys()]
 
@@ -247,10 +245,6 @@ async def _update_mysql(
             'ok': True,
             'updated_count': updated_count
         }
-    finally:
-        # RELIABILITY: Properly close async MySQL connection
-        conn.close()
-        await conn.ensure_closed()
 
 
 async def _update_sqlite(
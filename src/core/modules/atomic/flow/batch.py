@@ -137,6 +137,15 @@ from ...types import NodeType, EdgeType, DataType
             min=1,
             max=10,
         ),
+        field(
+            'task',
+            type='object',
+            label='Task',
+            label_key='modules.flow.batch.params.task.label',
+            description='Optional {module, params} run once per batch; ${batch} and ${batch_index} refer to the current batch',
+            description_key='modules.flow.batch.params.task.description',
+            required=False,
+        ),
     ),
 
     output_schema={
@@ -195,6 +204,19 @@ from ...types import NodeType, EdgeType, DataType
                 'delay_ms': 1000
             }
         },
+        {
+            'name': 'Run a task per batch',
+            'description': 'Send each batch of 100 records in one request, 3 requests at a time',
+            'params': {
+                'items': '${input.records}',
+                'batch_size': 100,
+                'parallel_batches': 3,
+                'task': {
+                    'module': 'http.post',
+                    'params': {'url': 'https://api.example.com/bulk', 'body': {'records': '${batch}'}}
+                }
+            }
+        },
         {
             'name': 'Parallel batch processing',
             'description': 'Process 3 batches in parallel',
@@ -217,9 +239,10 @@ class BatchModule(BaseModule):
     Splits an input array into batches and processes them sequentially
     or in parallel. Supports rate limiting via delay between batches.
 
-    The module emits a 'batch' event for each batch, allowing downstream
-    nodes to process individual batches. After all batches are processed,
-    a 'completed' event is emitted.
+    With a `task`, the workflow engine runs it once per batch
+    (parallel_batches at a time) and emits 'completed' with the per-batch
+    results. Without one, the module emits a 'batch' event for downstream
+    nodes.
     """
 
     module_name = "Batch Process"
@@ -241,6 +264,10 @@ class BatchModule(BaseModule):
         if self.parallel_batches < 1:
             raise ValueError("parallel_batches must be at least 1")
 
+        task = self.params.get('task')
+        if task is not None and not (isinstance(task, dict) and task.get('module')):
+            raise ValueError("task must be an object with a 'module'")
+
     async def execute(self) -> Dict[str, Any]:
         """
         Split items into batches and return batch execution plan.
@@ -294,7 +321,8 @@ class BatchModule(BaseModule):
             'continue_on_error': self.continue_on_error,
             'parallel_batches': self.parallel_batches,
             'total_batches': len(batches),
-            'total_items': len(self.items)
+            'total_items': len(self.items),
+            'task': self.params.get('task'),
         }
 
     def _build_batch_response(self, batches, batch_plan) -> Dict[str, Any]:
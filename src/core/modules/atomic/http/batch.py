@@ -16,12 +16,12 @@ from typing import Any, Dict, List, Optional
 
 from ...registry import register_module
 from ....utils import (
-    guarded_client_session,
-    validate_url_with_env_config,
+    validate_url_with_env_config_async,
     SSRFError,
     ssrf_protection_enabled,
     guarded_aiohttp_request,
 )
+from ....http_pool import pooled_client_sessions
 
 
 logger = logging.getLogger(__name__)
@@ -241,7 +241,7 @@ async def http_batch(context: Dict[str, Any]) -> Dict[str, Any]:
         for idx, req in enumerate(requests):
             url = req.get('url', '')
             try:
-                validate_url_with_env_config(url)
+                await validate_url_with_env_config_async(url)
             except SSRFError as e:
                 logger.warning(f"http.batch SSRF blocked request {idx}: {url}")
                 return {
@@ -254,14 +254,16 @@ async def http_batch(context: Dict[str, Any]) -> Dict[str, Any]:
     timeout = aiohttp.ClientTimeout(total=timeout_s)
     batch_start = time.time()
 
-    async with guarded_client_session(timeout=timeout) as session:
+    async with pooled_client_sessions(timeout=timeout) as sessions:
         if measure_time:
             results = []
             for req in requests:
+                session = sessions.for_url(req.get('url') or '')
                 r = await _execute_single_request(session, req, timeout_s, verify_ssl)
                 results.append(r)
         else:
-            coros = [_execute_single_request(session, req, timeout_s, verify_ssl)
+            coros = [_execute_single_request(sessions.for_url(req.get('url') or ''),
+                                             req, timeout_s, verify_ssl)
                      for req in requests]
             results = await asyncio.gather(*coros)
 
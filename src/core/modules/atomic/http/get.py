@@ -13,12 +13,12 @@ from ...registry import register_module
 from ...errors import ValidationError, NetworkError, ModuleError
 from ...schema import compose, presets
 from ....utils import (
-    guarded_client_session,
-    validate_url_with_env_config,
+    validate_url_with_env_config_async,
     SSRFError,
     ssrf_protection_enabled,
     guarded_aiohttp_request,
 )
+from ....http_pool import pooled_client_session
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +107,7 @@ async def http_get(context: Dict[str, Any]) -> Dict[str, Any]:
 
     if ssrf_protection_enabled():
         try:
-            validate_url_with_env_config(url)
+            await validate_url_with_env_config_async(url)
         except SSRFError as e:
             logger.warning(f"SSRF protection blocked GET to: {url}")
             raise NetworkError(str(e), url=url, status_code=0)
@@ -118,7 +118,7 @@ async def http_get(context: Dict[str, Any]) -> Dict[str, Any]:
     try:
         ssl_param = None if verify_ssl else False
         timeout = aiohttp.ClientTimeout(total=timeout_s)
-        async with guarded_client_session(timeout=timeout) as session:
+        async with pooled_client_session(url, timeout=timeout) as session:
             # SECURITY: revalidate every redirect hop through the SSRF guard so a
             # public URL cannot 302 into internal space (GHSA-c9hr-64h3-gxpc).
             response = await guarded_aiohttp_request(
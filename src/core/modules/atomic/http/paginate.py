@@ -12,7 +12,8 @@ import time
 from typing import Any, Dict, List, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
-from ....utils import guarded_client_session, SSRFError, validate_url_with_env_config
+from ....http_pool import pooled_client_session
+from ....utils import SSRFError, validate_url_with_env_config_async
 from ...registry import register_module
 from ...schema import compose, field, presets
 from ...schema.constants import FieldGroup
@@ -209,7 +210,7 @@ async def _paginate_link_header(
             # can point at a different (internal) host — revalidate it against
             # the SSRF guard before following. offset/page/cursor stay on the
             # already-validated base_url host, so only this hop needs rechecking.
-            validate_url_with_env_config(next_url)
+            await validate_url_with_env_config_async(next_url)
             url = next_url
 
         if delay_ms > 0:
@@ -497,7 +498,7 @@ async def http_paginate(context: Dict[str, Any]) -> Dict[str, Any]:
     pages_fetched = 0
 
     try:
-        validate_url_with_env_config(base_url)
+        await validate_url_with_env_config_async(base_url)
     except SSRFError as e:
         return _make_result(False, [], 0, start_time, str(e), 'SSRF_BLOCKED')
 
@@ -520,7 +521,7 @@ async def http_paginate(context: Dict[str, Any]) -> Dict[str, Any]:
     timeout = aiohttp.ClientTimeout(total=timeout_seconds)
 
     try:
-        async with guarded_client_session(timeout=timeout) as session:
+        async with pooled_client_session(base_url, timeout=timeout) as session:
             all_items, pages_fetched = await strategy_fn(
                 session, method, base_url, headers, verify_ssl,
                 data_path, page_size, max_pages, delay_ms,
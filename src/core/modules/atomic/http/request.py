@@ -14,12 +14,12 @@ from ...registry import register_module
 from ...schema import compose, field, presets
 from ...schema.constants import Visibility, FieldGroup
 from ....utils import (
-    guarded_client_session,
-    validate_url_with_env_config,
+    validate_url_with_env_config_async,
     SSRFError,
     ssrf_protection_enabled,
     guarded_aiohttp_request,
 )
+from ....http_pool import pooled_client_session
 
 
 logger = logging.getLogger(__name__)
@@ -316,7 +316,7 @@ async def http_request(context: Dict[str, Any]) -> Dict[str, Any]:
 
     if ssrf_protection_enabled():
         try:
-            validate_url_with_env_config(url)
+            await validate_url_with_env_config_async(url)
         except SSRFError as e:
             logger.warning(f"SSRF protection blocked request to: {url}")
             return _error_result(str(e), 'SSRF_BLOCKED', url, 0)
@@ -339,7 +339,7 @@ async def http_request(context: Dict[str, Any]) -> Dict[str, Any]:
 
     for attempt in range(max_attempts):
         try:
-            async with guarded_client_session(timeout=timeout) as session:
+            async with pooled_client_session(url, timeout=timeout) as session:
                 # SECURITY: revalidate every redirect hop through the SSRF guard
                 # so a public URL cannot 302 into internal space
                 # (GHSA-c9hr-64h3-gxpc). follow_redirects=False => do not follow.
@@ -11,7 +11,8 @@ import logging
 import time
 from typing import Any, Dict, List, Optional
 
-from ....utils import guarded_client_session, SSRFError, validate_url_with_env_config
+from ....http_pool import pooled_client_sessions
+from ....utils import SSRFError, validate_url_with_env_config_async
 from ...registry import register_module
 from ...schema import compose, field, presets
 from ...schema.constants import FieldGroup, Visibility
@@ -62,7 +63,7 @@ async def _execute_request(
     req_label = req.get('label', f'Request {index + 1}')
 
     try:
-        validate_url_with_env_config(req_url)
+        await validate_url_with_env_config_async(req_url)
     except SSRFError as e:
         return {'label': req_label, 'ok': False, 'error': str(e), 'error_code': 'SSRF_BLOCKED'}
 
@@ -279,8 +280,9 @@ async def http_session(context: Dict[str, Any]) -> Dict[str, Any]:
     cookie_jar = aiohttp.CookieJar()
 
     try:
-        async with guarded_client_session(timeout=timeout, cookie_jar=cookie_jar) as session:
+        async with pooled_client_sessions(timeout=timeout, cookie_jar=cookie_jar) as sessions:
             for i, req in enumerate(requests_list):
+                session = sessions.for_url(req.get('url', ''))
                 result = await _execute_request(session, req, i, auth, verify_ssl)
                 results.append(result)
                 if not result['ok']:
@@ -11,7 +11,7 @@ import re
 import time
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_host
+from ....utils import enforce_outbound_host_async
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -137,7 +137,7 @@ async def network_ping(context: Dict[str, Any]) -> Dict[str, Any]:
     # target must be bounded — otherwise it is a ready-made internal network
     # scanner reachable from any workflow. Loopback stays allowed; private
     # ranges need FLYTO_ALLOWED_HOSTS or FLYTO_ALLOW_PRIVATE_NETWORK.
-    enforce_outbound_host(host, purpose='ping')
+    await enforce_outbound_host_async(host, purpose='ping')
     count = int(params.get('count', 4))
     timeout = int(params.get('timeout', 5))
 
@@ -10,7 +10,7 @@ import re
 import time
 from typing import Any, Dict, List, Union
 
-from ....utils import enforce_outbound_host
+from ....utils import enforce_outbound_host_async
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -135,7 +135,7 @@ async def network_port_scan(context: Dict[str, Any]) -> Dict[str, Any]:
     # target must be bounded — otherwise it is a ready-made internal network
     # scanner reachable from any workflow. Loopback stays allowed; private
     # ranges need FLYTO_ALLOWED_HOSTS or FLYTO_ALLOW_PRIVATE_NETWORK.
-    enforce_outbound_host(host, purpose='port scan')
+    await enforce_outbound_host_async(host, purpose='port scan')
     ports_input = params.get('ports', '')
     timeout = float(params.get('timeout', 1.0))
 
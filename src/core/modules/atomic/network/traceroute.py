@@ -10,7 +10,7 @@ import platform
 import re
 from typing import Any, Dict, List
 
-from ....utils import enforce_outbound_host
+from ....utils import enforce_outbound_host_async
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -120,7 +120,7 @@ async def network_traceroute(context: Dict[str, Any]) -> Dict[str, Any]:
     # target must be bounded — otherwise it is a ready-made internal network
     # scanner reachable from any workflow. Loopback stays allowed; private
     # ranges need FLYTO_ALLOWED_HOSTS or FLYTO_ALLOW_PRIVATE_NETWORK.
-    enforce_outbound_host(host, purpose='traceroute')
+    await enforce_outbound_host_async(host, purpose='traceroute')
     max_hops = int(params.get('max_hops', 30))
     timeout = int(params.get('timeout', 5))
 
@@ -10,7 +10,7 @@ import logging
 import os
 from typing import Any, Dict, List
 
-from ....utils import is_private_ip, resolve_guard_ip
+from ....utils import is_private_ip, resolve_guard_ips_async
 from ...registry import register_module
 
 logger = logging.getLogger(__name__)
@@ -164,9 +164,12 @@ async def port_check(context: Dict[str, Any]) -> Dict[str, Any]:
             # connect proceed against e.g. ::ffff:127.0.0.1
             # (GHSA-v7q9-pr72-5fmv). The resolver now lives in core.utils and is
             # shared with every other host-taking module rather than duplicated.
-            guard_ip = resolve_guard_ip(host)
-            if guard_ip is None or is_private_ip(guard_ip):
-                target = host if guard_ip is None else f'{host} -> {guard_ip}'
+            # Every address is checked: a name may resolve to both a public and
+            # a private address.
+            guard_ips = await resolve_guard_ips_async(host)
+            private_ip = next((ip for ip in guard_ips or () if is_private_ip(ip)), None)
+            if guard_ips is None or private_ip is not None:
+                target = host if guard_ips is None else f'{host} -> {private_ip}'
                 return {
                     'ok': False,
                     'error': f'SSRF blocked: Cannot scan private/unresolvable network host ({target}). '
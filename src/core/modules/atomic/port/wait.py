@@ -11,7 +11,7 @@ import socket
 import time
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_host
+from ....utils import enforce_outbound_host_async
 from ...registry import register_module
 
 
@@ -172,7 +172,7 @@ async def port_wait(context: Dict[str, Any]) -> Dict[str, Any]:
     # can route to, including the cloud metadata endpoint — the same
     # reachability the HTTP SSRF advisories are about, without a URL. Loopback
     # stays allowed so self-hosted deployments are unaffected.
-    enforce_outbound_host(host, purpose='port wait')
+    await enforce_outbound_host_async(host, purpose='port wait')
     timeout_seconds = params.get('timeout', 60)
     interval_ms = params.get('interval', 500)
     expect_closed = params.get('expect_closed', False)
@@ -9,7 +9,7 @@ import json
 import logging
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_service_url
+from ....utils import enforce_outbound_service_url_async
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -128,7 +128,7 @@ async def queue_dequeue(context: Dict[str, Any]) -> Dict[str, Any]:
     # host it names. Unguarded that is an internal port prober and a route to
     # the cloud metadata service — the non-HTTP twin of the SSRF advisories.
     # Loopback (the normal self-hosted case) stays allowed.
-    enforce_outbound_service_url(redis_url, purpose='Redis')
+    await enforce_outbound_service_url_async(redis_url, purpose='Redis')
     timeout = int(params.get('timeout', 0) or 0)
 
     if not queue_name:
@@ -9,7 +9,7 @@ import asyncio
 import logging
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_host
+from ....utils import enforce_outbound_host_async
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -115,7 +115,7 @@ async def ssh_exec(context: Dict[str, Any]) -> Dict[str, Any]:
     #
     # Checked before the optional-dependency import so it fails closed whether
     # or not asyncssh is installed.
-    enforce_outbound_host(context['params']['host'], purpose='SSH')
+    await enforce_outbound_host_async(context['params']['host'], purpose='SSH')
 
     try:
         import asyncssh
@@ -9,7 +9,7 @@ import logging
 import os
 from typing import Any, Dict
 
-from ....utils import enforce_outbound_host, validate_path_with_env_config
+from ....utils import enforce_outbound_host_async, validate_path_with_env_config
 from ...registry import register_module
 from ...schema import compose
 from ...schema.builders import field
@@ -111,7 +111,7 @@ async def ssh_sftp_upload(context: Dict[str, Any]) -> Dict[str, Any]:
     # connection to it, so both the filesystem and the network side need a
     # boundary. Checked here, before the optional-dependency import, so it
     # fails closed whether or not asyncssh is installed.
-    enforce_outbound_host(context['params']['host'], purpose='SFTP')
+    await enforce_outbound_host_async(context['params']['host'], purpose='SFTP')
 
     try:
         import asyncssh
@@ -34,6 +34,7 @@ from ...errors import ValidationError
 
     retryable=False,
     concurrent_safe=True,
+    deterministic=True,
 
     requires_credentials=False,
     handles_sensitive_data=False,
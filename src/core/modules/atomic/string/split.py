@@ -33,6 +33,7 @@ from ...errors import ValidationError
     # Execution settings
     retryable=False,
     concurrent_safe=True,
+    deterministic=True,
 
     # Security settings
     requires_credentials=False,
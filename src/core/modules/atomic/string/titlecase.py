@@ -35,6 +35,7 @@ from ...errors import ValidationError
     timeout_ms=5000,
     retryable=False,
     concurrent_safe=True,
+    deterministic=True,
 
     # Security settings
     requires_credentials=False,
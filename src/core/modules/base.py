@@ -77,6 +77,12 @@ class BaseModule(ABC):
     # - "all": Receive all items at once (for aggregate operations)
     execution_mode: str = "single"
 
+    # Items-mode throughput (see StepExecutor._execute_items_mode)
+    # - max_item_concurrency: items in flight at once for I/O-bound modules
+    # - item_batch_size: chunk size handed to execute_batch() when overridden
+    max_item_concurrency: int = 1
+    item_batch_size: int = 100
+
     # When True, automatically validate params against registry params_schema
     # before calling validate_params(). Subclasses can opt-in by setting this
     # to True in their class definition.
@@ -177,6 +183,41 @@ class BaseModule(ABC):
             return Item(json=data, pairedItem=PairedItemInfo(item=index))
         return Item(json={'value': result}, pairedItem=PairedItemInfo(item=index))
 
+    async def execute_batch(
+        self,
+        items: List["Item"],
+        start_index: int,
+        context: "ItemContext"
+    ) -> List[Any]:
+        """
+        Process a chunk of items in one call (execution_mode="items").
+
+        Opt-in hook for CPU-bound modules: when a subclass overrides it,
+        the executor hands it chunks of ``item_batch_size`` items instead
+        of calling execute_item() once per item.
+
+        Args:
+            items: Chunk of input items
+            start_index: Index of the chunk's first item in the full input
+            context: Item execution context with access to all items
+
+        Returns:
+            One entry per input item, in order: an Item, a list of Items
+            (1:N), or an Exception instance to fail just that item.
+
+        Example:
+            async def execute_batch(self, items, start_index, context):
+                values = self._vectorized([item.json['x'] for item in items])
+                return [Item(json={'y': v}) for v in values]
+        """
+        results = []
+        for offset, item in enumerate(items):
+            try:
+                results.append(await self.execute_item(item, start_index + offset, context))
+            except Exception as e:
+                results.append(e)
+        return results
+
     async def execute_all(
         self,
         items: List["Item"],
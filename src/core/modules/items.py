@@ -14,7 +14,8 @@ Design Principles:
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 
 class ExecutionStatus(Enum):
@@ -176,6 +177,154 @@ class Item:
         return result
 
 
+class ItemBatch(Sequence):
+    """
+    One output's items, stored column-wise.
+
+    A step's output used to be materialized three times for the workflow
+    context (``data``, ``items`` and ``items_full``), and the next step then
+    rebuilt every ``Item`` from the ``items`` list. A batch keeps the json
+    payloads as one list — which *is* the legacy ``items`` value, shared rather
+    than copied — and the rarely set fields (binary, meta, error, pairedItem)
+    as sparse ``index -> value`` columns.
+
+    It is a read-only ``Sequence[Item]``: ``batch[i]`` and iteration build
+    each ``Item`` on access (sharing the stored json dict), so a downstream
+    step holds only the items it is working on. Slicing returns a list.
+
+    Binary payloads are not kept. Downstream steps never received them (they
+    read the json payloads), so the batch records only the attachment
+    metadata ``items_full`` reports, and the bytes are freed with the step's
+    own result, as before batches. Rows therefore have ``binary=None``.
+
+    Example:
+        batch = ItemBatch.from_items(result.items)
+        batch.json          # [{"a": 1}, {"a": 2}]  (the legacy ``items``)
+        batch[0]            # Item(json={"a": 1})
+        batch.to_dicts()    # the legacy ``items_full``
+    """
+    __slots__ = ("json", "_binary", "_meta", "_error", "_paired")
+
+    def __init__(
+        self,
+        json: Optional[List[Any]] = None,
+        binary: Optional[Dict[int, Dict[str, Dict[str, Any]]]] = None,
+        meta: Optional[Dict[int, ItemMeta]] = None,
+        error: Optional[Dict[int, ItemError]] = None,
+        paired: Optional[Dict[int, PairedItemInfo]] = None,
+    ):
+        self.json: List[Any] = json if json is not None else []
+        self._binary = binary or {}
+        self._meta = meta or {}
+        self._error = error or {}
+        self._paired = paired or {}
+
+    @classmethod
+    def from_items(cls, items: Iterable[Item]) -> "ItemBatch":
+        """Split items into columns (one pass; json dicts are shared, not copied)."""
+        if isinstance(items, ItemBatch):
+            return items
+        json: List[Any] = []
+        binary: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        meta: Dict[int, ItemMeta] = {}
+        error: Dict[int, ItemError] = {}
+        paired: Dict[int, PairedItemInfo] = {}
+        for i, item in enumerate(items):
+            json.append(item.json)
+            if item.binary:
+                binary[i] = {
+                    name: {"mimeType": v.mimeType, "fileName": v.fileName, "fileSize": v.fileSize}
+                    for name, v in item.binary.items()
+                }
+            if item.meta:
+                meta[i] = item.meta
+            if item.error:
+                error[i] = item.error
+            if item.pairedItem:
+                paired[i] = item.pairedItem
+        return cls(json, binary, meta, error, paired)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> "ItemBatch":
+        """Rebuild a batch from ``to_dicts()`` rows (e.g. a cached result)."""
+        json: List[Any] = []
+        binary: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        meta: Dict[int, ItemMeta] = {}
+        error: Dict[int, ItemError] = {}
+        paired: Dict[int, PairedItemInfo] = {}
+        for i, row in enumerate(rows):
+            json.append(row.get("json", {}))
+            if row.get("binary"):
+                binary[i] = {name: dict(info) for name, info in row["binary"].items()}
+            if row.get("meta"):
+                meta[i] = ItemMeta(**row["meta"])
+            if row.get("error"):
+                error[i] = ItemError(**row["error"])
+            if row.get("pairedItem"):
+                paired[i] = PairedItemInfo(**row["pairedItem"])
+        return cls(json, binary, meta, error, paired)
+
+    def json_only(self) -> "ItemBatch":
+        """
+        The items as the next step receives them: json payloads only.
+
+        Matches what rebuilding items from the legacy ``items`` list gives
+        (``Item.from_value`` of each payload). The json column is shared
+        unless a payload is not a dict and has to be wrapped.
+        """
+        if all(isinstance(value, dict) for value in self.json):
+            return ItemBatch(self.json)
+        return ItemBatch([Item.from_value(value).json for value in self.json])
+
+    def __len__(self) -> int:
+        return len(self.json)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self.json)))]
+        if index < 0:
+            index += len(self.json)
+        if not 0 <= index < len(self.json):
+            raise IndexError("ItemBatch index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Item]:
+        if not (self._binary or self._meta or self._error or self._paired):
+            for value in self.json:
+                yield Item(json=value)
+            return
+        for i in range(len(self.json)):
+            yield self._row(i)
+
+    def __repr__(self) -> str:
+        return f"ItemBatch({len(self.json)} items)"
+
+    def _row(self, i: int) -> Item:
+        return Item(
+            json=self.json[i],
+            meta=self._meta.get(i),
+            error=self._error.get(i),
+            pairedItem=self._paired.get(i),
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """``Item.to_dict()`` of every item (the legacy ``items_full``)."""
+        if not (self._binary or self._meta or self._error or self._paired):
+            return [{"json": value} for value in self.json]
+        rows = []
+        for i in range(len(self.json)):
+            row = self._row(i).to_dict()
+            binary = self._binary.get(i)
+            if binary:
+                row = {
+                    "json": row.pop("json"),
+                    "binary": {name: dict(info) for name, info in binary.items()},
+                    **row,
+                }
+            rows.append(row)
+        return rows
+
+
 @dataclass
 class NodeError:
     """Node-level error information."""
@@ -372,6 +521,120 @@ def wrap_legacy_result(result: Dict[str, Any]) -> NodeExecutionResult:
         )
 
 
+_ITEMS_FULL = "items_full"
+
+
+class LegacyStepResult(dict):
+    """
+    Legacy step result that builds ``items_full`` on first use.
+
+    ``items_full`` (every item's ``to_dict()``) is read by few consumers but
+    used to be built for every step, doubling the memory a large output held
+    in the workflow context. Here it is filled in from ``batch`` the first
+    time it is read, or when the result is iterated, compared, copied or
+    serialized, so to any reader it is an ordinary dict with the key present.
+
+    ``batch`` also lets the next step take its input items straight from
+    the columns (see ``ItemBatch.json_only``) while ``items`` is still the
+    batch's own json list. Without a batch (generic code such as
+    ``dataclasses.asdict`` rebuilding it from its pairs) it is a plain dict.
+    """
+    __slots__ = ("batch", "_pending", "_finish")
+
+    def __init__(self, legacy: Any = (), batch: Optional[ItemBatch] = None):
+        super().__init__(legacy)
+        self.batch = batch
+        self._pending = batch is not None
+        self._finish: Optional[Callable[[List[Dict[str, Any]]], Any]] = None
+
+    def _materialize(self) -> None:
+        if self._pending:
+            self._pending = False
+            rows = self.batch.to_dicts()
+            if self._finish is not None:
+                rows = self._finish(rows)
+            dict.__setitem__(self, _ITEMS_FULL, rows)
+
+    def map_values(self, fn: Callable[[str, Any], Any]) -> "LegacyStepResult":
+        """
+        A copy with ``fn(key, value)`` applied to every entry.
+
+        A pending ``items_full`` stays pending in both: the copy applies
+        ``fn`` to it when it is first read there.
+        """
+        result = LegacyStepResult(
+            {key: fn(key, value) for key, value in dict.items(self)}, self.batch
+        )
+        if self._pending:
+            finish = self._finish
+            result._finish = (
+                (lambda rows: fn(_ITEMS_FULL, finish(rows))) if finish is not None
+                else (lambda rows: fn(_ITEMS_FULL, rows))
+            )
+        else:
+            result._pending = False
+        return result
+
+    def __getitem__(self, key):
+        if key == _ITEMS_FULL:
+            self._materialize()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key == _ITEMS_FULL:
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key) -> bool:
+        return (key == _ITEMS_FULL and self._pending) or dict.__contains__(self, key)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + (1 if self._pending else 0)
+
+    def __setitem__(self, key, value) -> None:
+        if key == _ITEMS_FULL:
+            self._pending = False
+        dict.__setitem__(self, key, value)
+
+    def __eq__(self, other):
+        # dict.__eq__ reads the other side's raw entries, so fill both
+        self._materialize()
+        if isinstance(other, LegacyStepResult):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce_ex__(self, protocol):
+        # copy, deepcopy and pickle see a plain dict
+        self._materialize()
+        return (dict, (dict(dict.items(self)),))
+
+    __hash__ = None
+
+
+def _materializing(name: str):
+    method = getattr(dict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# Everything that sees the whole dict (or removes from it) fills items_full first.
+for _name in (
+    "__iter__", "__repr__", "__or__", "__ior__", "__delitem__",
+    "keys", "items", "values", "copy", "pop", "popitem", "setdefault", "update", "clear",
+):
+    setattr(LegacyStepResult, _name, _materializing(_name))
+del _name
+
+
 def items_to_legacy_context(result: NodeExecutionResult) -> Dict[str, Any]:
     """
     Convert NodeExecutionResult to legacy context format.
@@ -383,16 +646,17 @@ def items_to_legacy_context(result: NodeExecutionResult) -> Dict[str, Any]:
         result: Item-based execution result
 
     Returns:
-        Legacy context dict with 'ok', 'data', and 'items' fields
+        Legacy context dict with 'ok', 'data', 'items' and 'items_full'
+        fields ('items_full' is built on first access; see LegacyStepResult)
     """
+    batch = ItemBatch.from_items(result.items)
     legacy = result.to_legacy_dict()
 
     # Add items for new-style access (json only for backward compatibility)
-    legacy["items"] = [item.json for item in result.items]
-    # Preserve full item payloads for advanced consumers
-    legacy["items_full"] = [item.to_dict() for item in result.items]
+    legacy["items"] = batch.json
 
-    return legacy
+    # Full item payloads for advanced consumers are built on demand
+    return LegacyStepResult(legacy, batch)
 
 
 # =============================================================================
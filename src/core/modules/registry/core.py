@@ -60,6 +60,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Type  # noqa: E402
 
 from ...constants import ErrorMessages  # noqa: E402
 from ..base import BaseModule  # noqa: E402
+from .manifest import LazyModuleRef  # noqa: E402
 from ..types import (  # noqa: E402
     TIER_DISPLAY_ORDER,
     ModuleTier,
@@ -406,6 +407,14 @@ class ModuleRegistry:
             module_class: Module class inheriting from BaseModule
             metadata: Module metadata (optional)
         """
+        if cls.is_manifest_backed(module_id, module_class):
+            # The manifest row's own code, imported at last. The source digest
+            # guarantees the stored row already says everything this
+            # registration would, so only the class changes: the row, its owner
+            # and the generation stay as they are, and a plugin that happens to
+            # import a Core module file mid-pass does not come to own it.
+            cls._modules[module_id] = module_class
+            return
         cls._note_pass_touch(module_id)
         if cls._pass_registered is not None:
             cls._pass_registered.add(module_id)
@@ -454,6 +463,70 @@ class ModuleRegistry:
         cls._bump_generation()
         logger.debug(f"Module registered: {module_id}")
 
+    @classmethod
+    @_synchronized
+    def register_lazy(cls, rows: Dict[str, Tuple[LazyModuleRef, Dict[str, Any]]]) -> None:
+        """
+        Register modules whose code has not been imported yet.
+
+        Used by ``manifest.register_from_manifest``: each row's metadata is
+        stored as ``register()`` would store it, with a ``LazyModuleRef`` in
+        place of the class until ``get()`` needs it. An id that already has a
+        real class keeps it. One generation bump covers the whole batch.
+
+        Args:
+            rows: module_id -> (reference, metadata); the metadata dicts are
+                taken over, not copied, so pass freshly parsed ones
+        """
+        for module_id, (ref, metadata) in rows.items():
+            if module_id in cls._modules:
+                continue
+            cls._note_pass_touch(module_id)
+            if cls._pass_registered is not None:
+                cls._pass_registered.add(module_id)
+            metadata['plugin'] = cls._loading_plugin
+            cls._modules[module_id] = ref
+            cls._metadata[module_id] = metadata
+        cls._bump_generation()
+        logger.debug(f"Modules registered lazily: {len(rows)}")
+
+    @classmethod
+    def is_manifest_backed(cls, module_id: str, module_class: Any) -> bool:
+        """
+        Whether ``module_class`` is the not-yet-imported code of a manifest row.
+
+        True when ``module_id`` is still a ``LazyModuleRef`` pointing at the
+        module ``module_class`` is defined in. ``register_module`` skips the
+        quality validator in that case; the manifest generator already ran it
+        over the same source.
+        """
+        ref = cls._modules.get(module_id)
+        return (
+            isinstance(ref, LazyModuleRef)
+            and ref.module == getattr(module_class, '__module__', None)
+        )
+
+    @classmethod
+    def _materialize(cls, module_id: str, ref: LazyModuleRef) -> Type[BaseModule]:
+        """Import a lazily registered module and swap its class in.
+
+        Runs with no registry lock held. Importing the module runs its
+        ``@register_module``, which takes the lock; holding it here while
+        another thread imports the same file would deadlock the two on the
+        lock and the import lock in opposite orders.
+        """
+        try:
+            module_class = ref.load()
+        except (ImportError, AttributeError) as e:
+            raise ImportError(
+                f"Module '{module_id}' is in the module manifest but "
+                f"{ref.module}.{ref.attr} could not be imported: {e}"
+            ) from e
+        with cls._discovery_lock:
+            if cls._modules.get(module_id) is ref:
+                cls._modules[module_id] = module_class
+        return module_class
+
     @classmethod
     @_synchronized
     def unregister(cls, module_id: str):
@@ -621,11 +694,12 @@ class ModuleRegistry:
         cls._bump_generation()
 
     @classmethod
-    @_synchronized
     def get(cls, module_id: str) -> Type[BaseModule]:
         """
         Get module class by ID
 
+        A module registered from the manifest is imported here, on first use.
+
         Args:
             module_id: Module identifier
 
@@ -634,7 +708,17 @@ class ModuleRegistry:
 
         Raises:
             ValueError: If module not found
+            ImportError: If a manifest module's code cannot be imported
         """
+        module_class = cls._lookup(module_id)
+        if isinstance(module_class, LazyModuleRef):
+            return cls._materialize(module_id, module_class)
+        return module_class
+
+    @classmethod
+    @_synchronized
+    def _lookup(cls, module_id: str) -> Any:
+        """The registered class or ``LazyModuleRef`` for ``module_id``."""
         cls._ensure_discovered()
         if module_id not in cls._modules:
             raise ValueError(
@@ -752,7 +836,6 @@ class ModuleRegistry:
         logger.debug("Registry cleared")
 
     @classmethod
-    @_synchronized
     def list_all(
         cls,
         filter_by_stability: bool = False,
@@ -761,6 +844,9 @@ class ModuleRegistry:
         """
         List all registered module classes
 
+        Imports every module still registered lazily; callers that only need
+        ids should use ``module_ids()``.
+
         Args:
             filter_by_stability: If True, filter by stability level based on environment
             env: Environment override (production/staging/development/local)
@@ -768,6 +854,27 @@ class ModuleRegistry:
         Returns:
             Dict of module_id -> module class
         """
+        result = cls._list_registered(filter_by_stability, env)
+        for module_id, module_class in result.items():
+            if isinstance(module_class, LazyModuleRef):
+                result[module_id] = cls._materialize(module_id, module_class)
+        return result
+
+    @classmethod
+    @_synchronized
+    def module_ids(cls) -> List[str]:
+        """Ids of all registered modules, without importing any module code."""
+        cls._ensure_discovered()
+        return list(cls._modules)
+
+    @classmethod
+    @_synchronized
+    def _list_registered(
+        cls,
+        filter_by_stability: bool,
+        env: Optional[str],
+    ) -> Dict[str, Any]:
+        """``list_all`` as registered: classes and ``LazyModuleRef``s."""
         cls._ensure_discovered()
         if not filter_by_stability:
             return cls._modules.copy()
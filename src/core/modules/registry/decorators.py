@@ -185,6 +185,7 @@ def register_module(
     retryable: bool = False,
     max_retries: int = 3,
     concurrent_safe: bool = True,
+    deterministic: bool = False,
 
     # Security settings
     requires_credentials: bool = False,
@@ -318,6 +319,7 @@ def register_module(
             retryable=retryable,
             max_retries=max_retries,
             concurrent_safe=concurrent_safe,
+            deterministic=deterministic,
             requires_credentials=requires_credentials,
             handles_sensitive_data=handles_sensitive_data,
             required_permissions=required_permissions,
@@ -339,15 +341,18 @@ def register_module(
             required_feature=required_feature,
         )
 
-        # Quality Validation (P0 - hard fail on errors)
-        from .quality_validator import validate_module_quality
-
-        validate_module_quality(
-            module_class=module_class,
-            module_id=module_id,
-            metadata=metadata,
-            original_func=module_class_or_func if is_function else None,
-        )
+        # Quality Validation (P0 - hard fail on errors). Skipped for a module
+        # the prebuilt manifest already describes: the generator validated
+        # this exact source (see manifest.py).
+        if not ModuleRegistry.is_manifest_backed(module_id, module_class):
+            from .quality_validator import validate_module_quality
+
+            validate_module_quality(
+                module_class=module_class,
+                module_id=module_id,
+                metadata=metadata,
+                original_func=module_class_or_func if is_function else None,
+            )
 
         ModuleRegistry.register(module_id, module_class, metadata)
         return module_class
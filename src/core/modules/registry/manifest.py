@@ -0,0 +1,217 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Prebuilt module manifest — lazy loading for Core's own modules
+
+``import core.modules`` used to import every atomic and third-party package,
+and every ``@register_module`` ran the quality validator over its source. The
+CLI, the MCP server and each plugin worker paid seconds of start-up for a
+catalog that was identical on every run.
+
+``scripts/generate_module_manifest.py`` records, after one full (validated)
+import, every Core module's metadata and where its class lives. At start-up
+``register_from_manifest`` puts those rows in the registry with a
+``LazyModuleRef`` standing in for each class:
+
+- catalog, search and ``get_metadata`` are served from the manifest rows;
+- ``ModuleRegistry.get(module_id)`` imports the module's code on first use and
+  swaps the real class in;
+- a module imported that way skips the import-time quality validator — its
+  source is byte-identical to the source the manifest generator validated.
+
+The manifest carries a digest of the module sources and of the registry code
+that derives metadata from them. A manifest whose digest does not match the
+tree on disk is ignored and the packages are imported as before, so an edited
+checkout never serves stale metadata. Optional categories (whose registration
+depends on extras being installed) and plugin-owned modules are never put in
+the manifest.
+
+Environment variables:
+- FLYTO_LAZY_MODULES: 0/false always imports eagerly (default: lazy when a
+  current manifest exists)
+- FLYTO_MODULE_MANIFEST: manifest path (default: module_manifest.json next to
+  this file, written by the generator and shipped in the wheel)
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SCHEMA = 1
+
+DEFAULT_MANIFEST_PATH = Path(__file__).with_name("module_manifest.json")
+
+# core/modules — everything the digest covers is relative to it.
+_MODULES_ROOT = Path(__file__).resolve().parent.parent
+
+# Module sources, plus the code that turns decorator arguments into metadata.
+_DIGEST_ROOTS = ("atomic", "third_party", "registry", "types")
+
+# Packages whose classes the manifest may describe.
+_MANIFEST_PACKAGES = ("core.modules.atomic.", "core.modules.third_party.")
+
+# Registration gated on optional dependencies; always imported at start-up.
+_OPTIONAL_PACKAGES = ("core.modules.atomic.huggingface.", "core.modules.atomic.ssh.")
+
+_registered_from_manifest = False
+
+
+@dataclass(frozen=True)
+class LazyModuleRef:
+    """Registry stand-in for a module class that has not been imported yet."""
+
+    module_id: str
+    module: str
+    attr: str
+
+    def load(self) -> Any:
+        """Import the module's code and return the registered class."""
+        return getattr(importlib.import_module(self.module), self.attr)
+
+
+def lazy_loading_enabled() -> bool:
+    """Whether start-up may use the manifest (FLYTO_LAZY_MODULES, default on)."""
+    return os.environ.get("FLYTO_LAZY_MODULES", "").strip().lower() not in (
+        "0", "false", "no", "off"
+    )
+
+
+def manifest_path() -> Path:
+    """Manifest location: FLYTO_MODULE_MANIFEST, or the packaged default."""
+    override = os.environ.get("FLYTO_MODULE_MANIFEST")
+    return Path(override) if override else DEFAULT_MANIFEST_PATH
+
+
+def source_digest() -> str:
+    """SHA-256 over every ``.py`` file the manifest rows are derived from."""
+    digest = hashlib.sha256()
+    for root in _DIGEST_ROOTS:
+        for path in sorted((_MODULES_ROOT / root).rglob("*.py")):
+            digest.update(path.relative_to(_MODULES_ROOT).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _locate(module_class: Any) -> Optional[Dict[str, str]]:
+    """Where ``module_class`` is importable from, or None if it is not."""
+    module_name = getattr(module_class, "__module__", "") or ""
+    if not module_name.startswith(_MANIFEST_PACKAGES):
+        return None
+    if module_name.startswith(_OPTIONAL_PACKAGES):
+        return None
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+    for attr, value in vars(module).items():
+        if value is module_class:
+            return {"module": module_name, "attr": attr}
+    return None
+
+
+def build_manifest() -> Dict[str, Any]:
+    """
+    Describe the Core modules currently registered.
+
+    Call after a full eager import (the generator does this with
+    FLYTO_LAZY_MODULES=0), so every row was quality-validated on the way in.
+    """
+    from .core import ModuleRegistry
+
+    classes = ModuleRegistry.list_all()
+    rows: Dict[str, Any] = {}
+    # Registry order and key order are kept: listings and parameter forms
+    # follow them.
+    for module_id in classes:
+        metadata = ModuleRegistry._metadata.get(module_id)
+        if metadata is None or metadata.get("plugin", ""):
+            continue
+        location = _locate(classes[module_id])
+        if location is None:
+            continue
+        rows[module_id] = {**location, "metadata": metadata}
+    return {
+        "schema": MANIFEST_SCHEMA,
+        "source_digest": source_digest(),
+        "modules": rows,
+    }
+
+
+def write_manifest(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Build the manifest and write it to ``path`` (default: manifest_path())."""
+    manifest = build_manifest()
+    target = Path(path) if path is not None else manifest_path()
+    target.write_text(
+        json.dumps(manifest, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    return manifest
+
+
+def load_manifest(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    The manifest, if it exists and describes the source tree on disk.
+
+    Returns None — and start-up imports eagerly — when it is missing,
+    unreadable, of another schema, or built from different sources.
+    """
+    source = Path(path) if path is not None else manifest_path()
+    try:
+        manifest = json.loads(source.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable module manifest {source}: {e}")
+        return None
+    if not isinstance(manifest, dict) or manifest.get("schema") != MANIFEST_SCHEMA:
+        logger.info(f"Ignoring module manifest {source}: unsupported schema")
+        return None
+    if manifest.get("source_digest") != source_digest():
+        logger.info(f"Ignoring module manifest {source}: module sources have changed")
+        return None
+    return manifest
+
+
+def register_from_manifest() -> bool:
+    """
+    Register Core's modules lazily from a current manifest.
+
+    Returns:
+        True if the manifest was used; False if the caller must import the
+        module packages itself.
+    """
+    global _registered_from_manifest
+    if _registered_from_manifest:
+        return True
+    if not lazy_loading_enabled():
+        return False
+    manifest = load_manifest()
+    if manifest is None:
+        return False
+
+    from .core import ModuleRegistry
+
+    ModuleRegistry.register_lazy({
+        module_id: (
+            LazyModuleRef(module_id, row["module"], row["attr"]),
+            row["metadata"],
+        )
+        for module_id, row in manifest["modules"].items()
+    })
+    _registered_from_manifest = True
+    logger.debug(f"Registered {len(manifest['modules'])} modules from {manifest_path()}")
+    return True
+
+
+def registered_from_manifest() -> bool:
+    """Whether this process's Core modules came from the manifest."""
+    return _registered_from_manifest
@@ -55,6 +55,7 @@ def build_module_metadata(
     retryable: bool,
     max_retries: int,
     concurrent_safe: bool,
+    deterministic: bool,
     requires_credentials: bool,
     handles_sensitive_data: bool,
     required_permissions: Optional[List[str]],
@@ -139,6 +140,8 @@ def build_module_metadata(
         # If retryable=False, max_retries should be 0 (consistency fix)
         "max_retries": max_retries if retryable else 0,
         "concurrent_safe": concurrent_safe,
+        # Same params and input items always give the same result (step cache)
+        "deterministic": deterministic,
 
         # Security settings
         "requires_credentials": requires_credentials,
@@ -0,0 +1,249 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Quality Report Cache - on-disk results for the import-time quality validator
+
+``@register_module`` runs the quality validator on every import, in every
+process: it reads the module's source back with ``inspect``, parses it and
+walks the tree for each rule. The answer only changes when the module's
+source, its metadata or the validator does, so the API server, the CLI and
+every plugin worker recomputed the same reports on each start.
+
+A report is stored under a key derived from:
+
+- ``VALIDATOR_VERSION``, which also names the cache subdirectory;
+- the source of the validator itself (the rules in quality_validator.py,
+  rule_config.py and validation_types.py, and this file's key and entry
+  format), so editing a rule retires the old reports without a version bump;
+- the validator's configuration (complexity limit, skipped rules);
+- the module id, its metadata, and the name of the validated class/function;
+- the contents of every source file the checks read — the module's own file
+  and the files defining the classes in its MRO, since ``execute()`` and
+  ``validate_params()`` may be inherited.
+
+A warm process therefore validates nothing: it hashes the files (memoised per
+path, stat-checked) and reads one small JSON file per module. The validation
+mode is not part of the key; whether a cached report blocks registration is
+still decided on every import.
+
+Entries are written atomically (temp file + rename), so concurrent workers
+sharing the directory never read a partial entry; an unreadable entry is a
+miss. A directory that cannot be written disables the cache for the process.
+
+Environment variables:
+- FLYTO_QUALITY_CACHE: 0/false disables the cache (default: enabled)
+- FLYTO_QUALITY_CACHE_DIR: cache directory (default: ~/.flyto/cache/quality)
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .validation_types import Severity, ValidationIssue
+
+logger = logging.getLogger(__name__)
+
+# Bump to start a fresh cache directory (rule edits are keyed by _VALIDATOR_SOURCES).
+VALIDATOR_VERSION = 1
+
+# Files whose contents decide what a report says
+_VALIDATOR_SOURCES = tuple(
+    str(Path(__file__).with_name(name))
+    for name in ("quality_validator.py", "rule_config.py", "validation_types.py", "quality_cache.py")
+)
+
+
+def cache_enabled() -> bool:
+    """Whether reports may be cached (FLYTO_QUALITY_CACHE, default on)."""
+    return os.environ.get("FLYTO_QUALITY_CACHE", "").strip().lower() not in (
+        "0", "false", "no", "off"
+    )
+
+
+def cache_dir() -> Path:
+    """Cache location: FLYTO_QUALITY_CACHE_DIR, or ~/.flyto/cache/quality."""
+    override = os.environ.get("FLYTO_QUALITY_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".flyto" / "cache" / "quality"
+
+
+_digest_lock = threading.Lock()
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a source file, memoised until its size or mtime changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _digest_lock:
+        known = _file_digests.get(path)
+    if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+        return known[2]
+    try:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    with _digest_lock:
+        _file_digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def validator_digest() -> Optional[str]:
+    """SHA-256 over the validator's own source files, or None if one is missing."""
+    digest = hashlib.sha256()
+    for path in _VALIDATOR_SOURCES:
+        file_digest = _file_digest(path)
+        if file_digest is None:
+            return None
+        digest.update(file_digest.encode("ascii"))
+    return digest.hexdigest()
+
+
+def _source_files(target: Any, module_class: Any) -> Iterable[str]:
+    """The files the checks read for this module, in a stable order."""
+    files = []
+    for obj in (target, *getattr(module_class, "__mro__", ())):
+        if obj is object:
+            continue
+        try:
+            path = inspect.getfile(obj)
+        except (TypeError, OSError):
+            continue
+        if path not in files:
+            files.append(path)
+    return files
+
+
+def report_key(
+    module_class: Any,
+    module_id: str,
+    metadata: Dict[str, Any],
+    original_func: Optional[Any],
+    config: Dict[str, Any],
+) -> Optional[str]:
+    """
+    Cache key for one validation, or None if the module cannot be cached.
+
+    Modules whose source cannot be located (defined in a REPL or built
+    dynamically) are never cached: the key would not change with their code.
+    """
+    validator = validator_digest()
+    if validator is None:
+        return None
+    target = original_func if original_func is not None else module_class
+    files = []
+    for path in _source_files(target, module_class):
+        digest = _file_digest(path)
+        if digest is None:
+            return None
+        files.append((path, digest))
+    if not files:
+        return None
+    try:
+        payload = json.dumps({
+            "version": VALIDATOR_VERSION,
+            "validator": validator,
+            "config": config,
+            "module_id": module_id,
+            "target": getattr(target, "__qualname__", None),
+            "function_based": original_func is not None,
+            "metadata": metadata,
+            "files": files,
+        }, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QualityReportCache:
+    """Reports persisted as one JSON file per key under ``cache_dir()/v<VERSION>``."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self._root = (Path(root) if root is not None else cache_dir()) / f"v{VALIDATOR_VERSION}"
+        self._writable = True
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The stored ``{"issues": [...], "source_file": ...}``, or None on a miss."""
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return {
+                "issues": [_issue_from_dict(item) for item in entry["issues"]],
+                "source_file": entry.get("source_file"),
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable quality cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, issues: Iterable[ValidationIssue], source_file: Optional[str]) -> None:
+        """Store a report; failures only disable further writes."""
+        if not self._writable:
+            return
+        path = self._path(key)
+        entry = {
+            "issues": [issue.to_dict() for issue in issues],
+            "source_file": source_file,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.debug(f"Quality cache disabled, cannot write {path.parent}: {e}")
+            self._writable = False
+
+
+def _issue_from_dict(data: Dict[str, Any]) -> ValidationIssue:
+    return ValidationIssue(
+        rule_id=data["rule_id"],
+        severity=Severity(data["severity"]),
+        message=data["message"],
+        field=data.get("field"),
+        hint=data.get("hint"),
+        line=data.get("line"),
+        fixable=data.get("fixable", False),
+    )
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[QualityReportCache] = None
+
+
+def get_quality_cache() -> Optional[QualityReportCache]:
+    """The process-wide cache, or None when FLYTO_QUALITY_CACHE disables it."""
+    global _cache
+    if not cache_enabled():
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = QualityReportCache()
+        return _cache
+
+
+def reset_quality_cache() -> None:
+    """Forget the process-wide cache so the next use re-reads the environment."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+    with _digest_lock:
+        _file_digests.clear()
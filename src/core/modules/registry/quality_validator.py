@@ -22,15 +22,20 @@ Validation Rules:
     Q013: params_schema fields should have description
     Q014: String params should have placeholder
     Q015: input_types/output_types should be defined
+
+Each module's source is parsed and walked once, and the node list is shared by
+every AST rule. Reports are cached on disk keyed by source hash and validator
+version, so unchanged modules are not re-validated (see quality_cache.py).
 """
 
 import ast
 import inspect
 import re
 import logging
-from typing import List, Dict, Any, Optional, Type
+from typing import List, Dict, Any, Optional, Tuple, Type
 from dataclasses import dataclass, field
 
+from .quality_cache import get_quality_cache, report_key
 from .validation_types import (
     ValidationMode,
     Severity,
@@ -99,6 +104,13 @@ class ModuleQualityValidator:
         mandatory = get_mandatory_rules()
         self.skip_rules = all_skipped - mandatory
 
+    def cache_config(self) -> Dict[str, Any]:
+        """Settings that change this validator's reports (part of the cache key)."""
+        return {
+            "max_complexity": self.max_complexity,
+            "skip_rules": sorted(self.skip_rules),
+        }
+
     def validate(
         self,
         module_class: Type,
@@ -132,14 +144,18 @@ class ModuleQualityValidator:
             source_file = None
             source_code = None
 
-        # Run all validations
+        # Run all validations. The source is parsed and walked once; every
+        # AST rule reads the same node list.
         if source_code:
-            issues.extend(self._check_ast_syntax(source_code, module_id))
-            issues.extend(self._check_no_print(source_code, module_id))
-            issues.extend(self._check_no_chinese_identifiers(source_code, module_id))
-            issues.extend(self._check_complexity(source_code, module_id))
-            issues.extend(self._check_unused_imports(source_code, module_id))
-            issues.extend(self._check_function_length(source_code, module_id))
+            tree, syntax_issues = self._check_ast_syntax(source_code, module_id)
+            issues.extend(syntax_issues)
+            if tree is not None:
+                nodes = list(ast.walk(tree))
+                issues.extend(self._check_no_print(nodes, module_id))
+                issues.extend(self._check_no_chinese_identifiers(nodes, module_id))
+                issues.extend(self._check_complexity(nodes, module_id))
+                issues.extend(self._check_unused_imports(nodes, module_id))
+                issues.extend(self._check_function_length(nodes, module_id))
 
         # Type-specific checks
         if is_function_based:
@@ -171,13 +187,14 @@ class ModuleQualityValidator:
     # Q001: AST Syntax
     # =========================================================================
 
-    def _check_ast_syntax(self, source: str, module_id: str) -> List[ValidationIssue]:
-        """Q001: Validate AST syntax."""
+    def _check_ast_syntax(
+        self, source: str, module_id: str
+    ) -> Tuple[Optional[ast.AST], List[ValidationIssue]]:
+        """Q001: Validate AST syntax. Returns the tree (None if invalid) for the AST rules."""
         try:
-            ast.parse(source)
-            return []
+            return ast.parse(source), []
         except SyntaxError as e:
-            return [ValidationIssue(
+            return None, [ValidationIssue(
                 rule_id="Q001",
                 severity=Severity.ERROR,
                 message=f"Syntax error: {e.msg}",
@@ -189,83 +206,74 @@ class ModuleQualityValidator:
     # Q002: No print() statements
     # =========================================================================
 
-    def _check_no_print(self, source: str, module_id: str) -> List[ValidationIssue]:
+    def _check_no_print(self, nodes: List[ast.AST], module_id: str) -> List[ValidationIssue]:
         """Q002: No print() statements allowed."""
         issues = []
-        try:
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    func = node.func
-                    if isinstance(func, ast.Name) and func.id == 'print':
-                        issues.append(ValidationIssue(
-                            rule_id="Q002",
-                            severity=Severity.ERROR,
-                            message="print() statement found",
-                            line=node.lineno,
-                            hint="Use logging.debug/info/warning/error instead",
-                            fixable=True,
-                        ))
-        except SyntaxError:
-            pass
+        for node in nodes:
+            if isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name) and func.id == 'print':
+                    issues.append(ValidationIssue(
+                        rule_id="Q002",
+                        severity=Severity.ERROR,
+                        message="print() statement found",
+                        line=node.lineno,
+                        hint="Use logging.debug/info/warning/error instead",
+                        fixable=True,
+                    ))
         return issues
 
     # =========================================================================
     # Q003: No Chinese in identifiers (FIXED: comprehensive check)
     # =========================================================================
 
-    def _check_no_chinese_identifiers(self, source: str, module_id: str) -> List[ValidationIssue]:
+    def _check_no_chinese_identifiers(self, nodes: List[ast.AST], module_id: str) -> List[ValidationIssue]:
         """Q003: No Chinese characters in identifiers."""
         issues = []
-        try:
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                # Function/method names
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if CHINESE_PATTERN.search(node.name):
-                        issues.append(self._chinese_issue("function name", node.name, node.lineno))
-                    # Function arguments
-                    for arg in node.args.args + node.args.posonlyargs + node.args.kwonlyargs:
-                        if CHINESE_PATTERN.search(arg.arg):
-                            issues.append(self._chinese_issue("parameter", arg.arg, node.lineno))
-                    if node.args.vararg and CHINESE_PATTERN.search(node.args.vararg.arg):
-                        issues.append(self._chinese_issue("*args parameter", node.args.vararg.arg, node.lineno))
-                    if node.args.kwarg and CHINESE_PATTERN.search(node.args.kwarg.arg):
-                        issues.append(self._chinese_issue("**kwargs parameter", node.args.kwarg.arg, node.lineno))
-
-                # Class names
-                elif isinstance(node, ast.ClassDef):
-                    if CHINESE_PATTERN.search(node.name):
-                        issues.append(self._chinese_issue("class name", node.name, node.lineno))
-
-                # Variable names (assignments)
-                elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                    if CHINESE_PATTERN.search(node.id):
-                        issues.append(self._chinese_issue("variable name", node.id, node.lineno))
-
-                # Attribute access (obj.attr)
-                elif isinstance(node, ast.Attribute):
-                    if CHINESE_PATTERN.search(node.attr):
-                        issues.append(self._chinese_issue("attribute name", node.attr, node.lineno))
-
-                # Keyword arguments in calls (func(key=value))
-                elif isinstance(node, ast.keyword) and node.arg:
-                    if CHINESE_PATTERN.search(node.arg):
-                        issues.append(self._chinese_issue("keyword argument", node.arg, node.lineno))
-
-                # Global/Nonlocal declarations
-                elif isinstance(node, (ast.Global, ast.Nonlocal)):
-                    for name in node.names:
-                        if CHINESE_PATTERN.search(name):
-                            issues.append(self._chinese_issue("global/nonlocal name", name, node.lineno))
-
-                # Import aliases
-                elif isinstance(node, ast.alias):
-                    if node.asname and CHINESE_PATTERN.search(node.asname):
-                        issues.append(self._chinese_issue("import alias", node.asname, node.lineno))
-
-        except SyntaxError:
-            pass
+        for node in nodes:
+            # Function/method names
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if CHINESE_PATTERN.search(node.name):
+                    issues.append(self._chinese_issue("function name", node.name, node.lineno))
+                # Function arguments
+                for arg in node.args.args + node.args.posonlyargs + node.args.kwonlyargs:
+                    if CHINESE_PATTERN.search(arg.arg):
+                        issues.append(self._chinese_issue("parameter", arg.arg, node.lineno))
+                if node.args.vararg and CHINESE_PATTERN.search(node.args.vararg.arg):
+                    issues.append(self._chinese_issue("*args parameter", node.args.vararg.arg, node.lineno))
+                if node.args.kwarg and CHINESE_PATTERN.search(node.args.kwarg.arg):
+                    issues.append(self._chinese_issue("**kwargs parameter", node.args.kwarg.arg, node.lineno))
+
+            # Class names
+            elif isinstance(node, ast.ClassDef):
+                if CHINESE_PATTERN.search(node.name):
+                    issues.append(self._chinese_issue("class name", node.name, node.lineno))
+
+            # Variable names (assignments)
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                if CHINESE_PATTERN.search(node.id):
+                    issues.append(self._chinese_issue("variable name", node.id, node.lineno))
+
+            # Attribute access (obj.attr)
+            elif isinstance(node, ast.Attribute):
+                if CHINESE_PATTERN.search(node.attr):
+                    issues.append(self._chinese_issue("attribute name", node.attr, node.lineno))
+
+            # Keyword arguments in calls (func(key=value))
+            elif isinstance(node, ast.keyword) and node.arg:
+                if CHINESE_PATTERN.search(node.arg):
+                    issues.append(self._chinese_issue("keyword argument", node.arg, node.lineno))
+
+            # Global/Nonlocal declarations
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                for name in node.names:
+                    if CHINESE_PATTERN.search(name):
+                        issues.append(self._chinese_issue("global/nonlocal name", name, node.lineno))
+
+            # Import aliases
+            elif isinstance(node, ast.alias):
+                if node.asname and CHINESE_PATTERN.search(node.asname):
+                    issues.append(self._chinese_issue("import alias", node.asname, node.lineno))
         return issues
 
     def _chinese_issue(self, kind: str, name: str, line: int) -> ValidationIssue:
@@ -419,24 +427,20 @@ class ModuleQualityValidator:
     # Q010: Complexity (FIXED: BoolOp handling)
     # =========================================================================
 
-    def _check_complexity(self, source: str, module_id: str) -> List[ValidationIssue]:
+    def _check_complexity(self, nodes: List[ast.AST], module_id: str) -> List[ValidationIssue]:
         """Q010: Cyclomatic complexity should be reasonable."""
         issues = []
-        try:
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    complexity = self._calculate_complexity(node)
-                    if complexity > self.max_complexity:
-                        issues.append(ValidationIssue(
-                            rule_id="Q010",
-                            severity=Severity.WARNING,
-                            message=f"{node.name}() has high complexity ({complexity} > {self.max_complexity})",
-                            line=node.lineno,
-                            hint="Consider breaking into smaller functions",
-                        ))
-        except SyntaxError:
-            pass
+        for node in nodes:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                complexity = self._calculate_complexity(node)
+                if complexity > self.max_complexity:
+                    issues.append(ValidationIssue(
+                        rule_id="Q010",
+                        severity=Severity.WARNING,
+                        message=f"{node.name}() has high complexity ({complexity} > {self.max_complexity})",
+                        line=node.lineno,
+                        hint="Consider breaking into smaller functions",
+                    ))
         return issues
 
     def _calculate_complexity(self, node: ast.AST) -> int:
@@ -476,72 +480,61 @@ class ModuleQualityValidator:
     # Q011: Unused imports
     # =========================================================================
 
-    def _check_unused_imports(self, source: str, module_id: str) -> List[ValidationIssue]:
+    def _check_unused_imports(self, nodes: List[ast.AST], module_id: str) -> List[ValidationIssue]:
         """Q011: Detect unused imports."""
         issues = []
-        try:
-            tree = ast.parse(source)
-
-            # Collect all imported names
-            imported_names = set()
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imported_names.add(alias.asname or alias.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom):
-                    for alias in node.names:
-                        if alias.name != '*':
-                            imported_names.add(alias.asname or alias.name)
-
-            # Collect all used names
-            used_names = set()
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                    used_names.add(node.id)
-                elif isinstance(node, ast.Attribute):
-                    # obj.attr - obj is used
-                    if isinstance(node.value, ast.Name):
-                        used_names.add(node.value.id)
-
-            # Find unused imports
-            unused = imported_names - used_names
-            for name in unused:
-                issues.append(ValidationIssue(
-                    rule_id="Q011",
-                    severity=Severity.WARNING,
-                    message=f"Unused import: {name}",
-                    hint=f"Remove 'import {name}' or use it",
-                    fixable=True,
-                ))
-        except SyntaxError:
-            pass
+
+        # Collect imported names and used names in one pass
+        imported_names = set()
+        used_names = set()
+        for node in nodes:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imported_names.add(alias.asname or alias.name.split('.')[0])
+            elif isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    if alias.name != '*':
+                        imported_names.add(alias.asname or alias.name)
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                used_names.add(node.id)
+            elif isinstance(node, ast.Attribute):
+                # obj.attr - obj is used
+                if isinstance(node.value, ast.Name):
+                    used_names.add(node.value.id)
+
+        # Find unused imports
+        unused = imported_names - used_names
+        for name in unused:
+            issues.append(ValidationIssue(
+                rule_id="Q011",
+                severity=Severity.WARNING,
+                message=f"Unused import: {name}",
+                hint=f"Remove 'import {name}' or use it",
+                fixable=True,
+            ))
         return issues
 
     # =========================================================================
     # Q012: Function length limit
     # =========================================================================
 
-    def _check_function_length(self, source: str, module_id: str) -> List[ValidationIssue]:
+    def _check_function_length(self, nodes: List[ast.AST], module_id: str) -> List[ValidationIssue]:
         """Q012: Function should not exceed 50 lines."""
         issues = []
         max_lines = 50
-        try:
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Calculate function line count
-                    if hasattr(node, 'end_lineno') and node.end_lineno:
-                        length = node.end_lineno - node.lineno + 1
-                        if length > max_lines:
-                            issues.append(ValidationIssue(
-                                rule_id="Q012",
-                                severity=Severity.WARNING,
-                                message=f"Function '{node.name}' is {length} lines (max {max_lines})",
-                                line=node.lineno,
-                                hint="Consider breaking into smaller functions",
-                            ))
-        except SyntaxError:
-            pass
+        for node in nodes:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                # Calculate function line count
+                if hasattr(node, 'end_lineno') and node.end_lineno:
+                    length = node.end_lineno - node.lineno + 1
+                    if length > max_lines:
+                        issues.append(ValidationIssue(
+                            rule_id="Q012",
+                            severity=Severity.WARNING,
+                            message=f"Function '{node.name}' is {length} lines (max {max_lines})",
+                            line=node.lineno,
+                            hint="Consider breaking into smaller functions",
+                        ))
         return issues
 
     # =========================================================================
@@ -633,6 +626,33 @@ class ModuleQualityValidator:
 # Main entry point for @register_module
 # =============================================================================
 
+def _validate_cached(
+    validator: ModuleQualityValidator,
+    module_class: Type,
+    module_id: str,
+    metadata: Dict[str, Any],
+    original_func: Optional[Any],
+) -> QualityReport:
+    """Run the validator, or return its stored report for unchanged source (see quality_cache.py)."""
+    cache = get_quality_cache()
+    key = None
+    if cache is not None:
+        key = report_key(module_class, module_id, metadata, original_func, validator.cache_config())
+        if key is not None:
+            hit = cache.get(key)
+            if hit is not None:
+                return QualityReport(
+                    module_id=module_id,
+                    issues=hit["issues"],
+                    source_file=hit["source_file"],
+                )
+
+    report = validator.validate(module_class, module_id, metadata, original_func=original_func)
+    if key is not None:
+        cache.put(key, report.issues, report.source_file)
+    return report
+
+
 def validate_module_quality(
     module_class: Type,
     module_id: str,
@@ -665,7 +685,7 @@ def validate_module_quality(
         stability = stability.value
 
     validator = ModuleQualityValidator()
-    report = validator.validate(module_class, module_id, metadata, original_func=original_func)
+    report = _validate_cached(validator, module_class, module_id, metadata, original_func)
 
     if report.has_blocking_issues(mode, stability):
         # Build error message
@@ -301,6 +301,7 @@ from .database import (
     SQL_QUERY,
     DB_QUERY_PARAMS,
     FETCH_MODE,
+    DB_CHUNK_SIZE,
     DB_DATA,
     WHERE_CONDITIONS,
     RETURNING_COLUMNS,
@@ -593,6 +594,7 @@ __all__ = [
     'DATETIME_PARSE_FORMAT',
     'DATETIME_STRING',
     'TIMEZONE',
+    'DB_CHUNK_SIZE',
     'DB_CONNECTION_STRING',
     'DB_DATA',
     'DB_HOST',
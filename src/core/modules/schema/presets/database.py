@@ -241,8 +241,34 @@ def FETCH_MODE(
             {"value": "all", "label": "All Rows"},
             {"value": "one", "label": "First Row Only"},
             {"value": "none", "label": "None (INSERT/UPDATE)"},
+            {"value": "chunked", "label": "All Rows, in Chunks"},
         ],
-        description='How many rows to return from the query',
+        description='How many rows to return from the query. "chunked" also splits all rows '
+                    'into chunk_size items; the full result is still buffered in memory',
+        group=FieldGroup.OPTIONS,
+    )
+
+
+def DB_CHUNK_SIZE(
+    *,
+    key: str = "chunk_size",
+    default: int = 1000,
+    fetch_key: str = "fetch",
+    label: str = "Chunk Size",
+    label_key: str = "schema.field.db_chunk_size",
+) -> Dict[str, Dict[str, Any]]:
+    """Rows per item when query results are returned in chunks."""
+    return field(
+        key,
+        type="number",
+        label=label,
+        label_key=label_key,
+        default=default,
+        required=False,
+        min=1,
+        max=100000,
+        description='Rows per output item in chunked mode (the full result is buffered first)',
+        showIf={fetch_key: {"$in": ["chunked"]}},
         group=FieldGroup.OPTIONS,
     )
 
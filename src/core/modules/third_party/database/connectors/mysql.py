@@ -6,7 +6,7 @@ Execute SQL queries on MySQL database.
 """
 import os
 
-from .....utils import enforce_outbound_host
+from .....utils import enforce_outbound_host_async
 from ....registry import register_module
 from ....schema import compose, presets
 
@@ -109,7 +109,7 @@ async def mysql_query(context):
     # anywhere the runner can route, which is SSRF without a URL. A host from
     # MYSQL_HOST is operator configuration and gets the same check — the guard
     # is cheap and the operator can widen it via FLYTO_ALLOWED_HOSTS.
-    enforce_outbound_host(host, purpose='MySQL')
+    await enforce_outbound_host_async(host, purpose='MySQL')
 
     conn_params = {
         'host': host,
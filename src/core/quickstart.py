@@ -212,7 +212,7 @@ async def _run_demo(work_dir, evidence_path):
 
     header("3. Evidence — Context Snapshots")
 
-    await asyncio.sleep(0.2)  # let async evidence writes flush
+    await hooks.flush()
     evidence_list = await evidence_store.load_evidence(execution_id)
 
     for ev in evidence_list:
@@ -255,6 +255,7 @@ async def _run_demo(work_dir, evidence_path):
             initial_context=context,
         )
         await replay_engine.execute()
+        await replay_hooks.flush()
         return {
             "ok": True,
             "execution_id": replay_id,
@@ -74,16 +74,23 @@ from .protocol import (
     ErrorCode,
     PROTOCOL_VERSION,
 )
+from .framing import (
+    BlobChannel,
+    FramingError,
+    MessageCodec,
+)
 from .process import (
     PluginProcess,
     ProcessConfig,
     ProcessStatus,
     RestartPolicy,
+    StartupMetrics,
 )
 from .manager import (
     PluginManager,
     PluginManifest,
     PluginInfo,
+    StartupStats,
     RuntimeConfig as ManifestRuntimeConfig,
 )
 from .health import (
@@ -169,17 +176,22 @@ __all__ = [
     "ProtocolDecoder",
     "ErrorCode",
     "PROTOCOL_VERSION",
+    "BlobChannel",
+    "FramingError",
+    "MessageCodec",
 
     # Process management (Phase 1)
     "PluginProcess",
     "ProcessConfig",
     "ProcessStatus",
     "RestartPolicy",
+    "StartupMetrics",
 
     # Plugin management (Phase 1)
     "PluginManager",
     "PluginManifest",
     "PluginInfo",
+    "StartupStats",
     "ManifestRuntimeConfig",
 
     # Health checking (Phase 1)
@@ -25,6 +25,8 @@ class ProcessConfig:
     idle_timeout_seconds: int = 300
     min_processes: int = 0
     max_processes: int = 2
+    # Workers per plugin id to start before the first invoke
+    warm_pools: Dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -254,6 +256,7 @@ class RuntimeConfig:
             idle_timeout_seconds=data.get("idle_timeout_seconds", data.get("idleTimeoutSeconds", 300)),
             min_processes=data.get("min_processes", data.get("minProcesses", 0)),
             max_processes=data.get("max_processes", data.get("maxProcesses", 2)),
+            warm_pools=data.get("warm_pools", data.get("warmPools", {})),
         )
 
     @staticmethod
@@ -359,6 +362,7 @@ class RuntimeConfig:
                 "idleTimeoutSeconds": self.process.idle_timeout_seconds,
                 "minProcesses": self.process.min_processes,
                 "maxProcesses": self.process.max_processes,
+                "warmPools": self.process.warm_pools,
             },
             "restartPolicy": {
                 "maxRestarts": self.restart_policy.max_restarts,
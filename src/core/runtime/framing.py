@@ -0,0 +1,287 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Plugin Transport Framing
+
+Wire formats for the plugin protocol after the handshake.
+
+Every plugin starts in newline-delimited JSON, which is what the handshake
+itself uses. In its handshake the host offers:
+
+    "transport": {
+        "framing": ["length-prefixed", "newline"],
+        "encodings": ["msgpack", "json"],      # msgpack only if installed
+        "blobDir": "/dev/shm/flyto-blobs-xyz",  # omitted when disabled
+        "blobThreshold": 262144
+    }
+
+A plugin that understands it answers with its choice,
+
+    "transport": {"framing": "length-prefixed", "encoding": "msgpack", "blobs": true}
+
+and both sides switch right after the handshake response. A plugin that
+ignores the offer keeps newline JSON, so existing plugins are unaffected.
+
+Length-prefixed frames are a 4-byte big-endian payload length followed by
+the encoded message. Sizes are checked before the payload is read, and a
+frame needs no escaping or scanning for a delimiter.
+
+With blobs enabled, string or bytes values above the threshold travel out
+of band: the sender writes them to a file in the blob directory (tmpfs
+where available) and puts a reference in the message,
+
+    {"$blob": "<handle>", "kind": "str" | "bytes", "size": <bytes>}
+
+The receiver reads the file, deletes it and substitutes the value. Handles
+are plain names confined to the blob directory, which only the host and its
+plugin can write (mode 0700).
+"""
+
+import asyncio
+import json
+import os
+import re
+import secrets
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .protocol import MAX_MESSAGE_SIZE
+
+FRAMING_NEWLINE = "newline"
+FRAMING_LENGTH_PREFIXED = "length-prefixed"
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+SUPPORTED_FRAMINGS = (FRAMING_LENGTH_PREFIXED, FRAMING_NEWLINE)
+
+# Security: Bounds on out-of-band payloads
+MAX_BLOB_SIZE = 256 * 1024 * 1024  # 256MB per value
+MAX_BLOBS_PER_MESSAGE = 1024
+DEFAULT_BLOB_THRESHOLD = 256 * 1024  # 256KB
+
+BLOB_KEY = "$blob"
+_FRAME_HEADER = struct.Struct(">I")
+_BLOB_HANDLE_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+_SHM_DIR = Path("/dev/shm")
+
+
+class FramingError(ValueError):
+    """A frame or blob reference violates the transport contract."""
+
+
+def _msgpack():
+    """The msgpack module, or None when it is not installed."""
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def supported_encodings() -> List[str]:
+    """Encodings this side can speak, preferred first."""
+    if _msgpack() is not None:
+        return [ENCODING_MSGPACK, ENCODING_JSON]
+    return [ENCODING_JSON]
+
+
+class MessageCodec:
+    """
+    Encodes and decodes protocol messages for one framing/encoding pair.
+
+    The default instance is newline-delimited JSON, the format every plugin
+    speaks before (and, if it does not negotiate, after) the handshake.
+    """
+
+    def __init__(self, framing: str = FRAMING_NEWLINE, encoding: str = ENCODING_JSON):
+        if framing not in SUPPORTED_FRAMINGS:
+            raise FramingError(f"Unsupported framing: {framing}")
+        if encoding not in (ENCODING_JSON, ENCODING_MSGPACK):
+            raise FramingError(f"Unsupported encoding: {encoding}")
+        if encoding == ENCODING_MSGPACK and framing != FRAMING_LENGTH_PREFIXED:
+            # Binary payloads may contain the delimiter
+            raise FramingError("msgpack requires length-prefixed framing")
+        if encoding == ENCODING_MSGPACK and _msgpack() is None:
+            raise FramingError("msgpack is not installed")
+        self.framing = framing
+        self.encoding = encoding
+
+    def dumps(self, message: Any) -> bytes:
+        """Encode one message (a dict, or an already-serialized JSON string) as a frame."""
+        if self.encoding == ENCODING_MSGPACK:
+            if isinstance(message, str):
+                message = json.loads(message)
+            payload = _msgpack().packb(message, use_bin_type=True)
+        elif isinstance(message, str):
+            payload = message.encode("utf-8")
+        else:
+            payload = json.dumps(message).encode("utf-8")
+
+        if len(payload) > MAX_MESSAGE_SIZE:
+            raise FramingError(
+                f"Message too large ({len(payload)} bytes, max {MAX_MESSAGE_SIZE})"
+            )
+        if self.framing == FRAMING_NEWLINE:
+            return payload + b"\n"
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+    def loads(self, payload: bytes) -> Any:
+        """Decode one frame payload (without header or delimiter)."""
+        if len(payload) > MAX_MESSAGE_SIZE:
+            raise FramingError(
+                f"Message too large ({len(payload)} bytes, max {MAX_MESSAGE_SIZE})"
+            )
+        if self.encoding == ENCODING_MSGPACK:
+            return _msgpack().unpackb(payload, raw=False)
+        return json.loads(payload.decode("utf-8"))
+
+    async def read(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Read the next frame payload from ``reader``.
+
+        Returns:
+            The payload, b"" for a blank line in newline mode, or None at EOF
+
+        Raises:
+            FramingError: If the announced frame exceeds MAX_MESSAGE_SIZE
+        """
+        if self.framing == FRAMING_NEWLINE:
+            line = await reader.readline()
+            if not line:
+                return None
+            return line.strip()
+
+        try:
+            header = await reader.readexactly(_FRAME_HEADER.size)
+        except asyncio.IncompleteReadError:
+            return None
+        (length,) = _FRAME_HEADER.unpack(header)
+        if length > MAX_MESSAGE_SIZE:
+            raise FramingError(f"Frame too large ({length} bytes, max {MAX_MESSAGE_SIZE})")
+        try:
+            return await reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            return None
+
+
+class BlobChannel:
+    """
+    Out-of-band transfer of large values through files in a private directory.
+
+    The directory lives on tmpfs (/dev/shm) when the host has one, so a blob
+    is a memory copy rather than disk I/O.
+    """
+
+    def __init__(self, directory: Path, threshold: int = DEFAULT_BLOB_THRESHOLD):
+        self.directory = Path(directory)
+        self.threshold = threshold
+        # Set once the plugin accepts the channel in its handshake answer
+        self.accepted = False
+
+    @classmethod
+    def create(cls, threshold: int = DEFAULT_BLOB_THRESHOLD) -> "BlobChannel":
+        """Create a channel in a fresh private directory."""
+        base = _SHM_DIR if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK) else None
+        directory = tempfile.mkdtemp(prefix="flyto-blobs-", dir=base)
+        return cls(Path(directory), threshold)
+
+    def close(self) -> None:
+        """Remove the directory and any blobs nobody collected."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def externalize(self, value: Any) -> Any:
+        """Return ``value`` with large strings/bytes replaced by blob references."""
+        if isinstance(value, (str, bytes, bytearray)):
+            # Characters for str: a cheap lower bound on the encoded size
+            if len(value) < self.threshold:
+                return value
+            return self._write(value)
+        if isinstance(value, dict):
+            return {key: self.externalize(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.externalize(item) for item in value]
+        return value
+
+    def resolve(self, value: Any) -> Any:
+        """Return ``value`` with blob references replaced by their contents."""
+        budget = [MAX_BLOBS_PER_MESSAGE]
+        return self._resolve(value, budget)
+
+    def _write(self, value: Any) -> Dict[str, Any]:
+        if isinstance(value, str):
+            data, kind = value.encode("utf-8"), "str"
+        else:
+            data, kind = bytes(value), "bytes"
+        if len(data) > MAX_BLOB_SIZE:
+            raise FramingError(f"Blob too large ({len(data)} bytes, max {MAX_BLOB_SIZE})")
+        handle = secrets.token_hex(16)
+        fd = os.open(self.directory / handle, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return {BLOB_KEY: handle, "kind": kind, "size": len(data)}
+
+    def _resolve(self, value: Any, budget: List[int]) -> Any:
+        if isinstance(value, dict):
+            if BLOB_KEY in value:
+                budget[0] -= 1
+                if budget[0] < 0:
+                    raise FramingError(f"Too many blobs (max {MAX_BLOBS_PER_MESSAGE})")
+                return self._read(value)
+            return {key: self._resolve(item, budget) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item, budget) for item in value]
+        return value
+
+    def _read(self, ref: Dict[str, Any]) -> Any:
+        handle = ref.get(BLOB_KEY)
+        if not isinstance(handle, str) or not _BLOB_HANDLE_PATTERN.match(handle):
+            raise FramingError("Invalid blob handle")
+        path = self.directory / handle
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        except OSError as e:
+            raise FramingError(f"Blob not found: {handle}") from e
+        try:
+            with os.fdopen(fd, "rb") as f:
+                data = f.read(MAX_BLOB_SIZE + 1)
+        finally:
+            path.unlink(missing_ok=True)
+        if len(data) > MAX_BLOB_SIZE:
+            raise FramingError(f"Blob too large (max {MAX_BLOB_SIZE})")
+        if ref.get("kind") == "bytes":
+            return data
+        return data.decode("utf-8")
+
+
+def transport_offer(blobs: Optional[BlobChannel]) -> Dict[str, Any]:
+    """The host's transport offer for the handshake params."""
+    offer: Dict[str, Any] = {
+        "framing": list(SUPPORTED_FRAMINGS),
+        "encodings": supported_encodings(),
+    }
+    if blobs is not None:
+        offer["blobDir"] = str(blobs.directory)
+        offer["blobThreshold"] = blobs.threshold
+    return offer
+
+
+def negotiate(choice: Any) -> MessageCodec:
+    """
+    The codec for a plugin's handshake answer.
+
+    Anything missing or unrecognized falls back to newline JSON, so a
+    plugin cannot talk the host into a format it did not offer.
+    """
+    if not isinstance(choice, dict):
+        return MessageCodec()
+    framing = choice.get("framing", FRAMING_NEWLINE)
+    encoding = choice.get("encoding", ENCODING_JSON)
+    if framing not in SUPPORTED_FRAMINGS or encoding not in supported_encodings():
+        return MessageCodec()
+    try:
+        return MessageCodec(framing, encoding)
+    except FramingError:
+        return MessageCodec()
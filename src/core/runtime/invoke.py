@@ -246,7 +246,7 @@ class RuntimeInvoker:
 
         try:
             from ..modules.registry import ModuleRegistry
-            available = set(ModuleRegistry.list_all())
+            available = set(ModuleRegistry.module_ids())
             self._router.set_available_legacy(available)
             self._legacy_modules_loaded = True
             logger.debug(f"Loaded {len(available)} legacy modules for routing")
@@ -19,7 +19,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .exceptions import (
     PathTraversalError,
@@ -30,7 +30,13 @@ from .exceptions import (
     ValidationError,
 )
 from .languages import detect_language, get_language_config, validate_entry_point
-from .process import PluginProcess, ProcessConfig, ProcessStatus, RestartPolicy
+from .process import (
+    PluginProcess,
+    ProcessConfig,
+    ProcessStatus,
+    RestartPolicy,
+    StartupMetrics,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +62,7 @@ MAX_PLUGIN_ID_LENGTH = 128
 MAX_VERSION_LENGTH = 32
 MAX_ENTRY_POINT_LENGTH = 256
 MAX_PERMISSIONS_COUNT = 50
+MAX_WORKERS_PER_PLUGIN = 32
 
 
 def validate_plugin_id(plugin_id: str) -> None:
@@ -158,6 +165,11 @@ class RuntimeConfig:
     language: str = "python"
     entry: str = "main.py"
     min_flyto_version: Optional[str] = None
+    # Worker pool size; None falls back to the manager's min/maxProcesses
+    min_workers: Optional[int] = None
+    max_workers: Optional[int] = None
+    # Workers to start ahead of traffic (see PluginManager.prewarm)
+    warm_workers: Optional[int] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RuntimeConfig":
@@ -168,6 +180,9 @@ class RuntimeConfig:
             language=data.get("language", "python"),
             entry=data.get("entry", data.get("entryPoint", "main.py")),
             min_flyto_version=data.get("minFlytoVersion", data.get("min_flyto_version")),
+            min_workers=data.get("minWorkers", data.get("min_workers")),
+            max_workers=data.get("maxWorkers", data.get("max_workers")),
+            warm_workers=data.get("warmWorkers", data.get("warm_workers")),
         )
 
 
@@ -251,6 +266,21 @@ class PluginManifest:
             if dangerous:
                 logger.info(f"Plugin {plugin_id} has dangerous permissions: {dangerous}")
 
+        # Worker pool size: a manifest must not be able to fork-bomb the host
+        if validate:
+            for name, value in (("minWorkers", runtime.min_workers),
+                                ("maxWorkers", runtime.max_workers),
+                                ("warmWorkers", runtime.warm_workers)):
+                if value is None:
+                    continue
+                if (not isinstance(value, int) or isinstance(value, bool)
+                        or not 0 <= value <= MAX_WORKERS_PER_PLUGIN):
+                    raise ValidationError(
+                        f"runtime.{name} must be an integer between 0 and "
+                        f"{MAX_WORKERS_PER_PLUGIN}",
+                        field=f"runtime.{name}"
+                    )
+
         return cls(
             id=plugin_id,
             name=data.get("name", plugin_id),
@@ -285,6 +315,52 @@ def _set_event() -> asyncio.Event:
     return event
 
 
+@dataclass
+class StartupStats:
+    """Start-up latency of one plugin's processes, aggregated across starts.
+
+    ``cold_starts`` counts starts an invocation had to wait for; ``warm_starts``
+    those done ahead of traffic (pre-warming and background scale-out). The
+    latencies cover both, since a process costs the same to start either way —
+    the split says how often callers paid it.
+    """
+    cold_starts: int = 0
+    warm_starts: int = 0
+    last: Optional[StartupMetrics] = None
+    total_spawn_ms: float = 0.0
+    total_handshake_ms: float = 0.0
+    max_total_ms: float = 0.0
+
+    @property
+    def starts(self) -> int:
+        """All recorded starts."""
+        return self.cold_starts + self.warm_starts
+
+    def record(self, metrics: StartupMetrics, cold: bool) -> None:
+        """Add one successful start."""
+        if cold:
+            self.cold_starts += 1
+        else:
+            self.warm_starts += 1
+        self.last = metrics
+        self.total_spawn_ms += metrics.spawn_ms
+        self.total_handshake_ms += metrics.handshake_ms
+        self.max_total_ms = max(self.max_total_ms, metrics.total_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for status and metrics endpoints."""
+        starts = self.starts or 1
+        return {
+            "coldStarts": self.cold_starts,
+            "warmStarts": self.warm_starts,
+            "lastSpawnMs": round(self.last.spawn_ms, 2) if self.last else None,
+            "lastHandshakeMs": round(self.last.handshake_ms, 2) if self.last else None,
+            "avgSpawnMs": round(self.total_spawn_ms / starts, 2),
+            "avgHandshakeMs": round(self.total_handshake_ms / starts, 2),
+            "maxStartupMs": round(self.max_total_ms, 2),
+        }
+
+
 @dataclass
 class PluginInfo:
     """Information about a loaded plugin.
@@ -303,6 +379,14 @@ class PluginInfo:
     wait for the process to drain instead of polling it. ``lock`` serializes the
     lifecycle transitions themselves — start, stop, unload — so two of them can
     never interleave.
+
+    ``process`` is the plugin's primary worker. Under concurrent load the
+    manager adds ``extra_workers`` (up to ``max_workers`` in total) and sends
+    each invocation to the worker with the fewest outstanding requests;
+    ``worker_load`` holds those counts, keyed by ``id()`` of the worker, and
+    ``worker_last_used`` the monotonic time each worker last finished a call.
+    The primary is always the last worker retired, so a plugin that has
+    extras always has a started primary as well.
     """
     plugin_id: str
     manifest: PluginManifest
@@ -314,14 +398,52 @@ class PluginInfo:
     idle_event: asyncio.Event = field(
         default_factory=_set_event, repr=False, compare=False
     )
+    process_config: Optional[ProcessConfig] = field(default=None, repr=False, compare=False)
+    min_workers: int = 0
+    max_workers: int = 1
+    scale_up_threshold: int = 1
+    extra_workers: List[PluginProcess] = field(default_factory=list, repr=False, compare=False)
+    worker_load: Dict[int, int] = field(default_factory=dict, repr=False, compare=False)
+    worker_last_used: Dict[int, float] = field(default_factory=dict, repr=False, compare=False)
+    scale_task: Optional[asyncio.Task] = field(default=None, repr=False, compare=False)
+
+    @property
+    def workers(self) -> List[PluginProcess]:
+        """All workers, primary first."""
+        return [self.process, *self.extra_workers]
+
+    def load_of(self, worker: PluginProcess) -> int:
+        """Outstanding invocations on ``worker``."""
+        return self.worker_load.get(id(worker), 0)
+
+    def pick_worker(self) -> Optional[PluginProcess]:
+        """The serving worker with the fewest outstanding invocations.
+
+        Ties go to the earlier worker, so light traffic keeps landing on the
+        primary and extras go idle long enough for the idle sweep to retire
+        them. Returns None when no worker is serving.
+        """
+        serving = [w for w in self.workers if w.is_serving]
+        if not serving:
+            return None
+        return min(serving, key=self.load_of)
 
-    def claim(self) -> None:
-        """Mark one invocation as in flight."""
+    def saturated(self) -> bool:
+        """Whether the pool should grow: every worker is at the queue threshold."""
+        if len(self.workers) >= self.max_workers:
+            return False
+        worker = self.pick_worker()
+        return worker is not None and self.load_of(worker) >= self.scale_up_threshold
+
+    def claim(self, worker: Optional[PluginProcess] = None) -> None:
+        """Mark one invocation as in flight, on ``worker`` if given."""
+        if worker is not None:
+            self.worker_load[id(worker)] = self.load_of(worker) + 1
         self.active_invocations += 1
         self.idle_event.clear()
         self.last_invoke_time = time.monotonic()
 
-    def release(self) -> None:
+    def release(self, worker: Optional[PluginProcess] = None) -> None:
         """Mark one invocation as finished.
 
         The timestamp is refreshed *before* the count drops, and the order is
@@ -331,6 +453,10 @@ class PluginInfo:
         stops a process on — so a long call could be followed by its own plugin
         being torn down as though it had been abandoned all along.
         """
+        if worker is not None:
+            key = id(worker)
+            self.worker_load[key] = max(self.load_of(worker) - 1, 0)
+            self.worker_last_used[key] = time.monotonic()
         self.last_invoke_time = time.monotonic()
         self.active_invocations -= 1
         if self.active_invocations < 0:
@@ -353,7 +479,8 @@ class PluginManager:
     - Load plugin manifests
     - Start/stop plugin processes
     - Route invoke requests to correct plugin
-    - Handle plugin lifecycle (lazy start, idle timeout)
+    - Handle plugin lifecycle (lazy start, warm pools, idle timeout)
+    - Record process start-up latency per plugin
     """
 
     def __init__(
@@ -384,7 +511,19 @@ class PluginManager:
         # Configuration from runtime config
         self._start_policy = self.config.get("startPolicy", "lazy")
         self._idle_timeout_seconds = self.config.get("idleTimeoutSeconds", 300)
+        # Worker pool per plugin: minProcesses stay up once started,
+        # maxProcesses caps scale-out, and a new worker is added when every
+        # worker has scaleUpQueueThreshold invocations outstanding. A
+        # manifest's runtime.minWorkers/maxWorkers override the first two.
+        self._min_processes = self.config.get("minProcesses", 0)
         self._max_processes = self.config.get("maxProcesses", 2)
+        self._scale_up_threshold = self.config.get("scaleUpQueueThreshold", 1)
+        # Warm pools: workers per plugin that prewarm() starts before the
+        # first invoke and that then count towards the plugin's minimum.
+        # warmPools maps plugin id -> workers and wins over a manifest's
+        # runtime.warmWorkers; startPolicy "eager" warms one worker (or
+        # min_workers) for every plugin that declares neither.
+        self._warm_pools: Dict[str, int] = dict(self.config.get("warmPools") or {})
         # How long an unload waits for accepted work to finish before stopping
         # the process anyway. Bounded on purpose: shutdown must not become
         # contingent on a plugin choosing to reply.
@@ -413,6 +552,10 @@ class PluginManager:
         self._task_lock = asyncio.Lock()
         self._shutting_down = False
 
+        # Start-up latency per plugin id; kept across unload so the cost of
+        # every cold start stays visible
+        self._startup_stats: Dict[str, StartupStats] = {}
+
     async def discover_plugins(self) -> List[str]:
         """
         Discover available plugins in the plugin directory.
@@ -575,7 +718,17 @@ class PluginManager:
         )
 
         # Create process (but don't start yet)
-        process = PluginProcess(process_config, self._restart_policy)
+        process = self._create_process(process_config)
+
+        max_workers = manifest.runtime.max_workers
+        if max_workers is None:
+            max_workers = self._max_processes
+        max_workers = max(int(max_workers), 1)
+        min_workers = manifest.runtime.min_workers
+        if min_workers is None:
+            min_workers = self._min_processes
+        min_workers = max(int(min_workers), self._warm_target(manifest))
+        min_workers = min(max(min_workers, 0), max_workers)
 
         # Create plugin info
         info = PluginInfo(
@@ -583,6 +736,10 @@ class PluginManager:
             manifest=manifest,
             process=process,
             path=plugin_path,
+            process_config=process_config,
+            min_workers=min_workers,
+            max_workers=max_workers,
+            scale_up_threshold=max(int(self._scale_up_threshold), 1),
         )
 
         self._plugins[plugin_id] = info
@@ -614,11 +771,88 @@ class PluginManager:
         if not info:
             return
 
+        await self._cancel_scaling(info)
         async with info.lock:
             await self._drain(info)
-            await info.process.stop()
+            await self._stop_workers(info)
         logger.info(f"Unloaded plugin: {plugin_id}")
 
+    def _create_process(self, process_config: ProcessConfig) -> PluginProcess:
+        """Create one (unstarted) worker process for a plugin."""
+        return PluginProcess(process_config, self._restart_policy)
+
+    def _warm_target(self, manifest: PluginManifest) -> int:
+        """Workers ``prewarm`` should have running for ``manifest``'s plugin."""
+        warm = self._warm_pools.get(manifest.id)
+        if warm is None:
+            warm = manifest.runtime.warm_workers
+        if warm is None:
+            warm = 1 if self._start_policy == "eager" else 0
+        return max(int(warm), 0)
+
+    async def _start_worker(self, info: PluginInfo, worker: PluginProcess,
+                            cold: bool) -> bool:
+        """Start ``worker`` and record its start-up latency.
+
+        ``cold`` marks a start an invocation is waiting on, as opposed to one
+        made ahead of traffic.
+        """
+        started = await worker.start()
+        metrics = getattr(worker, "last_startup", None)
+        if started and isinstance(metrics, StartupMetrics):
+            stats = self._startup_stats.setdefault(info.plugin_id, StartupStats())
+            stats.record(metrics, cold=cold)
+        return started
+
+    async def _join_worker(self, info: PluginInfo, worker: PluginProcess) -> bool:
+        """Add a started extra worker to ``info``'s pool, or stop it.
+
+        The worker is stopped instead if the plugin was stopped or unloaded
+        while it started, or the pool filled up meanwhile.
+        """
+        async with info.lock:
+            joinable = (
+                not self._shutting_down
+                and self._plugins.get(info.plugin_id) is info
+                and info.process.is_serving
+                and len(info.workers) < info.max_workers
+            )
+            if joinable:
+                info.extra_workers.append(worker)
+                info.worker_last_used[id(worker)] = time.monotonic()
+        if not joinable:
+            await worker.stop(reason="shutdown")
+        return joinable
+
+    async def _stop_workers(self, info: PluginInfo, reason: str = "shutdown") -> None:
+        """Stop every worker of ``info``, extras first. Caller holds ``info.lock``."""
+        extras, info.extra_workers = info.extra_workers, []
+        for worker in extras:
+            await self._retire_worker(info, worker, reason)
+        await info.process.stop(reason=reason)
+
+    async def _retire_worker(self, info: PluginInfo, worker: PluginProcess,
+                             reason: str) -> None:
+        """Stop an extra worker and drop its bookkeeping.
+
+        The caller has already removed it from ``extra_workers``, so no new
+        invocation can be dispatched to it while it stops.
+        """
+        info.worker_load.pop(id(worker), None)
+        info.worker_last_used.pop(id(worker), None)
+        try:
+            await worker.stop(reason=reason)
+        except Exception:  # noqa: BLE001 - one worker must not block the rest
+            logger.exception(f"Failed to stop worker of plugin {info.plugin_id}")
+
+    async def _cancel_scaling(self, info: PluginInfo) -> None:
+        """Cancel a scale-up in progress; its half-started worker stops itself."""
+        task = info.scale_task
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
     async def _drain(self, info: PluginInfo) -> bool:
         """Wait for ``info``'s in-flight invocations to finish.
 
@@ -676,7 +910,7 @@ class PluginManager:
                 return False
             if info.process.status == ProcessStatus.STOPPED:
                 return False
-            await info.process.stop(reason="idle")
+            await self._stop_workers(info, reason="idle")
 
         logger.info(f"Stopped plugin process (still loaded): {plugin_id}")
         return True
@@ -747,18 +981,25 @@ class PluginManager:
                 raise PluginNotFoundError(plugin_id)
 
             # Start process if not running (lazy start)
-            if not info.process.is_ready:
-                started = await info.process.start()
+            if not info.process.is_serving:
+                started = await self._start_worker(info, info.process, cold=True)
                 if not started:
                     raise PluginNotFoundError(plugin_id)
 
-            # Claim the process before releasing the lock, so the idle sweep
+            # Least-outstanding-requests dispatch. A pool that is saturated
+            # grows in the background; this call queues on the least loaded
+            # worker rather than waiting out a process start.
+            worker = info.pick_worker() or info.process
+            if info.saturated() or len(info.workers) < info.min_workers:
+                self._schedule_scale_up(info)
+
+            # Claim the worker before releasing the lock, so the idle sweep
             # cannot decide this plugin is unused between here and the invoke.
-            info.claim()
+            info.claim(worker)
 
         try:
             # Invoke the step
-            return await info.process.invoke(
+            return await worker.invoke(
                 step=step,
                 input_data=input_data,
                 config=config,
@@ -769,7 +1010,121 @@ class PluginManager:
             # Stamps on the way out before dropping the count, so idleness is
             # measured from when the plugin stopped working and no sweep can see
             # "released" and "stale" at the same time. See PluginInfo.release.
-            info.release()
+            info.release(worker)
+
+    def _schedule_scale_up(self, info: PluginInfo) -> None:
+        """Start one more worker for ``info`` unless a start is already running."""
+        if info.scale_task is not None and not info.scale_task.done():
+            return
+        if len(info.workers) >= info.max_workers or info.process_config is None:
+            return
+        info.scale_task = asyncio.create_task(self._scale_up(info))
+
+    async def _scale_up(self, info: PluginInfo) -> None:
+        """Start workers until the pool has ``min_workers``, or one more if saturated.
+
+        The process start runs outside ``info.lock`` so invocations keep flowing
+        to the existing workers meanwhile; the new worker joins the pool under
+        the lock (see ``_join_worker``).
+        """
+        while True:
+            worker = self._create_process(info.process_config)
+            try:
+                started = await self._start_worker(info, worker, cold=False)
+            except asyncio.CancelledError:
+                await worker.stop(reason="shutdown")
+                raise
+            if not started:
+                logger.warning(f"Could not add a worker to plugin {info.plugin_id}")
+                return
+            if not await self._join_worker(info, worker):
+                return
+
+            logger.info(
+                f"Plugin {info.plugin_id} scaled to {len(info.workers)} worker(s)"
+            )
+            if len(info.workers) >= info.min_workers and not info.saturated():
+                return
+
+    async def prewarm(self, plugin_ids: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Start warm pools ahead of traffic.
+
+        A plugin started lazily makes its first caller wait for the interpreter
+        to spawn and the handshake to complete, which for a heavy plugin can be
+        seconds. Pre-warming pays that at server start instead: each plugin is
+        loaded and brought up to its warm target — ``warmPools``, the manifest's
+        ``runtime.warmWorkers``, or one worker under ``startPolicy: eager`` —
+        with the extra workers spawned concurrently rather than one by one.
+        Warm workers count towards ``min_workers``, so the idle sweep keeps
+        them running.
+
+        Failures are per plugin: a plugin that cannot start is logged and
+        reported as 0 workers, and the others still warm.
+
+        Args:
+            plugin_ids: Plugins to warm; defaults to every discovered plugin
+                with a warm target. Listed plugins get at least one worker.
+
+        Returns:
+            Running workers per plugin id
+        """
+        if plugin_ids is None:
+            if not self._manifests:
+                await self.discover_plugins()
+            plugin_ids = [
+                plugin_id for plugin_id, manifest in self._manifests.items()
+                if self._warm_target(manifest) > 0
+            ]
+        plugin_ids = list(plugin_ids)
+
+        results = await asyncio.gather(
+            *(self._prewarm_plugin(plugin_id) for plugin_id in plugin_ids),
+            return_exceptions=True,
+        )
+        warmed: Dict[str, int] = {}
+        for plugin_id, result in zip(plugin_ids, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not pre-warm plugin {plugin_id}: {result}")
+                warmed[plugin_id] = 0
+            else:
+                warmed[plugin_id] = result
+        if warmed:
+            logger.info(f"Pre-warmed {sum(warmed.values())} worker(s) in pool {self.pool_id}")
+        return warmed
+
+    async def _prewarm_plugin(self, plugin_id: str) -> int:
+        """Bring one plugin up to its warm target; returns its running workers."""
+        info = await self.load_plugin(plugin_id)
+
+        async with info.lock:
+            # Same checks as the lazy start in invoke
+            if self._shutting_down:
+                raise PluginManagerShutdownError(plugin_id, self.pool_id)
+            if self._plugins.get(plugin_id) is not info:
+                raise PluginNotFoundError(plugin_id)
+            if not info.process.is_serving:
+                if not await self._start_worker(info, info.process, cold=False):
+                    return 0
+            missing = max(info.min_workers, 1) - len(info.workers)
+
+        if missing <= 0 or info.process_config is None:
+            return len(info.workers)
+
+        workers = [self._create_process(info.process_config) for _ in range(missing)]
+        try:
+            started = await asyncio.gather(
+                *(self._start_worker(info, worker, cold=False) for worker in workers)
+            )
+        except asyncio.CancelledError:
+            for worker in workers:
+                await worker.stop(reason="shutdown")
+            raise
+        for worker, ok in zip(workers, started):
+            if ok:
+                await self._join_worker(info, worker)
+        return len(info.workers)
 
     async def start_health_checks(self, interval_seconds: int = 30) -> bool:
         """Start periodic health checks.
@@ -836,6 +1191,25 @@ class PluginManager:
                 healthy = await info.process.ping()
                 if not healthy:
                     logger.warning(f"Plugin {plugin_id} failed health check")
+            await self._retire_unhealthy_workers(info)
+
+    async def _retire_unhealthy_workers(self, info: PluginInfo) -> None:
+        """Retire extra workers that crashed or fail a ping while idle.
+
+        Busy workers are not pinged: a plugin that handles one request at a
+        time answers the ping only after its current call, which would read
+        as a failure. The primary is left to its restart policy, as before.
+        """
+        for worker in list(info.extra_workers):
+            if worker.is_serving:
+                if info.load_of(worker) or await worker.ping():
+                    continue
+            async with info.lock:
+                if worker not in info.extra_workers or info.load_of(worker):
+                    continue
+                info.extra_workers.remove(worker)
+            logger.warning(f"Retiring unhealthy worker of plugin {info.plugin_id}")
+            await self._retire_worker(info, worker, "unhealthy")
 
     async def _check_idle(self):
         """Stop idle plugins that haven't been invoked recently.
@@ -855,18 +1229,44 @@ class PluginManager:
 
         now = time.monotonic()
         for plugin_id, info in list(self._plugins.items()):
+            await self._retire_idle_workers(info, now, idle_timeout)
             last_invoke = info.last_invoke_time
             if (
                 last_invoke is not None
                 and (now - last_invoke) > idle_timeout
                 and info.process.status == ProcessStatus.READY
                 and not info.active_invocations
+                and info.min_workers == 0
             ):
                 logger.info(f"Stopping idle plugin: {plugin_id}")
                 # stop_plugin re-checks under the plugin lock; the conditions
                 # above are a cheap filter, not the decision.
                 await self.stop_plugin(plugin_id)
 
+    async def _retire_idle_workers(self, info: PluginInfo, now: float,
+                                   idle_timeout: float) -> None:
+        """Shrink the pool: stop extra workers idle longer than ``idle_timeout``.
+
+        Never below ``min_workers``; newest extras go first, since dispatch
+        prefers earlier workers and the newest are the least used.
+        """
+        retired = []
+        async with info.lock:
+            for worker in reversed(list(info.extra_workers)):
+                if len(info.workers) <= max(info.min_workers, 1):
+                    break
+                last_used = info.worker_last_used.get(id(worker), now)
+                if info.load_of(worker) or (now - last_used) <= idle_timeout:
+                    continue
+                info.extra_workers.remove(worker)
+                retired.append(worker)
+        for worker in retired:
+            await self._retire_worker(info, worker, "idle")
+        if retired:
+            logger.info(
+                f"Plugin {info.plugin_id} scaled down to {len(info.workers)} worker(s)"
+            )
+
     async def shutdown(self):
         """Shutdown all plugins and cleanup.
 
@@ -904,6 +1304,16 @@ class PluginManager:
             "version": info.manifest.version,
             "status": info.process.status.value,
             "steps": [s.get("id") for s in info.manifest.steps],
+            "workers": len(info.workers) if info.process.is_serving else 0,
+            "activeInvocations": info.active_invocations,
+            "startup": self._startup_stats.get(plugin_id, StartupStats()).to_dict(),
+        }
+
+    def get_startup_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Start-up latency per plugin id, for every plugin started so far."""
+        return {
+            plugin_id: stats.to_dict()
+            for plugin_id, stats in self._startup_stats.items()
         }
 
     def list_plugins(self) -> List[Dict[str, Any]]:
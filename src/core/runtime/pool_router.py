@@ -133,10 +133,13 @@ class PoolRouter:
         """Initialize the router and shared pool."""
         # Create shared pool
         shared_config = self._pool_configs["shared"]
+        shared_options = self.config.get("sharedPool", {})
         self._shared_pool = PluginManager(
             plugin_dir=self.plugin_dir,
             config={
                 "maxProcesses": shared_config.max_processes,
+                "startPolicy": shared_options.get("startPolicy", "lazy"),
+                "warmPools": shared_options.get("warmPools", {}),
             },
             pool_id="shared",
         )
@@ -144,6 +147,11 @@ class PoolRouter:
         # Discover plugins in shared pool
         await self._shared_pool.discover_plugins()
 
+        # Start warm pools now rather than on each plugin's first invoke.
+        # Dedicated pools are created on a tenant's first request, so they
+        # keep starting lazily.
+        await self._shared_pool.prewarm()
+
         # Create semaphore for shared pool
         self._pool_semaphores["shared"] = asyncio.Semaphore(
             shared_config.max_concurrent_invokes
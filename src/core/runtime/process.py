@@ -7,7 +7,6 @@ Handles subprocess lifecycle for plugin execution.
 """
 
 import asyncio
-import json
 import logging
 import os
 import signal
@@ -15,14 +14,23 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Union
 
 from .protocol import (
     ProtocolEncoder,
     ProtocolDecoder,
     JsonRpcResponse,
+    MAX_MESSAGE_SIZE,
     PROTOCOL_VERSION,
 )
+from .framing import (
+    BlobChannel,
+    FramingError,
+    MessageCodec,
+    DEFAULT_BLOB_THRESHOLD,
+    negotiate,
+    transport_offer,
+)
 from .exceptions import (
     PluginCrashedError,
     PluginTimeoutError,
@@ -106,6 +114,11 @@ class ProcessConfig:
     max_memory_mb: int = 512
     max_cpu_percent: int = 100
 
+    # Transport: offer length-prefixed/msgpack framing in the handshake, and
+    # pass values of at least blob_threshold_bytes out of band (0 disables)
+    negotiate_transport: bool = True
+    blob_threshold_bytes: int = DEFAULT_BLOB_THRESHOLD
+
     def get_language_config(self) -> LanguageConfig:
         """Get the language configuration for this plugin."""
         return get_language_config(self.language)
@@ -157,6 +170,18 @@ class ProcessConfig:
         return env
 
 
+@dataclass
+class StartupMetrics:
+    """Cold-start cost of one process start, in milliseconds."""
+    spawn_ms: float
+    handshake_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Spawn plus handshake: what a caller waiting on the start pays."""
+        return self.spawn_ms + self.handshake_ms
+
+
 @dataclass
 class RestartPolicy:
     """Restart policy for crashed plugins."""
@@ -172,7 +197,8 @@ class PluginProcess:
 
     Handles:
     - Process lifecycle (start, stop, restart)
-    - JSON-RPC communication over stdio
+    - JSON-RPC communication over stdio, in the framing negotiated at
+      handshake (see framing.py)
     - Health checking
     - Crash detection and restart policy
     """
@@ -189,6 +215,16 @@ class PluginProcess:
         self._status = ProcessStatus.STOPPED
         self._request_id = 0
         self._pending_requests: Dict[int, asyncio.Future] = {}
+        # Invocations awaiting a reply; the process is BUSY while any are
+        self._in_flight = 0
+
+        # Wire format: newline JSON until the handshake negotiates otherwise
+        self._codec = MessageCodec()
+        self._blobs: Optional[BlobChannel] = None
+        self._handshake_id: Optional[int] = None
+
+        # Timings of the most recent successful start
+        self.last_startup: Optional[StartupMetrics] = None
 
         # Restart tracking
         self._restart_times: List[float] = []
@@ -211,6 +247,16 @@ class PluginProcess:
         """Check if process is ready for invocations."""
         return self._status == ProcessStatus.READY
 
+    @property
+    def is_serving(self) -> bool:
+        """Check if process is started and accepting invocations (idle or busy)."""
+        return self._status in (ProcessStatus.READY, ProcessStatus.BUSY)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of invocations awaiting a reply."""
+        return self._in_flight
+
     @property
     def is_unhealthy(self) -> bool:
         """Check if process is marked unhealthy."""
@@ -261,7 +307,12 @@ class PluginProcess:
                 f"(language: {self.config.language}, cmd: {cmd[0]})"
             )
 
-            # Start subprocess
+            if self.config.negotiate_transport and self.config.blob_threshold_bytes > 0:
+                self._blobs = BlobChannel.create(self.config.blob_threshold_bytes)
+
+            # Start subprocess. The stream limit bounds a newline-framed line;
+            # the 64KB default would reject any large result outright.
+            spawn_started = time.monotonic()
             self._process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
@@ -269,16 +320,27 @@ class PluginProcess:
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(self.config.plugin_dir),
                 env=env,
+                limit=MAX_MESSAGE_SIZE + 1,
             )
 
+            spawned = time.monotonic()
+
             # Start reader task
             self._reader_task = asyncio.create_task(self._read_stdout())
 
             # Perform handshake
             success = await self._handshake()
             if success:
+                self.last_startup = StartupMetrics(
+                    spawn_ms=(spawned - spawn_started) * 1000,
+                    handshake_ms=(time.monotonic() - spawned) * 1000,
+                )
                 self._status = ProcessStatus.READY
-                logger.info(f"Plugin {self.config.plugin_id} ready")
+                logger.info(
+                    f"Plugin {self.config.plugin_id} ready "
+                    f"(spawn {self.last_startup.spawn_ms:.0f}ms, "
+                    f"handshake {self.last_startup.handshake_ms:.0f}ms)"
+                )
                 return True
             else:
                 await self.stop()
@@ -287,6 +349,7 @@ class PluginProcess:
         except Exception as e:
             logger.error(f"Failed to start plugin {self.config.plugin_id}: {e}")
             self._status = ProcessStatus.STOPPED
+            self._reset_transport()
             return False
 
     async def stop(self, reason: str = "shutdown", grace_period_ms: int = 5000):
@@ -339,6 +402,7 @@ class PluginProcess:
             self._process = None
             self._reader_task = None
             self._status = ProcessStatus.STOPPED
+            self._reset_transport()
 
             # Cancel pending requests
             for future in self._pending_requests.values():
@@ -372,7 +436,7 @@ class PluginProcess:
             PluginTimeoutError: If invocation timed out
             PluginProtocolError: If protocol error
         """
-        if not self.is_ready:
+        if not self.is_serving:
             if not await self.start():
                 raise PluginCrashedError(self.config.plugin_id)
 
@@ -383,13 +447,17 @@ class PluginProcess:
         future: asyncio.Future = asyncio.Future()
         self._pending_requests[request_id] = future
 
+        self._in_flight += 1
         try:
             self._status = ProcessStatus.BUSY
 
             # Send invoke request
-            msg = ProtocolEncoder.encode_invoke(
+            request = ProtocolEncoder.invoke_request(
                 step, input_data, config, context, request_id, timeout
             )
+            msg = request.to_dict()
+            if self._blobs_active:
+                msg["params"]["input"] = self._blobs.externalize(input_data)
             await self._send(msg)
 
             # Wait for response
@@ -405,7 +473,10 @@ class PluginProcess:
 
         finally:
             self._pending_requests.pop(request_id, None)
-            if self._status == ProcessStatus.BUSY:
+            self._in_flight -= 1
+            # Requests are multiplexed by id, so one reply must not mark the
+            # process idle while others are still outstanding
+            if self._status == ProcessStatus.BUSY and not self._in_flight:
                 self._status = ProcessStatus.READY
 
     async def ping(self, timeout_ms: int = 5000) -> bool:
@@ -444,12 +515,15 @@ class PluginProcess:
         future: asyncio.Future = asyncio.Future()
         self._pending_requests[request_id] = future
 
+        self._handshake_id = request_id
+
         try:
             msg = ProtocolEncoder.encode_handshake(
                 PROTOCOL_VERSION,
                 self.config.plugin_id,
                 "startup",
                 request_id,
+                transport=transport_offer(self._blobs) if self.config.negotiate_transport else None,
             )
             await self._send(msg)
 
@@ -462,7 +536,9 @@ class PluginProcess:
                 result = response.result or {}
                 plugin_version = result.get("pluginVersion", "unknown")
                 logger.info(
-                    f"Handshake complete: {self.config.plugin_id} v{plugin_version}"
+                    f"Handshake complete: {self.config.plugin_id} v{plugin_version} "
+                    f"({self._codec.framing}/{self._codec.encoding}"
+                    f"{', blobs' if self._blobs_active else ''})"
                 )
                 return True
             else:
@@ -479,12 +555,36 @@ class PluginProcess:
 
         finally:
             self._pending_requests.pop(request_id, None)
+            self._handshake_id = None
+
+    @property
+    def _blobs_active(self) -> bool:
+        """Whether the plugin accepted the blob side channel."""
+        return self._blobs is not None and self._blobs.accepted
+
+    def _apply_transport(self, response: JsonRpcResponse) -> None:
+        """
+        Switch to the transport the plugin chose in its handshake response.
 
-    async def _send(self, message: str):
-        """Send message to plugin stdin."""
+        Runs in the reader, before it reads anything after the response, since
+        the plugin switches as soon as it has written it.
+        """
+        choice = (response.result or {}).get("transport") if response.is_success else None
+        self._codec = negotiate(choice)
+        if self._blobs is not None:
+            self._blobs.accepted = isinstance(choice, dict) and choice.get("blobs") is True
+
+    def _reset_transport(self) -> None:
+        """Back to newline JSON for the next start; drop uncollected blobs."""
+        self._codec = MessageCodec()
+        if self._blobs is not None:
+            self._blobs.close()
+            self._blobs = None
+
+    async def _send(self, message: Union[str, Dict[str, Any]]):
+        """Send message (JSON string or message dict) to plugin stdin."""
         if self._process and self._process.stdin:
-            data = (message + "\n").encode("utf-8")
-            self._process.stdin.write(data)
+            self._process.stdin.write(self._codec.dumps(message))
             await self._process.stdin.drain()
 
     async def _read_stdout(self):
@@ -494,18 +594,24 @@ class PluginProcess:
 
         try:
             while True:
-                line = await self._process.stdout.readline()
-                if not line:
+                try:
+                    payload = await self._codec.read(self._process.stdout)
+                except FramingError as e:
+                    # A bad frame header desynchronizes the stream for good
+                    logger.error(f"Plugin {self.config.plugin_id} framing error: {e}")
+                    self._process.kill()
+                    await self._handle_crash()
+                    break
+                if payload is None:
                     # Process ended
                     await self._handle_crash()
                     break
 
                 try:
-                    data = line.decode("utf-8").strip()
-                    if not data:
+                    if not payload:
                         continue
 
-                    raw = json.loads(data)
+                    raw = self._codec.loads(payload)
 
                     # Notification: has "method" but no "id" (or id is null)
                     # e.g., ui.open / ui.close from plugin UI steps
@@ -517,10 +623,27 @@ class PluginProcess:
                                 logger.debug(f"Notification callback error: {cb_err}")
                         continue
 
-                    response = ProtocolDecoder.decode_response(data)
+                    # Parsed once: the decoder takes the dict, not the text
+                    response = ProtocolDecoder.decode_response_dict(raw)
+                    if (
+                        self.config.negotiate_transport
+                        and response.id is not None
+                        and response.id == self._handshake_id
+                    ):
+                        self._apply_transport(response)
 
-                    # Find pending request
                     future = self._pending_requests.get(response.id)
+                    if self._blobs_active and response.result is not None:
+                        try:
+                            response.result = self._blobs.resolve(response.result)
+                        except (FramingError, UnicodeDecodeError) as e:
+                            if future and not future.done():
+                                future.set_exception(
+                                    PluginProtocolError(self.config.plugin_id, str(e))
+                                )
+                            continue
+
+                    # Find pending request
                     if future and not future.done():
                         future.set_result(response)
 
@@ -565,6 +688,7 @@ class PluginProcess:
         self._pending_requests.clear()
 
         self._process = None
+        self._reset_transport()
 
         # Notify callback
         if self._on_crash:
@@ -113,6 +113,7 @@ class HandshakeParams(BaseModel):
     protocolVersion: str = Field(..., max_length=32)
     pluginId: str = Field(..., max_length=256)
     executionId: str = Field(..., max_length=256)
+    transport: Optional[Dict[str, Any]] = None
 
 
 class ShutdownParams(BaseModel):
@@ -219,14 +220,18 @@ class JsonRpcRequest:
     id: int
     jsonrpc: str = JSONRPC_VERSION
 
-    def to_json(self) -> str:
-        """Serialize to JSON string."""
-        return json.dumps({
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a message dict."""
+        return {
             "jsonrpc": self.jsonrpc,
             "method": self.method,
             "params": self.params,
             "id": self.id,
-        })
+        }
+
+    def to_json(self) -> str:
+        """Serialize to JSON string."""
+        return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, data: str, validate: bool = True) -> "JsonRpcRequest":
@@ -301,8 +306,23 @@ class JsonRpcResponse:
         # Security: Check message size
         validate_message_size(data)
 
-        obj = json.loads(data)
+        return cls.from_dict(json.loads(data), filter_secrets)
+
+    @classmethod
+    def from_dict(cls, obj: Dict[str, Any], filter_secrets: bool = True) -> "JsonRpcResponse":
+        """
+        Build from an already-decoded message.
 
+        The caller is responsible for the size check, which framed transports
+        do on the frame header before reading the payload.
+
+        Args:
+            obj: Decoded message
+            filter_secrets: If True, filter sensitive data from error messages
+
+        Raises:
+            KeyError: If the message has no id
+        """
         # Security: Filter sensitive data from error messages
         error = obj.get("error")
         if error and filter_secrets:
@@ -343,6 +363,7 @@ class ProtocolEncoder:
         plugin_id: str,
         execution_id: str,
         request_id: int,
+        transport: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Encode handshake request.
@@ -352,17 +373,21 @@ class ProtocolEncoder:
             plugin_id: Plugin identifier
             execution_id: Current execution ID
             request_id: Request ID for correlation
+            transport: Transport offer (see framing.transport_offer)
 
         Returns:
             JSON-RPC request string
         """
+        params = {
+            "protocolVersion": protocol_version,
+            "pluginId": plugin_id,
+            "executionId": execution_id,
+        }
+        if transport is not None:
+            params["transport"] = transport
         request = JsonRpcRequest(
             method="handshake",
-            params={
-                "protocolVersion": protocol_version,
-                "pluginId": plugin_id,
-                "executionId": execution_id,
-            },
+            params=params,
             id=request_id,
         )
         return request.to_json()
@@ -390,7 +415,21 @@ class ProtocolEncoder:
         Returns:
             JSON-RPC request string
         """
-        request = JsonRpcRequest(
+        return ProtocolEncoder.invoke_request(
+            step, input_data, config, context, request_id, timeout_ms
+        ).to_json()
+
+    @staticmethod
+    def invoke_request(
+        step: str,
+        input_data: Dict[str, Any],
+        config: Dict[str, Any],
+        context: Dict[str, Any],
+        request_id: int,
+        timeout_ms: int = 30000,
+    ) -> JsonRpcRequest:
+        """Build an invoke request without serializing it (for framed transports)."""
+        return JsonRpcRequest(
             method="invoke",
             params={
                 "step": step,
@@ -401,7 +440,6 @@ class ProtocolEncoder:
             },
             id=request_id,
         )
-        return request.to_json()
 
     @staticmethod
     def encode_shutdown(
@@ -576,6 +614,22 @@ class ProtocolDecoder:
         """
         return JsonRpcResponse.from_json(data)
 
+    @staticmethod
+    def decode_response_dict(obj: Dict[str, Any]) -> JsonRpcResponse:
+        """
+        Decode a JSON-RPC response that has already been parsed.
+
+        Args:
+            obj: Decoded message
+
+        Returns:
+            JsonRpcResponse object
+
+        Raises:
+            KeyError: If missing required fields
+        """
+        return JsonRpcResponse.from_dict(obj)
+
     @staticmethod
     def decode_request(data: str) -> JsonRpcRequest:
         """
@@ -38,10 +38,18 @@ Refused (raises SafeEvalError):
   - Import, with, try, raise, assert, def, class
   - Subscript assignment, walrus :=
   - Any name not in the context dict or builtins whitelist
+
+Expressions are validated and compiled once into a tree of closures and
+kept in a bounded LRU (`EXPRESSION_CACHE`) keyed by expression text, so
+repeated guards only pay for name lookups and operators. The same cache
+holds the engine's compiled `when:` conditions.
 """
 
 import ast
-from typing import Any, Mapping
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Mapping
 
 
 class SafeEvalError(ValueError):
@@ -87,6 +95,55 @@ _ALLOWED_NODES = (
 )
 
 
+# Upper bound on cached compiled expressions (shared by all evaluators)
+_CACHE_SIZE = 2048
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+class ExpressionCache:
+    """
+    Bounded, thread-safe LRU of compiled expressions.
+
+    Keys are ``(kind, text)`` so different evaluators (safe_eval
+    expressions, engine conditions) can share one bound without their
+    compiled forms colliding. Compilation errors are never cached.
+    """
+
+    def __init__(self, maxsize: int = _CACHE_SIZE):
+        self._maxsize = max(1, maxsize)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compile(self, kind: str, text: str, compile_fn: Callable[[str], Any]) -> Any:
+        """Return the cached compiled form of ``text``, compiling it on a miss."""
+        key = (kind, text)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                return compiled
+
+        compiled = compile_fn(text)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+EXPRESSION_CACHE = ExpressionCache()
+
+
 def safe_eval(expression: str, context: Mapping[str, Any]) -> Any:
     """Evaluate ``expression`` against ``context`` without giving the
     expression author the ability to execute arbitrary Python.
@@ -94,19 +151,32 @@ def safe_eval(expression: str, context: Mapping[str, Any]) -> Any:
     Raises ``SafeEvalError`` if the expression contains any disallowed
     syntax — never silently downgrades.
     """
+    return compile_expression(expression)(context)
+
+
+def compile_expression(expression: str) -> Evaluator:
+    """Validate and compile ``expression`` once; cached by expression text.
+
+    Returns a callable taking the evaluation context. Raises
+    ``SafeEvalError`` exactly like ``safe_eval`` for refused input.
+    """
     if not isinstance(expression, str):
         raise SafeEvalError(f"expression must be str, got {type(expression).__name__}")
     if len(expression) > 4096:
         # Bound how much CPU the parser/walker can be made to spend on
         # one expression — guards in workflow YAML should be small.
         raise SafeEvalError("expression too long (limit 4096 chars)")
+    return EXPRESSION_CACHE.get_or_compile("safe_eval", expression, _compile_expression)
+
+
+def _compile_expression(expression: str) -> Evaluator:
     try:
         tree = ast.parse(expression, mode="eval")
     except SyntaxError as e:
         raise SafeEvalError(f"syntax error: {e}") from e
 
     _validate(tree)
-    return _eval_node(tree.body, context)
+    return _compile(tree.body)
 
 
 def _validate(tree: ast.AST) -> None:
@@ -137,116 +207,157 @@ def _validate(tree: ast.AST) -> None:
                     raise SafeEvalError("**kwargs unpacking not allowed")
 
 
-def _eval_node(node: ast.AST, context: Mapping[str, Any]) -> Any:
+_BIN_OPS: Mapping[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+_UNARY_OPS: Mapping[type, Callable[[Any], Any]] = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Invert: operator.invert,
+}
+
+_COMPARE_OPS: Mapping[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+
+def _power(left: Any, right: Any) -> Any:
+    # Bound exponent to keep this from being a CPU DoS via 2**huge.
+    if isinstance(right, (int, float)) and right > 64:
+        raise SafeEvalError("exponent too large")
+    return left ** right
+
+
+def _compile(node: ast.AST) -> Evaluator:
+    """Turn a validated AST node into a closure over the context."""
     # Constants
     if isinstance(node, ast.Constant):
-        return node.value
+        value = node.value
+        return lambda context: value
 
     # Names: look up in caller context, then builtins whitelist.
     if isinstance(node, ast.Name):
-        if node.id in context:
-            return context[node.id]
-        if node.id in ALLOWED_BUILTINS:
-            return ALLOWED_BUILTINS[node.id]
-        raise SafeEvalError(f"name {node.id!r} is not defined")
+        name = node.id
+
+        def load(context: Mapping[str, Any]) -> Any:
+            if name in context:
+                return context[name]
+            if name in ALLOWED_BUILTINS:
+                return ALLOWED_BUILTINS[name]
+            raise SafeEvalError(f"name {name!r} is not defined")
+        return load
 
-    # Boolean logic
+    # Boolean logic — every operand is evaluated (no short-circuit), as
+    # callers may rely on name errors surfacing from either side.
     if isinstance(node, ast.BoolOp):
-        values = [_eval_node(v, context) for v in node.values]
+        operands = [_compile(v) for v in node.values]
         if isinstance(node.op, ast.And):
-            result: Any = True
-            for v in values:
-                result = result and v
-            return result
+            def and_(context: Mapping[str, Any]) -> Any:
+                result: Any = True
+                for v in [fn(context) for fn in operands]:
+                    result = result and v
+                return result
+            return and_
         if isinstance(node.op, ast.Or):
-            result = False
-            for v in values:
-                result = result or v
-            return result
+            def or_(context: Mapping[str, Any]) -> Any:
+                result: Any = False
+                for v in [fn(context) for fn in operands]:
+                    result = result or v
+                return result
+            return or_
         raise SafeEvalError(f"bool op {type(node.op).__name__} not allowed")
 
     # Unary
     if isinstance(node, ast.UnaryOp):
-        v = _eval_node(node.operand, context)
-        if isinstance(node.op, ast.Not):
-            return not v
-        if isinstance(node.op, ast.USub):
-            return -v
-        if isinstance(node.op, ast.UAdd):
-            return +v
-        if isinstance(node.op, ast.Invert):
-            return ~v
-        raise SafeEvalError(f"unary op {type(node.op).__name__} not allowed")
+        unary = _UNARY_OPS.get(type(node.op))
+        if unary is None:
+            raise SafeEvalError(f"unary op {type(node.op).__name__} not allowed")
+        operand = _compile(node.operand)
+        return lambda context: unary(operand(context))
 
     # Arithmetic
     if isinstance(node, ast.BinOp):
-        left = _eval_node(node.left, context)
-        right = _eval_node(node.right, context)
-        op = node.op
-        if isinstance(op, ast.Add): return left + right
-        if isinstance(op, ast.Sub): return left - right
-        if isinstance(op, ast.Mult): return left * right
-        if isinstance(op, ast.Div): return left / right
-        if isinstance(op, ast.FloorDiv): return left // right
-        if isinstance(op, ast.Mod): return left % right
-        if isinstance(op, ast.Pow):
-            # Bound exponent to keep this from being a CPU DoS via 2**huge.
-            if isinstance(right, (int, float)) and right > 64:
-                raise SafeEvalError("exponent too large")
-            return left ** right
-        raise SafeEvalError(f"bin op {type(op).__name__} not allowed")
+        binary = _power if isinstance(node.op, ast.Pow) else _BIN_OPS.get(type(node.op))
+        if binary is None:
+            raise SafeEvalError(f"bin op {type(node.op).__name__} not allowed")
+        left_fn = _compile(node.left)
+        right_fn = _compile(node.right)
+        return lambda context: binary(left_fn(context), right_fn(context))
 
     # Comparisons (chained: a < b < c)
     if isinstance(node, ast.Compare):
-        left = _eval_node(node.left, context)
+        first = _compile(node.left)
+        chain = []
         for op, comp in zip(node.ops, node.comparators):
-            right = _eval_node(comp, context)
-            if isinstance(op, ast.Eq):    ok = left == right
-            elif isinstance(op, ast.NotEq): ok = left != right
-            elif isinstance(op, ast.Lt):   ok = left < right
-            elif isinstance(op, ast.LtE):  ok = left <= right
-            elif isinstance(op, ast.Gt):   ok = left > right
-            elif isinstance(op, ast.GtE):  ok = left >= right
-            elif isinstance(op, ast.In):   ok = left in right
-            elif isinstance(op, ast.NotIn): ok = left not in right
-            elif isinstance(op, ast.Is):   ok = left is right
-            elif isinstance(op, ast.IsNot): ok = left is not right
-            else: raise SafeEvalError(f"compare op {type(op).__name__} not allowed")
-            if not ok:
-                return False
-            left = right
-        return True
+            compare = _COMPARE_OPS.get(type(op))
+            if compare is None:
+                raise SafeEvalError(f"compare op {type(op).__name__} not allowed")
+            chain.append((compare, _compile(comp)))
+
+        def compare_chain(context: Mapping[str, Any]) -> bool:
+            left = first(context)
+            for compare, right_fn in chain:
+                right = right_fn(context)
+                if not compare(left, right):
+                    return False
+                left = right
+            return True
+        return compare_chain
 
     # Subscript
     if isinstance(node, ast.Subscript):
-        target = _eval_node(node.value, context)
+        target_fn = _compile(node.value)
         slc = node.slice
         if isinstance(slc, ast.Slice):
-            lower = _eval_node(slc.lower, context) if slc.lower else None
-            upper = _eval_node(slc.upper, context) if slc.upper else None
-            step = _eval_node(slc.step, context) if slc.step else None
-            return target[slice(lower, upper, step)]
-        return target[_eval_node(slc, context)]
+            bounds = [_compile(b) if b else None for b in (slc.lower, slc.upper, slc.step)]
+
+            def get_slice(context: Mapping[str, Any]) -> Any:
+                target = target_fn(context)
+                lower, upper, step = (fn(context) if fn else None for fn in bounds)
+                return target[slice(lower, upper, step)]
+            return get_slice
+        index_fn = _compile(slc)
+        return lambda context: target_fn(context)[index_fn(context)]
 
     # Containers
-    if isinstance(node, ast.List):
-        return [_eval_node(e, context) for e in node.elts]
-    if isinstance(node, ast.Tuple):
-        return tuple(_eval_node(e, context) for e in node.elts)
-    if isinstance(node, ast.Set):
-        return {_eval_node(e, context) for e in node.elts}
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        elements = [_compile(e) for e in node.elts]
+        container = {ast.List: list, ast.Tuple: tuple, ast.Set: set}[type(node)]
+        return lambda context: container(fn(context) for fn in elements)
     if isinstance(node, ast.Dict):
-        return {
-            _eval_node(k, context) if k is not None else None: _eval_node(v, context)
+        pairs = [
+            (_compile(k) if k is not None else None, _compile(v))
             for k, v in zip(node.keys, node.values)
+        ]
+        return lambda context: {
+            k(context) if k is not None else None: v(context) for k, v in pairs
         }
 
     # Whitelisted function calls
     if isinstance(node, ast.Call):
         # _validate already ensured node.func is a Name in ALLOWED_BUILTINS.
         fn = ALLOWED_BUILTINS[node.func.id]  # type: ignore[union-attr]
-        args = [_eval_node(a, context) for a in node.args]
-        kwargs = {kw.arg: _eval_node(kw.value, context) for kw in node.keywords}
-        return fn(*args, **kwargs)
+        arg_fns = [_compile(a) for a in node.args]
+        kwarg_fns = [(kw.arg, _compile(kw.value)) for kw in node.keywords]
+        return lambda context: fn(
+            *[a(context) for a in arg_fns],
+            **{name: v(context) for name, v in kwarg_fns},
+        )
 
     raise SafeEvalError(f"unhandled node type: {type(node).__name__}")
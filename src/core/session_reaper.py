@@ -19,6 +19,10 @@ A session with no recorded activity is left alone rather than reaped:
 absence of data is not evidence of staleness, and callers that don't yet
 call touch_session() for a given session must not have it disappear out
 from under them.
+
+The same sweep closes the shared http.* connection pools (see http_pool.py)
+that have gone unused for FLYTO_HTTP_POOL_IDLE_TIMEOUT_S, and the database.*
+pools (see db_pool.py) unused for FLYTO_DB_POOL_IDLE_TIMEOUT_S.
 """
 import asyncio
 import logging
@@ -89,6 +93,22 @@ async def reap_stale_sessions(
         activity.pop(session_id, None)
 
 
+async def reap_idle_http_pools() -> None:
+    """One sweep: close shared HTTP connection pools that have gone idle."""
+    from .http_pool import close_idle_pools
+    closed = await close_idle_pools()
+    if closed:
+        logger.info("Reaper: closed %d idle HTTP connection pool(s)", closed)
+
+
+async def reap_idle_db_pools() -> None:
+    """One sweep: close shared database connection pools that have gone idle."""
+    from .db_pool import close_idle_db_pools
+    closed = await close_idle_db_pools()
+    if closed:
+        logger.info("Reaper: closed %d idle database connection pool(s)", closed)
+
+
 async def reaper_loop(
     browser_sessions: Dict[str, Any],
     debugger_sessions: Dict[str, Any],
@@ -96,7 +116,8 @@ async def reaper_loop(
     interval_s: float = DEFAULT_SWEEP_INTERVAL_S,
     timeout_s: Optional[float] = None,
 ) -> None:
-    """Run reap_stale_sessions on a fixed interval until cancelled.
+    """Run reap_stale_sessions, reap_idle_http_pools and reap_idle_db_pools
+    on a fixed interval until cancelled.
 
     Intended to be wrapped in asyncio.create_task() by each transport's
     entry point and cancelled (with the cancellation awaited) on shutdown.
@@ -109,5 +130,13 @@ async def reaper_loop(
                 await reap_stale_sessions(browser_sessions, debugger_sessions, activity, timeout)
             except Exception:
                 logger.exception("Session reaper sweep failed")
+            try:
+                await reap_idle_http_pools()
+            except Exception:
+                logger.exception("HTTP pool reaper sweep failed")
+            try:
+                await reap_idle_db_pools()
+            except Exception:
+                logger.exception("Database pool reaper sweep failed")
     except asyncio.CancelledError:
         pass
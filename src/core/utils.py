@@ -5,16 +5,20 @@ Core Utilities - Shared utility functions
 
 This module contains reusable utility functions to reduce code duplication.
 """
+import asyncio
 import fnmatch
 import ipaddress
 import logging
 import os
 import re
 import socket
+import threading
+import time
+import weakref
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 
 import aiohttp
@@ -455,6 +459,238 @@ def _parse_allowed_ports(value: str) -> set[int]:
     return ports
 
 
+# -----------------------------------------------------------------------------
+# Guard DNS cache
+# -----------------------------------------------------------------------------
+
+DEFAULT_DNS_CACHE_TTL_S = 30.0
+DEFAULT_DNS_NEGATIVE_TTL_S = 5.0
+_DNS_CACHE_MAX_ENTRIES = 1024
+
+
+def _dns_ttl_setting(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return default
+
+
+def _addresses_from_addrinfo(infos) -> Tuple[Tuple[int, str], ...]:
+    """Unique (family, address) pairs from getaddrinfo output, in order."""
+    seen = []
+    for family, _, _, _, sockaddr in infos:
+        entry = (family, sockaddr[0])
+        if entry not in seen:
+            seen.append(entry)
+    return tuple(seen)
+
+
+def _literal_address(host: str) -> Optional[Tuple[Tuple[int, str], ...]]:
+    """The address tuple for an IP literal, or None for a name."""
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    family = socket.AF_INET if ip.version == 4 else socket.AF_INET6
+    return ((family, host),)
+
+
+class _GuardDNSResolver:
+    """
+    Cached host lookups shared by every SSRF guard in this module.
+
+    ``validate_url_ssrf``, ``enforce_outbound_host`` and
+    ``_SSRFGuardedResolver`` used to resolve independently, the first two with
+    blocking calls made from inside async modules, so every guarded call
+    stalled the event loop on DNS and repeated the lookup for the same host.
+    They now share this resolver:
+
+    * answers are kept for the record TTL when aiodns is installed, capped at
+      FLYTO_DNS_CACHE_TTL_S; without aiodns (no TTL from getaddrinfo) for
+      FLYTO_DNS_CACHE_TTL_S;
+    * failures are kept for FLYTO_DNS_NEGATIVE_TTL_S and raised again, so an
+      unresolvable host keeps failing closed without a lookup per call;
+    * concurrent async lookups of one host share a single query.
+
+    Only DNS answers are cached. Policy (private ranges, metadata endpoints,
+    allowlists, trusted scopes) is applied to every cached address on every
+    call. Setting both TTLs to 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int = _DNS_CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        # host -> (expires_at, addresses or None, error message or None)
+        self._entries: Dict[str, Tuple[float, Optional[Tuple], Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[Any, str], "asyncio.Task"] = {}
+        self._aiodns_resolvers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(self, host: str) -> Tuple[Tuple[int, str], ...]:
+        """Blocking lookup for sync callers. Raises ``socket.gaierror``."""
+        literal = _literal_address(host)
+        if literal is not None:
+            return literal
+        key = host.lower()
+        entry = self._cached(key)
+        if entry is not None:
+            return self._unpack(host, entry)
+        try:
+            infos = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            self._store_failure(key, e)
+            raise
+        addresses = _addresses_from_addrinfo(infos)
+        self._store(key, addresses, _dns_ttl_setting('FLYTO_DNS_CACHE_TTL_S', DEFAULT_DNS_CACHE_TTL_S))
+        return addresses
+
+    async def lookup_async(self, host: str) -> Tuple[Tuple[int, str], ...]:
+        """Non-blocking lookup. Raises ``socket.gaierror``."""
+        literal = _literal_address(host)
+        if literal is not None:
+            return literal
+        key = host.lower()
+        entry = self._cached(key)
+        if entry is not None:
+            return self._unpack(host, entry)
+        loop = asyncio.get_running_loop()
+        flight = (loop, key)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = loop.create_task(self._query(key, host))
+            self._inflight[flight] = task
+            task.add_done_callback(lambda done: self._finish(flight, done))
+        # One caller giving up must not cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET):
+        """aiohttp ``AbstractResolver.resolve`` over the shared cache."""
+        results = [
+            {
+                'hostname': host,
+                'host': address,
+                'port': port,
+                'family': addr_family,
+                'proto': 0,
+                'flags': socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+            }
+            for addr_family, address in await self.lookup_async(host)
+            if family in (socket.AF_UNSPEC, addr_family)
+        ]
+        if not results:
+            raise socket.gaierror(socket.EAI_NONAME, f"No usable address for {host}")
+        return results
+
+    async def close(self):
+        # Shared by every guarded connector; nothing per-connector to release
+        return None
+
+    def _finish(self, flight, task) -> None:
+        self._inflight.pop(flight, None)
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every waiter was cancelled
+
+    def _cached(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry
+
+    @staticmethod
+    def _unpack(host: str, entry) -> Tuple[Tuple[int, str], ...]:
+        _, addresses, error = entry
+        if addresses is None:
+            raise socket.gaierror(socket.EAI_NONAME, f"{error} (cached failure for {host})")
+        return addresses
+
+    def _store(self, key: str, addresses, ttl: float, error: Optional[str] = None) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, addresses, error)
+
+    def _store_failure(self, key: str, error: Exception) -> None:
+        ttl = _dns_ttl_setting('FLYTO_DNS_NEGATIVE_TTL_S', DEFAULT_DNS_NEGATIVE_TTL_S)
+        message = getattr(error, 'strerror', None) or str(error)
+        self._store(key, None, ttl, error=message)
+
+    async def _query(self, key: str, host: str) -> Tuple[Tuple[int, str], ...]:
+        ttl = _dns_ttl_setting('FLYTO_DNS_CACHE_TTL_S', DEFAULT_DNS_CACHE_TTL_S)
+        answer = await self._query_aiodns(host)
+        if answer is not None:
+            addresses, record_ttl = answer
+            ttl = min(ttl, record_ttl)
+        else:
+            try:
+                infos = await asyncio.get_running_loop().getaddrinfo(
+                    host, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM,
+                )
+            except socket.gaierror as e:
+                self._store_failure(key, e)
+                raise
+            addresses = _addresses_from_addrinfo(infos)
+        self._store(key, addresses, ttl)
+        return addresses
+
+    async def _query_aiodns(self, host: str):
+        """``(addresses, ttl)`` from aiodns when it is installed, else None.
+
+        Any aiodns failure also returns None so the system resolver makes the
+        final (fail-closed) call; c-ares and getaddrinfo can disagree on
+        search domains and /etc/hosts.
+        """
+        try:
+            import aiodns
+        except ImportError:
+            return None
+        loop = asyncio.get_running_loop()
+        resolver = self._aiodns_resolvers.get(loop)
+        if resolver is None:
+            resolver = aiodns.DNSResolver(loop=loop)
+            self._aiodns_resolvers[loop] = resolver
+        try:
+            result = await resolver.getaddrinfo(
+                host, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM,
+            )
+        except Exception:
+            logger.debug("SSRF: aiodns lookup failed, using getaddrinfo", exc_info=True)
+            return None
+        addresses = []
+        ttls = []
+        for node in result.nodes:
+            addr = node.addr
+            if node.family == socket.AF_INET6 and len(addr) > 3 and addr[3]:
+                return None  # scoped link-local; let getaddrinfo format it
+            ip = addr[0].decode('ascii') if isinstance(addr[0], bytes) else addr[0]
+            if (node.family, ip) not in addresses:
+                addresses.append((node.family, ip))
+            ttls.append(node.ttl)
+        if not addresses:
+            return None
+        return tuple(addresses), float(min(ttls))
+
+
+_GUARD_DNS = _GuardDNSResolver()
+
+
+def clear_guard_dns_cache() -> None:
+    """Drop every cached SSRF-guard DNS answer (e.g. after a DNS change)."""
+    _GUARD_DNS.clear()
+
+
 def validate_url_ssrf(
     url: str,
     allow_private: bool = False,
@@ -498,6 +734,51 @@ def validate_url_ssrf(
         # Allow private targets except metadata endpoints (development)
         validate_url_ssrf("http://localhost:8080", allow_private=True)
     """
+    url, hostname = _ssrf_check_target(
+        url, allow_private, allowed_ports, restricted_hosts, restricted_ports,
+    )
+    if hostname is None:
+        return url
+    # Resolve before honoring private/allowlist exceptions so a trusted alias
+    # cannot resolve to a cloud metadata credential endpoint.
+    try:
+        resolved_ips = [ip for _, ip in _GUARD_DNS.lookup(hostname)]
+    except socket.gaierror as e:
+        return _ssrf_unresolved(url, hostname, allowed_hosts, e)
+    return _ssrf_check_resolved(url, hostname, resolved_ips, allow_private, allowed_hosts)
+
+
+async def validate_url_ssrf_async(
+    url: str,
+    allow_private: bool = False,
+    allowed_hosts: Optional[list] = None,
+    allowed_ports: Optional[set[int]] = None,
+    restricted_hosts: Optional[list] = None,
+    restricted_ports: Optional[set[int]] = None,
+) -> str:
+    """``validate_url_ssrf`` for async callers: the DNS lookup does not block
+    the event loop. Same arguments, checks and errors."""
+    url, hostname = _ssrf_check_target(
+        url, allow_private, allowed_ports, restricted_hosts, restricted_ports,
+    )
+    if hostname is None:
+        return url
+    try:
+        resolved_ips = [ip for _, ip in await _GUARD_DNS.lookup_async(hostname)]
+    except socket.gaierror as e:
+        return _ssrf_unresolved(url, hostname, allowed_hosts, e)
+    return _ssrf_check_resolved(url, hostname, resolved_ips, allow_private, allowed_hosts)
+
+
+def _ssrf_check_target(
+    url: str,
+    allow_private: bool,
+    allowed_ports: Optional[set[int]],
+    restricted_hosts: Optional[list],
+    restricted_ports: Optional[set[int]],
+) -> Tuple[str, Optional[str]]:
+    """The checks that need no DNS. Returns the normalized URL and the
+    hostname to resolve, or None when there is nothing to resolve."""
     # Strip whitespace from URL (common user input error)
     url = url.strip()
 
@@ -505,7 +786,7 @@ def validate_url_ssrf(
     # the HTTP client will reject it as a normal client error. Non-empty values
     # still pass scheme, permanent-metadata, DNS, and scope validation below.
     if allow_private and not url:
-        return url
+        return url, None
 
     # Auto-prepend https:// if no scheme provided (common user input error)
     if url and '://' not in url:
@@ -555,23 +836,32 @@ def validate_url_ssrf(
             f"Allowed ports: {sorted(allowed_port_set)}"
         )
 
-    # Resolve before honoring private/allowlist exceptions so a trusted alias
-    # cannot resolve to a cloud metadata credential endpoint.
-    try:
-        addr_info = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC)
-        resolved_ips = [sockaddr[0] for _, _, _, _, sockaddr in addr_info]
-        for ip in resolved_ips:
-            if _is_metadata_ip(ip):
-                raise SSRFError(
-                    f"Cloud metadata endpoint blocked: {hostname} -> {ip}"
-                )
-    except socket.gaierror as e:
-        if _host_in_allowlist(hostname_lower, allowed_hosts):
-            logger.debug(
-                "SSRF: Allowing explicitly allowlisted host despite current DNS failure"
+    return url, hostname
+
+
+def _ssrf_unresolved(url: str, hostname: str, allowed_hosts, error: Exception) -> str:
+    if _host_in_allowlist(hostname.lower().rstrip('.'), allowed_hosts):
+        logger.debug(
+            "SSRF: Allowing explicitly allowlisted host despite current DNS failure"
+        )
+        return url
+    raise SSRFError(f"DNS resolution failed for {hostname}: {error}") from error
+
+
+def _ssrf_check_resolved(
+    url: str,
+    hostname: str,
+    resolved_ips: List[str],
+    allow_private: bool,
+    allowed_hosts,
+) -> str:
+    """Policy checks on every address the hostname resolved to."""
+    hostname_lower = hostname.lower().rstrip('.')
+    for ip in resolved_ips:
+        if _is_metadata_ip(ip):
+            raise SSRFError(
+                f"Cloud metadata endpoint blocked: {hostname} -> {ip}"
             )
-            return url
-        raise SSRFError(f"DNS resolution failed for {hostname}: {e}") from e
 
     # Development/self-hosted mode still permits private targets, but never
     # the permanent metadata deny above.
@@ -734,6 +1024,12 @@ def validate_url_with_env_config(url: str) -> str:
     return validate_url_ssrf(url, **config)
 
 
+async def validate_url_with_env_config_async(url: str) -> str:
+    """``validate_url_with_env_config`` without blocking the event loop on DNS."""
+    config = get_ssrf_config()
+    return await validate_url_ssrf_async(url, **config)
+
+
 def enforce_outbound_url(url: str) -> str:
     """Run the operator SSRF guard on a client-controlled outbound URL.
 
@@ -757,6 +1053,13 @@ def enforce_outbound_url(url: str) -> str:
     return url
 
 
+async def enforce_outbound_url_async(url: str) -> str:
+    """``enforce_outbound_url`` for async modules (non-blocking, cached DNS)."""
+    if ssrf_protection_enabled():
+        return await validate_url_with_env_config_async(url)
+    return url
+
+
 # Hosts that always name this machine. Infrastructure modules (Redis, MySQL,
 # SMTP, SSH) connect here as a matter of course in self-hosted deployments, so
 # blocking them would break normal operation without closing any real path —
@@ -774,16 +1077,32 @@ def resolve_guard_ip(host: str) -> Optional[str]:
     ``except gaierror: pass`` turned the miss into a fail-open. IP literals are
     range-checked directly; everything else is resolved; ``None`` means
     unresolvable and the caller must fail closed.
+
+    This returns only the first address. A name can resolve to a public and a
+    private address at once, so guards should check every address from
+    :func:`resolve_guard_ips` instead.
     """
+    ips = resolve_guard_ips(host)
+    return ips[0] if ips else None
+
+
+def resolve_guard_ips(host: str) -> Optional[List[str]]:
+    """Every address ``host`` names (an IP literal names itself), from the
+    shared guard DNS cache. ``None`` means unresolvable: fail closed."""
     try:
-        ipaddress.ip_address(host)
-        return host  # literal, including IPv4-mapped / 6to4 / NAT64 forms
-    except ValueError:
-        pass
+        addresses = _GUARD_DNS.lookup(host)
+    except (socket.gaierror, UnicodeError):
+        return None
+    return [ip for _, ip in addresses] or None
+
+
+async def resolve_guard_ips_async(host: str) -> Optional[List[str]]:
+    """:func:`resolve_guard_ips` without blocking the event loop."""
     try:
-        return socket.gethostbyname(host)
-    except socket.gaierror:
+        addresses = await _GUARD_DNS.lookup_async(host)
+    except (socket.gaierror, UnicodeError):
         return None
+    return [ip for _, ip in addresses] or None
 
 
 def enforce_outbound_host(host: str, *, purpose: str = 'connection') -> str:
@@ -826,31 +1145,48 @@ def enforce_outbound_host(host: str, *, purpose: str = 'connection') -> str:
     """
     if not ssrf_protection_enabled():
         return host
+    hostname = (host or '').strip()
+    if _outbound_host_exempt(hostname):
+        return host
+    _check_outbound_host_ips(hostname, resolve_guard_ips(hostname), purpose)
+    return host
 
+
+async def enforce_outbound_host_async(host: str, *, purpose: str = 'connection') -> str:
+    """``enforce_outbound_host`` for async modules (non-blocking, cached DNS)."""
+    if not ssrf_protection_enabled():
+        return host
     hostname = (host or '').strip()
-    if hostname.lower() in _LOOPBACK_HOSTS:
+    if _outbound_host_exempt(hostname):
         return host
+    _check_outbound_host_ips(hostname, await resolve_guard_ips_async(hostname), purpose)
+    return host
+
 
+def _outbound_host_exempt(hostname: str) -> bool:
+    """Loopback, allowlisted, or private networking allowed: no lookup needed."""
+    if hostname.lower() in _LOOPBACK_HOSTS:
+        return True
     config = get_ssrf_config()
     if _host_in_allowlist(hostname, config.get('allowed_hosts')):
-        return host
-    if config.get('allow_private'):
-        return host
+        return True
+    return bool(config.get('allow_private'))
+
 
-    guard_ip = resolve_guard_ip(hostname)
-    if guard_ip is None:
+def _check_outbound_host_ips(hostname: str, guard_ips: Optional[List[str]], purpose: str) -> None:
+    if guard_ips is None:
         raise SSRFError(
             f"SSRF blocked: {purpose} host '{hostname}' could not be resolved. "
             f"Unresolvable hosts are refused rather than attempted. "
             f"Add it to FLYTO_ALLOWED_HOSTS if it is expected."
         )
-    if is_private_ip(guard_ip):
-        raise SSRFError(
-            f"SSRF blocked: {purpose} host '{hostname}' resolves to the "
-            f"private/link-local address {guard_ip}. Set FLYTO_ALLOWED_HOSTS "
-            f"or FLYTO_ALLOW_PRIVATE_NETWORK=true to permit it."
-        )
-    return host
+    for guard_ip in guard_ips:
+        if is_private_ip(guard_ip):
+            raise SSRFError(
+                f"SSRF blocked: {purpose} host '{hostname}' resolves to the "
+                f"private/link-local address {guard_ip}. Set FLYTO_ALLOWED_HOSTS "
+                f"or FLYTO_ALLOW_PRIVATE_NETWORK=true to permit it."
+            )
 
 
 def enforce_outbound_service_url(url: str, *, purpose: str = 'service') -> str:
@@ -863,16 +1199,29 @@ def enforce_outbound_service_url(url: str, *, purpose: str = 'service') -> str:
     """
     if not ssrf_protection_enabled():
         return url
+    hostname = _service_url_host(url)
+    if hostname is not None:
+        enforce_outbound_host(hostname, purpose=purpose)
+    return url
 
-    parsed = urlparse(url if '://' in (url or '') else f'//{url}')
-    hostname = parsed.hostname
-    if hostname is None:
-        # No host component at all (e.g. a unix socket path) — nothing to reach.
+
+async def enforce_outbound_service_url_async(url: str, *, purpose: str = 'service') -> str:
+    """``enforce_outbound_service_url`` for async modules (non-blocking, cached DNS)."""
+    if not ssrf_protection_enabled():
         return url
-    enforce_outbound_host(hostname, purpose=purpose)
+    hostname = _service_url_host(url)
+    if hostname is not None:
+        await enforce_outbound_host_async(hostname, purpose=purpose)
     return url
 
 
+def _service_url_host(url: str) -> Optional[str]:
+    """The host a service URL dials. None when there is no host component
+    at all (e.g. a unix socket path) — nothing to reach."""
+    parsed = urlparse(url if '://' in (url or '') else f'//{url}')
+    return parsed.hostname
+
+
 _REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
 
 
@@ -902,7 +1251,7 @@ async def guarded_aiohttp_request(session, method: str, url: str, *,
     kwargs.pop('allow_redirects', None)
     guard = ssrf_protection_enabled()
     if guard:
-        validate_url_with_env_config(url)
+        await validate_url_with_env_config_async(url)
     method = method.upper()
     for hop in range(max_redirects + 1):
         response = await session.request(method, url, allow_redirects=False, **kwargs)
@@ -911,7 +1260,7 @@ async def guarded_aiohttp_request(session, method: str, url: str, *,
             response.release()
             url = urljoin(url, location)
             if guard:
-                validate_url_with_env_config(url)  # raises SSRFError on a blocked hop
+                await validate_url_with_env_config_async(url)  # raises SSRFError on a blocked hop
             if response.status == 303:
                 method = 'GET'
                 kwargs.pop('json', None)
@@ -967,8 +1316,9 @@ class _SSRFGuardedResolver(aiohttp.abc.AbstractResolver):
             if restricted_hosts is not None
             else None
         )
-        from aiohttp.resolver import DefaultResolver
-        self._inner = DefaultResolver()
+        # Shared with validate_url_ssrf / enforce_outbound_host, so the
+        # address the URL guard checked is the cached one connected to
+        self._inner = _GUARD_DNS
 
     async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET):
         if self._restricted_hosts is not None and not _host_in_allowlist(
@@ -0,0 +1,131 @@
+"""Tests for BrowserDriver.extract — single-round-trip batched extraction."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+os.environ.setdefault("FLYTO_ENV", "test")
+
+from core.browser.driver import BrowserDriver  # noqa: E402
+
+
+FIELDS = {"title": "h2", "url": "a@href", "id": "@data-id", "price": "xpath=//span"}
+
+
+def _driver(rows):
+    """A driver whose page answers evaluate with ``rows``."""
+    driver = BrowserDriver(headless=True)
+    driver._page = MagicMock()
+    driver._page.evaluate = AsyncMock(return_value=rows)
+    driver._query_selector_all = AsyncMock(return_value=[])
+    driver._query_selector = AsyncMock(return_value=None)
+    return driver
+
+
+class TestCompileSelector:
+    def test_css_and_xpath_compile(self):
+        driver = BrowserDriver(headless=True)
+
+        assert driver._compile_selector("div.item > a") == {"kind": "css", "value": "div.item > a"}
+        assert driver._compile_selector("css=li") == {"kind": "css", "value": "li"}
+        assert driver._compile_selector("//tr[2]") == {"kind": "xpath", "value": "//tr[2]"}
+        assert driver._compile_selector("xpath=//td") == {"kind": "xpath", "value": "//td"}
+
+    def test_locator_engines_do_not_compile(self):
+        driver = BrowserDriver(headless=True)
+
+        for selector in ("text=Buy", "role=button", "label=Email", "data-testid=row"):
+            assert driver._compile_selector(selector) is None
+
+
+class TestBatchedExtract:
+    @pytest.mark.asyncio
+    async def test_all_rows_come_from_one_evaluate(self):
+        driver = _driver([["A", "/a", "1", "9"], ["B", None, "2", None]])
+
+        result = await driver.extract(".card", FIELDS, multiple=True)
+
+        assert result == {
+            "status": "success",
+            "count": 2,
+            "data": [
+                {"title": "A", "url": "/a", "id": "1", "price": "9"},
+                {"title": "B", "url": None, "id": "2", "price": None},
+            ],
+        }
+        driver._page.evaluate.assert_awaited_once()
+        driver._query_selector_all.assert_not_awaited()
+
+        arg = driver._page.evaluate.await_args.args[1]
+        assert arg["selector"] == {"kind": "css", "value": ".card"}
+        assert arg["index"] is None
+        assert arg["fields"] == [
+            {"sub": {"kind": "css", "value": "h2"}, "attr": None},
+            {"sub": {"kind": "css", "value": "a"}, "attr": "href"},
+            {"sub": None, "attr": "data-id"},
+            {"sub": {"kind": "xpath", "value": "//span"}, "attr": None},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_extraction_honours_nth_and_shortcuts(self):
+        driver = _driver([["A", "/a", "1", "9"]])
+
+        result = await driver.extract("name=row:nth=2", FIELDS)
+
+        assert result["data"]["title"] == "A"
+        arg = driver._page.evaluate.await_args.args[1]
+        assert arg["selector"] == {"kind": "css", "value": '[name="row"]'}
+        assert arg["index"] == 2
+
+    @pytest.mark.asyncio
+    async def test_uncompilable_field_uses_the_element_path(self):
+        driver = _driver([["A"]])
+
+        result = await driver.extract(".card", {"button": "text=Buy"}, multiple=True)
+
+        assert result["count"] == 0
+        driver._page.evaluate.assert_not_awaited()
+        driver._query_selector_all.assert_awaited_once_with(".card")
+
+    @pytest.mark.asyncio
+    async def test_script_rejection_and_empty_results_fall_back(self):
+        for rows in (None, []):
+            driver = _driver(rows)
+
+            with pytest.raises(RuntimeError, match="Element not found"):
+                await driver.extract('.card:has-text("x")', FIELDS)
+            driver._query_selector.assert_awaited_once()
+
+
+@pytest.mark.browser
+@pytest.mark.asyncio
+async def test_batched_and_element_paths_agree():
+    """Real page: the batched script returns what the element path does."""
+    rows = "".join(
+        f'<tr class="row" data-id="{i}"><td class="n">Item {i}</td>'
+        f'<td><a href="/i/{i}">open</a></td></tr>'
+        for i in range(50)
+    )
+    html = f"""<table>{rows}</table><div id="host"></div>
+    <script>
+      document.getElementById('host').attachShadow({{mode: 'open'}}).innerHTML =
+        '<div class="row" data-id="s"><td class="n">Shadow</td></div>';
+    </script>"""
+    fields = {"name": ".n", "url": "a@href", "id": "@data-id", "second": "//td[2]"}
+
+    driver = BrowserDriver(headless=True)
+    await driver.launch()
+    try:
+        await driver._page.set_content(html)
+        for selector in (".row", '//tr[@class="row"]', ".row:nth=3"):
+            multiple = ":nth=" not in selector
+            batched = await driver.extract(selector, fields, multiple=multiple)
+            driver._extract_batched = AsyncMock(return_value=None)
+            legacy = await driver.extract(selector, fields, multiple=multiple)
+            del driver._extract_batched
+            assert batched == legacy
+    finally:
+        await driver.close()
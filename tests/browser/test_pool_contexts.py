@@ -0,0 +1,173 @@
+"""Tests for BrowserPool context mode — many contexts per browser process."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+os.environ.setdefault("FLYTO_ENV", "test")
+
+from core.browser import driver as driver_module  # noqa: E402
+from core.browser.pool import BrowserPool, PoolTaskError  # noqa: E402
+from core.browser.proxy_pool import ProxyPool  # noqa: E402
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+
+class _FakePage:
+    def __init__(self):
+        self.alive = True
+
+    async def evaluate(self, script):
+        if not self.alive:
+            raise RuntimeError("Target closed")
+        return 1
+
+
+class _FakeDriver:
+    """The BrowserDriver surface BrowserPool uses, without a browser."""
+
+    launches = []
+
+    def __init__(self, headless=True, viewport=None, browser_type='chromium'):
+        self._browser = None
+        self._page = None
+        self._human = None
+        self._current_proxy = None
+        self.contexts_opened = 0
+        self.closed = False
+
+    async def launch(self, **kwargs):
+        _FakeDriver.launches.append(kwargs)
+        self._browser = _FakeBrowser()
+        self._page = _FakePage()
+
+    async def new_context(self, proxy=None):
+        context = _FakeDriver()
+        context._browser = self._browser
+        await context.reset_context(proxy)
+        return context
+
+    async def reset_context(self, proxy=None):
+        self.contexts_opened += 1
+        self._page = _FakePage()
+        self._current_proxy = proxy
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_driver(monkeypatch):
+    _FakeDriver.launches = []
+    monkeypatch.setattr(driver_module, "BrowserDriver", _FakeDriver)
+    return _FakeDriver
+
+
+class TestContextPool:
+    @pytest.mark.asyncio
+    async def test_each_browser_hosts_several_contexts_with_their_own_proxy(self, fake_driver):
+        pool = BrowserPool(size=2, contexts_per_browser=3)
+        await pool.launch_all(proxy_pool=ProxyPool(["http://p1", "http://p2"]))
+
+        assert len(pool.browsers) == 2 and len(pool.contexts) == 6
+        assert pool.capacity == 6
+        # Hosts skip the persistent profile and the proxy; contexts carry it
+        assert all(kw["persistent"] is False for kw in fake_driver.launches)
+        assert [c._current_proxy for c in pool.contexts] == ["http://p1", "http://p2"] * 3
+        assert {id(c._browser) for c in pool.contexts} == {id(b._browser) for b in pool.browsers}
+
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_map_runs_a_page_per_context_concurrently(self, fake_driver):
+        pool = BrowserPool(size=1, contexts_per_browser=4)
+        await pool.launch_all()
+        running = 0
+        peak = 0
+
+        async def task(driver, item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return item * 2
+
+        assert await pool.map(list(range(8)), task) == [i * 2 for i in range(8)]
+        assert peak == 4
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_contexts_are_recycled_after_max_uses(self, fake_driver):
+        pool = BrowserPool(size=1, contexts_per_browser=2, max_uses_per_context=2)
+        await pool.launch_all(proxy_pool=ProxyPool(["http://p1", "http://p2", "http://p3"]))
+        context = await pool.acquire()
+        first_proxy = context._current_proxy
+
+        await pool.release(context)
+        assert context.contexts_opened == 1
+        await pool.release(context)
+
+        assert context.contexts_opened == 2
+        assert context._current_proxy != first_proxy
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_a_dead_context_is_reset_not_relaunched(self, fake_driver):
+        pool = BrowserPool(size=1, contexts_per_browser=2)
+        await pool.launch_all()
+        context = await pool.acquire()
+        await pool.release(context)
+        context._page.alive = False
+
+        while (acquired := await pool.acquire()) is not context:
+            await pool.release(acquired)
+
+        assert context.contexts_opened == 2
+        assert len(fake_driver.launches) == 1  # same browser process
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_a_dead_browser_is_relaunched_once_for_all_its_contexts(self, fake_driver):
+        pool = BrowserPool(size=1, contexts_per_browser=2)
+        await pool.launch_all()
+        old_host = pool.browsers[0]
+        old_host._browser.connected = False
+        for context in pool.contexts:
+            context._page.alive = False
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        assert len(fake_driver.launches) == 2 and old_host.closed
+        new_browser = pool.browsers[0]._browser
+        assert first._browser is new_browser and second._browser is new_browser
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_a_crashed_task_resets_its_context(self, fake_driver):
+        pool = BrowserPool(size=1, contexts_per_browser=2)
+        await pool.launch_all()
+
+        async def task(driver, item):
+            raise RuntimeError("Target closed")
+
+        results = await pool.map([1], task)
+
+        assert isinstance(results[0], PoolTaskError) and results[0].retryable
+        assert sorted(c.contexts_opened for c in pool.contexts) == [1, 2]
+        await pool.close_all()
+
+    def test_default_pool_hands_out_whole_browsers(self):
+        pool = BrowserPool(size=3)
+
+        assert not pool.context_mode and pool.capacity == 3
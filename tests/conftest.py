@@ -5,7 +5,9 @@ Provides global fixtures and configuration for all tests.
 """
 
 import os
+import shutil
 import sys
+import tempfile
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -13,6 +15,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Module registration writes quality reports to the cache; keep the suite's
+# out of ~/.flyto. Set before any test module imports the module catalog.
+_QUALITY_CACHE_DIR = tempfile.mkdtemp(prefix="flyto-test-quality-")
+os.environ["FLYTO_QUALITY_CACHE_DIR"] = _QUALITY_CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_QUALITY_CACHE_DIR, ignore_errors=True)
+
 import asyncio
 
 import pytest
@@ -0,0 +1,185 @@
+"""
+Plugin transport framing — negotiated length-prefixed frames, msgpack and
+out-of-band blobs, against a real plugin subprocess.
+"""
+
+import asyncio
+import textwrap
+
+import pytest
+
+from core.runtime.framing import (
+    BLOB_KEY,
+    BlobChannel,
+    FramingError,
+    MessageCodec,
+    negotiate,
+)
+from core.runtime.process import PluginProcess, ProcessConfig
+from core.runtime.protocol import MAX_MESSAGE_SIZE
+
+
+FRAMED_PLUGIN = textwrap.dedent("""\
+    #!/usr/bin/env python3
+    \"\"\"Plugin that negotiates length-prefixed JSON frames and blobs.\"\"\"
+    import json
+    import os
+    import struct
+    import sys
+
+    def main():
+        stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+        framed = False
+        blob_dir = None
+
+        def send(obj):
+            data = json.dumps(obj).encode()
+            stdout.write(struct.pack(">I", len(data)) + data if framed else data + b"\\n")
+            stdout.flush()
+
+        def recv():
+            if framed:
+                header = stdin.read(4)
+                if len(header) < 4:
+                    return None
+                (length,) = struct.unpack(">I", header)
+                return json.loads(stdin.read(length))
+            line = stdin.readline()
+            return json.loads(line) if line else None
+
+        while True:
+            req = recv()
+            if req is None:
+                break
+            method, req_id, params = req["method"], req["id"], req.get("params", {})
+            if method == "handshake":
+                offer = params.get("transport")
+                result = {"pluginVersion": "1.0.0"}
+                if offer:
+                    blob_dir = offer.get("blobDir")
+                    result["transport"] = {"framing": "length-prefixed", "encoding": "json",
+                                           "blobs": blob_dir is not None}
+                send({"jsonrpc": "2.0", "id": req_id, "result": result})
+                framed = bool(offer)
+            elif method == "invoke":
+                data = params["input"]
+                if params["step"] == "big":
+                    name = "result%d" % req_id
+                    with open(os.path.join(blob_dir, name), "w") as f:
+                        f.write("x" * data["size"])
+                    result = {"ok": True, "data": {"text": {"$blob": name, "kind": "str"}}}
+                else:
+                    text = data["text"]
+                    via_blob = isinstance(text, dict)
+                    if via_blob:
+                        path = os.path.join(blob_dir, text["$blob"])
+                        with open(path) as f:
+                            text = f.read()
+                        os.unlink(path)
+                    result = {"ok": True, "data": {"length": len(text), "via_blob": via_blob}}
+                send({"jsonrpc": "2.0", "id": req_id, "result": result})
+            elif method == "ping":
+                send({"jsonrpc": "2.0", "id": req_id, "result": {}})
+            elif method == "shutdown":
+                send({"jsonrpc": "2.0", "id": req_id, "result": {}})
+                sys.exit(0)
+
+    if __name__ == "__main__":
+        main()
+""")
+
+
+@pytest.fixture
+def framed_config(tmp_path):
+    plugin_dir = tmp_path / "framed-plugin"
+    plugin_dir.mkdir()
+    (plugin_dir / "main.py").write_text(FRAMED_PLUGIN)
+    return ProcessConfig(
+        plugin_id="framed-plugin",
+        plugin_dir=plugin_dir,
+        entry_point="main.py",
+        language="python",
+        blob_threshold_bytes=1024,
+    )
+
+
+class TestMessageCodec:
+    def test_length_prefixed_round_trip(self):
+        codec = MessageCodec("length-prefixed", "json")
+        frame = codec.dumps({"id": 1, "result": {"text": "a\nb"}})
+
+        assert int.from_bytes(frame[:4], "big") == len(frame) - 4
+        assert codec.loads(frame[4:]) == {"id": 1, "result": {"text": "a\nb"}}
+
+    def test_msgpack_round_trip_keeps_bytes(self):
+        pytest.importorskip("msgpack")
+        codec = MessageCodec("length-prefixed", "msgpack")
+
+        frame = codec.dumps({"id": 1, "result": {"png": b"\x89PNG\n"}})
+
+        assert codec.loads(frame[4:]) == {"id": 1, "result": {"png": b"\x89PNG\n"}}
+
+    async def test_oversized_frame_is_rejected_before_reading_it(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data((MAX_MESSAGE_SIZE + 1).to_bytes(4, "big"))
+
+        with pytest.raises(FramingError):
+            await MessageCodec("length-prefixed", "json").read(reader)
+
+    def test_negotiation_falls_back_to_newline_json(self):
+        for choice in (None, {}, {"framing": "carrier-pigeon"}, {"encoding": "pickle"}):
+            codec = negotiate(choice)
+            assert (codec.framing, codec.encoding) == ("newline", "json")
+
+
+class TestBlobChannel:
+    def test_large_values_round_trip_out_of_band(self, tmp_path):
+        channel = BlobChannel(tmp_path, threshold=8)
+
+        message = channel.externalize({"small": "abc", "text": "y" * 20, "raw": [b"z" * 9]})
+
+        assert message["small"] == "abc"
+        assert BLOB_KEY in message["text"] and BLOB_KEY in message["raw"][0]
+        assert channel.resolve(message) == {"small": "abc", "text": "y" * 20, "raw": [b"z" * 9]}
+        assert list(tmp_path.iterdir()) == []  # collected blobs are deleted
+
+    def test_handles_cannot_leave_the_blob_directory(self, tmp_path):
+        channel = BlobChannel(tmp_path / "blobs")
+        (tmp_path / "secret").write_text("s3cret")
+
+        for handle in ("../secret", "/etc/passwd", "", 7):
+            with pytest.raises(FramingError):
+                channel.resolve({"data": {BLOB_KEY: handle}})
+
+
+class TestFramedPluginProcess:
+    async def test_negotiates_frames_and_moves_large_payloads_through_blobs(self, framed_config):
+        process = PluginProcess(framed_config)
+        try:
+            assert await process.start()
+            assert process._codec.framing == "length-prefixed"
+            blob_dir = process._blobs.directory
+
+            small = await process.invoke("echo", {"text": "hi"}, {}, {})
+            large = await process.invoke("echo", {"text": "x" * 5000}, {}, {})
+            result = await process.invoke("big", {"size": 200_000}, {}, {})
+
+            assert small["data"] == {"length": 2, "via_blob": False}
+            assert large["data"] == {"length": 5000, "via_blob": True}
+            assert result["data"]["text"] == "x" * 200_000
+            assert list(blob_dir.iterdir()) == []
+            assert await process.ping()
+        finally:
+            await process.stop()
+
+        assert not blob_dir.exists()
+
+    async def test_transport_negotiation_can_be_disabled(self, framed_config):
+        framed_config.negotiate_transport = False
+        process = PluginProcess(framed_config)
+        try:
+            assert await process.start()
+            assert process._codec.framing == "newline"
+            assert process._blobs is None
+        finally:
+            await process.stop()
@@ -108,6 +108,23 @@ while True:
         assert len(manifest.steps) == 1
         assert manifest.steps[0]["id"] == "test_step"
 
+    @pytest.mark.asyncio
+    async def test_prewarm_starts_real_workers_and_records_startup(self, sample_manifest):
+        """Warm workers complete the handshake before the first invoke."""
+        manager = PluginManager(
+            sample_manifest.parent, config={"warmPools": {"test-plugin": 2}}
+        )
+        try:
+            assert await manager.prewarm() == {"test-plugin": 2}
+
+            info = manager._plugins["test-plugin"]
+            assert all(worker.is_ready for worker in info.workers)
+            assert all(worker.last_startup.handshake_ms > 0 for worker in info.workers)
+            startup = manager.get_plugin_status("test-plugin")["startup"]
+            assert (startup["coldStarts"], startup["warmStarts"]) == (0, 2)
+        finally:
+            await manager.shutdown()
+
     def test_protocol_encoder_handshake(self):
         """Test handshake message encoding."""
         import json
@@ -22,6 +22,7 @@ from core.capability_manifest import (
     get_capability_manifest,
     refresh_capability_manifest,
 )
+from core.catalog.search_index import invalidate_search_index
 from core.modules.base import BaseModule
 from core.modules.registry import ModuleRegistry
 from core.modules.registry import core as registry_core
@@ -170,6 +171,7 @@ def registry():
         for name, value in saved.items():
             setattr(ModuleRegistry, name, value)
         _invalidate_manifest_cache()
+        invalidate_search_index()
 
 
 @pytest.fixture
@@ -19,6 +19,7 @@ from types import MappingProxyType
 import pytest
 
 from core.catalog.module import get_module_detail, search_modules
+from core.catalog.search_index import invalidate_search_index
 from core.mcp_handler import search_modules as bridge_search_modules
 from core.modules.registry import ModuleRegistry
 
@@ -46,8 +47,12 @@ def catalog(monkeypatch):
     both from the same snapshot is what makes a parity assertion meaningful,
     since any disagreement then belongs to the catalog and not the fixture. The
     real registry is never mutated and no module is ever executed.
+
+    The table changes without the registry generation moving, so the cached
+    search index is dropped on install and again on teardown.
     """
     def _install(table):
+        invalidate_search_index()
         snapshot = dict(table)
         monkeypatch.setattr(
             ModuleRegistry,
@@ -59,7 +64,8 @@ def catalog(monkeypatch):
             "get_metadata",
             classmethod(lambda cls, module_id, *a, **kw: snapshot.get(module_id)),
         )
-    return _install
+    yield _install
+    invalidate_search_index()
 
 
 def _by_id(results):
@@ -0,0 +1,97 @@
+"""Cached trigram index behind catalog search.
+
+The index may only narrow which modules are scored, never change the answer:
+every query must return exactly what scoring every visible module returns.
+It is reused until the registry generation moves, and kept per language.
+"""
+
+import pytest
+
+from core.catalog.module import _score_module, search_modules
+from core.catalog.search_index import (
+    get_search_index,
+    invalidate_search_index,
+)
+from core.modules.registry import ModuleRegistry
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    invalidate_search_index()
+    yield
+    invalidate_search_index()
+
+
+@pytest.fixture
+def metadata_reads(monkeypatch):
+    """Count how often the index goes back to the registry for metadata."""
+    calls = []
+    original = ModuleRegistry.get_all_metadata.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(kwargs.get('lang'))
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(ModuleRegistry, "get_all_metadata", classmethod(counting))
+    return calls
+
+
+def _brute_force(query):
+    """search_modules without narrowing: score every indexed module."""
+    query_lower = query.lower()
+    query_words = [w for w in query_lower.split() if len(w) > 1]
+    if '.' in query_lower and not query_words:
+        query_words = query_lower.replace('.', ' ').split()
+    hits = []
+    for entry in get_search_index().entries:
+        score = _score_module(query_words, query_lower, entry)
+        if score > 0:
+            hits.append({**entry.row, 'score': score})
+    hits.sort(key=lambda x: (-x['score'], x['module_id']))
+    return hits
+
+
+@pytest.mark.parametrize("query", [
+    "uppercase",
+    "http request",
+    "browser click element",
+    "browser.goto",
+    "json",
+    "db",
+    "s",
+    "csv to json",
+    "nomatchwhatsoever",
+    "send slack message",
+    "Screenshot",
+])
+def test_narrowing_never_changes_results(query):
+    assert search_modules(query, limit=10_000) == _brute_force(query)
+
+
+def test_index_is_reused_until_the_generation_moves(metadata_reads, monkeypatch):
+    search_modules("http")
+    search_modules("browser click")
+    assert metadata_reads == ['en']
+
+    monkeypatch.setattr(
+        ModuleRegistry, "_generation", ModuleRegistry.current_generation() + 1
+    )
+    search_modules("http")
+
+    assert metadata_reads == ['en', 'en']
+
+
+def test_each_language_has_its_own_index(metadata_reads):
+    search_modules("http")
+    search_modules("http", lang="zh")
+    search_modules("http", lang="zh")
+
+    assert metadata_reads == ['en', 'zh']
+    assert get_search_index("zh") is not get_search_index("en")
+
+
+def test_results_do_not_alias_the_index():
+    hit = search_modules("uppercase")[0]
+    hit["label"] = "changed"
+
+    assert search_modules("uppercase")[0]["label"] != "changed"
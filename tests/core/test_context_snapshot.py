@@ -0,0 +1,98 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Copy-on-write context snapshots — O(1) snapshots that keep their point-in-time view.
+"""
+
+import copy
+import json
+import pickle
+
+from core.modules import atomic  # noqa: F401 — registers production modules
+
+from core.engine.context import ContextSnapshot, CopyOnWriteContext, snapshot_context
+from core.engine.hooks import HookContext, NullHooks
+from core.engine.workflow import WorkflowEngine
+
+
+class TestCopyOnWriteContext:
+    def test_snapshot_keeps_values_from_when_it_was_taken(self):
+        ctx = CopyOnWriteContext({"a": {"ok": True}, "b": 1})
+        snap = ctx.snapshot()
+
+        ctx["a"] = {"ok": False}
+        ctx["c"] = 3
+        del ctx["b"]
+        ctx.update({"d": 4})
+
+        assert snap.to_dict() == {"a": {"ok": True}, "b": 1}
+        assert "c" not in snap and "b" in snap
+        assert len(snap) == 2
+        assert dict(ctx) == {"a": {"ok": False}, "c": 3, "d": 4}
+
+    def test_unchanged_entries_are_shared(self):
+        big = {"rows": list(range(1000))}
+        ctx = CopyOnWriteContext({"big": big})
+        snap = ctx.snapshot()
+        ctx["small"] = 1
+
+        assert snap["big"] is big
+        assert list(snap._undo) == ["small"]
+
+    def test_mutators_record_previous_values(self):
+        ctx = CopyOnWriteContext({"a": 1, "b": 2, "c": 3})
+        snap = ctx.snapshot()
+
+        ctx.pop("a")
+        ctx.setdefault("e", 5)
+        ctx.popitem()
+        ctx |= {"b": 20}
+        ctx.clear()
+
+        assert snap == {"a": 1, "b": 2, "c": 3}
+        assert ctx == {}
+
+    def test_plain_dict_behaviour(self):
+        ctx = CopyOnWriteContext({"a": [1, 2]})
+        snap = ctx.snapshot()
+
+        assert isinstance(ctx, dict)
+        assert json.loads(json.dumps(ctx)) == {"a": [1, 2]}
+        assert type(snap.copy()) is dict
+        assert type(copy.deepcopy(snap)) is dict
+        assert pickle.loads(pickle.dumps(snap)) == {"a": [1, 2]}
+        assert isinstance(copy.copy(ctx), CopyOnWriteContext)
+
+    def test_snapshot_context_falls_back_to_copy(self):
+        plain = {"a": 1}
+        snap = snapshot_context(plain)
+        plain["a"] = 2
+        assert snap == {"a": 1} and type(snap) is dict
+
+
+class _RecordingHooks(NullHooks):
+    def __init__(self):
+        self.before = {}
+
+    def on_pre_execute(self, context: HookContext):
+        self.before[context.step_id] = context.variables
+        return super().on_pre_execute(context)
+
+
+class TestEngineSnapshots:
+    async def test_hooks_receive_point_in_time_snapshots(self):
+        hooks = _RecordingHooks()
+        workflow = {
+            "id": "snapshots",
+            "steps": [
+                {"id": "first", "module": "string.uppercase", "params": {"text": "a"}},
+                {"id": "second", "module": "string.uppercase", "params": {"text": "b"}},
+            ],
+        }
+        engine = WorkflowEngine(workflow, hooks=hooks)
+        await engine.execute()
+
+        assert isinstance(hooks.before["second"], ContextSnapshot)
+        assert "first" not in hooks.before["first"]
+        assert "second" not in hooks.before["second"]
+        assert hooks.before["second"]["first"] == engine.context["first"]
@@ -0,0 +1,307 @@
+"""
+Tests for the shared database.* connection pools (core.db_pool) and the
+bulk insert / streaming query paths.
+
+asyncpg and aiomysql need a live server, so the manager is driven through a
+recording pool that stands in for the driver's, and the PostgreSQL and MySQL
+insert paths are checked against the SQL and arguments its connection
+records; the SQLite paths run for real.
+"""
+
+import sqlite3
+import sys
+import types
+from contextlib import asynccontextmanager
+
+import pytest
+
+from core import db_pool
+from core.db_pool import DbPoolManager
+from core.modules.atomic.database import insert
+from core.modules.atomic.database.insert import database_insert
+from core.modules.atomic.database.query import database_query
+from core.session_reaper import reap_idle_db_pools
+
+
+async def _run(module, params: dict) -> dict:
+    return await module(params, {}).execute()
+
+
+class _Connection:
+    """Records every statement as ``(method, sql, args)``."""
+
+    def __init__(self):
+        self.rollbacks = 0
+        self.calls = []
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    # asyncpg
+    @asynccontextmanager
+    async def transaction(self):
+        self.calls.append(("begin", None, None))
+        yield
+        self.calls.append(("commit", None, None))
+
+    async def fetch(self, sql, *args):
+        self.calls.append(("fetch", sql, list(args)))
+        return [{"id": value} for value in args[::2]]
+
+    async def executemany(self, sql, args):
+        self.calls.append(("executemany", sql, args))
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        self.calls.append(("copy", table, (columns, records)))
+
+    # aiomysql
+    @asynccontextmanager
+    async def cursor(self):
+        yield self
+
+    async def execute(self, sql, args):
+        self.calls.append(("execute", sql, args))
+
+    async def commit(self):
+        self.calls.append(("commit", None, None))
+
+
+class _Acquire:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def __aenter__(self):
+        self.pool.checkouts += 1
+        return self.pool.connection
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _RecordingPool:
+    """Hands out one connection and counts what the manager does with it."""
+
+    def __init__(self):
+        self.connection = _Connection()
+        self.checkouts = 0
+        self.closed = False
+
+    def acquire(self):
+        return _Acquire(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class _Manager(DbPoolManager):
+    def __init__(self):
+        super().__init__(min_size=1, max_size=4)
+        self.created = []
+
+    async def _create_pool(self, db_type, connect):
+        pool = _RecordingPool()
+        self.created.append((db_type, connect, pool))
+        return pool
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A fresh process-wide manager per test."""
+    monkeypatch.delenv("FLYTO_DB_POOL", raising=False)
+    fresh = _Manager()
+    monkeypatch.setattr(db_pool, "_manager", fresh)
+    return fresh
+
+
+class TestDbPoolManager:
+    async def test_calls_share_one_pool_per_database(self, manager):
+        for _ in range(3):
+            async with db_pool.db_connection("postgresql", dsn="postgresql://u:secret@db:5432/app"):
+                pass
+        async with db_pool.db_connection("postgresql", dsn="postgresql://u:secret@db:5432/other"):
+            pass
+
+        assert len(manager.created) == 2
+        assert manager.created[0][2].checkouts == 3
+        labels = [entry["database"] for entry in manager.stats()["databases"]]
+        assert labels == ["postgresql://db:5432/app", "postgresql://db:5432/other"]
+
+    async def test_mysql_connection_is_rolled_back_before_reuse(self, manager):
+        async with db_pool.db_connection("mysql", host="db", port=3306, db="app") as conn:
+            pass
+
+        assert conn.rollbacks == 1
+
+    async def test_idle_pools_are_reaped(self, manager):
+        async with db_pool.db_connection("postgresql", dsn="postgresql://db/app"):
+            assert await manager.close_idle(idle_s=0) == 0
+
+        await reap_idle_db_pools()
+        assert len(manager) == 1
+
+        assert await manager.close_idle(idle_s=0) == 1
+        assert manager.created[0][2].closed
+        assert len(manager) == 0
+
+    async def test_disabled_pooling_opens_and_closes_per_call(self, manager, monkeypatch):
+        monkeypatch.setenv("FLYTO_DB_POOL", "0")
+        events = []
+
+        async def connect(db_type, connect):
+            events.append(("open", connect["dsn"]))
+            return object()
+
+        async def close(db_type, conn):
+            events.append(("close", db_type))
+
+        monkeypatch.setattr(db_pool, "_connect", connect)
+        monkeypatch.setattr(db_pool, "_close_connection", close)
+
+        async with db_pool.db_connection("postgresql", dsn="postgresql://db/app"):
+            assert events == [("open", "postgresql://db/app")]
+
+        assert events[-1] == ("close", "postgresql")
+        assert manager.created == []
+
+    async def test_sqlite_is_not_pooled(self, manager):
+        with pytest.raises(ValueError, match="sqlite"):
+            async with db_pool.db_connection("sqlite"):
+                pass
+
+    def test_sizes_follow_the_environment(self, monkeypatch):
+        monkeypatch.setenv("FLYTO_DB_POOL_MIN_SIZE", "20")
+        monkeypatch.setenv("FLYTO_DB_POOL_MAX_SIZE", "5")
+
+        fresh = DbPoolManager()
+
+        assert (fresh.min_size, fresh.max_size) == (5, 5)
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    path = tmp_path / "app.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    monkeypatch.setenv("SQLITE_DATABASE", str(path))
+    return path
+
+
+def _count(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+
+class TestSqlite:
+    async def test_bulk_insert(self, sqlite_db):
+        rows = [{"id": i, "name": f"user{i}"} for i in range(2500)]
+
+        result = await _run(database_insert, {"table": "users", "data": rows, "database_type": "sqlite"})
+
+        assert result["ok"] and result["inserted_count"] == 2500
+        assert _count(sqlite_db) == 2500
+
+    async def test_insert_is_one_transaction(self, sqlite_db):
+        rows = [{"id": 1, "name": "a"}, {"id": 2, "name": None}]
+
+        with pytest.raises(Exception, match="NOT NULL"):
+            await _run(database_insert, {"table": "users", "data": rows, "database_type": "sqlite"})
+
+        assert _count(sqlite_db) == 0
+
+    async def test_chunked_returns_one_item_per_chunk(self, sqlite_db):
+        rows = [{"id": i, "name": f"user{i}"} for i in range(5)]
+        await _run(database_insert, {"table": "users", "data": rows, "database_type": "sqlite"})
+
+        result = await _run(database_query, {
+            "query": "SELECT id, name FROM users ORDER BY id",
+            "database_type": "sqlite",
+            "fetch": "chunked",
+            "chunk_size": 2,
+        })
+
+        assert result["rows"] == rows
+        assert result["row_count"] == 5 and result["columns"] == ["id", "name"]
+
+        chunks = result["data"]
+        assert [chunk["chunk"] for chunk in chunks] == [0, 1, 2]
+        assert [chunk["row_count"] for chunk in chunks] == [2, 2, 1]
+        assert chunks[0]["columns"] == ["id", "name"]
+        assert [row for chunk in chunks for row in chunk["rows"]] == rows
+
+    async def test_chunked_empty_result(self, sqlite_db):
+        result = await _run(database_query, {
+            "query": "SELECT * FROM users", "database_type": "sqlite", "fetch": "chunked",
+        })
+
+        assert result["ok"] and result["data"] == []
+        assert result["rows"] == [] and result["row_count"] == 0
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """Let the insert paths' driver import checks pass; the pool supplies the connection."""
+    monkeypatch.setitem(sys.modules, "asyncpg", types.ModuleType("asyncpg"))
+    monkeypatch.setitem(sys.modules, "aiomysql", types.ModuleType("aiomysql"))
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db:5432/app")
+    monkeypatch.setenv("MYSQL_HOST", "db")
+
+
+def _statements(manager):
+    return manager.created[0][2].connection.calls
+
+
+_ROWS = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}]
+
+
+class TestPostgresqlInsert:
+    async def test_returning_numbers_placeholders_per_chunk(self, manager, drivers, monkeypatch):
+        # Two columns and at most five bind parameters: two rows per statement
+        monkeypatch.setattr(insert, "MAX_BIND_PARAMS", 5)
+
+        result = await _run(database_insert, {"table": "users", "data": _ROWS, "returning": ["id"]})
+
+        assert result["returning_data"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert _statements(manager) == [
+            ("begin", None, None),
+            ("fetch", "INSERT INTO users (id, name) VALUES ($1, $2), ($3, $4) RETURNING id",
+             [1, "a", 2, "b"]),
+            ("fetch", "INSERT INTO users (id, name) VALUES ($1, $2) RETURNING id", [3, "c"]),
+            ("commit", None, None),
+        ]
+
+    async def test_executemany_below_copy_threshold(self, manager, drivers, monkeypatch):
+        monkeypatch.setattr(insert, "COPY_MIN_ROWS", 4)
+
+        await _run(database_insert, {"table": "users", "data": _ROWS})
+
+        assert _statements(manager)[1] == (
+            "executemany", "INSERT INTO users (id, name) VALUES ($1, $2)",
+            [[1, "a"], [2, "b"], [3, "c"]],
+        )
+
+    async def test_copy_from_threshold_with_folded_names(self, manager, drivers, monkeypatch):
+        monkeypatch.setattr(insert, "COPY_MIN_ROWS", 3)
+        rows = [{"ID": row["id"], "Name": row["name"]} for row in _ROWS]
+
+        result = await _run(database_insert, {"table": "Users", "data": rows})
+
+        assert result["inserted_count"] == 3
+        assert _statements(manager) == [
+            ("begin", None, None),
+            ("copy", "users", (["id", "name"], [(1, "a"), (2, "b"), (3, "c")])),
+            ("commit", None, None),
+        ]
+
+
+class TestMysqlInsert:
+    async def test_multi_row_chunks(self, manager, drivers, monkeypatch):
+        monkeypatch.setattr(insert, "MAX_ROWS_PER_STATEMENT", 2)
+
+        result = await _run(database_insert, {"table": "users", "data": _ROWS, "database_type": "mysql"})
+
+        assert result["inserted_count"] == 3
+        assert _statements(manager) == [
+            ("execute", "INSERT INTO users (id, name) VALUES (%s, %s), (%s, %s)", [1, "a", 2, "b"]),
+            ("execute", "INSERT INTO users (id, name) VALUES (%s, %s)", [3, "c"]),
+            ("commit", None, None),
+        ]
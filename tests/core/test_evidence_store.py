@@ -0,0 +1,281 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Evidence store — delta-encoded contexts with periodic keyframes, the
+sidecar index and the background writer.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from core.modules import atomic  # noqa: F401 — registers production modules
+
+from core.engine.evidence import EvidenceExecutorHooks, EvidenceStore, StepEvidence
+from core.engine.hooks import CompositeHooks
+from core.engine.evidence.codec import ContextDeltaEncoder
+from core.engine.evidence.index import INDEX_FILENAME, EvidenceIndex
+from core.engine.replay.manager import ReplayManager
+from core.engine.workflow import WorkflowEngine
+
+
+def _evidence(index, before, after, execution_id="exec_1"):
+    return StepEvidence(
+        step_id=f"step_{index}",
+        execution_id=execution_id,
+        timestamp=datetime(2026, 1, 1),
+        duration_ms=index,
+        context_before=before,
+        context_after=after,
+        output={"index": index},
+        step_index=index,
+    )
+
+
+async def _write_run(store, steps=7):
+    """Each step adds its output to the context; returns expected contexts."""
+    big = {"rows": list(range(50))}
+    context = {"params": big}
+    expected = []
+    for index in range(steps):
+        before = dict(context)
+        context = dict(context)
+        context[f"step_{index}"] = {"ok": True, "value": index}
+        if index == 3:
+            context.pop("params")
+        expected.append((before, dict(context)))
+        await store.save_evidence(_evidence(index, before, context))
+    await store.flush("exec_1")
+    return expected
+
+
+def _lines(store, execution_id="exec_1"):
+    path = store.base_path / execution_id / "evidence.jsonl"
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestDeltaEncoding:
+    async def test_keyframes_and_deltas_on_disk(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        await _write_run(store)
+
+        lines = _lines(store)
+        assert [line["context_encoding"] for line in lines] == [
+            "keyframe", "delta", "delta", "keyframe", "delta", "delta", "keyframe",
+        ]
+        # A delta only carries what the step changed
+        assert lines[1]["context_before"] == {"set": {}, "unset": []}
+        assert lines[1]["context_after"] == {
+            "set": {"step_1": {"ok": True, "value": 1}}, "unset": [],
+        }
+        assert lines[4]["context_after"]["set"] == {"step_4": {"ok": True, "value": 4}}
+
+    async def test_load_evidence_rebuilds_full_contexts(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        expected = await _write_run(store)
+
+        loaded = await store.load_evidence("exec_1")
+
+        assert [(e.context_before, e.context_after) for e in loaded] == expected
+        assert loaded[5].output == {"index": 5}
+
+    async def test_replay_manager_rebuilds_state(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        expected = await _write_run(store)
+        manager = ReplayManager(tmp_path)
+
+        state = await manager.load_execution_state("exec_1", "step_5")
+        steps = await manager.load_execution_steps("exec_1")
+
+        assert (state["context_before"], state["context_after"]) == expected[5]
+        assert steps[4]["context_after"] == expected[4][1]
+        assert "context_encoding" not in steps[4]
+
+    async def test_legacy_full_context_lines_still_load(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        path = tmp_path / "exec_old" / "evidence.jsonl"
+        path.parent.mkdir()
+        record = _evidence(0, {"a": 1}, {"a": 1, "b": 2}, "exec_old").to_dict()
+        path.write_text(json.dumps(record) + "\n")
+
+        loaded = await store.load_evidence("exec_old")
+
+        assert loaded[0].context_after == {"a": 1, "b": 2}
+
+    async def test_large_values_are_truncated_per_entry(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        context = {"text": "x" * 20000}
+        await store.save_evidence(_evidence(0, context, context))
+
+        loaded = await store.load_evidence("exec_1")
+
+        assert loaded[0].context_before["text"].endswith("[truncated: 20000 chars]")
+
+    def test_only_changed_entries_are_encoded(self):
+        prepared = []
+        encoder = ContextDeltaEncoder(prepare=lambda value: prepared.append(value) or value)
+        context = {"big": {"rows": list(range(50))}}
+        for index in range(5):
+            before = dict(context)
+            context = {**context, f"step_{index}": {"value": index}}
+            encoder.encode({"context_before": before, "context_after": context})
+
+        assert prepared == [context["big"]] + [{"value": index} for index in range(5)]
+
+    def test_equal_new_objects_are_not_changes(self):
+        encoder = ContextDeltaEncoder()
+        encoder.encode({"context_before": {}, "context_after": {"a": {"x": 1}}})
+
+        data = encoder.encode({"context_before": {"a": {"x": 1}}, "context_after": {"a": {"x": 1}}})
+
+        assert data["context_before"] == {"set": {}, "unset": []}
+        assert data["context_after"] == {"set": {}, "unset": []}
+
+
+class TestEvidenceIndex:
+    async def test_index_maps_records_to_byte_ranges(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        await _write_run(store)
+        jsonl = tmp_path / "exec_1" / "evidence.jsonl"
+
+        entries = EvidenceIndex.open(jsonl).entries
+        raw = jsonl.read_bytes()
+
+        assert [e["step_index"] for e in entries] == list(range(7))
+        assert [e["keyframe"] for e in entries][:4] == [True, False, False, True]
+        record = json.loads(raw[entries[5]["offset"]:entries[5]["offset"] + entries[5]["length"]])
+        assert record["step_id"] == "step_5"
+
+    async def test_lookup_reads_only_from_nearest_keyframe(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        expected = await _write_run(store)
+        jsonl = tmp_path / "exec_1" / "evidence.jsonl"
+
+        # Corrupt the records before the keyframe at step 3 (same length)
+        entries = EvidenceIndex.open(jsonl).entries
+        raw = bytearray(jsonl.read_bytes())
+        raw[:entries[3]["offset"]] = b"x" * entries[3]["offset"]
+        jsonl.write_bytes(bytes(raw))
+
+        by_id = await store.load_step_evidence("exec_1", "step_5")
+        by_index = await store.load_step_evidence("exec_1", step_index=4)
+        state = await ReplayManager(tmp_path).load_execution_state("exec_1", "step_5")
+
+        assert (by_id.context_before, by_id.context_after) == expected[5]
+        assert by_index.context_after == expected[4][1]
+        assert state["context_after"] == expected[5][1]
+
+    async def test_missing_or_stale_index_is_rebuilt(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        expected = await _write_run(store)
+        index_path = tmp_path / "exec_1" / INDEX_FILENAME
+        full_index = index_path.read_text()
+
+        index_path.unlink()
+        found = await store.load_step_evidence("exec_1", "step_6")
+        assert found.context_after == expected[6][1]
+        assert index_path.read_text() == full_index
+
+        index_path.write_text(full_index.splitlines(True)[0])
+        assert (await store.load_step_evidence("exec_1", "step_2")).step_index == 2
+        assert index_path.read_text() == full_index
+
+    async def test_unknown_step(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        await _write_run(store, steps=2)
+        assert await store.load_step_evidence("exec_1", "nope") is None
+        assert await store.load_step_evidence("exec_missing", "step_0") is None
+
+
+class TestBackgroundWriter:
+    async def test_records_are_visible_after_flush(self, tmp_path):
+        store = EvidenceStore(tmp_path, fsync="batch")
+        for index in range(5):
+            await store.save_evidence(_evidence(index, {}, {"n": index}))
+
+        await store.flush("exec_1")
+
+        assert [line["step_index"] for line in _lines(store)] == list(range(5))
+        assert len(EvidenceIndex.open(tmp_path / "exec_1" / "evidence.jsonl").entries) == 5
+
+    async def test_loads_wait_for_queued_writes(self, tmp_path):
+        store = EvidenceStore(tmp_path, max_pending_writes=2)
+        for index in range(10):
+            await store.save_evidence(_evidence(index, {}, {"n": index}))
+
+        loaded = await store.load_evidence("exec_1")
+
+        assert [e.context_after["n"] for e in loaded] == list(range(10))
+        assert await store.list_executions() == ["exec_1"]
+
+    async def test_artifacts_are_written_in_background(self, tmp_path):
+        store = EvidenceStore(tmp_path, fsync="always")
+        name = await store.save_screenshot("exec_1", "step_1", b"png")
+        await store.save_dom_snapshot("exec_1", "step_1", "<html></html>")
+
+        path = await store.get_screenshot_path("exec_1", "step_1")
+
+        assert name == "step_1.png"
+        assert path.read_bytes() == b"png"
+        assert (await store.get_dom_snapshot_path("exec_1", "step_1")).read_text() == "<html></html>"
+
+    async def test_files_reopen_after_execution_flush(self, tmp_path):
+        store = EvidenceStore(tmp_path, keyframe_interval=3)
+        expected = await _write_run(store, steps=4)
+        await store.save_evidence(_evidence(4, expected[-1][1], {"done": True}))
+
+        loaded = await store.load_evidence("exec_1")
+
+        assert len(loaded) == 5
+        assert loaded[4].context_after == {"done": True}
+
+    async def test_close_drains_queue(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        await store.save_evidence(_evidence(0, {}, {"a": 1}))
+
+        store.close()
+
+        assert _lines(store)[0]["step_id"] == "step_0"
+
+    def test_rejects_unknown_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            EvidenceStore(tmp_path, fsync="sometimes")
+
+
+class TestExecutorHooksInEngine:
+    WORKFLOW = {
+        "id": "evidence",
+        "steps": [
+            {"id": "first", "module": "string.uppercase", "params": {"text": "a"}},
+            {"id": "second", "module": "string.uppercase", "params": {"text": "b"}},
+        ],
+    }
+
+    async def test_engine_run_writes_evidence(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        engine = WorkflowEngine(self.WORKFLOW, hooks=EvidenceExecutorHooks(store, "exec_1"))
+
+        await engine.execute()
+
+        loaded = await store.load_evidence("exec_1")
+        assert [e.step_id for e in loaded] == ["first", "second"]
+        assert "first" not in loaded[0].context_before
+        assert loaded[1].context_before["first"] == loaded[0].context_after["first"]
+        assert _lines(store)
+
+    async def test_failed_run_still_flushes(self, tmp_path):
+        store = EvidenceStore(tmp_path)
+        workflow = {"id": "evidence", "steps": [
+            *self.WORKFLOW["steps"][:1],
+            {"id": "broken", "module": "no.such_module", "params": {}},
+        ]}
+        hooks = CompositeHooks([EvidenceExecutorHooks(store, "exec_1")])
+        engine = WorkflowEngine(workflow, hooks=hooks)
+
+        with pytest.raises(Exception):
+            await engine.execute()
+
+        lines = _lines(store)
+        assert [line["step_id"] for line in lines] == ["first", "broken"]
+        assert [line["status"] for line in lines] == ["success", "error"]
@@ -0,0 +1,198 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+flow.parallel / flow.batch — the engine runs the returned plans for real.
+"""
+
+import time
+
+import pytest
+
+from core.modules import atomic  # noqa: F401 — registers production modules
+from core.engine.workflow import WorkflowEngine
+
+
+def _delay(ms):
+    return {"module": "utility.delay", "params": {"duration_ms": ms}}
+
+
+def _upper(text):
+    return {"module": "string.uppercase", "params": {"text": text}}
+
+
+# Upstream data holding ${...} text: it must reach the task unexpanded
+DATA = {"note": "${params.marker}", "marker": "expanded"}
+
+
+async def _run(step, params=None):
+    engine = WorkflowEngine(
+        {"id": "wf_plans", "name": "Plans", "steps": [dict(step, id="plan")]}, params=params,
+    )
+    await engine.execute()
+    return engine.context["plan"]
+
+
+class TestParallelPlan:
+    async def test_tasks_run_concurrently_with_real_results(self):
+        start = time.monotonic()
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [_delay(200), _delay(200), _delay(200), _upper("x")]},
+        })
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert result["__event__"] == "completed"
+        assert result["completed_count"] == 4 and result["failed_count"] == 0
+        assert [r["status"] for r in result["results"]] == ["completed"] * 4
+        assert result["results"][3]["result"]["data"]["result"] == "X"
+        assert result["results"][0]["duration_ms"] >= 200
+        assert "__parallel_execution__" not in result
+
+    async def test_concurrency_limit(self):
+        start = time.monotonic()
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [_delay(100)] * 4, "concurrency_limit": 2},
+        })
+        elapsed = time.monotonic() - start
+
+        assert result["completed_count"] == 4
+        assert elapsed >= 0.2
+
+    async def test_fail_fast_cancels_remaining(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [{"module": "no.such_module"}, _delay(2000)]},
+        })
+
+        assert result["__event__"] == "error"
+        assert result["ok"] is False
+        assert [r["status"] for r in result["results"]] == ["failed", "cancelled"]
+        assert result["duration_ms"] < 1000
+
+    async def test_settle_reports_each_outcome(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [{"module": "no.such_module"}, _upper("a")], "mode": "settle"},
+        })
+
+        assert result["__event__"] == "partial"
+        assert (result["completed_count"], result["failed_count"]) == (1, 1)
+
+    async def test_race_returns_first_result(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [_delay(2000), _upper("fast")], "mode": "race"},
+        })
+
+        assert result["winner"] == 1
+        assert result["result"]["data"]["result"] == "FAST"
+        assert result["results"][0]["status"] == "cancelled"
+
+    async def test_timeout_returns_partial(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [_upper("a"), _delay(2000)], "timeout_ms": 100},
+        })
+
+        assert result["__event__"] == "partial"
+        assert result["__error__"]["code"] == "PARALLEL_TIMEOUT"
+        assert [r["status"] for r in result["results"]] == ["completed", "cancelled"]
+
+    async def test_denied_modules_stay_blocked_inside_tasks(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [{"module": "shell.exec", "params": {"command": "id"}}]},
+        })
+
+        assert result["__event__"] == "error"
+        assert "blocked by the capability policy" in result["results"][0]["error"]
+
+    async def test_task_params_are_resolved_once(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": [_upper("${params.note}")]},
+        }, DATA)
+
+        assert result["results"][0]["result"]["data"]["result"] == "${PARAMS.MARKER}"
+
+    async def test_tasks_from_data_are_not_resolved_again(self):
+        result = await _run({
+            "module": "flow.parallel",
+            "params": {"tasks": "${params.tasks}"},
+        }, {**DATA, "tasks": [_upper("${params.marker}")]})
+
+        assert result["results"][0]["result"]["data"]["result"] == "${PARAMS.MARKER}"
+
+
+class TestBatchPlan:
+    @pytest.fixture(autouse=True)
+    def _allow_flow_batch(self, monkeypatch):
+        # flow.batch is denied by default (nested-execution gadget); opt in
+        # the way an operator would
+        import core.module_policy as module_policy
+        from core.module_policy import ModuleFilter
+        monkeypatch.delenv("FLYTO_MODULE_DENYLIST", raising=False)
+        monkeypatch.setenv("FLYTO_MODULE_ALLOWLIST", "flow.*,string.*,utility.*")
+        monkeypatch.setattr(module_policy, "module_filter", ModuleFilter())
+
+    async def test_task_runs_once_per_batch(self):
+        result = await _run({
+            "module": "flow.batch",
+            "params": {
+                "items": ["a", "b", "c", "d", "e"],
+                "batch_size": 2,
+                "parallel_batches": 2,
+                "task": {"module": "string.uppercase", "params": {"text": "${batch_index}:${batch}"}},
+            },
+        })
+
+        assert result["__event__"] == "completed"
+        assert result["total_batches"] == 3 and result["total_items"] == 5
+        texts = [r["result"]["data"]["result"] for r in result["results"]]
+        assert [t.split(":")[0] for t in texts] == ["0", "1", "2"]
+        assert "'A'" in texts[0] and "'E'" in texts[2]
+        assert [r["size"] for r in result["results"]] == [2, 2, 1]
+
+    async def test_delay_spaces_batch_starts(self):
+        start = time.monotonic()
+        result = await _run({
+            "module": "flow.batch",
+            "params": {
+                "items": [1, 2, 3],
+                "batch_size": 1,
+                "parallel_batches": 3,
+                "delay_ms": 100,
+                "task": _upper("${batch}"),
+            },
+        })
+
+        assert result["completed_count"] == 3
+        assert time.monotonic() - start >= 0.2
+
+    async def test_failure_stops_without_continue_on_error(self):
+        result = await _run({
+            "module": "flow.batch",
+            "params": {"items": [1, 2, 3], "batch_size": 1, "task": {"module": "no.such_module"}},
+        })
+
+        assert result["__event__"] == "error"
+        assert [r["status"] for r in result["results"]] == ["failed", "cancelled", "cancelled"]
+
+    async def test_batch_data_is_not_resolved_again(self):
+        result = await _run({
+            "module": "flow.batch",
+            "params": {"items": ["${params.note}"], "batch_size": 1, "task": _upper("${batch}")},
+        }, DATA)
+
+        assert "${PARAMS.MARKER}" in result["results"][0]["result"]["data"]["result"]
+
+    async def test_without_task_the_plan_is_kept(self):
+        result = await _run({
+            "module": "flow.batch",
+            "params": {"items": [1, 2, 3], "batch_size": 2},
+        })
+
+        assert result["__event__"] == "batch"
+        assert result["all_batches"] == [[1, 2], [3]]
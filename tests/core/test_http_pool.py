@@ -0,0 +1,153 @@
+"""
+Tests for the shared http.* connection pools (core.http_pool).
+
+Uses a live aiohttp server on localhost that records which client socket
+each request arrived on, so connection reuse is observed rather than assumed.
+"""
+
+import pytest
+from aiohttp import web
+
+from core import http_pool
+from core.http_pool import HttpPoolManager
+from core.modules.atomic.http.batch import http_batch
+from core.modules.atomic.http.request import http_request
+from core.modules.atomic.http.session import http_session
+from core.session_reaper import reap_idle_http_pools
+
+
+async def _run(module, params: dict) -> dict:
+    return await module(params, {}).execute()
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A fresh process-wide manager per test."""
+    monkeypatch.delenv("FLYTO_HTTP_POOL", raising=False)
+    fresh = HttpPoolManager(limit_per_host=4, keepalive_s=30)
+    monkeypatch.setattr(http_pool, "_manager", fresh)
+    return fresh
+
+
+@pytest.fixture
+async def server(monkeypatch, manager):
+    """Yields (base_url, peers) where peers lists each request's client port."""
+    monkeypatch.setenv("FLYTO_ALLOW_PRIVATE_NETWORK", "true")
+    peers = []
+
+    async def handle_echo(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"cookie": request.cookies.get("sid")})
+
+    async def handle_login(request: web.Request) -> web.Response:
+        response = web.json_response({"step": "login"})
+        response.set_cookie("sid", "secret")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/echo", handle_echo)
+    app.router.add_get("/login", handle_login)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://localhost:{port}", peers
+    await manager.close_all()
+    await runner.cleanup()
+
+
+class TestConnectionReuse:
+    async def test_sequential_requests_share_one_connection(self, server, manager):
+        base, peers = server
+
+        for _ in range(5):
+            result = await _run(http_request, {"url": f"{base}/echo"})
+            assert result["ok"]
+
+        assert len(peers) == 5 and len(set(peers)) == 1
+        assert manager.stats()["pools"] == 1
+        assert manager.stats()["origins"][0]["sessions"] == 5
+
+    async def test_batch_is_capped_per_host(self, server, manager):
+        base, peers = server
+
+        result = await _run(http_batch, {
+            "requests": [{"url": f"{base}/echo"} for _ in range(12)],
+        })
+
+        assert result["ok"] and result["failed_count"] == 0
+        assert len(set(peers)) <= manager.limit_per_host
+
+    async def test_connections_are_not_capped_by_default(self, monkeypatch):
+        monkeypatch.delenv("FLYTO_HTTP_POOL_LIMIT_PER_HOST", raising=False)
+        fresh = HttpPoolManager()
+
+        connector = fresh._acquire("https://api.example.com/v1").connector
+
+        assert (connector.limit, connector.limit_per_host) == (0, 0)
+        await connector.close()
+
+    async def test_cookies_do_not_leak_between_calls(self, server, manager):
+        base, _ = server
+
+        first = await _run(http_session, {"requests": [
+            {"url": f"{base}/login"}, {"url": f"{base}/echo"},
+        ]})
+        second = await _run(http_session, {"requests": [{"url": f"{base}/echo"}]})
+
+        assert first["results"][1]["body"] == {"cookie": "secret"}
+        assert second["results"][0]["body"] == {"cookie": None}
+        assert manager.stats()["pools"] == 1
+
+    async def test_pooling_can_be_disabled(self, server, manager, monkeypatch):
+        base, peers = server
+        monkeypatch.setenv("FLYTO_HTTP_POOL", "0")
+
+        for _ in range(3):
+            assert (await _run(http_request, {"url": f"{base}/echo"}))["ok"]
+
+        assert len(manager) == 0
+        assert len(set(peers)) == 3
+
+
+class TestPoolKeys:
+    async def test_security_settings_get_separate_pools(self, server, manager, monkeypatch):
+        base, _ = server
+
+        await _run(http_request, {"url": f"{base}/echo"})
+        monkeypatch.setenv("FLYTO_ALLOWED_HOSTS", "localhost")
+        await _run(http_request, {"url": f"{base}/echo"})
+
+        assert len(manager) == 2
+
+    async def test_connect_time_guard_still_applies(self, server, manager, monkeypatch):
+        base, _ = server
+        await _run(http_request, {"url": f"{base}/echo"})
+        monkeypatch.setenv("FLYTO_ALLOW_PRIVATE_NETWORK", "false")
+
+        async with manager.session(f"{base}/echo") as session:
+            with pytest.raises(Exception, match="DNS-rebinding guard"):
+                await session.get(f"{base}/echo")
+
+
+class TestIdleClose:
+    async def test_only_idle_pools_are_closed(self, server, manager):
+        base, _ = server
+        await _run(http_request, {"url": f"{base}/echo"})
+
+        async with manager.session("http://example.invalid/"):
+            assert await manager.close_idle(idle_s=60) == 0
+            assert await manager.close_idle(idle_s=0) == 1
+
+        assert [o["origin"] for o in manager.stats()["origins"]] == ["http://example.invalid"]
+
+    async def test_reaper_sweep_closes_idle_pools(self, server, manager, monkeypatch):
+        base, _ = server
+        await _run(http_request, {"url": f"{base}/echo"})
+        connector = next(iter(manager._pools.values())).connector
+        monkeypatch.setenv("FLYTO_HTTP_POOL_IDLE_TIMEOUT_S", "0")
+
+        await reap_idle_http_pools()
+
+        assert len(manager) == 0 and connector.closed
@@ -0,0 +1,240 @@
+"""Column-wise item batches behind the legacy step result.
+
+items_to_legacy_context no longer builds ``items_full`` up front and the next
+step no longer rebuilds an Item per row, but neither change may be visible:
+the legacy dict must read, compare, copy and serialize exactly as the eagerly
+built one did, and a downstream step must see the same input items.
+"""
+
+import copy
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from core.engine.step_executor.executor import StepExecutor, _redact_sensitive_output
+from core.engine.workflow.engine import WorkflowEngine
+from core.engine.variable_resolver import VariableResolver
+from core.modules.base import BaseModule
+from core.modules.items import (
+    BinaryData,
+    ExecutionStatus,
+    Item,
+    ItemBatch,
+    ItemError,
+    ItemMeta,
+    LegacyStepResult,
+    NodeError,
+    NodeExecutionResult,
+    PairedItemInfo,
+    items_to_legacy_context,
+)
+from core.modules.registry.core import ModuleRegistry
+
+
+def _items():
+    return [
+        Item(json={"a": 1}),
+        Item(json={"a": 2}, meta=ItemMeta(sourceNodeId="up", sourceItemIndex=1)),
+        Item(json={}, error=ItemError(message="boom", itemIndex=2)),
+        Item(
+            json={"file": "x.png"},
+            binary={"file": BinaryData(data=b"\x89PNG", mimeType="image/png", fileSize=4)},
+            pairedItem=PairedItemInfo(item=0, input=1),
+        ),
+    ]
+
+
+def _eager(result):
+    """items_to_legacy_context as it was before batches."""
+    legacy = result.to_legacy_dict()
+    legacy["items"] = [item.json for item in result.items]
+    legacy["items_full"] = [item.to_dict() for item in result.items]
+    return legacy
+
+
+class TestItemBatch:
+    def test_rows_round_trip(self):
+        items = _items()
+        batch = ItemBatch.from_items(items)
+
+        assert len(batch) == 4
+        assert list(batch)[:3] == items[:3]
+        assert batch[1:3] == items[1:3]
+        assert batch.to_dicts() == [item.to_dict() for item in items]
+
+    def test_binary_payloads_are_not_kept(self):
+        items = _items()
+        batch = ItemBatch.from_items(items)
+
+        assert batch[-1].binary is None
+        assert batch[-1].pairedItem == items[-1].pairedItem
+        assert batch.to_dicts()[-1]["binary"] == {
+            "file": {"mimeType": "image/png", "fileName": None, "fileSize": 4}
+        }
+        assert b"\x89PNG" not in pickle.dumps(batch)
+
+    def test_json_column_is_shared_not_copied(self):
+        items = _items()
+        batch = ItemBatch.from_items(items)
+
+        assert batch.json[0] is items[0].json
+        assert batch[0].json is items[0].json
+
+    def test_json_only_matches_rebuilding_from_items(self):
+        batch = ItemBatch.from_items(_items() + [Item(json=5)])
+
+        assert list(batch.json_only()) == [Item.from_value(v) for v in batch.json]
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            ItemBatch.from_items(_items())[4]
+
+
+class TestLegacyStepResult:
+    @pytest.fixture
+    def result(self):
+        return NodeExecutionResult(data=[_items()])
+
+    def test_items_full_is_built_on_first_read(self, result):
+        legacy = items_to_legacy_context(result)
+
+        assert isinstance(legacy, LegacyStepResult)
+        assert not dict.__contains__(legacy, "items_full")
+        assert "items_full" in legacy and len(legacy) == 4
+        assert legacy["items_full"] == _eager(result)["items_full"]
+
+    def test_reads_like_the_eager_dict(self, result):
+        eager = _eager(result)
+
+        assert items_to_legacy_context(result) == eager
+        assert dict(items_to_legacy_context(result)) == eager
+        assert {**items_to_legacy_context(result)} == eager
+        assert list(items_to_legacy_context(result).items()) == list(eager.items())
+        assert json.dumps(items_to_legacy_context(result)) == json.dumps(eager)
+        assert items_to_legacy_context(result).get("items_full") == eager["items_full"]
+
+    def test_two_pending_results_compare_equal(self, result):
+        assert items_to_legacy_context(result) == items_to_legacy_context(result)
+        assert not items_to_legacy_context(result) != items_to_legacy_context(result)
+
+    def test_copies_are_plain_dicts(self, result):
+        legacy = items_to_legacy_context(result)
+
+        for clone in (copy.copy(legacy), copy.deepcopy(legacy), pickle.loads(pickle.dumps(legacy))):
+            assert type(clone) is dict
+            assert clone == _eager(result)
+
+    def test_asdict_rebuilds_it_from_its_pairs(self, result):
+        @dataclasses.dataclass
+        class Holder:
+            context: dict
+
+        rebuilt = dataclasses.asdict(Holder({"step": items_to_legacy_context(result)}))
+
+        assert rebuilt == {"context": {"step": _eager(result)}}
+
+    def test_assigned_items_full_is_kept(self, result):
+        legacy = items_to_legacy_context(result)
+        legacy["items_full"] = []
+
+        assert legacy["items_full"] == []
+        assert legacy == {**_eager(result), "items_full": []}
+
+    def test_error_result(self):
+        failed = NodeExecutionResult(
+            data=[[]], status=ExecutionStatus.ERROR, error=NodeError(message="nope", code="X"),
+        )
+
+        assert items_to_legacy_context(failed) == _eager(failed)
+
+
+class _DoubleModule(BaseModule):
+    """Doubles each item's value."""
+
+    module_id = "test.item_batch.double"
+    execution_mode = "items"
+
+    def validate_params(self) -> None:
+        return None
+
+    async def execute(self):
+        return self.success({})
+
+    async def execute_item(self, item: Item, index: int, context):
+        return Item(json={"value": item.json.get("value", 0) * 2})
+
+
+@pytest.fixture
+def double_module():
+    ModuleRegistry.register(_DoubleModule.module_id, _DoubleModule)
+    yield _DoubleModule.module_id
+    ModuleRegistry.unregister(_DoubleModule.module_id)
+
+
+async def _run(module_id, context, inputs):
+    step_config = {"id": "next", "module": module_id, "params": {}, "inputs": inputs}
+    return await StepExecutor().execute_step(
+        step_config=step_config,
+        step_index=0,
+        context=context,
+        resolver=VariableResolver(params={}, context=context),
+        should_execute=True,
+    )
+
+
+class TestDownstreamSteps:
+    def test_upstream_batch_is_passed_without_rebuilding(self):
+        upstream = items_to_legacy_context(NodeExecutionResult(data=[_items()]))
+
+        items = StepExecutor()._get_input_items_from_context({"up": upstream}, ["up"])
+
+        assert isinstance(items, ItemBatch)
+        assert items.json is upstream["items"]
+        assert list(items) == [Item.from_value(v) for v in upstream["items"]]
+
+    def test_replaced_items_are_not_served_from_the_batch(self):
+        upstream = items_to_legacy_context(NodeExecutionResult(data=[_items()]))
+        upstream["items"] = [{"a": 9}]
+
+        items = StepExecutor()._get_input_items_from_context({"up": upstream}, ["up"])
+
+        assert items == [Item(json={"a": 9})]
+
+    async def test_chained_steps(self, double_module):
+        upstream = items_to_legacy_context(NodeExecutionResult(
+            data=[[Item(json={"value": v}) for v in (1, 2, 3)]],
+        ))
+        plain = _eager(NodeExecutionResult(data=[[Item(json={"value": v}) for v in (4, 5)]]))
+        context = {"up": upstream, "plain": plain}
+
+        single = await _run(double_module, context, ["up"])
+        merged = await _run(double_module, context, ["up", "plain"])
+
+        assert single["items"] == [{"value": 2}, {"value": 4}, {"value": 6}]
+        assert merged["items"] == [{"value": v} for v in (2, 4, 6, 8, 10)]
+        assert merged["items_full"][0] == {"json": {"value": 2}}
+
+
+class TestEngineRun:
+    async def test_items_full_stays_unbuilt_after_a_full_step(self, double_module):
+        engine = WorkflowEngine({"steps": [{"id": "double", "module": double_module, "params": {}}]})
+
+        await engine.execute()
+
+        result = engine.context["double"]
+        assert isinstance(result, LegacyStepResult)
+        assert result._pending is True
+
+    def test_redaction_applies_when_items_full_is_read(self):
+        result = items_to_legacy_context(NodeExecutionResult(
+            data=[[Item(json={"api_key": "sk-1", "name": "a"})]],
+        ))
+
+        redacted = _redact_sensitive_output(result)
+
+        assert result._pending and redacted._pending
+        assert redacted["items"] == [{"api_key": "[REDACTED]", "name": "a"}]
+        assert redacted["items_full"] == [{"json": {"api_key": "[REDACTED]", "name": "a"}}]
+        assert result["items_full"] == [{"json": {"api_key": "sk-1", "name": "a"}}]
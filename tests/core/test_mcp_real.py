@@ -396,3 +396,19 @@ class TestSTDIOSubprocess:
     def test_ping(self, mcp_server):
         resp = _call(mcp_server, "ping")
         assert resp["result"] == {}
+
+    def test_slow_call_does_not_block_later_requests(self, mcp_server):
+        global _next_id
+        slow_id, ping_id = _next_id, _next_id + 1
+        _next_id += 2
+        _send_jsonrpc(mcp_server, "tools/call", {
+            "name": "execute_module",
+            "arguments": {"module_id": "utility.delay", "params": {"duration_ms": 1500}},
+        }, req_id=slow_id)
+        _send_jsonrpc(mcp_server, "ping", None, req_id=ping_id)
+
+        first = _read_response(mcp_server, timeout=15.0)
+        second = _read_response(mcp_server, timeout=15.0)
+
+        assert [first.get("id"), second.get("id")] == [ping_id, slow_id]
+        assert "error" not in second, f"Got error: {second.get('error')}"
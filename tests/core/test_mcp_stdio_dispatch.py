@@ -0,0 +1,192 @@
+"""
+Tests for concurrent request dispatch in the STDIO MCP server.
+
+handle_jsonrpc_request is replaced with a fake whose per-request delay and
+progress are scripted, so ordering, session serialization, the in-flight cap
+and cancellation are observed without launching browsers.
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from core import mcp_server
+from core.mcp_server import RequestDispatcher, StdoutWriter, max_in_flight
+
+
+def _tool_call(req_id, module_id="string.uppercase", context=None, delay=0.0):
+    arguments = {"module_id": module_id, "params": {"delay": delay}}
+    if context is not None:
+        arguments["context"] = context
+    return {
+        "jsonrpc": "2.0", "id": req_id, "method": "tools/call",
+        "params": {"name": "execute_module", "arguments": arguments},
+    }
+
+
+@pytest.fixture
+async def harness(monkeypatch):
+    """Yields (dispatcher, writer, stream, log, browser_sessions).
+
+    log records ("start", id) and ("end", id) as the fake handler runs.
+    """
+    log = []
+
+    async def fake_handle(request, browser_sessions, debugger_sessions, session_activity):
+        if "id" not in request:
+            return None
+        arguments = request.get("params", {}).get("arguments", {})
+        if arguments.get("module_id") == "fail.module":
+            raise RuntimeError("handler exploded")
+        log.append(("start", request["id"]))
+        await asyncio.sleep(arguments.get("params", {}).get("delay", 0))
+        log.append(("end", request["id"]))
+        return {"jsonrpc": "2.0", "id": request["id"], "result": {}}
+
+    monkeypatch.setattr(mcp_server, "handle_jsonrpc_request", fake_handle)
+    stream = io.StringIO()
+    writer = StdoutWriter(stream)
+    writer.start()
+    browser_sessions = {}
+    dispatcher = RequestDispatcher(writer, browser_sessions, {}, {}, limit=8)
+    yield dispatcher, writer, stream, log, browser_sessions
+    await dispatcher.drain()
+    await writer.close()
+
+
+async def _finish(dispatcher, writer, stream):
+    await dispatcher.drain()
+    await writer.close()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestConcurrency:
+    async def test_fast_request_is_not_blocked_by_slow_one(self, harness):
+        dispatcher, writer, stream, _, _ = harness
+
+        dispatcher.submit(_tool_call(1, "browser.goto", delay=0.2))
+        dispatcher.submit({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        responses = await _finish(dispatcher, writer, stream)
+
+        assert [r["id"] for r in responses] == [2, 1]
+
+    async def test_same_browser_session_runs_in_arrival_order(self, harness):
+        dispatcher, writer, stream, log, _ = harness
+        ctx = {"browser_session": "s1"}
+
+        dispatcher.submit(_tool_call(1, "browser.goto", ctx, delay=0.05))
+        dispatcher.submit(_tool_call(2, "browser.click", ctx, delay=0.0))
+        dispatcher.submit(_tool_call(3, "browser.goto", {"browser_session": "s2"}, delay=0.0))
+        responses = await _finish(dispatcher, writer, stream)
+
+        assert log.index(("end", 1)) < log.index(("start", 2))
+        assert log.index(("start", 3)) < log.index(("end", 1))
+        assert sorted(r["id"] for r in responses) == [1, 2, 3]
+
+    async def test_sole_session_and_launch_share_a_lane(self, harness):
+        dispatcher, writer, stream, log, browser_sessions = harness
+
+        dispatcher.submit(_tool_call(1, "browser.launch", delay=0.05))
+        dispatcher.submit(_tool_call(2, "browser.goto"))
+        await dispatcher.drain()
+        browser_sessions["only"] = object()
+        dispatcher.submit(_tool_call(3, "browser.goto", delay=0.05))
+        dispatcher.submit(_tool_call(4, "browser.click", {"browser_session": "only"}))
+        await _finish(dispatcher, writer, stream)
+
+        assert log.index(("end", 1)) < log.index(("start", 2))
+        assert log.index(("end", 3)) < log.index(("start", 4))
+        assert dispatcher._lanes == {}
+
+    async def test_pipelined_launch_goto_click_run_in_order(self, harness):
+        dispatcher, writer, stream, log, browser_sessions = harness
+
+        dispatcher.submit(_tool_call(1, "browser.launch", delay=0.05))
+        dispatcher.submit(_tool_call(2, "browser.goto", delay=0.05))
+        await asyncio.sleep(0.01)
+        browser_sessions["s1"] = object()  # the launch has opened its session
+        dispatcher.submit(_tool_call(3, "browser.click", {"browser_session": "s1"}))
+        await _finish(dispatcher, writer, stream)
+
+        assert log == [("start", 1), ("end", 1), ("start", 2), ("end", 2), ("start", 3), ("end", 3)]
+        assert dispatcher._lanes == {} and dispatcher._unbound == {}
+
+    async def test_session_less_call_queues_behind_its_session(self, harness):
+        dispatcher, writer, stream, log, browser_sessions = harness
+        browser_sessions["s1"] = object()
+
+        dispatcher.submit(_tool_call(1, "browser.click", {"browser_session": "s1"}, delay=0.05))
+        dispatcher.submit(_tool_call(2, "browser.goto"))
+        await _finish(dispatcher, writer, stream)
+
+        assert log.index(("end", 1)) < log.index(("start", 2))
+
+    async def test_in_flight_cap(self, harness, monkeypatch):
+        _, writer, stream, _, _ = harness
+        dispatcher = RequestDispatcher(writer, {}, {}, {}, limit=2)
+        running = peak = 0
+        original = mcp_server.handle_jsonrpc_request
+
+        async def counting(*args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await original(*args)
+            finally:
+                running -= 1
+
+        monkeypatch.setattr(mcp_server, "handle_jsonrpc_request", counting)
+        for i in range(6):
+            dispatcher.submit(_tool_call(i, delay=0.02))
+        responses = await _finish(dispatcher, writer, stream)
+
+        assert peak == 2 and len(responses) == 6
+
+
+class TestCancellationAndErrors:
+    async def test_cancelled_request_gets_no_response(self, harness):
+        dispatcher, writer, stream, log, _ = harness
+
+        dispatcher.submit(_tool_call("slow", delay=5))
+        dispatcher.submit(_tool_call("fast"))
+        await asyncio.sleep(0.01)
+        dispatcher.submit({
+            "jsonrpc": "2.0", "method": "notifications/cancelled",
+            "params": {"requestId": "slow", "reason": "user aborted"},
+        })
+        responses = await _finish(dispatcher, writer, stream)
+
+        assert [r["id"] for r in responses] == ["fast"]
+        assert ("end", "slow") not in log
+
+    async def test_unknown_cancel_is_ignored(self, harness):
+        dispatcher, _, _, _, _ = harness
+
+        assert dispatcher.cancel("nope") is False
+
+    async def test_handler_error_carries_the_request_id(self, harness):
+        dispatcher, writer, stream, _, _ = harness
+
+        dispatcher.submit(_tool_call(7, "fail.module"))
+        responses = await _finish(dispatcher, writer, stream)
+
+        assert responses == [{
+            "jsonrpc": "2.0", "id": 7,
+            "error": {"code": -32000, "message": "handler exploded"},
+        }]
+
+    async def test_notifications_write_nothing(self, harness):
+        dispatcher, writer, stream, _, _ = harness
+
+        dispatcher.submit({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        assert await _finish(dispatcher, writer, stream) == []
+
+
+def test_in_flight_cap_from_env(monkeypatch):
+    monkeypatch.setenv("FLYTO_MCP_MAX_IN_FLIGHT", "3")
+    assert max_in_flight() == 3
+    monkeypatch.setenv("FLYTO_MCP_MAX_IN_FLIGHT", "junk")
+    assert max_in_flight() == mcp_server.DEFAULT_MAX_IN_FLIGHT
@@ -0,0 +1,137 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""Lazy module loading from the prebuilt module manifest.
+
+With a current manifest, ``import core.modules`` registers Core's modules
+without importing their code; the catalog it serves must be exactly the one an
+eager import builds, and ``ModuleRegistry.get()`` must still hand back the real
+class. A manifest built from other sources must be ignored, never served.
+
+Start-up is process-wide state, so each case runs in a fresh interpreter with
+FLYTO_MODULE_MANIFEST pointing at a manifest generated into a temp directory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.modules.registry.manifest import MANIFEST_SCHEMA, load_manifest, source_digest
+
+ROOT = Path(__file__).resolve().parents[2]
+GENERATOR = ROOT / "scripts" / "generate_module_manifest.py"
+
+_PROBE = '''\
+import hashlib, json, sys
+import core.modules
+from core.modules.registry import ModuleRegistry
+from core.modules.registry.manifest import registered_from_manifest
+
+# Rows by id; within a row key order is kept, since parameter forms follow it.
+metadata = ModuleRegistry.get_all_metadata(filter_by_stability=False)
+catalog = json.dumps([metadata[m] for m in sorted(metadata)], default=str)
+lazy_http = "core.modules.atomic.http.get" not in sys.modules
+module_class = ModuleRegistry.get("string.uppercase")
+print(json.dumps({
+    "from_manifest": registered_from_manifest(),
+    "module_count": len(ModuleRegistry.module_ids()),
+    "catalog": hashlib.sha256(catalog.encode()).hexdigest(),
+    "http_not_imported": lazy_http,
+    "materialized": module_class.__module__,
+    "runnable": hasattr(module_class, "execute"),
+}))
+'''
+
+
+def _probe(manifest: Path, **env) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True, text=True, timeout=180, cwd=ROOT,
+        env={
+            **os.environ,
+            "PYTHONPATH": str(ROOT / "src"),
+            "FLYTO_VALIDATION_MODE": "dev",
+            "FLYTO_MODULE_MANIFEST": str(manifest),
+            **env,
+        },
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("manifest") / "module_manifest.json"
+    result = subprocess.run(
+        [sys.executable, str(GENERATOR), "--output", str(path)],
+        capture_output=True, text=True, timeout=180, cwd=ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+    return path
+
+
+@pytest.fixture(scope="module")
+def eager(manifest) -> dict:
+    return _probe(manifest, FLYTO_LAZY_MODULES="0")
+
+
+def test_lazy_start_serves_the_eager_catalog(manifest, eager):
+    lazy = _probe(manifest)
+
+    assert lazy["from_manifest"] is True
+    assert lazy["http_not_imported"] is True
+    assert lazy["module_count"] == eager["module_count"]
+    assert lazy["catalog"] == eager["catalog"]
+
+
+def test_get_materializes_the_real_class(manifest):
+    lazy = _probe(manifest)
+
+    assert lazy["materialized"].startswith("core.modules.atomic.string.")
+    assert lazy["runnable"] is True
+
+
+def test_lazy_loading_can_be_switched_off(eager):
+    assert eager["from_manifest"] is False
+    assert eager["http_not_imported"] is False
+
+
+def test_stale_manifest_falls_back_to_eager_import(manifest, eager, tmp_path):
+    stale = tmp_path / "stale.json"
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    data["source_digest"] = "0" * 64
+    stale.write_text(json.dumps(data), encoding="utf-8")
+
+    result = _probe(stale)
+
+    assert result["from_manifest"] is False
+    assert result["catalog"] == eager["catalog"]
+
+
+class TestLoadManifest:
+    def test_missing_file(self, tmp_path):
+        assert load_manifest(tmp_path / "absent.json") is None
+
+    def test_unreadable_file(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert load_manifest(path) is None
+
+    def test_other_schema(self, tmp_path):
+        path = tmp_path / "future.json"
+        path.write_text(json.dumps({
+            "schema": MANIFEST_SCHEMA + 1, "source_digest": source_digest(), "modules": {},
+        }), encoding="utf-8")
+        assert load_manifest(path) is None
+
+    def test_current_manifest(self, tmp_path):
+        path = tmp_path / "current.json"
+        path.write_text(json.dumps({
+            "schema": MANIFEST_SCHEMA, "source_digest": source_digest(), "modules": {},
+        }), encoding="utf-8")
+        assert load_manifest(path)["modules"] == {}
@@ -52,6 +52,8 @@ GUARD_SYMBOLS = (
     "enforce_outbound_service_url",
     "guarded_aiohttp_request",
     "guarded_client_session",
+    "pooled_client_session",
+    "pooled_client_sessions",
     "ssrf_guarded_connector",
     "trusted_outbound_network_scope",
     "assert_env_credential_endpoint_allowed",
@@ -0,0 +1,186 @@
+"""On-disk cache for the import-time module quality validator.
+
+A stored report may only be served for the exact source, metadata and
+validator it was computed from, and serving it must not change what
+registration does with it: blocking is still decided per import.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from core.modules.registry import quality_cache, quality_validator
+from core.modules.registry.quality_cache import (
+    QualityReportCache,
+    get_quality_cache,
+    reset_quality_cache,
+)
+from core.modules.registry.quality_validator import (
+    ModuleQualityValidator,
+    validate_module_quality,
+)
+
+_MODULE_SOURCE = '''\
+class SampleModule:
+    """A sample module."""
+
+    async def execute(self) -> dict:
+        import json
+        print("debug")
+        return {{"value": {value}}}
+
+    def validate_params(self) -> None:
+        return None
+'''
+
+METADATA = {"category": "string", "input_types": ["string"], "output_types": ["string"]}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("FLYTO_QUALITY_CACHE_DIR", str(directory))
+    monkeypatch.delenv("FLYTO_QUALITY_CACHE", raising=False)
+    reset_quality_cache()
+    yield directory
+    reset_quality_cache()
+
+
+@pytest.fixture
+def sample(tmp_path, monkeypatch):
+    """Write (and rewrite) an importable module; returns a loader."""
+    package = tmp_path / "src"
+    package.mkdir()
+    monkeypatch.syspath_prepend(str(package))
+
+    def load(value=1):
+        path = package / "quality_cache_sample.py"
+        path.write_text(_MODULE_SOURCE.format(value=value), encoding="utf-8")
+        sys.modules.pop("quality_cache_sample", None)
+        importlib.invalidate_caches()
+        return importlib.import_module("quality_cache_sample").SampleModule
+
+    yield load
+    sys.modules.pop("quality_cache_sample", None)
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    """Count how often the validator actually runs."""
+    calls = []
+    original = ModuleQualityValidator.validate
+
+    def counting(self, *args, **kwargs):
+        calls.append(args[1])
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ModuleQualityValidator, "validate", counting)
+    return calls
+
+
+def _rules(report):
+    return sorted(i.rule_id for i in report.issues)
+
+
+def test_single_parse_rules_still_report(sample):
+    report = ModuleQualityValidator().validate(sample(), "test.sample", METADATA)
+
+    assert "Q002" in _rules(report)
+    assert [i.message for i in report.issues if i.rule_id == "Q011"] == ["Unused import: json"]
+
+
+def test_warm_validation_reuses_the_stored_report(sample, validations):
+    module_class = sample()
+    first = validate_module_quality(module_class, "test.sample", METADATA)
+    second = validate_module_quality(module_class, "test.sample", METADATA)
+
+    assert validations == ["test.sample"]
+    assert second.issues == first.issues
+    assert second.source_file == first.source_file
+
+
+def test_a_new_process_reads_the_cache_from_disk(sample, validations):
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+    reset_quality_cache()
+
+    validate_module_quality(module_class, "test.sample", METADATA)
+
+    assert validations == ["test.sample"]
+
+
+def test_source_change_invalidates(sample, validations):
+    validate_module_quality(sample(value=1), "test.sample", METADATA)
+    validate_module_quality(sample(value=22), "test.sample", METADATA)
+
+    assert validations == ["test.sample", "test.sample"]
+
+
+def test_metadata_change_invalidates(sample, validations):
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+    validate_module_quality(module_class, "test.sample", {**METADATA, "category": "flow"})
+
+    assert len(validations) == 2
+
+
+def test_validator_change_invalidates(sample, validations, tmp_path, monkeypatch):
+    rules = tmp_path / "rules.py"
+    rules.write_text("RULES = ['Q002']\n", encoding="utf-8")
+    monkeypatch.setattr(quality_cache, "_VALIDATOR_SOURCES", (str(rules),))
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+
+    rules.write_text("RULES = ['Q002', 'Q011']\n", encoding="utf-8")
+    validate_module_quality(module_class, "test.sample", METADATA)
+
+    assert len(validations) == 2
+
+
+def test_cached_report_still_blocks_in_ci_mode(sample, monkeypatch):
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+
+    monkeypatch.setenv("FLYTO_VALIDATION_MODE", "ci")
+    with pytest.raises(ValueError, match="print"):
+        validate_module_quality(module_class, "test.sample", METADATA)
+
+
+def test_disabled_cache_always_validates(sample, validations, monkeypatch, cache_dir):
+    monkeypatch.setenv("FLYTO_QUALITY_CACHE", "0")
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+    validate_module_quality(module_class, "test.sample", METADATA)
+
+    assert len(validations) == 2
+    assert not cache_dir.exists()
+
+
+def test_corrupt_entry_is_a_miss(sample, validations, cache_dir):
+    module_class = sample()
+    validate_module_quality(module_class, "test.sample", METADATA)
+    for entry in cache_dir.rglob("*.json"):
+        entry.write_text("{truncated", encoding="utf-8")
+
+    report = validate_module_quality(module_class, "test.sample", METADATA)
+
+    assert len(validations) == 2
+    assert "Q002" in _rules(report)
+
+
+def test_unwritable_directory_does_not_fail_registration(sample, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(quality_validator, "get_quality_cache", lambda: cache)
+    cache = QualityReportCache(blocker)
+
+    report = validate_module_quality(sample(), "test.sample", METADATA)
+
+    assert "Q002" in _rules(report)
+    assert cache._writable is False
+
+
+def test_process_cache_follows_the_environment(monkeypatch):
+    monkeypatch.setenv("FLYTO_QUALITY_CACHE", "off")
+    assert get_quality_cache() is None
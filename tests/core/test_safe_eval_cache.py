@@ -0,0 +1,54 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Compiled safe_eval expressions — validated once, cached by text, bounded.
+"""
+
+import pytest
+
+from core.safe_eval import (
+    EXPRESSION_CACHE,
+    ExpressionCache,
+    SafeEvalError,
+    compile_expression,
+    safe_eval,
+)
+
+
+class TestCompileExpression:
+    def test_compiled_expression_is_cached_and_reusable(self):
+        evaluate = compile_expression("count >= 1 and status == 'open'")
+
+        assert compile_expression("count >= 1 and status == 'open'") is evaluate
+        assert evaluate({"count": 3, "status": "open"}) is True
+        assert evaluate({"count": 0, "status": "open"}) is False
+
+    def test_refused_expressions_are_not_cached(self):
+        size = len(EXPRESSION_CACHE)
+        for _ in range(2):
+            with pytest.raises(SafeEvalError):
+                compile_expression("x.__class__")
+        assert len(EXPRESSION_CACHE) == size
+
+    def test_undefined_name_still_raises_per_evaluation(self):
+        evaluate = compile_expression("known or unknown")
+        with pytest.raises(SafeEvalError, match="not defined"):
+            evaluate({"known": True})
+        assert safe_eval("known or unknown", {"known": False, "unknown": 2}) == 2
+
+
+class TestExpressionCache:
+    def test_evicts_least_recently_used(self):
+        cache = ExpressionCache(maxsize=2)
+        cache.get_or_compile("k", "a", str.upper)
+        cache.get_or_compile("k", "b", str.upper)
+        cache.get_or_compile("k", "a", lambda text: pytest.fail("should be cached"))
+        cache.get_or_compile("k", "c", str.upper)
+
+        assert len(cache) == 2
+        assert cache.get_or_compile("k", "b", lambda text: "recompiled") == "recompiled"
+
+    def test_kinds_do_not_collide(self):
+        cache = ExpressionCache()
+        assert cache.get_or_compile("one", "x", lambda text: 1) == 1
+        assert cache.get_or_compile("two", "x", lambda text: 2) == 2
@@ -0,0 +1,167 @@
+"""Shared DNS cache behind the SSRF guards.
+
+validate_url_ssrf, enforce_outbound_host and _SSRFGuardedResolver answer from
+one cache: positive and negative entries, record TTLs when aiodns provides
+them, one query for concurrent async lookups. Policy is never cached — it is
+re-applied to every cached address on every call. DNS is faked through
+socket.getaddrinfo (which loop.getaddrinfo also calls) so nothing touches the
+network.
+"""
+import asyncio
+import socket
+import sys
+import time
+import types
+
+import pytest
+
+from core import utils
+from core.utils import (
+    SSRFError,
+    _SSRFGuardedResolver,
+    enforce_outbound_host,
+    enforce_outbound_host_async,
+    resolve_guard_ips,
+    validate_url_ssrf,
+    validate_url_ssrf_async,
+)
+
+
+def _infos(*ips):
+    return [
+        (socket.AF_INET6 if ":" in ip else socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0))
+        for ip in ips
+    ]
+
+
+@pytest.fixture
+def fake_dns(monkeypatch):
+    """Route getaddrinfo to a table; records every host actually queried."""
+    table = {}
+    queries = []
+
+    def getaddrinfo(host, *args, **kwargs):
+        queries.append(host)
+        answer = table.get(host)
+        if answer is None:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return _infos(*answer)
+
+    monkeypatch.setattr(utils.socket, "getaddrinfo", getaddrinfo)
+    monkeypatch.delenv("FLYTO_DNS_CACHE_TTL_S", raising=False)
+    monkeypatch.delenv("FLYTO_DNS_NEGATIVE_TTL_S", raising=False)
+    monkeypatch.delenv("FLYTO_ALLOW_PRIVATE_NETWORK", raising=False)
+    monkeypatch.delenv("FLYTO_ALLOWED_HOSTS", raising=False)
+    monkeypatch.delitem(sys.modules, "aiodns", raising=False)
+    utils.clear_guard_dns_cache()
+    yield table, queries
+    utils.clear_guard_dns_cache()
+
+
+class TestCache:
+    def test_repeated_guards_share_one_lookup(self, fake_dns):
+        table, queries = fake_dns
+        table["api.example.test"] = ["93.184.216.34"]
+
+        for _ in range(3):
+            validate_url_ssrf("https://api.example.test/items")
+            enforce_outbound_host("api.example.test", purpose="Redis")
+
+        assert queries == ["api.example.test"]
+
+    def test_failures_are_cached_and_still_fail_closed(self, fake_dns):
+        _, queries = fake_dns
+
+        for _ in range(2):
+            with pytest.raises(SSRFError, match="could not be resolved"):
+                enforce_outbound_host("gone.example.test", purpose="MySQL")
+            with pytest.raises(SSRFError, match="DNS resolution failed"):
+                validate_url_ssrf("https://gone.example.test/")
+
+        assert queries == ["gone.example.test"]
+
+    def test_zero_ttl_disables_caching(self, fake_dns, monkeypatch):
+        table, queries = fake_dns
+        table["api.example.test"] = ["93.184.216.34"]
+        monkeypatch.setenv("FLYTO_DNS_CACHE_TTL_S", "0")
+
+        resolve_guard_ips("api.example.test")
+        resolve_guard_ips("api.example.test")
+
+        assert len(queries) == 2
+
+    def test_policy_is_reapplied_to_cached_answers(self, fake_dns, monkeypatch):
+        table, _ = fake_dns
+        table["db.internal.test"] = ["10.0.0.5"]
+
+        with pytest.raises(SSRFError):
+            enforce_outbound_host("db.internal.test")
+        monkeypatch.setenv("FLYTO_ALLOWED_HOSTS", "db.internal.test")
+
+        assert enforce_outbound_host("db.internal.test") == "db.internal.test"
+
+
+class TestEveryAddressIsChecked:
+    def test_one_private_address_blocks_the_host(self, fake_dns):
+        table, _ = fake_dns
+        table["mixed.example.test"] = ["93.184.216.34", "::ffff:127.0.0.1"]
+
+        assert resolve_guard_ips("mixed.example.test") == ["93.184.216.34", "::ffff:127.0.0.1"]
+        with pytest.raises(SSRFError, match="::ffff:127.0.0.1"):
+            enforce_outbound_host("mixed.example.test")
+        with pytest.raises(SSRFError, match="private IP"):
+            validate_url_ssrf("https://mixed.example.test/")
+
+
+class TestAsync:
+    async def test_concurrent_lookups_share_one_query(self, fake_dns):
+        table, queries = fake_dns
+        table["api.example.test"] = ["93.184.216.34"]
+
+        await asyncio.gather(*(
+            enforce_outbound_host_async("api.example.test") for _ in range(20)
+        ))
+        await validate_url_ssrf_async("https://api.example.test/")
+
+        assert queries == ["api.example.test"]
+
+    async def test_async_guard_matches_the_sync_one(self, fake_dns):
+        table, _ = fake_dns
+        table["meta.example.test"] = ["169.254.169.254"]
+
+        with pytest.raises(SSRFError, match="metadata"):
+            await validate_url_ssrf_async("https://meta.example.test/", allow_private=True)
+        with pytest.raises(SSRFError, match="could not be resolved"):
+            await enforce_outbound_host_async("gone.example.test")
+
+    async def test_guarded_resolver_reuses_the_validated_answer(self, fake_dns):
+        table, queries = fake_dns
+        table["api.example.test"] = ["93.184.216.34"]
+        validate_url_ssrf("https://api.example.test/")
+
+        resolver = _SSRFGuardedResolver()
+        infos = await resolver.resolve("api.example.test", 443, socket.AF_UNSPEC)
+
+        assert [(i["host"], i["port"]) for i in infos] == [("93.184.216.34", 443)]
+        assert queries == ["api.example.test"]
+
+    async def test_record_ttl_from_aiodns_bounds_the_entry(self, fake_dns, monkeypatch):
+        _, queries = fake_dns
+
+        class _Resolver:
+            def __init__(self, loop=None):
+                pass
+
+            async def getaddrinfo(self, host, **kwargs):
+                node = types.SimpleNamespace(
+                    family=socket.AF_INET, addr=(b"93.184.216.34", 0), ttl=2,
+                )
+                return types.SimpleNamespace(nodes=[node])
+
+        monkeypatch.setitem(sys.modules, "aiodns", types.SimpleNamespace(DNSResolver=_Resolver))
+        monkeypatch.setattr(utils, "_GUARD_DNS", utils._GuardDNSResolver())
+
+        assert await utils.resolve_guard_ips_async("api.example.test") == ["93.184.216.34"]
+        expires_at = utils._GUARD_DNS._entries["api.example.test"][0]
+        assert expires_at - time.monotonic() <= 2
+        assert queries == []  # answered by aiodns, not getaddrinfo
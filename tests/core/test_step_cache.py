@@ -0,0 +1,234 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+Step result cache — content-addressed keys, stores and engine wiring.
+"""
+
+import time
+
+import pytest
+
+from core.modules import atomic  # noqa: F401 — registers production modules
+from core.engine.step_cache import (
+    CachePolicy,
+    DirectoryStepCache,
+    MemoryStepCache,
+    StepResultCache,
+    compute_cache_key,
+    get_cache_config,
+)
+from core.engine.workflow import WorkflowEngine
+from core.modules.items import (
+    BinaryData,
+    Item,
+    ItemBatch,
+    ItemError,
+    ItemMeta,
+    LegacyStepResult,
+    NodeExecutionResult,
+    items_to_legacy_context,
+)
+
+COUNTER_MODULE_ID = "test.step_cache_counter"
+CALLS = []
+
+
+def _register_counter():
+    from core.modules.registry import ModuleRegistry, register_module
+
+    if ModuleRegistry.has(COUNTER_MODULE_ID):
+        return
+
+    @register_module(
+        module_id=COUNTER_MODULE_ID,
+        version="1.0.0",
+        category="testing",
+        tags=["test"],
+        label="Step Cache Counter",
+        description="Counts executions for step cache tests",
+        icon="Hash",
+        color="#000000",
+        input_types=["any"],
+        output_types=["any"],
+        can_receive_from=["*"],
+        can_connect_to=["*"],
+        requires_credentials=False,
+        handles_sensitive_data=False,
+    )
+    async def step_cache_counter(ctx):
+        CALLS.append(ctx["params"].get("value"))
+        return {"ok": True, "data": {"value": ctx["params"].get("value"), "n": len(CALLS)}}
+
+
+def _workflow(steps, **extra):
+    return dict({"id": "wf_cache", "name": "Step cache", "steps": steps}, **extra)
+
+
+@pytest.fixture(autouse=True)
+def _counter():
+    _register_counter()
+    CALLS.clear()
+    yield
+
+
+class TestCacheKey:
+    def test_key_is_stable_and_content_addressed(self):
+        key = compute_cache_key("string.uppercase", "1.0.0", {"text": "a", "n": [1, 2]})
+
+        assert key == compute_cache_key("string.uppercase", "1.0.0", {"n": [1, 2], "text": "a"})
+        assert key != compute_cache_key("string.uppercase", "1.0.1", {"text": "a", "n": [1, 2]})
+        assert key != compute_cache_key("string.uppercase", "1.0.0", {"text": "b", "n": [1, 2]})
+
+    def test_input_items_are_part_of_the_key(self):
+        a = [Item(json={"x": 1}, binary={"f": BinaryData(data=b"one", mimeType="text/plain")})]
+        b = [Item(json={"x": 1}, binary={"f": BinaryData(data=b"two", mimeType="text/plain")})]
+
+        assert compute_cache_key("m", "1", {}, a) != compute_cache_key("m", "1", {}, b)
+        assert compute_cache_key("m", "1", {}, []) != compute_cache_key("m", "1", {})
+
+    def test_unserializable_params_are_not_cacheable(self):
+        assert compute_cache_key("m", "1", {"obj": object()}) is None
+
+
+class TestPolicy:
+    def test_only_deterministic_modules_by_default(self):
+        cache = StepResultCache(MemoryStepCache(), get_cache_config({"cache": {"ttl": 60}}))
+
+        assert cache.policy_for({}, "string.uppercase").ttl == 60
+        assert cache.policy_for({}, "utility.delay") is None
+        assert cache.policy_for({"cache": False}, "string.uppercase") is None
+
+    def test_step_block_opts_in_and_overrides(self):
+        cache = StepResultCache(MemoryStepCache(), get_cache_config({}))
+
+        assert cache.policy_for({}, "string.uppercase") is None
+        assert cache.policy_for({"cache": True}, "string.uppercase").ttl is None
+        assert cache.policy_for({"cache": True}, "utility.delay") is None
+        policy = cache.policy_for({"cache": {"ttl": 5, "deterministic": True}}, "utility.delay")
+        assert (policy.ttl, policy.deterministic) == (5, True)
+
+
+class TestStores:
+    async def test_memory_store_ttl_and_lru(self):
+        store = MemoryStepCache(max_entries=2)
+        await store.set("a", "1", ttl=0.01)
+        await store.set("b", "2")
+        await store.set("c", "3")
+        time.sleep(0.02)
+
+        assert await store.get("a") is None
+        assert (await store.get("b"), await store.get("c")) == ("2", "3")
+        assert len(store) == 2
+
+    async def test_directory_store_roundtrip_and_expiry(self, tmp_path):
+        store = DirectoryStepCache(tmp_path)
+        await store.set("ab12", '{"ok": true}')
+        await store.set("cd34", '"x"', ttl=0.01)
+        time.sleep(0.02)
+
+        assert await DirectoryStepCache(tmp_path).get("ab12") == '{"ok": true}'
+        assert await store.get("cd34") is None
+        assert not (tmp_path / "cd" / "cd34.json").exists()
+        await store.clear()
+        assert await store.get("ab12") is None
+
+
+class TestResultTypes:
+    @pytest.fixture
+    def legacy(self):
+        return items_to_legacy_context(NodeExecutionResult(data=[[
+            Item(json={"n": 1}, meta=ItemMeta(sourceNodeId="src", sourceItemIndex=0)),
+            Item(json={"n": 2}, error=ItemError(message="bad", itemIndex=1)),
+            Item(json={"n": 3}, binary={"file": BinaryData(data=b"x", mimeType="text/plain")}),
+        ]]))
+
+    async def test_item_results_keep_their_type(self, legacy):
+        cache = StepResultCache(MemoryStepCache())
+        await cache.put("k", legacy, CachePolicy())
+
+        hit, cached = await cache.get("k")
+
+        assert hit and isinstance(cached, LegacyStepResult)
+        assert isinstance(cached.batch, ItemBatch)
+        assert cached._pending and legacy._pending
+        assert cached["items"] is cached.batch.json
+        assert cached == legacy
+
+    async def test_built_items_full_is_kept(self, legacy):
+        cache = StepResultCache(MemoryStepCache())
+        legacy["items_full"] = []
+        await cache.put("k", legacy, CachePolicy())
+
+        _, cached = await cache.get("k")
+
+        assert not cached._pending
+        assert cached["items_full"] == []
+
+    async def test_plain_results_stay_plain(self):
+        cache = StepResultCache(MemoryStepCache())
+        await cache.put("k", {"ok": True, "data": {"a": 1}}, CachePolicy())
+
+        _, cached = await cache.get("k")
+
+        assert type(cached) is dict and cached == {"ok": True, "data": {"a": 1}}
+
+
+class TestEngineCache:
+    async def test_rerun_skips_cached_steps(self):
+        store = MemoryStepCache()
+        workflow = _workflow([
+            {"id": "count", "module": COUNTER_MODULE_ID, "params": {"value": "a"},
+             "cache": {"deterministic": True}},
+            {"id": "upper", "module": "string.uppercase", "params": {"text": "${count.data.value}"},
+             "cache": True},
+        ])
+
+        first = WorkflowEngine(workflow, step_cache=store)
+        await first.execute()
+        second = WorkflowEngine(workflow, step_cache=store)
+        await second.execute()
+
+        assert CALLS == ["a"]
+        assert second.context["count"] == first.context["count"]
+        assert second.context["upper"] == first.context["upper"]
+        assert type(second.context["count"]) is type(first.context["count"])
+        assert len(store) == 2
+
+    async def test_changed_params_miss(self):
+        store = MemoryStepCache()
+        for value in ["a", "b", "a"]:
+            workflow = _workflow([
+                {"id": "count", "module": COUNTER_MODULE_ID, "params": {"value": value},
+                 "cache": {"deterministic": True}},
+            ])
+            await WorkflowEngine(workflow, step_cache=store).execute()
+
+        assert CALLS == ["a", "b"]
+
+    async def test_non_deterministic_module_runs_without_opt_in(self):
+        store = MemoryStepCache()
+        workflow = _workflow(
+            [{"id": "count", "module": COUNTER_MODULE_ID, "params": {"value": "a"}}],
+            cache=True,
+        )
+
+        await WorkflowEngine(workflow, step_cache=store).execute()
+        await WorkflowEngine(workflow, step_cache=store).execute()
+
+        assert CALLS == ["a", "a"]
+        assert len(store) == 0
+
+    async def test_cached_result_is_a_copy(self):
+        store = MemoryStepCache()
+        workflow = _workflow([
+            {"id": "count", "module": COUNTER_MODULE_ID, "params": {"value": "a"},
+             "cache": {"deterministic": True}},
+        ])
+
+        first = WorkflowEngine(workflow, step_cache=store)
+        await first.execute()
+        first.context["count"]["data"]["value"] = "mutated"
+        second = WorkflowEngine(workflow, step_cache=store)
+        await second.execute()
+
+        assert second.context["count"]["data"]["value"] == "a"
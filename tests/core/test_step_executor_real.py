@@ -1757,6 +1757,103 @@ class TestForeachExecution:
         assert isinstance(result, list)
         assert len(result) == 3
 
+    async def test_foreach_concurrency_keeps_order_and_isolates_context(self):
+        """concurrency: N resolves each iteration against its own context."""
+        context = {"names": ["alice", "bob", "carol", "dave"]}
+        step_config = {
+            "id": "upper_concurrent",
+            "module": "string.uppercase",
+            "params": {"text": "${item}"},
+            "foreach": "${names}",
+            "as": "item",
+            "concurrency": 3,
+        }
+        executor = make_executor()
+        resolver = make_resolver(context=context)
+
+        result = await executor.execute_step(
+            step_config=step_config,
+            step_index=0,
+            context=context,
+            resolver=resolver,
+        )
+
+        assert [r["data"]["result"] for r in result] == ["ALICE", "BOB", "CAROL", "DAVE"]
+        assert "item" not in context
+        assert "__foreach_index__" not in context
+
+    async def test_foreach_concurrency_is_bounded(self):
+        """No more than `concurrency` iterations are in flight at once."""
+        import asyncio
+        from core.engine.step_executor.foreach import execute_foreach_step
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_single(step_config, resolver, context, timeout, step_index, trace):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return resolver.resolve("${item}") * 2
+
+        context = {"nums": list(range(10))}
+        results = await execute_foreach_step(
+            {"id": "bounded", "concurrency": 4},
+            make_resolver(context=context),
+            context,
+            "${nums}",
+            "item",
+            fake_single,
+        )
+
+        assert results == [n * 2 for n in range(10)]
+        assert 1 < peak <= 4
+
+    async def test_foreach_concurrency_on_error_continue(self):
+        """Failed iterations become error entries at their input position."""
+        from core.engine.step_executor.foreach import execute_foreach_step
+
+        async def fake_single(step_config, resolver, context, timeout, step_index, trace):
+            if context["item"] == 2:
+                raise ValueError("boom")
+            return context["item"]
+
+        context = {"nums": [0, 1, 2, 3]}
+        results = await execute_foreach_step(
+            {"id": "cont", "concurrency": 2, "on_error": "continue"},
+            make_resolver(context=context),
+            context,
+            "${nums}",
+            "item",
+            fake_single,
+        )
+
+        assert results[:2] == [0, 1]
+        assert results[2] == {"ok": False, "error": "boom", "index": 2}
+        assert results[3] == 3
+
+    async def test_foreach_concurrency_on_error_stop_raises(self):
+        """With on_error: stop a failing iteration fails the whole step."""
+        from core.engine.step_executor.foreach import execute_foreach_step
+
+        async def fake_single(step_config, resolver, context, timeout, step_index, trace):
+            if context["item"] == 1:
+                raise ValueError("boom")
+            return context["item"]
+
+        context = {"nums": [0, 1, 2]}
+        with pytest.raises(StepExecutionError, match="iteration 1 failed"):
+            await execute_foreach_step(
+                {"id": "stop", "concurrency": 2},
+                make_resolver(context=context),
+                context,
+                "${nums}",
+                "item",
+                fake_single,
+            )
+
 
 # ---------------------------------------------------------------------------
 # 24. Step trace with result.data path (line 274-275)
@@ -2655,3 +2752,91 @@ class TestHookSkipAndAbortPaths:
             )
 
         assert "aborted_step" in str(exc_info.value) or "blocked by policy" in str(exc_info.value)
+
+
+# ---------------------------------------------------------------------------
+# 31. Items mode: max_item_concurrency fan-out and execute_batch chunks
+# ---------------------------------------------------------------------------
+
+class TestItemsModeThroughput:
+    @staticmethod
+    def _items(n):
+        from core.modules.items import Item
+        return [Item(json={"value": i}) for i in range(n)]
+
+    async def test_max_item_concurrency_bounds_in_flight_and_keeps_order(self):
+        import asyncio
+        from core.modules.base import BaseModule
+        from core.modules.items import Item
+
+        state = {"in_flight": 0, "peak": 0}
+
+        class SlowItems(BaseModule):
+            execution_mode = "items"
+            max_item_concurrency = 5
+
+            def validate_params(self):
+                pass
+
+            async def execute(self):
+                return {"ok": True, "data": {}}
+
+            async def execute_item(self, item, index, ctx):
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                await asyncio.sleep(0.01 * (index % 3))
+                state["in_flight"] -= 1
+                if item.json["value"] == 7:
+                    raise RuntimeError("bad item")
+                return Item(json={"double": item.json["value"] * 2})
+
+        result = await make_executor()._execute_items_mode(
+            "fan_out", SlowItems({}, {}), {"$on_error": "continue"}, self._items(20), None
+        )
+
+        assert 1 < state["peak"] <= 5
+        assert result["items"][0] == {"double": 0}
+        assert result["items"][7] == {}
+        assert result["items"][19] == {"double": 38}
+        assert result["items_full"][7]["error"]["itemIndex"] == 7
+
+    async def test_execute_batch_receives_chunks_and_reports_item_failures(self):
+        from core.modules.base import BaseModule
+        from core.modules.items import Item
+
+        chunks = []
+
+        class VectorItems(BaseModule):
+            execution_mode = "items"
+            item_batch_size = 4
+
+            def validate_params(self):
+                pass
+
+            async def execute(self):
+                return {"ok": True, "data": {}}
+
+            async def execute_batch(self, items, start_index, ctx):
+                chunks.append((start_index, len(items)))
+                return [
+                    ValueError("odd") if item.json["value"] == 5
+                    else Item(json={"sq": item.json["value"] ** 2})
+                    for item in items
+                ]
+
+        executor = make_executor()
+        result = await executor._execute_items_mode(
+            "batched", VectorItems({}, {}), {"$on_error": "continue"}, self._items(10), None
+        )
+
+        assert chunks == [(0, 4), (4, 4), (8, 2)]
+        assert len(result["items"]) == 10
+        assert result["items"][9] == {"sq": 81}
+        assert result["items_full"][5]["error"]["message"] == "odd"
+
+        with pytest.raises(ValueError, match="odd"):
+            await executor._execute_items_mode(
+                "batched", VectorItems({}, {}), {"$on_error": "stop"}, self._items(10), None
+            )
+        # Stop mode does not start the chunk after the failing one
+        assert chunks[-1] == (4, 4)
@@ -0,0 +1,158 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+VariableResolver compiled plans — compile() + resolve_plan() must match resolve().
+"""
+
+import pytest
+
+from core.engine.step_executor.executor import StepExecutor
+from core.engine.variable_resolver import VariableResolver
+
+
+CONTEXT = {
+    "fetch": {"ok": True, "data": {"title": "Hello", "count": 3},
+              "items": [{"name": "a"}, {"name": "b"}]},
+    "row": {"id": 7, "tags": ["x", "y"]},
+}
+PARAMS = {"base": "https://example.com", "ui": {"query": "flyto"}}
+
+
+def _resolver(context=None):
+    return VariableResolver(PARAMS, dict(context or CONTEXT), {"id": "wf-1"})
+
+
+RAW_VALUES = [
+    "plain text",
+    "${fetch.title}",
+    "{{fetch.count}}",
+    "${row}",
+    "${missing.value}",
+    "Title: ${fetch.title} (${fetch.count}) ${missing}",
+    "${base}/items/${row.id}?q=${query}",
+    "${fetch.items[1].name} / ${fetch.items.length} / ${steps.row.tags.0}",
+    "${workflow.id}",
+    "unterminated ${fetch.title",
+    {"url": "${base}/x", "headers": {"Accept": "json"}, "n": 5, "flag": True},
+    ["${row.id}", "const", ["${fetch.title}", {"k": "${row.tags}"}]],
+    {"nested": {"deep": ["a", "b", {"c": "d"}]}},
+    42,
+    None,
+]
+
+
+class TestCompiledPlans:
+    @pytest.mark.parametrize("raw", RAW_VALUES)
+    def test_plan_matches_resolve(self, raw):
+        resolver = _resolver()
+        plan = resolver.compile(raw)
+        assert resolver.resolve_plan(plan) == resolver.resolve(raw)
+
+    def test_plan_is_reusable_across_contexts(self):
+        raw = {"text": "Item ${item.name} #${__foreach_index__}"}
+        plan = _resolver().compile(raw)
+
+        results = []
+        for index, item in enumerate([{"name": "a"}, {"name": "b"}]):
+            child = _resolver().with_context({"item": item, "__foreach_index__": index})
+            results.append(child.resolve_plan(plan))
+
+        assert results == [{"text": "Item a #0"}, {"text": "Item b #1"}]
+
+    def test_constant_subtrees_are_copied_not_shared(self):
+        raw = {"headers": {"Accept": "json"}, "list": [1, 2]}
+        resolver = _resolver()
+        plan = resolver.compile(raw)
+        assert plan.is_constant
+
+        first = resolver.resolve_plan(plan)
+        first["headers"]["X-Mutated"] = "1"
+        first["list"].append(3)
+
+        assert resolver.resolve_plan(plan) == {"headers": {"Accept": "json"}, "list": [1, 2]}
+        assert raw == {"headers": {"Accept": "json"}, "list": [1, 2]}
+
+    def test_single_reference_keeps_value_type(self):
+        resolver = _resolver()
+        assert resolver.resolve_plan(resolver.compile("${row.tags}")) == ["x", "y"]
+        assert resolver.resolve_plan(resolver.compile("{{missing}}")) == "${missing}"
+
+
+class TestCompiledConditions:
+    @pytest.mark.parametrize("condition,expected", [
+        ("${fetch.data.count} > 2", True),
+        ("{{fetch.data.count}} <= 2", False),
+        ("${fetch.data.title} == Hello", True),
+        ("${fetch.data.title} != Hello", False),
+        ("${row.tags} contains y", True),
+        ("${row.tags} !contains y", False),
+        ("${fetch.data.title} > 1", False),  # non-numeric compares to False
+        ("${fetch.ok}", True),
+        ("yes", True),
+        ("${missing}", False),
+    ])
+    def test_operators(self, condition, expected):
+        assert _resolver().evaluate_condition(condition) is expected
+
+    def test_operator_from_resolved_value(self):
+        resolver = _resolver({"rule": "3 >= 2"})
+        assert resolver.evaluate_condition("${rule}") is True
+
+    def test_substituted_value_cannot_change_operator(self):
+        resolver = _resolver({"name": "a == a"})
+        assert resolver.evaluate_condition("${name} contains b") is False
+
+    @pytest.mark.parametrize("condition,expected", [
+        ("${tags.contains_list} contains foo", True),
+        ("${tags.contains_list} !contains foo", False),
+        ("${check_contains.ok}", True),
+        ("{{check_contains.ok}}", True),
+        ("${limits.lt_gt} >= 3", True),
+        ("${limits.lt_gt} == ${limits.lt_gt}", True),
+    ])
+    def test_operator_words_inside_paths(self, condition, expected):
+        resolver = _resolver({
+            "tags": {"contains_list": "foo,bar"},
+            "check_contains": {"ok": True},
+            "limits": {"lt_gt": 3},
+        })
+        assert resolver.evaluate_condition(condition) is expected
+
+    def test_compiled_once_and_reused_across_contexts(self):
+        from core.safe_eval import EXPRESSION_CACHE
+
+        condition = "${item.n} >= 10"
+        results = [
+            _resolver().with_context({"item": {"n": n}}).evaluate_condition(condition)
+            for n in (5, 10, 15)
+        ]
+        size = len(EXPRESSION_CACHE)
+        _resolver().evaluate_condition(condition)
+
+        assert results == [False, True, True]
+        assert len(EXPRESSION_CACHE) == size
+
+
+class TestExecutorPlanCache:
+    def test_one_entry_per_step(self):
+        executor = StepExecutor()
+        resolver = _resolver()
+        plans = [
+            executor._get_resolution_plan(resolver, "fetch", {"url": "${base}/x"})
+            for _ in range(5)
+        ]
+        for _ in range(5):
+            executor._get_resolution_plan(resolver, "noop", {})
+
+        assert all(plan is plans[0] for plan in plans)
+        assert len(executor._resolution_plans) == 2
+
+    def test_changed_params_recompile(self):
+        executor = StepExecutor()
+        resolver = _resolver()
+        executor._get_resolution_plan(resolver, "fetch", {"url": "${base}/x"})
+
+        plan = executor._get_resolution_plan(resolver, "fetch", {"url": "${base}/y"})
+
+        assert resolver.resolve_plan(plan) == {"url": "https://example.com/y"}
+        assert len(executor._resolution_plans) == 1
@@ -0,0 +1,172 @@
+# Copyright 2026 Flyto2. Licensed under Apache-2.0. See LICENSE.
+
+"""
+DAG scheduler tests — dependency graph construction and real WorkflowEngine runs.
+
+Modules used (no external dependencies):
+- string.uppercase  — converts text to uppercase
+- utility.delay     — sleeps for duration_ms
+"""
+
+import time
+
+import pytest
+
+from core.modules import atomic  # noqa: F401 — registers production modules
+
+from core.engine.workflow import DagScheduler, WorkflowEngine, WorkflowRouter
+from core.engine.workflow.scheduler import get_scheduler_config
+
+
+def _graph(steps, edges=None):
+    router = WorkflowRouter()
+    router.build_step_index(steps)
+    router.build_edge_index(edges or [], steps)
+    scheduler = DagScheduler()
+    scheduler.build(steps, router)
+    return scheduler.dependencies
+
+
+class TestSchedulerConfig:
+    def test_string_and_dict_forms(self):
+        assert get_scheduler_config({"scheduler": "dag"})["max_concurrency"] == 8
+        assert get_scheduler_config(
+            {"scheduler": {"mode": "dag", "max_concurrency": 3}}
+        ) == {"mode": "dag", "max_concurrency": 3}
+
+    def test_absent_or_other_mode(self):
+        assert get_scheduler_config({}) is None
+        assert get_scheduler_config({"scheduler": {"mode": "sequential"}}) is None
+
+
+class TestDependencyGraph:
+    def test_references_edges_and_output_vars(self):
+        steps = [
+            {"id": "a", "module": "string.uppercase", "params": {"text": "x"}},
+            {"id": "b", "module": "string.uppercase", "params": {"text": "y"}, "output": "bee"},
+            {"id": "c", "module": "string.uppercase", "params": {"text": "${a.result}"}},
+            {"id": "d", "module": "string.uppercase", "params": {"text": "{{bee.result}}"}},
+            {"id": "e", "module": "string.uppercase", "params": {"text": "z"}},
+        ]
+        edges = [{"source": "c", "target": "e", "sourceHandle": "output"}]
+
+        deps = _graph(steps, edges)
+
+        assert deps[0] == set() and deps[1] == set()
+        assert deps[2] == {0}
+        assert deps[3] == {1}
+        assert deps[4] == {2}
+
+    def test_forward_reference_keeps_sequential_semantics(self):
+        """A later producer waits for an earlier reader (write-after-read)."""
+        steps = [
+            {"id": "reader", "module": "string.uppercase", "params": {"text": "${late.result}"}},
+            {"id": "late", "module": "string.uppercase", "params": {"text": "x"}},
+        ]
+        assert _graph(steps)[1] == {0}
+
+    def test_context_coupled_modules_keep_order(self):
+        steps = [
+            {"id": "launch", "module": "browser.launch", "params": {}},
+            {"id": "other", "module": "string.uppercase", "params": {"text": "x"}},
+            {"id": "goto", "module": "browser.goto", "params": {"url": "https://example.com"}},
+        ]
+        deps = _graph(steps)
+        assert deps[2] == {0}
+        assert deps[1] == set()
+
+    def test_foreach_and_llm_steps_keep_order(self):
+        steps = [
+            {"id": "each_a", "module": "string.uppercase", "foreach": "${rows}", "as": "row",
+             "params": {"text": "${row}"}},
+            {"id": "each_b", "module": "string.uppercase", "foreach": "${rows}", "as": "row",
+             "params": {"text": "${row}"}},
+            {"id": "chat", "module": "llm.chat", "params": {"prompt": "hi"}},
+            {"id": "other", "module": "string.uppercase", "params": {"text": "x"}},
+            {"id": "agent", "module": "acme.agent", "params": {"task": "t"}},
+        ]
+        deps = _graph(steps)
+        assert deps[1] == {0}
+        assert deps[2] == {1}
+        assert deps[3] == set()
+        assert deps[4] == {2}
+
+    def test_flow_control_is_unsupported(self):
+        steps = [{"id": "sw", "module": "flow.switch", "params": {}}]
+        router = WorkflowRouter()
+        router.build_step_index(steps)
+        router.build_edge_index([], steps)
+        assert "flow control" in DagScheduler.unsupported_reason(steps, router)
+
+
+class TestDagExecution:
+    async def test_independent_branches_run_concurrently(self):
+        workflow = {
+            "id": "dag-wide",
+            "scheduler": {"mode": "dag", "max_concurrency": 4},
+            "steps": [
+                {"id": f"wait_{i}", "module": "utility.delay", "params": {"duration_ms": 200}}
+                for i in range(4)
+            ] + [
+                {"id": "join", "module": "string.uppercase",
+                 "params": {"text": "${wait_0.waited_ms}-${wait_3.waited_ms}"}},
+            ],
+            "output": {"joined": "${join.result}"},
+        }
+
+        started = time.monotonic()
+        output = await WorkflowEngine(workflow).execute()
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.7
+        assert output["joined"].count("-") == 1
+
+    async def test_results_match_sequential_order(self):
+        steps = [
+            {"id": "a", "module": "string.uppercase", "params": {"text": "one"}},
+            {"id": "b", "module": "string.uppercase", "params": {"text": "${a.result} two"}},
+            {"id": "c", "module": "string.uppercase", "params": {"text": "three"}},
+            {"id": "d", "module": "string.uppercase", "params": {"text": "${b.result} ${c.result}"}},
+        ]
+        output_template = {"final": "${d.result}"}
+
+        sequential = await WorkflowEngine(
+            {"id": "seq", "steps": [dict(s) for s in steps], "output": output_template}
+        ).execute()
+        dag = await WorkflowEngine(
+            {"id": "dag", "scheduler": "dag", "steps": [dict(s) for s in steps],
+             "output": output_template}
+        ).execute()
+
+        assert dag["final"] == sequential["final"] == "ONE TWO THREE"
+
+    async def test_concurrency_cap_is_respected(self):
+        workflow = {
+            "id": "dag-capped",
+            "scheduler": {"mode": "dag", "max_concurrency": 1},
+            "steps": [
+                {"id": f"wait_{i}", "module": "utility.delay", "params": {"duration_ms": 100}}
+                for i in range(3)
+            ],
+        }
+
+        started = time.monotonic()
+        await WorkflowEngine(workflow).execute()
+        assert time.monotonic() - started >= 0.3
+
+    async def test_failure_stops_dispatch(self):
+        from core.engine.exceptions import WorkflowExecutionError
+
+        workflow = {
+            "id": "dag-fail",
+            "scheduler": "dag",
+            "steps": [
+                {"id": "bad", "module": "no.such_module", "params": {}},
+                {"id": "after", "module": "string.uppercase", "params": {"text": "${bad.result}"}},
+            ],
+        }
+        engine = WorkflowEngine(workflow)
+
+        with pytest.raises(WorkflowExecutionError):
+            await engine.execute()
+        assert "after" not in engine.context
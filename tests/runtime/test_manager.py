@@ -20,7 +20,7 @@ from core.runtime.manager import (
     PluginManifest,
     RuntimeConfig,
 )
-from core.runtime.process import ProcessStatus
+from core.runtime.process import ProcessStatus, StartupMetrics
 
 
 class TestRuntimeConfig:
@@ -428,11 +428,16 @@ class _FakeProcess:
         # held in flight while another lifecycle operation is attempted.
         self.hold = None
         self.entered_invoke = asyncio.Event()
+        self.last_startup = None
 
     @property
     def is_ready(self):
         return self.status == ProcessStatus.READY
 
+    @property
+    def is_serving(self):
+        return self.status in (ProcessStatus.READY, ProcessStatus.BUSY)
+
     @property
     def is_unhealthy(self):
         return self.status == ProcessStatus.UNHEALTHY
@@ -445,6 +450,7 @@ class _FakeProcess:
         if self.start_fails:
             return False
         self.status = ProcessStatus.READY
+        self.last_startup = StartupMetrics(spawn_ms=10.0, handshake_ms=30.0)
         return True
 
     async def stop(self, reason="shutdown", grace_period_ms=5000):
@@ -889,3 +895,260 @@ class TestPluginManagerShutdownIsFinal:
         assert (await call)["ok"] is True
         await closing
         assert process.stop_reasons == ["shutdown"]
+
+
+class TestPluginManagerWorkerPool:
+    """Concurrent invocations of one plugin spread over a worker pool."""
+
+    @staticmethod
+    async def _pooled(plugin_dir, **config):
+        """``_loaded`` with every scale-out worker also a held fake."""
+        manager, info, primary = await _loaded(plugin_dir, **config)
+        primary.hold = asyncio.Event()
+        spawned = []
+
+        def create_process(process_config):
+            worker = _FakeProcess()
+            worker.hold = primary.hold
+            spawned.append(worker)
+            return worker
+
+        manager._create_process = create_process
+        return manager, info, primary, spawned
+
+    @pytest.mark.asyncio
+    async def test_a_saturated_pool_grows_and_dispatches_to_the_new_worker(
+        self, lifecycle_plugin_dir
+    ):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, maxProcesses=3
+        )
+
+        first = asyncio.create_task(_invoke(manager))
+        await primary.entered_invoke.wait()
+        second = asyncio.create_task(_invoke(manager))
+        await asyncio.sleep(0)
+        await info.scale_task
+
+        # The call that found the pool saturated queued on the primary rather
+        # than waiting for the new worker to start.
+        assert info.load_of(primary) == 2
+        assert len(spawned) == 1 and info.extra_workers == spawned
+
+        third = asyncio.create_task(_invoke(manager))
+        await spawned[0].entered_invoke.wait()
+        assert info.load_of(spawned[0]) == 1  # least outstanding wins
+
+        primary.hold.set()
+        assert all(r["ok"] for r in await asyncio.gather(first, second, third))
+        assert manager.get_plugin_status("worker")["workers"] == 2
+
+    @pytest.mark.asyncio
+    async def test_the_pool_never_exceeds_max_processes(self, lifecycle_plugin_dir):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, maxProcesses=1
+        )
+
+        calls = [asyncio.create_task(_invoke(manager)) for _ in range(4)]
+        while info.active_invocations < 4:
+            await asyncio.sleep(0)
+
+        assert spawned == [] and info.scale_task is None
+        assert info.load_of(primary) == 4
+        primary.hold.set()
+        await asyncio.gather(*calls)
+
+    @pytest.mark.asyncio
+    async def test_manifest_max_workers_overrides_the_manager_default(self, tmp_path):
+        plugin_dir = tmp_path / "plugins"
+        plugin = plugin_dir / "worker"
+        plugin.mkdir(parents=True)
+        (plugin / "main.py").touch()
+        (plugin / "plugin.manifest.json").write_text(json.dumps({
+            "id": "worker",
+            "version": "1.0.0",
+            "steps": [{"id": "run"}],
+            "runtime": {"minWorkers": 2, "maxWorkers": 4},
+        }))
+
+        manager, info, _ = await _loaded(plugin_dir, maxProcesses=1)
+
+        assert (info.min_workers, info.max_workers) == (2, 4)
+
+    def test_manifest_worker_counts_are_bounded(self):
+        with pytest.raises(Exception, match="maxWorkers"):
+            PluginManifest.from_dict({
+                "id": "worker",
+                "steps": [],
+                "runtime": {"maxWorkers": 10_000},
+            })
+
+    @pytest.mark.asyncio
+    async def test_min_workers_are_started_with_the_primary(self, lifecycle_plugin_dir):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, minProcesses=3, maxProcesses=4
+        )
+        primary.hold.set()
+
+        await _invoke(manager)
+        await info.scale_task
+
+        assert len(spawned) == 2 and len(info.workers) == 3
+
+    @pytest.mark.asyncio
+    async def test_idle_sweep_retires_extra_workers_down_to_min(self, lifecycle_plugin_dir):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, minProcesses=2, maxProcesses=4, idleTimeoutSeconds=30
+        )
+        primary.hold.set()
+        await _invoke(manager)
+        await info.scale_task
+        info.min_workers = 1
+        info.extra_workers.append(manager._create_process(None))
+        for worker in info.extra_workers:
+            info.worker_last_used[id(worker)] = time.monotonic() - 60
+        info.last_invoke_time = time.monotonic()
+
+        await manager._check_idle()
+
+        assert info.extra_workers == []
+        assert [w.stop_reasons for w in spawned] == [["idle"], ["idle"]]
+        # The primary was used recently, so it stays up
+        assert primary.stop_reasons == [] and primary.is_ready
+
+    @pytest.mark.asyncio
+    async def test_health_sweep_retires_a_crashed_worker(self, lifecycle_plugin_dir):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, minProcesses=2
+        )
+        primary.hold.set()
+        await _invoke(manager)
+        await info.scale_task
+
+        spawned[0].status = ProcessStatus.STOPPED  # crashed
+        await manager._check_health()
+
+        assert info.extra_workers == []
+        assert spawned[0].stop_reasons == ["unhealthy"]
+
+    @pytest.mark.asyncio
+    async def test_unload_stops_every_worker(self, lifecycle_plugin_dir):
+        manager, info, primary, spawned = await self._pooled(
+            lifecycle_plugin_dir, minProcesses=2
+        )
+        primary.hold.set()
+        await _invoke(manager)
+        await info.scale_task
+
+        await manager.unload_plugin("worker")
+
+        assert primary.stop_reasons == ["shutdown"]
+        assert spawned[0].stop_reasons == ["shutdown"]
+
+
+class TestPluginManagerWarmPools:
+    """Warm pools start before traffic; start-up latency is recorded per plugin."""
+
+    @staticmethod
+    async def _warming(plugin_dir, **config):
+        """A manager whose every process, primary included, is a fake."""
+        manager = PluginManager(plugin_dir, config=config or None)
+        spawned = []
+
+        def create_process(process_config):
+            worker = _FakeProcess()
+            spawned.append(worker)
+            return worker
+
+        manager._create_process = create_process
+        await manager.discover_plugins()
+        return manager, spawned
+
+    @pytest.mark.asyncio
+    async def test_prewarm_starts_the_configured_pool_before_any_invoke(
+        self, lifecycle_plugin_dir
+    ):
+        manager, spawned = await self._warming(
+            lifecycle_plugin_dir, warmPools={"worker": 3}, maxProcesses=4
+        )
+
+        assert await manager.prewarm() == {"worker": 3}
+
+        info = manager._plugins["worker"]
+        assert len(spawned) == 3 and all(w.is_ready for w in spawned)
+        assert info.workers == spawned and info.min_workers == 3
+
+        # The first invoke finds a started pool and starts nothing
+        await _invoke(manager)
+        assert [w.start_count for w in spawned] == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_prewarm_is_a_no_op_for_lazy_plugins(self, lifecycle_plugin_dir):
+        manager, spawned = await self._warming(lifecycle_plugin_dir)
+
+        assert await manager.prewarm() == {}
+        assert spawned == [] and "worker" not in manager._plugins
+
+    @pytest.mark.asyncio
+    async def test_eager_start_policy_warms_one_worker(self, lifecycle_plugin_dir):
+        manager, spawned = await self._warming(lifecycle_plugin_dir, startPolicy="eager")
+
+        assert await manager.prewarm() == {"worker": 1}
+        assert len(spawned) == 1 and spawned[0].is_ready
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_plugin(
+        self, lifecycle_plugin_dir
+    ):
+        manager, _ = await self._warming(lifecycle_plugin_dir, startPolicy="eager")
+
+        def create_failing(process_config):
+            worker = _FakeProcess()
+            worker.start_fails = True
+            return worker
+
+        manager._create_process = create_failing
+
+        assert await manager.prewarm(["worker", "missing"]) == {"worker": 0, "missing": 0}
+
+    @pytest.mark.asyncio
+    async def test_warm_workers_survive_the_idle_sweep(self, lifecycle_plugin_dir):
+        manager, spawned = await self._warming(
+            lifecycle_plugin_dir, warmPools={"worker": 2}, idleTimeoutSeconds=30
+        )
+        await manager.prewarm()
+        info = manager._plugins["worker"]
+        info.last_invoke_time = time.monotonic() - 60
+        for worker in info.extra_workers:
+            info.worker_last_used[id(worker)] = time.monotonic() - 60
+
+        await manager._check_idle()
+
+        assert all(w.is_ready and w.stop_reasons == [] for w in spawned)
+
+    @pytest.mark.asyncio
+    async def test_startup_latency_is_split_into_cold_and_warm_starts(
+        self, lifecycle_plugin_dir
+    ):
+        manager, spawned = await self._warming(lifecycle_plugin_dir)
+
+        await _invoke(manager)  # lazy start: the caller waits for it
+        await manager.stop_plugin("worker")
+        await manager.prewarm(["worker"])
+
+        startup = manager.get_plugin_status("worker")["startup"]
+        assert startup["coldStarts"] == 1 and startup["warmStarts"] == 1
+        assert startup["lastSpawnMs"] == 10.0 and startup["lastHandshakeMs"] == 30.0
+        assert startup["maxStartupMs"] == 40.0
+
+        # Kept after unload, so the cost of a plugin's starts stays visible
+        await manager.unload_plugin("worker")
+        assert manager.get_startup_metrics()["worker"]["coldStarts"] == 1
+
+    def test_manifest_warm_workers_are_bounded(self):
+        with pytest.raises(Exception, match="warmWorkers"):
+            PluginManifest.from_dict({
+                "id": "worker",
+                "steps": [],
+                "runtime": {"warmWorkers": -1},
+            })
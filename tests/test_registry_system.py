@@ -448,6 +448,7 @@ class TestBuildModuleMetadata:
             retryable=False,
             max_retries=3,
             concurrent_safe=True,
+            deterministic=False,
             requires_credentials=False,
             handles_sensitive_data=False,
             required_permissions=None,